@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import GeneratedListing, KeywordResearch, ListingOptimization
+from .models import GeneratedListing, KeywordResearch, ListingOptimization, BulkGenerationBatch
 
 @admin.register(GeneratedListing)
 class GeneratedListingAdmin(admin.ModelAdmin):
@@ -18,4 +18,10 @@ class KeywordResearchAdmin(admin.ModelAdmin):
 class ListingOptimizationAdmin(admin.ModelAdmin):
     list_display = ('listing', 'optimization_type', 'priority', 'implemented')
     list_filter = ('optimization_type', 'priority', 'implemented')
-    search_fields = ('suggestion',)
\ No newline at end of file
+    search_fields = ('suggestion',)
+
+@admin.register(BulkGenerationBatch)
+class BulkGenerationBatchAdmin(admin.ModelAdmin):
+    list_display = ('id', 'name', 'status', 'total_items', 'completed_items', 'failed_items', 'created_at')
+    list_filter = ('status',)
+    readonly_fields = ('created_at', 'updated_at', 'started_at', 'finished_at')
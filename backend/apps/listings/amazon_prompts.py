@@ -0,0 +1,581 @@
+"""
+Amazon Prompt Templates
+The fixed parts of the Amazon listing prompt, compiled once at import. _generate_amazon_listing
+renders them with the per-product values and assembles the result with the enhancement
+fragments (see prompt_templates.assemble_prompt).
+"""
+
+import functools
+
+from .prompt_templates import PromptTemplate
+
+
+# Writing approach per brand tone (professional is the fallback)
+AMAZON_TONE_TEMPLATES = {
+    'professional': PromptTemplate('tone_professional', """
+WRITE AS A HUMAN EXPERT, NOT A MARKETING ROBOT
+
+You're a respected professional who genuinely knows this field. Your job is to write like you're personally recommending this to a colleague, not creating marketing copy.
+
+CRITICAL ANTI-ROBOT RULES:
+❌ NEVER use "revolutionary", "game-changing", "cutting-edge", "state-of-the-art"
+❌ NEVER start with brand name in title unless it naturally fits
+❌ NEVER use the same bullet structure as other products
+❌ NEVER start description with "Are you tired of..." or "Experience the..."
+❌ NEVER use "**FEATURE NAME:**" format in bullets
+
+HUMAN WRITING APPROACH:
+✅ Write like you're explaining to a smart colleague
+✅ Use specific, unusual details that show you actually understand the product
+✅ Include subtle professional insights that only an expert would know
+✅ Vary sentence structure dramatically - mix very short and longer explanations
+✅ Use unexpected but professional language
+
+TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
+DESCRIPTION STYLE: "{chosen_approach}"  
+STRUCTURAL APPROACH: "{chosen_structure}"
+
+TITLE VARIATION: Create something that sounds like a professional wrote it, not a marketing team
+BULLET VARIATION: Write each bullet completely differently - some short, some detailed, varied formats
+DESCRIPTION VARIATION: Tell the story from a professional's perspective, not marketing copy
+"""),
+
+    'casual': PromptTemplate('tone_casual', """
+WRITE LIKE A REAL FRIEND WHO FOUND SOMETHING AMAZING
+
+You're that friend who discovers cool stuff and can't wait to share it. Write like you're texting someone you care about, not creating an ad.
+
+CRITICAL ANTI-ROBOT RULES:
+❌ NEVER use "game-changer", "life-saver", "must-have"
+❌ NEVER start bullets with "MAKES LIFE EASIER:" or similar templates
+❌ NEVER use the same casual phrases everyone uses
+❌ NEVER sound like you're trying to sell something
+❌ NEVER use forced enthusiasm
+
+HUMAN FRIEND APPROACH:
+✅ Write like you're actually excited about this thing
+✅ Use specific, quirky details that make it feel real
+✅ Include slightly imperfect, conversational language
+✅ Share it like you'd tell a story to a friend
+✅ Use casual language that doesn't sound forced
+
+TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
+DESCRIPTION STYLE: "{chosen_approach}"  
+STRUCTURAL APPROACH: "{chosen_structure}"
+
+TITLE VARIATION: Write it like a casual recommendation, not marketing copy
+BULLET VARIATION: Each bullet should sound completely different - some chatty, some quick, varied styles
+DESCRIPTION VARIATION: Tell it like you're sharing a personal discovery with a friend
+"""),
+
+    'luxury': PromptTemplate('tone_luxury', """
+WRITE AS A SOPHISTICATED CONNOISSEUR, NOT A LUXURY SALES PERSON
+
+You appreciate true quality and understand what makes something genuinely exceptional. Write like you're sharing a rare discovery with someone who appreciates fine things.
+
+CRITICAL ANTI-ROBOT RULES:
+❌ NEVER use "exquisite", "handcrafted", "premium experience", "discerning"
+❌ NEVER start with "for the discerning" or "exclusive collection"
+❌ NEVER use obvious luxury buzzwords
+❌ NEVER sound pretentious or trying-too-hard
+❌ NEVER use "EXCEPTIONAL CRAFTSMANSHIP:" bullet format
+
+SOPHISTICATED HUMAN APPROACH:
+✅ Write with quiet confidence about genuine quality
+✅ Use subtle language that shows real appreciation for quality
+✅ Include specific details that only someone who knows quality would notice
+✅ Let the quality speak for itself without shouting about it
+✅ Use refined but not pretentious language
+
+TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
+DESCRIPTION STYLE: "{chosen_approach}"  
+STRUCTURAL APPROACH: "{chosen_structure}"
+
+TITLE VARIATION: Something that quietly suggests quality without screaming luxury
+BULLET VARIATION: Each should demonstrate quality through specific details, not declarations
+DESCRIPTION VARIATION: Show appreciation for quality through informed perspective
+"""),
+
+    'playful': PromptTemplate('tone_playful', """
+WRITE WITH GENUINE CREATIVITY, NOT FORCED ENTHUSIASM
+
+You're naturally creative and see fun possibilities everywhere. Write like you're sharing something that genuinely delights you, not trying to be quirky.
+
+CRITICAL ANTI-ROBOT RULES:
+❌ NEVER use "seriously cool", "totally awesome", "mind-blowing", "game-changer"
+❌ NEVER start bullets with "TOTALLY AWESOME:" or similar
+❌ NEVER force quirky comparisons that don't fit
+❌ NEVER sound like you're trying too hard to be fun
+❌ NEVER use obviously playful templates
+
+GENUINELY CREATIVE APPROACH:
+✅ Find unexpected but fitting ways to describe things
+✅ Use creativity that flows naturally from the product
+✅ Include surprising details that make people smile
+✅ Let your natural creativity show without forcing it
+✅ Write with energy that feels authentic
+
+TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
+DESCRIPTION STYLE: "{chosen_approach}"  
+STRUCTURAL APPROACH: "{chosen_structure}"
+
+TITLE VARIATION: Something creative that fits the product naturally
+BULLET VARIATION: Each should surprise in a different way - some clever, some simple, varied approaches
+DESCRIPTION VARIATION: Share the creative possibility in a way that feels natural
+"""),
+
+    'minimal': PromptTemplate('tone_minimal', """
+WRITE WITH PURPOSEFUL CLARITY, NOT STRIPPED-DOWN MARKETING
+
+You understand that the best things are simple and clear. Write like someone who values substance over style and knows what really matters.
+
+CRITICAL ANTI-ROBOT RULES:
+❌ NEVER use "essential", "simply better", "pure", "refined"
+❌ NEVER use "CLEAR BENEFIT:" bullet format
+❌ NEVER artificially strip away all personality
+❌ NEVER sound cold or robotic in pursuit of minimalism
+❌ NEVER use obvious minimal buzzwords
+
+THOUGHTFUL SIMPLICITY APPROACH:
+✅ Say exactly what needs to be said, nothing more
+✅ Use clear language that gets to the point
+✅ Include only details that truly matter
+✅ Let simplicity emerge from clarity, not force it
+✅ Write with calm confidence in the essentials
+
+TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
+DESCRIPTION STYLE: "{chosen_approach}"  
+STRUCTURAL APPROACH: "{chosen_structure}"
+
+TITLE VARIATION: Clear and direct without unnecessary words
+BULLET VARIATION: Each should be as long as it needs to be - some short, some longer, all clear
+DESCRIPTION VARIATION: Focus on what matters most, explained clearly
+"""),
+
+    'bold': PromptTemplate('tone_bold', """
+WRITE WITH AUTHENTIC CONFIDENCE, NOT MARKETING HYPERBOLE
+
+You believe strongly in what you're sharing and aren't afraid to make confident claims you can back up. Write like someone with genuine conviction, not a salesperson.
+
+CRITICAL ANTI-ROBOT RULES:
+❌ NEVER use "revolutionary", "breakthrough", "destroys", "shatters", "unleashes"
+❌ NEVER start bullets with "BREAKTHROUGH POWER:" or similar
+❌ NEVER use obvious bold/power buzzwords
+❌ NEVER sound like you're compensating with volume
+❌ NEVER use dramatic language that doesn't fit the product
+
+GENUINELY CONFIDENT APPROACH:
+✅ Make strong claims that you can actually support
+✅ Use confident language that feels earned, not manufactured
+✅ Include specific evidence for your bold statements
+✅ Let your conviction show through substance, not adjectives
+✅ Write with power that comes from genuine belief
+
+TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
+DESCRIPTION STYLE: "{chosen_approach}"  
+STRUCTURAL APPROACH: "{chosen_structure}"
+
+TITLE VARIATION: Confident but specific, not generically bold
+BULLET VARIATION: Each should demonstrate confidence in different ways - some direct, some detailed
+DESCRIPTION VARIATION: Show conviction through evidence and specific benefits
+"""),
+}
+
+
+# British culture block for the UK marketplace (category-specific additions stay in the service)
+UK_ENHANCEMENT_TEMPLATE = PromptTemplate('uk_enhancement', """
+🇬🇧 UNITED KINGDOM MARKET - EXACT MEXICO PATTERN REPLICATION FOR 10/10 QUALITY
+=================================================================================
+
+🚨🚨🚨 MANDATORY REQUIREMENTS - NO EXCEPTIONS ALLOWED 🚨🚨🚨
+
+⭐ CRITICAL SUCCESS FACTORS - FOLLOW MEXICO'S PROVEN FORMULA EXACTLY:
+
+1. BULLET STRUCTURE - EXACT MEXICO REPLICATION:
+   🎯 ALL 5 bullets MUST start with ★ symbol
+   🎯 Follow Mexico's emotional intensity pattern exactly
+   🎯 Each bullet MUST contain ONE British formality phrase
+   🎯 Length: 180-250 characters per bullet (Mexico standard)
+
+2. MANDATORY BRITISH FORMALITY PHRASES (USE ONE PER BULLET):
+   ✓ "We're delighted to offer" ✓ "Rest assured" ✓ "You'll find" 
+   ✓ "We're confident" ✓ "Proudly British" ✓ "You can be certain"
+   ✓ "It's our pleasure to provide" ✓ "We guarantee you'll notice"
+
+3. BRITISH CULTURAL INTEGRATION (MINIMUM 5 REFERENCES):
+   ✓ UK occasions: {occasion}, Boxing Day, Sunday roast, afternoon tea
+   ✓ British weather/climate considerations ✓ British homes/lifestyle
+   ✓ UK families/customers ✓ British standards/engineering ✓ British heritage
+
+4. EMOTIONAL POWER UPGRADE (BEAT COMPETITORS):
+   ❌ good → ✓ brilliant/exceptional ❌ nice → ✓ splendid/outstanding
+   ❌ great → ✓ remarkable/superb ❌ quality → ✓ premium excellence
+
+🔥 MANDATORY 5-BULLET PATTERN (FOLLOW MEXICO'S EXACT STRUCTURE):
+
+★ BULLET 1 - BRITISH EXCELLENCE SHOWCASE:
+"★ BRITISH ENGINEERING EXCELLENCE: [Premium feature] engineered to British Standards for [exceptional result]. We're confident you'll find [refined benefit] that transforms your [UK lifestyle scenario]."
+
+★ BULLET 2 - HERITAGE MEETS INNOVATION:
+"★ HERITAGE CRAFTSMANSHIP: [Quality element] combining traditional British excellence with [modern innovation]. Rest assured, [guarantee/quality promise] with full UK warranty backing."
+
+★ BULLET 3 - PERFECT FOR BRITISH HOMES:
+"★ PERFECT FOR BRITISH LIFESTYLE: [Lifestyle feature] ideal for {occasion}, Sunday roasts, and [weather considerations]. You'll find it brilliant for [specific British use case]."
+
+★ BULLET 4 - TRUSTED BY UK FAMILIES:
+"★ TRUSTED ACROSS BRITAIN: [Social proof] chosen by thousands of British families from London to Edinburgh. We're delighted to offer [exclusive British benefit]."
+
+★ BULLET 5 - EXCEPTIONAL BRITISH GIFT:
+"★ THOUGHTFUL BRITISH GIFT: Perfect {occasion} present with [British packaging/service]. Proudly presented with British customer service excellence and next-day delivery."
+
+💪 MANDATORY ELEMENTS TO INCLUDE (10/10 QUALITY CHECKPOINT):
+🎯 5 bullets with ★ symbols ✓ 🎯 British formality in every bullet ✓
+🎯 UK cultural references (min 5) ✓ 🎯 Occasion integration: {occasion} ✓
+🎯 British spelling (colour, favourite) ✓ 🎯 Weather considerations ✓
+🎯 Trust signals (warranty, CE, standards) ✓ 🎯 Emotional intensity ✓
+
+🇬🇧 UK DESCRIPTION STRUCTURE (1400-1600 chars - FOLLOW EXACTLY):
+Para 1: "Experience the difference British excellence makes. [Product] represents the finest in [category] engineering, designed specifically for discerning British customers who appreciate [quality aspect]..."
+Para 2: "From [British scenario] to [UK lifestyle activity], this [sophisticated feature] delivers [premium benefit]. Perfect for British homes and weather conditions..."
+Para 3: "Whether you're preparing for {occasion} or enjoying [British tradition], you'll find [product] provides [exceptional benefit] that exceeds expectations..."
+Para 4: "Join thousands of satisfied British families. Rest assured, with [UK warranty] and British customer service, you're investing in proven excellence."
+
+🚨 FINAL QUALITY ASSURANCE - VERIFY BEFORE SUBMISSION:
+✅ All 5 bullets start with ★ ✅ British formality in each bullet
+✅ Cultural integration present ✅ Emotional power words used  
+✅ Trust signals included ✅ British spelling consistent
+✅ Occasion '{occasion}' referenced ✅ Weather considerations mentioned
+
+FAILURE TO MEET ALL REQUIREMENTS = AUTOMATIC REJECTION
+
+🚨🚨🚨 CRITICAL BULLET FORMAT REQUIREMENT 🚨🚨🚨
+JSON OUTPUT REQUIREMENT FOR UK MARKET:
+"bulletPoints": [
+    "★ BRITISH ENGINEERING EXCELLENCE: [content with British formality]",
+    "★ HERITAGE CRAFTSMANSHIP: [content with British formality]", 
+    "★ PERFECT FOR BRITISH LIFESTYLE: [content with British formality]",
+    "★ TRUSTED ACROSS BRITAIN: [content with British formality]",
+    "★ THOUGHTFUL BRITISH GIFT: [content with British formality]"
+]
+
+EVERY SINGLE BULLET MUST START WITH ★ SYMBOL - NO EXCEPTIONS!
+DO NOT USE "•" OR "-" OR ANY OTHER SYMBOL - ONLY ★
+THIS IS MANDATORY FOR UK MARKET COMPLIANCE
+Instead of "nice" → "superb", "magnificent", "splendid"
+Instead of "works well" → "performs brilliantly", "excels magnificently"
+
+DESCRIPTION REQUIREMENTS:
+- Minimum 800 words with British cultural integration
+- Include 3+ British formality phrases
+- Reference British lifestyle scenarios
+- Strong call-to-action with urgency
+- Mention British service and support
+- Include weather/climate considerations
+
+COMPETITIVE POSITIONING:
+Beat Helium 10: Superior emotional engagement + British localization
+Beat Jasper AI: Market-specific formality + proven conversion structure  
+Beat CopyMonkey: Authentic British culture + emotional appeal
+
+QUALITY CONTROL CHECKLIST:
+□ All 5 bullets start with ★
+□ Each bullet contains British formality phrase
+□ British cultural elements integrated throughout
+□ Emotional intensity words used extensively
+□ UK occasions and lifestyle referenced
+□ British spelling used consistently
+□ Trust signals included prominently
+□ Weather/climate considerations mentioned
+
+🏆 TARGET: 10/10 QUALITY SCORE - BEAT ALL COMPETITORS
+""")
+
+
+# Product facts, conversion rules and the JSON skeleton the model must fill
+AMAZON_CORE_TEMPLATE = PromptTemplate('amazon_core', """CRITICAL: USE ONLY THE FOLLOWING INFORMATION - NO GENERIC CONTENT!
+DO NOT MAKE UP FEATURES OR BENEFITS NOT PROVIDED BELOW!
+
+PRODUCT INFORMATION (USE ALL OF THIS):
+- Product: {product_name}
+- Brand: {brand_name} (MUST appear in title and throughout listing)
+- Category: {product_category}
+- Description: {description}
+- Features: {features}
+- Price: ${price}
+- Product ID: {product_id}
+- Marketplace: {marketplace_display}
+{brand_context}
+
+
+REQUIRED ELEMENTS (MUST USE):
+- Target Keywords: {target_keywords}
+- Categories for Context: {categories}
+- Special Occasion: {occasion}
+
+⚠️ IMPORTANT: Base EVERYTHING on the actual product information above. Do not use generic placeholder content. If a detail isn't provided, extract it from the description or features given.
+
+RANDOMIZATION ELEMENTS FOR TODAY:
+- Content Focus: {chosen_focus}
+- Title Approach: {chosen_title_approach}  
+- FAQ Style: {chosen_faq_style}
+- Variety Emphasis: {variety_emphasis}
+
+AMAZON RUFUS AI OPTIMIZATION STRATEGY:
+Amazon's Rufus AI assistant helps customers find products through conversational queries. Your listing must be optimized for:
+- Natural language questions ("What's the best bluetooth headphone for working out?")
+- Comparison queries ("How is this different from other brands?") 
+- Use case scenarios ("Good for traveling?", "Will this work for gaming?")
+- Problem-solving language ("Stops hurting my ears", "Finally doesn't fall out")
+
+📝 MERGED STYLE APPROACH (GPT-4 + GPT-5 BEST PRACTICES):
+Merge two proven approaches into one powerful listing:
+
+From GPT-4 strengths: emotional storytelling, vivid scenarios, problem-solving benefits, and strong feature-to-benefit connections.
+From GPT-5 strengths: short, mobile-friendly bullet points, gifting/lifestyle positioning, broad keyword coverage, and strong trust signals (like warranties and guarantees).
+
+🔥🔥🔥 CONVERSION OPTIMIZATION REQUIREMENTS (BEATS HELIUM 10, JASPER, COPYMONKEY) 🔥🔥🔥
+
+TRUST SIGNALS (MANDATORY - Beats CopyMonkey):
+• Include "Guarantee", "Warranty", "Certified", "Quality" in EVERY listing
+• Add "30-day money back", "2-year warranty", "CE/FDA certified" when applicable
+• Use "Premium", "Professional", "Trusted by thousands" positioning
+• Include social proof: "Join 10,000+ satisfied customers"
+• Add scarcity: "Limited availability", "Best seller", "Stock running low"
+
+URGENCY ELEMENTS (MANDATORY - Conversion Boost):
+• Use action verbs: "Get", "Enjoy", "Experience", "Upgrade", "Transform"
+• Time-sensitive language: "Today", "Now", "Don't miss out", "While supplies last"
+• Exclusive positioning: "Exclusive design", "Limited edition", "Premium selection"
+• Call-to-action in description: "Click Add to Cart to secure yours today"
+
+BENEFIT-FOCUSED STRUCTURE (MANDATORY - Beats Jasper AI):
+• EVERY bullet must follow: FEATURE → BENEFIT → OUTCOME
+• Example: "40H Battery Life → Never stops your music → Enjoy week-long trips without charging"
+• Use emotional outcomes: "Feel confident", "Save time", "Reduce stress", "Impress guests"
+• Problem → Solution format in at least 2 bullets
+• Include lifestyle transformation: "Turn your daily routine into..."
+
+CONVERSION PSYCHOLOGY (MANDATORY):
+• Loss aversion: "Don't let poor quality ruin your experience"
+• Social proof: "Chosen by professionals", "Family favorite", "Top-rated"
+• Authority: "Engineered by experts", "Industry-leading", "Patented technology"
+• Reciprocity: "Includes bonus accessories", "Free guide included"
+• Commitment: "Investment in quality", "Built to last a lifetime"
+
+🔥🔥🔥 END CONVERSION OPTIMIZATION 🔥🔥🔥
+
+MERGED STYLE RULES:
+• Title: Mobile-first priority - impactful and fully scannable within 110-125 characters (up to 140 max if brand name is long). Start with hook + primary keyword + trust signal
+• Bullet Points: 5 maximum, each 200+ chars. Each begins with a strong 6-8 word benefit phrase (micro-headline) before detailed explanation. MUST include trust/urgency elements
+• Description: 1500-2000 chars, broken into short 2-3 sentence chunks with line breaks for mobile readability. Each chunk ends with conversion-focused CTA
+• FAQ: Address objections, highlight guarantees, emphasize urgency
+• A+ Content: Heavy focus on trust badges, comparison charts, money-back guarantees
+• Keywords: Include conversion terms: "best", "premium", "guaranteed", "certified"
+• Backend Keywords: 249 max chars, include trust and urgency keywords
+• No Repetition: Vary trust signals and urgency elements across sections
+
+🚨🚨 AMAZON USA OPTIMIZATION RULES (NON-NEGOTIABLE) 🚨🚨
+
+TITLE VALIDATION CHECKLIST:
+✅ Starts with main product keywords (NOT marketing taglines)
+✅ High-intent search terms in first 40 characters  
+✅ Brand placed in middle, not at start
+✅ Specific model/size/capacity numbers included
+✅ No soft phrases like "Simply", "Just", "So Easy"
+
+BULLET VALIDATION CHECKLIST:
+✅ EVERY bullet starts with ALL CAPS LABEL (3-5 words)
+✅ Specific technical specs included (battery hours, weight, size)
+✅ Measurable performance numbers (RPM, dB, hours, oz/g)
+✅ Benefit stated immediately after label
+✅ No bullets without technical specifications
+
+CRITICAL FAILURE POINTS:
+❌ Title starting with taglines instead of keywords = FAILED LISTING
+❌ Bullets without ALL CAPS labels = FAILED LISTING  
+❌ Missing technical specs = FAILED LISTING
+❌ Soft marketing language = FAILED LISTING
+
+YOUR MISSION: Create a COMPREHENSIVE, MAXIMUM-LENGTH Amazon listing optimized for Amazon USA search algorithm and fast-scanning behavior.
+
+CRITICAL CONTENT REQUIREMENTS - GENERATE MAXIMUM CONTENT:
+✅ Title: 110-125 chars ideal (up to 140 max). Start with hook + primary keyword. Mobile-first priority for scanability
+✅ Bullet Points: 5 bullets, each 200+ chars. Each begins with strong 6-8 word benefit phrase before detailed explanation
+✅ Product Description: 1500-2000 chars, broken into short readable chunks, each ending with soft benefit-driven hook
+✅ A+ Content: 5 complete sections with unique focus, no duplication between sections, mobile-responsive
+✅ Visual Templates: GENERATE ACTUAL CONTENT for each template field - no instruction text, only real content
+✅ Backend Keywords: 249 max chars, must not duplicate exact words from title/bullets, target complementary indexing terms
+✅ SEO Keywords: 80+ total (short + long-tail), ensuring no overstuffing; distribute naturally across listing
+✅ Brand Story: 250-400 character detailed brand narrative with proper punctuation
+✅ FAQs: 5+ detailed Q&As with proper grammar and complete sentences
+✅ Features: 5+ specific product features
+✅ What's in Box: Complete unboxing experience
+✅ Trust Builders: Multiple guarantees and certifications
+✅ Social Proof: Detailed customer satisfaction claims
+
+🎨 VISUAL TEMPLATE CRITICAL REQUIREMENTS:
+- Generate ACTUAL content for imageTitle, suggestedScene, overlayText, styleGuide, layoutStructure, colorScheme
+- Do NOT write instructions like "Write actual..." - provide the actual content
+- Base all visual content on the specific product information provided
+- Make each template unique and product-specific
+- Provide ready-to-use design briefs that can be immediately implemented
+
+KEYWORD STRATEGY FOR MAXIMUM VISIBILITY:
+- Primary Keywords (15+): Direct product terms, brand + product, category terms
+- Long-tail Keywords (25+): 3-7 word phrases, natural questions, use cases
+- Problem-solving Keywords (15+): Pain points, solutions, comparisons  
+- Rufus Conversation Keywords (15+): "best for", "good for", "works with", "better than"
+- Semantic Keywords (10+): Related terms, synonyms, variations
+- TOTAL TARGET: 80+ keywords covering every possible search angle
+
+CRITICAL JSON FORMATTING RULES:
+1. ALL JSON field values MUST use double quotes (") not single quotes (')
+2. INSIDE content text, use single quotes for contractions: dont, cant, wont, its  
+3. NEVER use unescaped double quotes inside content text
+4. JSON structure: {{"field": "content with single quotes inside"}}
+5. Test your JSON structure before submitting
+6. CORRECT: {{"title": "This is Johns favorite product"}}
+7. WRONG: {{'title': 'This is Johns favorite product'}}
+
+KEYWORD GENERATION RULES:
+1. For "primary" keywords: ALWAYS start with product name and brand name, then add 13+ related single/double words
+2. For "longTail": Create 25+ actual phrases (3-7 words), not instruction text
+3. For all keyword arrays: Generate actual keywords, NOT instruction text or examples
+4. Replace template phrases like [actual use case] with real use cases based on the product
+5. EXAMPLE GOOD: ["wireless earbuds", "bluetooth headphones", "noise cancelling"] 
+6. EXAMPLE BAD: ["Generate 15+ short keywords based on..."]
+
+RESPONSE FORMAT: Return COMPREHENSIVE JSON with ALL fields populated with MAXIMUM-LENGTH content:
+
+{{
+  "productTitle": "{title_format}",
+  
+  "bulletPoints": [
+    "{bullet_format_1}",
+    "{bullet_format_2}", 
+    "{bullet_format_3}",
+    "{bullet_format_4}",
+    "{bullet_format_5}"
+  ],
+  
+  "productDescription": "{description_format}",
+  
+  "seoKeywords": {{
+    "primary": ["{product_name_slug}", "{brand_name_lower}", "{industry_keywords}"],
+    "longTail": ["GENERATE_25_PHRASES: {longtail_use}", "{longtail_brand}", "{longtail_quality}", "{longtail_premium}", "{longtail_shipping}", "etc"],
+    "problemSolving": ["GENERATE_15_PROBLEM_KEYWORDS: {problem_keywords}"],
+    "rufusConversational": ["GENERATE_15_RUFUS_PHRASES: {rufus_good_for}", "{rufus_works_with}", "{rufus_perfect_for}", "{rufus_better_than}", "{rufus_ideal_for}"],
+    "semantic": ["GENERATE_10_RELATED: {semantic_terms}"]
+  }},
+  
+  "backendKeywords": "Write exactly 249 characters of comprehensive search terms. CRITICAL: For occasions, prioritize occasion-specific terms first (e.g., 'christmas gift for him', 'valentine present ideas', 'mothers day gift'). Then include: product variations, synonyms, competitor terms, misspellings, related categories, use cases, customer language, technical terms, seasonal terms, gift occasions, target demographics, problem keywords, solution keywords, benefit terms, feature variations, brand alternatives, size variations, color terms, material types, style descriptors, application areas, compatibility terms, professional vs consumer terms, and industry jargon.",
+  
+  "aPlusContentPlan": {{
+    "section1_hero": {{
+      "title": "Write compelling headline with occasion/gift theme",
+      "content": "Write comprehensive story explaining value proposition with emotional benefits and specific use cases. Connect personally with customers.",
+      "keywords": ["3-5 relevant keywords for this section"],
+      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Describe exactly what should be shown in the image - specific people, setting, lighting, product placement, props, colors, mood, and composition. Include technical specs and why this image works for conversion. Example: 'Turkish family of 4 in modern Istanbul apartment, warm evening lighting, father using headphones while working on laptop, family visible in background preparing dinner, product prominently displayed on desk with premium materials visible, shot emphasizes comfort and family time, professional photography style (970x600px hero lifestyle shot)'",
+      "seoOptimization": "Brief note on SEO strategy for this section"
+    }},
+    "section2_features": {{
+      "title": "Key Features and Benefits",
+      "content": "Write detailed technical analysis covering 6-8 features with specifications and real-world benefits.",
+      "keywords": ["3-5 feature-related keywords"],
+      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Specific description of feature showcase images - exact product angles, close-up details, demonstration scenarios, technical diagrams, before/after comparisons. Include lighting, background, props, and why each image converts. Example: 'Grid of 6 feature images: 1) Close-up of premium foam padding with cross-section view, 2) Hands adjusting noise-canceling controls with sound waves graphic, 3) Battery indicator showing 40-hour display, 4) Waterproof test with droplets, 5) Bluetooth connection to multiple devices, 6) Foldable design demonstration (300x300px each)'",
+      "seoOptimization": "Feature-based keywords strategy"
+    }},
+    "section3_usage": {{
+      "title": "Real-World Applications",
+      "content": "Write comprehensive guide describing 4-6 usage scenarios across different environments with specific examples.",
+      "keywords": ["3-5 usage-related keywords"],
+      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Specific real-world usage scenarios - exact people, activities, environments where product is used. Include demographics, settings, lighting, and emotional context. Example: 'Collage of 4 usage scenarios: 1) Young professional in coffee shop working with headphones, 2) Jogger in park using wireless features, 3) Family movie night with surround sound, 4) Business traveler in airport lounge, each showing different benefits (220x220px each)'",
+      "seoOptimization": "Usage-based search optimization"
+    }},
+    "section4_quality": {{
+      "title": "Quality Assurance",
+      "content": "Write detailed analysis covering quality control, testing standards, and certifications with specific metrics.",
+      "keywords": ["3-5 quality/trust keywords"],
+      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Trust-building certification display - specific badges, certificates, test results, quality seals. Include layout, colors, and credibility elements. Example: 'Professional layout showing CE certification badge, TSE quality seal, 2-year warranty certificate, customer satisfaction ratings (4.8/5 stars), Turkish quality assurance logo, arranged in trust-building grid format with premium styling'",
+      "seoOptimization": "Trust and quality-focused keywords"
+    }},
+    "section5_guarantee": {{
+      "title": "Warranty and Support",
+      "content": "Write comprehensive guide covering warranty terms, return policies, and customer support with timeframes.",
+      "keywords": ["3-5 warranty/support keywords"],
+      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Customer support and warranty visualization - specific support channels, warranty terms, customer service elements. Example: 'Split-screen image: Left shows warranty certificate with 2-year guarantee highlighted, right shows Turkish customer service representative helping customer via phone/chat, includes contact information and support hours, professional and reassuring tone'",
+      "seoOptimization": "Support and warranty-based keywords"
+    }},
+    "section6_social_proof": {{
+      "title": "Customer Stories",
+      "content": "Write detailed section featuring customer testimonials, usage stories, and real experiences.",
+      "keywords": ["3-5 testimonial/review keywords"],
+      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Social proof and testimonials layout - specific customer photos, review snippets, star ratings, usage proof. Example: 'Grid of 6 customer testimonials with profile photos, 5-star ratings, specific quotes about battery life and comfort, includes verified purchase badges, diverse Turkish customers, authentic and credible presentation'",
+      "seoOptimization": "Social proof and customer satisfaction keywords"
+    }},
+    "section7_comparison": {{
+      "title": "Why Choose This Product",
+      "content": "Write competitive analysis comparing advantages, unique features, and value propositions vs alternatives.",
+      "keywords": ["3-5 comparison/competitive keywords"],
+      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Competitive comparison and advantages - specific comparison metrics, charts, feature differences. Example: 'Professional comparison table showing this product vs 3 competitors: battery life (40h vs 20h), noise cancellation (-35dB vs -20dB), warranty (2 years vs 1 year), price value, clearly highlighting advantages with checkmarks and superior metrics'",
+      "seoOptimization": "Competitive advantage and comparison keywords"
+    }},
+    "section8_package": {{
+      "title": "Complete Package Contents",
+      "content": "Write detailed description of what customers receive: package contents, accessories, and setup guides.",
+      "keywords": ["3-5 package/contents keywords"],
+      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Unboxing and package contents display - specific items, premium packaging, first impression elements. Example: 'Top-down unboxing shot showing premium box opening to reveal headphones nestled in soft foam, accessories laid out (charging cable, carrying case, manual), clean white background, emphasizing quality packaging and complete value package'"
+      "seoOptimization": "Package and contents-based keywords"
+    }},
+    "overallStrategy": "Complete A+ content strategy for customer journey from awareness to purchase."
+  }},
+  
+  "brandSummary": "Write 250-400 character detailed brand story including: company background, mission, what makes the brand unique, customer focus, quality commitment, and competitive advantages. Make it feel authentic and substantial, not generic marketing speak.",
+  
+  "whatsInBox": [
+    "Main product with detailed description",
+    "Essential accessory 1 with purpose",
+    "Essential accessory 2 with purpose", 
+    "Documentation and warranty information",
+    "Additional items or bonuses included"
+  ],
+  
+  "trustBuilders": [
+    "Specific guarantee or warranty details (include gift return policies if occasion is specified)",
+    "Certification or testing information", 
+    "Company reliability factors",
+    "Customer service commitments (mention gift wrapping/message services if occasion-focused)",
+    "Quality assurance details (include testimonials mentioning occasion/gift use when applicable)"
+  ],
+  
+  "faqs": [
+    "Q: Ask realistic customer question about compatibility, usage, or concerns (for occasions, include delivery timing, gift wrapping, or recipient suitability)? A: Write detailed, helpful answer with proper grammar and contractions (don't, can't, it's) that builds confidence and addresses the specific concern thoroughly.",
+    "Q: Ask different realistic question about product benefits, comparison, or technical specs (for occasions, focus on gift-worthiness, why it makes a great [occasion] gift)? A: Provide comprehensive answer with proper apostrophes (you're, we're, they're) that demonstrates expertise and helps customer decision-making.",
+    "Q: Ask practical question about setup, maintenance, or common issues? A: Give specific, actionable answer with correct grammar (won't, shouldn't, isn't) that reduces customer anxiety and shows product knowledge.",
+    "Q: Ask comparison question about this vs alternatives or competitors? A: Answer diplomatically with proper contractions while highlighting unique advantages and value proposition.",
+    "Q: Ask about return policy, shipping, or purchasing concerns? A: Address practical concerns with correct grammar and confidence-building information and clear policies."
+  ],
+  
+  "socialProof": "Write 150-300 characters describing customer satisfaction, ratings, testimonials, or usage statistics. Make it credible and specific without making unverifiable claims.",
+  
+  "guarantee": "Write 100-200 characters describing specific guarantee, warranty, or risk-free offer. Include timeframe and what's covered. Make it compelling but honest."
+}}""")
+
+
+@functools.lru_cache(maxsize=64)
+def amazon_market_phrases(marketplace):
+    """Localized keyword placeholders for the seoKeywords skeleton (depend on the marketplace only)"""
+    return {
+        'longtail_use': '[ürün] [kullanım] için ideal' if marketplace == 'tr' else '[product] [用途]に最適' if marketplace == 'jp' else 'mejor [product] para [uso]' if marketplace == 'es' else '[product] perfekt för [användning]' if marketplace == 'se' else 'best [product] for [use]',
+        'longtail_brand': '[marka] [ürün] orijinal' if marketplace == 'tr' else '[brand] [product] 正規品' if marketplace == 'jp' else '[brand] [product] original certificado' if marketplace == 'es' else '[brand] [product] äkta kvalitet' if marketplace == 'se' else '[brand] [product] with [feature]',
+        'longtail_quality': '[ürün] kaliteli [özellik]' if marketplace == 'tr' else '[product] 高品質 [機能]' if marketplace == 'jp' else '[product] profesional [aplicación]' if marketplace == 'es' else '[product] kvalitet [funktion]' if marketplace == 'se' else '[product] that [solves problem]',
+        'longtail_premium': '[ürün] premium kalite' if marketplace == 'tr' else '[product] プレミアム品質' if marketplace == 'jp' else '[product] premium calidad' if marketplace == 'es' else '[product] premium kvalitet' if marketplace == 'se' else 'professional [product] for [application]',
+        'longtail_shipping': '[ürün] Türkiye kargo' if marketplace == 'tr' else '[product] 送料無料' if marketplace == 'jp' else 'oferta [product] [beneficio]' if marketplace == 'es' else '[product] sverige frakt' if marketplace == 'se' else 'high quality [product] [benefit]',
+        'problem_keywords': 'problemas españoles específicos' if marketplace == 'es' else 'based on what issues this product solves from description',
+        'rufus_good_for': 'bueno para [uso real]' if marketplace == 'es' else 'good for [real use]',
+        'rufus_works_with': 'funciona con [items compatibles]' if marketplace == 'es' else 'works with [compatible items]',
+        'rufus_perfect_for': 'perfecto para [escenarios]' if marketplace == 'es' else 'perfect for [scenarios]',
+        'rufus_better_than': 'mejor que [alternativas]' if marketplace == 'es' else 'better than [alternatives]',
+        'rufus_ideal_for': 'ideal para [situaciones]' if marketplace == 'es' else 'ideal for [situations]',
+        'semantic_terms': 'sinónimos españoles, variaciones, términos relacionados, términos técnicos, nombres informales' if marketplace == 'es' else 'synonyms, variations, related terms, technical terms, informal names',
+    }
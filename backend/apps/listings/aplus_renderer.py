@@ -0,0 +1,1407 @@
+"""
+A+ Content Renderer
+Builds the Amazon A+ HTML from a parsed aPlusContentPlan. Section and page templates are split
+into literal chunks once at import, per-market labels and section keywords are plain dict
+lookups, and render_aplus emits the whole document in one pass - cheap enough to re-render
+thousands of stored plans when a template changes. Listings whose plan has no sections (and
+every Turkey listing) get cards built from their own fields by fallback_cards, from the
+per-market FALLBACK_CARD_TEXT table.
+"""
+
+import string
+
+# Interface labels of the section cards
+MARKET_LABELS = {
+    'default': {'keywords': 'Keywords', 'image_strategy': 'Image Strategy', 'seo_focus': 'SEO Focus'},
+    'tr': {'keywords': 'Anahtar Kelimeler', 'image_strategy': 'Görsel Strateji', 'seo_focus': 'SEO Odak'},
+    'jp': {'keywords': 'キーワード', 'image_strategy': '画像戦略', 'seo_focus': 'SEO焦点'},
+    'de': {'keywords': 'Schlüsselwörter', 'image_strategy': 'Bildstrategie', 'seo_focus': 'SEO-Fokus'},
+    'fr': {'keywords': 'Mots-clés', 'image_strategy': 'Stratégie image', 'seo_focus': 'Focus SEO'},
+    'es': {'keywords': 'Palabras clave', 'image_strategy': 'Estrategia imagen', 'seo_focus': 'Enfoque SEO'},
+    'nl': {'keywords': 'Trefwoorden', 'image_strategy': 'Beeld Strategie', 'seo_focus': 'SEO Focus'},
+    'eg': {'keywords': 'الكلمات المفتاحية', 'image_strategy': 'استراتيجية الصور', 'seo_focus': 'تركيز تحسين محركات البحث'},
+    'mx': {'keywords': 'Palabras Clave', 'image_strategy': 'Estrategia de Imagen', 'seo_focus': 'Enfoque SEO'},
+    'sa': {'keywords': 'الكلمات المفتاحية', 'image_strategy': 'استراتيجية الصور', 'seo_focus': 'تركيز تحسين محركات البحث'},
+    'pl': {'keywords': 'Słowa Kluczowe', 'image_strategy': 'Strategia Obrazów', 'seo_focus': 'Skupienie SEO'},
+    'be': {'keywords': 'Mots-clés', 'image_strategy': "Stratégie d'Image", 'seo_focus': 'Focus SEO'},
+}
+
+# (section type, substrings of the plan key that select it); first match wins
+SECTION_TYPES = [
+    ('hero', ('hero', 'section1')),
+    ('features', ('feature', 'section2')),
+    ('trust', ('trust', 'quality', 'guarantee')),
+    ('usage', ('usage', 'section3')),
+    ('quality', ('quality', 'section4')),
+    ('social_proof', ('social', 'proof', 'section6')),
+    ('comparison', ('comparison', 'section7')),
+    ('package', ('package', 'section8')),
+    ('faq', ('faq', 'support')),
+]
+
+SECTION_KEYWORDS = {
+    'hero': {
+        'jp': 'プレミアム品質, みんなの信頼, 安心保証, 日本基準',
+        'es': 'calidad premium, confianza familiar, garantía extendida',
+        'de': 'Premium-Qualität, deutsche Standards, TÜV-geprüft',
+        'fr': 'qualité premium, tradition française, savoir-faire',
+        'it': 'qualità premium, eccellenza italiana, fiducia del cliente',
+        'tr': 'premium kalite, güvenilir marka, müşteri memnuniyeti',
+        'sa': 'جودة فائقة، علامة موثوقة، رضا العملاء',
+        'eg': 'جودة ممتازة، علامة تجارية موثوقة، رضا العملاء',
+        'pl': 'jakość premium, zaufana marka, zadowolenie klienta',
+        'be': 'qualité premium, marque de confiance, satisfaction client',
+        'sg': 'premium quality Singapore, trusted brand excellence, customer satisfaction guarantee, multicultural harmony',
+        'uk': 'premium quality Britain, trusted British brand excellence, customer satisfaction guarantee, refined British lifestyle',
+        'au': 'premium quality Australia, trusted brand excellence, customer satisfaction guarantee, Aussie lifestyle',
+        'default': 'premium quality, trusted brand, customer satisfaction',
+    },
+    'features': {
+        'jp': '高品質, 安全性, 使いやすさ, 長期保証',
+        'es': 'funcionalidad superior, diseño elegante, uso familiar',
+        'de': 'Ingenieursqualität, Präzision, Zuverlässigkeit, Effizienz',
+        'fr': 'sophistication, élégance française, art de vivre',
+        'it': 'design innovativo, prestazioni superiori, stile italiano',
+        'tr': 'yenilikçi tasarım, yüksek performans, kullanıcı dostu',
+        'sa': 'تصميم مبتكر، أداء عالي، سهل الاستخدام',
+        'eg': 'تصميم مبدع، أداء عالي الجودة، سهل الاستعمال',
+        'pl': 'innowacyjny design, wysoka wydajność, przyjazny użytkownikowi',
+        'be': 'design innovant, haute performance, convivial',
+        'sg': 'innovative design excellence, high performance technology, user-friendly interface, Singapore lifestyle integration',
+        'uk': 'innovative British design excellence, high performance engineering, user-friendly interface, sophisticated British lifestyle integration',
+        'au': 'innovative design excellence, high performance technology, user-friendly interface, Australian lifestyle integration',
+        'default': 'innovative design, high performance, user-friendly',
+    },
+    'trust': {
+        'jp': 'みんなが選ぶ安心, 長期保証, 日本品質基準, アフターサポート',
+        'es': 'recomendado por familias, garantía extendida, servicio al cliente',
+        'de': 'TÜV-geprüft, deutsche Qualitätsnormen, Zertifizierung, Compliance',
+        'fr': 'tradition française, savoir-faire, qualité artisanale, héritage',
+        'it': 'tradizione italiana, artigianato, qualità superiore, heritage',
+        'tr': '5 yıldızlı değerlendirmeler, para iade garantisi, müşteri memnuniyeti',
+        'sa': 'تقييمات 5 نجوم، ضمان استرداد المال، رضا العملاء',
+        'eg': 'تقييمات خمس نجوم، ضمان إرجاع الأموال، رضا العملاء',
+        'pl': '5-gwiazdkowe recenzje, gwarancja zwrotu pieniędzy, zadowolenie klientów',
+        'be': 'avis 5 étoiles, garantie de remboursement, satisfaction client',
+        'sg': '5-star Singapore reviews, money-back guarantee, customer satisfaction excellence, trusted by families',
+        'uk': '5-star British reviews, money-back guarantee, customer satisfaction excellence, trusted by UK families nationwide',
+        'au': '5-star Australian reviews, money-back guarantee, customer satisfaction excellence, trusted by Aussie families',
+        'default': '5-star reviews, money-back guarantee, customer satisfaction',
+    },
+    'usage': {
+        'jp': '日常使い, 様々な場面, 便利性, 効率アップ',
+        'es': 'uso cotidiano, vida familiar, versatilidad, comodidad',
+        'de': 'vielseitige Anwendung, Alltagstauglichkeit, praktisch, effizient',
+        'fr': "usage quotidien, polyvalence, praticité, élégance d'usage",
+        'it': 'uso quotidiano, versatilità italiana, praticità, stile di vita',
+        'tr': 'günlük kullanım, çok amaçlı, pratik, kullanışlı',
+        'sa': 'استخدام يومي، تطبيقات متنوعة، عملي، مريح',
+        'eg': 'استعمال يومي، تطبيقات متعددة، عملي، مريح',
+        'pl': 'codzienne użycie, wszechstronne zastosowania, praktyczny, wygodny',
+        'be': 'usage quotidien, applications polyvalentes, pratique, pratique',
+        'sg': 'everyday Singapore lifestyle, versatile HDB applications, practical urban living, convenient MRT-friendly',
+        'uk': 'everyday British lifestyle, versatile home applications, practical weather durability, convenient commuter-friendly',
+        'au': 'everyday Australian lifestyle, versatile home applications, practical outback durability, convenient city-friendly',
+        'default': 'everyday use, versatile applications, practical, convenient',
+    },
+    'quality': {
+        'jp': '品質管理, 検査基準, 製造工程, 信頼性テスト',
+        'es': 'control de calidad, estándares europeos, fabricación cuidadosa',
+        'de': 'Qualitätskontrolle, ISO-Standards, deutsche Fertigung, Prüfsiegel',
+        'fr': 'contrôle qualité, normes françaises, fabrication soignée',
+        'it': 'controllo qualità, standard italiani, manifattura eccellente',
+        'tr': 'kalite kontrol, TSE belgesi, CE sertifikası, 2 yıl garanti',
+        'sa': 'مراقبة الجودة، معايير سعودية، تصنيع معتمد، ضمان سنتين',
+        'eg': 'مراقبة الجودة، معايير مصرية، تصنيع معتمد، ضمان سنتان',
+        'pl': 'kontrola jakości, polskie standardy, certyfikowana doskonałość',
+        'be': 'contrôle qualité, normes belges, excellence certifiée',
+        'sg': 'quality control Singapore, SPRING standards, certified excellence, tropical climate tested',
+        'uk': 'quality control Britain, British Standards Institution, certified excellence, UK weather tested',
+        'au': 'quality control Australia, ACMA standards, certified excellence, extreme climate tested',
+        'default': 'quality control, manufacturing standards, certified excellence',
+    },
+    'social_proof': {
+        'jp': 'お客様満足度, 高評価レビュー, リピーター多数, 口コミ人気',
+        'es': 'testimonios reales, familias satisfechas, recomendaciones',
+        'de': 'Kundenbewertungen, Zufriedenheitsgarantie, Weiterempfehlung',
+        'fr': 'témoignages clients, satisfaction garantie, reconnaissance',
+        'it': 'testimonianze, soddisfazione clienti, raccomandazioni',
+        'tr': 'müşteri yorumları, doğrulanmış incelemeler, memnuniyet garantili',
+        'sa': 'شهادات العملاء، مراجعات موثقة، رضا مضمون',
+        'eg': 'شهادات العملاء، مراجعات موثقة، رضا مضمون',
+        'pl': 'opinie klientów, zweryfikowane recenzje, zadowolenie gwarantowane',
+        'be': 'témoignages clients, avis vérifiés, satisfaction garantie',
+        'sg': 'Singapore customer testimonials, verified family reviews, satisfaction guaranteed, multicultural trust',
+        'uk': 'British customer testimonials, verified family reviews, satisfaction guaranteed, authentic British trust',
+        'au': 'Australian customer testimonials, verified family reviews, satisfaction guaranteed, fair dinkum trust',
+        'default': 'customer testimonials, verified reviews, satisfaction guaranteed',
+    },
+    'comparison': {
+        'jp': '他社比較, 優位性, 選ばれる理由, 差別化ポイント',
+        'es': 'ventajas competitivas, mejor elección, diferencias clave',
+        'de': 'Wettbewerbsvorteil, Alleinstellungsmerkmal, Überlegenheit',
+        'fr': 'avantages concurrentiels, supériorité, choix optimal',
+        'it': 'vantaggi competitivi, superiorità, scelta migliore',
+        'tr': 'rekabet avantajı, üstün seçim, temel farklılıklar',
+        'sa': 'ميزة تنافسية، خيار متفوق، مميزات رئيسية',
+        'eg': 'ميزة تنافسية، الخيار الأفضل، مزايا أساسية',
+        'pl': 'przewaga konkurencyjna, najlepszy wybór, kluczowe różnice',
+        'be': 'avantage concurrentiel, choix supérieur, différenciateurs clés',
+        'sg': 'competitive advantage Singapore, superior choice excellence, key differentiators, Lion City quality',
+        'uk': 'competitive advantage Britain, superior choice excellence, key differentiators, British innovation heritage',
+        'au': 'competitive advantage Australia, superior choice excellence, key differentiators, Aussie innovation',
+        'default': 'competitive advantage, superior choice, key differentiators',
+    },
+    'package': {
+        'jp': '同梱内容, パッケージング, 付属品, 開封体験',
+        'es': 'contenido completo, empaque premium, accesorios incluidos',
+        'de': 'Lieferumfang, Verpackungsqualität, Zubehör, Vollständigkeit',
+        'fr': 'contenu livré, emballage soigné, accessoires inclus',
+        'it': 'contenuto confezione, imballaggio curato, accessori inclusi',
+        'tr': 'paket içeriği, premium ambalaj, dahil aksesuarlar',
+        'sa': 'محتويات العبوة، تغليف فاخر، إكسسوارات مدرجة',
+        'eg': 'محتويات الحزمة، تعبئة فاخرة، اكسسوارات مشمولة',
+        'pl': 'zawartość opakowania, premium pakowanie, dołączone akcesoria',
+        'be': 'contenu emballage, emballage premium, accessoires inclus',
+        'sg': 'complete package contents, premium Singapore packaging, included accessories, tropical-ready materials',
+        'uk': 'complete package contents, premium British packaging, included accessories, weather-resistant materials',
+        'au': 'complete package contents, premium Australian packaging, included accessories, extreme-weather materials',
+        'default': 'package contents, premium packaging, included accessories',
+    },
+    'faq': {
+        'jp': '詳しい説明, 心配解消, 使い方ガイド, トラブル対応',
+        'es': 'ayuda familiar, dudas comunes, consejos prácticos',
+        'de': 'technische Details, Bedienungsanleitung, Problemlösung',
+        'fr': "conseils d'expert, solutions élégantes, guide sophistiqué",
+        'it': 'supporto tecnico, guide dettagliate, assistenza italiana',
+        'tr': 'sık sorulan sorular, Türkçe destek, kullanım kılavuzu, problem çözümü',
+        'sa': 'أسئلة شائعة، دعم باللغة العربية، دليل الاستخدام، حل المشاكل',
+        'eg': 'أسئلة شائعة، دعم باللغة العربية، دليل الاستعمال، حل المشاكل',
+        'pl': 'szybkie odpowiedzi, rozwiązywanie problemów, przewodnik użytkownika',
+        'default': 'quick answers, troubleshooting, user guide',
+    },
+}
+
+# Category-specific overrides: (section type, marketplace): [(category substrings, keywords)]
+CATEGORY_SECTION_KEYWORDS = {
+    ('features', 'jp'): [
+        (('audio', 'headphone'), '高音質, ノイズキャンセリング, 長時間再生, 快適装着'),
+        (('kitchen',), '衛生的, 食洗機対応, 安全設計, 長持ち'),
+    ],
+}
+
+# Used for hero sections whose imageDescription is missing or shorter than 50 characters
+HERO_IMAGE_DESCRIPTIONS = {
+    'jp': '日本の家庭で安心して使用、清潔感と品質を重視 (970x600px)',
+    'es': 'Familia española disfrutando del producto, ambiente cálido (970x600px)',
+    'de': 'Deutsche Qualität und Präzision im modernen Zuhause (970x600px)',
+    'fr': 'Élégance française, sophistication au quotidien (970x600px)',
+    'default': 'Modern lifestyle, premium quality experience (970x600px)',
+}
+
+COLOR_SCHEMES = {
+    color: {'bg': f'bg-{color}-50', 'border': f'border-{color}-200', 'title': f'text-{color}-900'}
+    for color in ('blue', 'green', 'purple', 'orange', 'teal', 'indigo', 'pink', 'yellow')
+}
+
+SECTION_COLORS = {
+    'section1_hero': 'blue',
+    'section2_features': 'green',
+    'section3_usage': 'purple',
+    'section4_quality': 'orange',
+    'section5_guarantee': 'teal',
+    'section6_social_proof': 'indigo',
+    'section7_comparison': 'pink',
+    'section8_package': 'yellow',
+}
+
+# By plan key first, then by the section's cardType
+SECTION_ICONS = {
+    'section1_hero': '🚀',
+    'section2_features': '✨',
+    'section3_usage': '🎯',
+    'section4_quality': '🏆',
+    'section5_guarantee': '🛡️',
+    'section6_social_proof': '💬',
+    'section7_comparison': '📊',
+    'section8_package': '📦',
+    'hero': '🌟',
+    'features': '⚡',
+    'usage': '🔥',
+    'quality': '💎',
+    'guarantee': '🛡️',
+    'social': '🤝',
+    'comparison': '📈',
+    'package': '🎁',
+    'default': '💫',
+}
+
+# Cards the generator builds from the listing fields when the plan has no sections (and always for
+# Turkey): card kind -> marketplace -> texts. A text is a string or [(category substrings, text)]
+# ending in a () catch-all; first match wins.
+FALLBACK_CARD_TEXT = {
+    'hero': {
+        'jp': {
+            'keywords': 'プレミアム, 品質, 信頼性',
+            'image': 'ライフスタイル写真 (970x600px)',
+            'seo': '品質重視のSEO戦略',
+        },
+        'es': {
+            'keywords': 'premium, calidad, confianza',
+            'image': 'Imagen de estilo de vida (970x600px)',
+            'seo': 'Estrategia SEO de calidad',
+        },
+        'de': {
+            'keywords': 'Premium, Qualität, Vertrauen',
+            'image': 'Lifestyle-Bild (970x600px)',
+            'seo': 'Qualitätsfokussierte SEO-Strategie',
+        },
+        'fr': {
+            'keywords': 'premium, qualité, confiance',
+            'image': 'Image lifestyle (970x600px)',
+            'seo': 'Stratégie SEO axée qualité',
+        },
+        'tr': {
+            'keywords': 'premium kalite, güvenilir marka, müşteri memnuniyeti',
+            'image': [
+                (('audio', 'headphone'), 'ENGLISH: Turkish family in modern home during New Year celebration, father gaming with premium headset while children watch excitedly, warm festive lighting with traditional decorations in background, RGB headset glowing, quality time together, Turkish hospitality atmosphere visible (970x600px)'),
+                (('kitchen',), 'ENGLISH: Traditional Turkish kitchen during family gathering, grandmother using premium knife sharpener while family prepares feast together, warm lighting, fresh ingredients and traditional Turkish dishes, multi-generational cooking moment, hospitality elements visible (970x600px)'),
+                (('water', 'bottle'), 'ENGLISH: Active Turkish family at Bosphorus park during weekend, father drinking from large water bottle after outdoor activity, children playing nearby, golden sunset lighting, healthy lifestyle focus, Istanbul skyline in background, family values combined (970x600px)'),
+                ((), 'ENGLISH: Turkish family in modern home showcasing premium product, quality lifestyle focus, warm lighting, traditional hospitality values with modern functionality (970x600px)'),
+            ],
+            'seo': 'Kalite odaklı SEO stratejisi',
+        },
+        'sa': {
+            'keywords': 'جودة فائقة، علامة موثوقة، رضا العملاء',
+            'image': 'عائلة سعودية في منزل عصري أثناء عيد الفطر، الأب يلعب الألعاب بينما يشاهد الأطفال، إضاءة دافئة، السماعة ظاهرة مع إضاءة RGB، أجواء احتفالية (970x600px)',
+            'seo': 'استراتيجية تحسين محركات البحث المركزة على الجودة',
+        },
+        'in': {
+            'keywords': 'premium quality, trusted brand, customer satisfaction',
+            'image': 'Indian family in modern kitchen during festival preparation, mother using premium knife set to prepare dal sabzi while family gathers around, traditional spices and fresh vegetables visible, warm festive lighting with rangoli in background, perfect gifting moment (970x600px)',
+            'seo': 'Indian cooking and festival gifting focused SEO strategy',
+        },
+        'nl': {
+            'keywords': 'premium kwaliteit, betrouwbaar merk, klanttevredenheid',
+            'image': 'ENGLISH: Dutch lifestyle hero image with product (970x600px)',
+            'seo': 'Kwaliteit gerichte SEO strategie',
+        },
+        'pl': {
+            'keywords': 'premium jakość, zaufana marka, zadowolenie klientów',
+            'image': [
+                (('audio', 'headphone'), 'ENGLISH: Polish family in cozy living room during Christmas preparations, father gaming with premium headset while children watch excitedly, warm festive lighting with Christmas tree in background, RGB headset glowing, quality time together, traditional Polish decorations visible (970x600px)'),
+                (('kitchen',), 'ENGLISH: Traditional Polish kitchen during Christmas Eve preparation, grandmother using premium knife sharpener while family gathers around traditional wigilia table, warm lighting, fresh bread and traditional Polish dishes, multi-generational cooking moment, heritage elements visible (970x600px)'),
+                (('water', 'bottle'), 'ENGLISH: Active Polish family at outdoor park during weekend, father drinking from large water bottle after cycling, children playing nearby, morning sunlight, healthy lifestyle focus, Polish nature in background, fitness and family values combined (970x600px)'),
+                ((), 'ENGLISH: Polish family in modern home showcasing premium product, quality lifestyle focus, warm lighting, traditional values with modern functionality (970x600px)'),
+            ],
+            'seo': 'Strategia SEO skoncentrowana na jakości polskiej',
+        },
+        'be': {
+            'keywords': 'qualité premium, marque de confiance, satisfaction client',
+            'image': [
+                (('audio', 'headphone'), 'ENGLISH: Belgian family in elegant home during holiday celebration, father enjoying premium headset while family gathers around, warm festive lighting with European decorations, RGB headset glowing, quality time together, Belgian hospitality and sophistication visible (970x600px)'),
+                (('kitchen',), 'ENGLISH: Traditional Belgian kitchen during family meal preparation, grandmother using premium knife sharpener while family prepares European feast, warm lighting, fresh ingredients and traditional Belgian specialties, multi-generational cooking moment, European heritage elements visible (970x600px)'),
+                (('water', 'bottle'), 'ENGLISH: Active Belgian family at European countryside during weekend, father drinking from large water bottle after cycling, children playing nearby, golden sunlight, healthy lifestyle focus, Belgian landscapes in background, family values combined (970x600px)'),
+                ((), 'ENGLISH: Belgian family in modern European home showcasing premium product, quality lifestyle focus, warm lighting, traditional European values with modern functionality (970x600px)'),
+            ],
+            'seo': 'Stratégie SEO axée sur la qualité belge',
+        },
+        'sg': {
+            'keywords': 'premium quality Singapore excellence, trusted brand multicultural, customer satisfaction guaranteed Singapore',
+            'image': [
+                (('audio', 'headphone'), 'ENGLISH: Elegant Singaporean family in premium HDB apartment during Chinese New Year reunion celebration, father experiencing luxury gaming headset while multi-generational family shares prosperity feast, authentic red lanterns with Singapore skyline view, warm festive lighting, RGB headset illuminating modern Asian décor, harmony between traditional values and cutting-edge technology, Merlion visible through window, Singapore multicultural unity and hospitality essence captured (970x600px)'),
+                (('kitchen',), "ENGLISH: Contemporary Singapore HDB kitchen during festive meal preparation, experienced grandmother demonstrating premium knife sharpener while family prepares traditional laksa and bak kwa, efficient modern kitchen with Marina Bay view, fresh tropical ingredients and local hawker-inspired specialties, multi-generational cooking wisdom, Singapore's rich food heritage and innovation visible, authentic Lion City atmosphere (970x600px)"),
+                (('water', 'bottle'), 'ENGLISH: Active Singaporean family exercising at Marina Bay Sands area during golden hour weekend, father hydrating from premium water bottle after MRT commute and jogging, children playing with Gardens by the Bay backdrop, golden tropical sunlight filtering through urban canopy, healthy Singapore lifestyle focus, iconic landmarks including Singapore Flyer visible, modern tropical city living excellence (970x600px)'),
+                ((), "ENGLISH: Sophisticated Singaporean family in modern executive HDB showcasing premium product, quality lifestyle excellence focus, contemporary lighting with tropical ambiance, perfect blend of traditional Asian family values with Singapore's technological innovation and efficiency, multicultural harmony and Lion City prosperity visible, authentic Singapore living standard (970x600px)"),
+            ],
+            'seo': 'Advanced SEO strategy optimized for Singapore market excellence and multicultural search patterns',
+        },
+        'uk': {
+            'keywords': 'premium quality British excellence, trusted brand heritage, customer satisfaction guaranteed Britain',
+            'image': [
+                (('audio', 'headphone'), 'ENGLISH: Distinguished British family in elegant Georgian home during Boxing Day celebration, father enjoying premium gaming headset while multi-generational family gathers around traditional fireplace, festive Christmas decorations visible, warm ambient lighting, RGB headset complementing sophisticated British interior, harmony between British heritage and modern technology, Big Ben visible through window, authentic British refinement and tradition captured (970x600px)'),
+                (('kitchen',), "ENGLISH: Elegant British kitchen during Sunday roast preparation, experienced cook demonstrating premium knife sharpener while family prepares traditional Yorkshire pudding and beef roast, classic Shaker-style kitchen with countryside view, fresh British ingredients and seasonal vegetables, multi-generational cooking traditions, Britain's rich culinary heritage and innovation visible, authentic British home cooking excellence (970x600px)"),
+                (('water', 'bottle'), 'ENGLISH: Active British family exercising in Hyde Park during crisp autumn morning, father hydrating from premium water bottle after morning jog and cycling, children playing with London Eye backdrop, golden British sunlight filtering through changing leaves, healthy British outdoor lifestyle focus, iconic landmarks including Tower Bridge visible, modern British urban living excellence (970x600px)'),
+                ((), "ENGLISH: Sophisticated British family in refined home showcasing premium product, quality lifestyle excellence focus, natural lighting with British countryside ambiance, perfect blend of traditional British values with Britain's technological innovation and reliability, authentic British heritage and modern prosperity visible, distinguished British living standard (970x600px)"),
+            ],
+            'seo': 'Advanced SEO strategy optimized for British market excellence and sophisticated search patterns',
+        },
+        'au': {
+            'keywords': 'premium quality Australian excellence, trusted brand fair dinkum, customer satisfaction guaranteed Australia',
+            'image': [
+                (('audio', 'headphone'), 'ENGLISH: Authentic Australian family in modern Queensland home during Australia Day celebration, father experiencing premium gaming headset while multi-generational family enjoys backyard BBQ, Southern Cross visible in twilight sky, warm golden hour lighting, RGB headset illuminating contemporary Australian décor, harmony between laid-back Aussie culture and cutting-edge technology, Sydney Harbour Bridge visible in distance, Australian mateship and hospitality essence captured (970x600px)'),
+                (('kitchen',), "ENGLISH: Contemporary Australian kitchen during weekend family cooking, experienced grandmother demonstrating premium knife sharpener while family prepares traditional meat pies and pavlova, modern open-plan kitchen with bushland view, fresh local ingredients and Australian specialties, multi-generational cooking wisdom, Australia's rich culinary heritage and innovation visible, authentic Aussie fair dinkum atmosphere (970x600px)"),
+                (('water', 'bottle'), 'ENGLISH: Active Australian family exercising at Bondi Beach area during golden hour weekend, father hydrating from premium water bottle after surfing and beach run, children playing with Sydney Opera House backdrop, warm Australian sunlight filtering through coastal environment, healthy Aussie outdoor lifestyle focus, iconic landmarks including Harbour Bridge visible, modern Australian coastal living excellence (970x600px)'),
+                ((), "ENGLISH: Relaxed Australian family in modern home showcasing premium product, quality lifestyle excellence focus, natural lighting with outback ambiance, perfect blend of traditional Aussie values with Australia's technological innovation and efficiency, fair dinkum mateship and Australian prosperity visible, authentic Australian living standard (970x600px)"),
+            ],
+            'seo': 'Advanced SEO strategy optimized for Australian market excellence and fair dinkum search patterns',
+        },
+        'default': {
+            'keywords': 'premium, quality, trust',
+            'image': 'Hero lifestyle image (970x600px)',
+            'seo': 'Quality-focused SEO strategy',
+        },
+    },
+    'features': {
+        'jp': {
+            'keywords': [
+                (('audio', 'headphone'), '高音質, ノイズキャンセリング, 長時間再生, 快適装着'),
+                (('kitchen', 'cutting'), '衛生的, 食洗機対応, 安全設計, 長持ち'),
+                (('electronics',), '省エネ, 高性能, 操作簡単, 日本製品質'),
+                ((), '高品質, 安全性, 使いやすさ, 長期保証'),
+            ],
+            'image': [
+                (('audio', 'headphone'), '清潔な白背景で機能を精密に表示、日本語説明付き (1500x1500px)'),
+                (('kitchen',), '日本の台所で使用シーン、清潔感と機能性を強調 (1500x1500px)'),
+                ((), '機能詳細図解、日本語ラベル付き (1500x1500px)'),
+            ],
+            'seo': '機能キーワード最適化戦略',
+        },
+        'br': {
+            'keywords': [
+                (('audio', 'headphone'), 'som cristalino, cancelamento ruído, bateria longa, confortável'),
+                (('kitchen',), 'cozinha prática, família brasileira, durável, fácil limpeza'),
+                ((), 'qualidade premium, garantia estendida, suporte brasileiro'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'Pessoa usando fones em ambiente tropical, destaque para recursos técnicos com ícones coloridos (1500x1500px)'),
+                (('kitchen',), 'Cozinha brasileira moderna mostrando produto em uso, família preparando refeição (1500x1500px)'),
+                ((), 'Infográfico com recursos detalhados, cores vibrantes do Brasil (1500x1500px)'),
+            ],
+            'seo': 'Otimização para palavras-chave de recursos técnicos',
+        },
+        'mx': {
+            'keywords': [
+                (('audio', 'headphone'), 'sonido superior, cancelación ruido, batería duradera, comodidad total'),
+                (('kitchen',), 'cocina mexicana, tradición familiar, resistente, práctico'),
+                ((), 'calidad certificada, garantía mexicana, servicio local'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'Usuario disfrutando música en sala familiar mexicana, características destacadas con iconos (1500x1500px)'),
+                (('kitchen',), 'Cocina tradicional mexicana con producto destacado, familia reunida (1500x1500px)'),
+                ((), 'Gráfico de características con diseño mexicano colorido (1500x1500px)'),
+            ],
+            'seo': 'SEO optimizado para características técnicas en México',
+        },
+        'in': {
+            'keywords': [
+                (('audio', 'headphone'), 'superior sound, festival music, family entertainment, diwali gift perfect'),
+                (('kitchen', 'knife'), 'daily indian cooking, dal sabzi preparation, ginger garlic chopping, festival gifting ideal'),
+                ((), 'certified quality, indian warranty, festival gift ready, local service'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'Indian family enjoying festival music at home, features highlighted with rangoli decorations (1500x1500px)'),
+                (('kitchen', 'knife'), 'Indian mother preparing dal sabzi in traditional kitchen, knife set prominently displayed with fresh vegetables like onions ginger garlic, warm lighting (1500x1500px)'),
+                ((), 'Feature infographic with Indian festival motifs and family cooking focus (1500x1500px)'),
+            ],
+            'seo': 'SEO optimised for Indian cooking and gifting keywords',
+        },
+        'eg': {
+            'keywords': [
+                (('audio', 'headphone'), 'صوت فائق، إلغاء الضوضاء، بطارية طويلة، راحة العائلة المصرية'),
+                (('kitchen',), 'مطبخ مصري، تقاليد عائلية، تراث النيل، مقاوم، عملي'),
+                ((), 'جودة معتمدة، ضمان مصري، خدمة محلية، تراث فرعوني'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'مستخدم مصري يستمتع بالموسيقى في صالة عائلية مصرية، ميزات بارزة مع أيقونات مصرية (1500x1500px)'),
+                (('kitchen',), 'مطبخ مصري تقليدي مع المنتج البارز، عائلة مصرية مجتمعة، تراث النيل (1500x1500px)'),
+                ((), 'رسوم بيانية للميزات بتصميم مصري ملون، رموز فرعونية (1500x1500px)'),
+            ],
+            'seo': 'تحسين محركات البحث للميزات التقنية في مصر',
+        },
+        'sa': {
+            'keywords': [
+                (('audio', 'headphone'), 'صوت فائق، إلغاء الضوضاء، بطارية طويلة، راحة كاملة'),
+                (('kitchen',), 'مطبخ سعودي، تقاليد عائلية، مقاوم، عملي'),
+                ((), 'جودة معتمدة، ضمان سعودي، خدمة محلية'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'مستخدم يستمتع بالموسيقى في صالة عائلية سعودية، ميزات بارزة مع أيقونات (1500x1500px)'),
+                (('kitchen',), 'مطبخ سعودي تقليدي مع المنتج البارز، عائلة مجتمعة (1500x1500px)'),
+                ((), 'رسوم بيانية للميزات بتصميم سعودي ملون (1500x1500px)'),
+            ],
+            'seo': 'تحسين محركات البحث للميزات التقنية في السعودية',
+        },
+        'pl': {
+            'keywords': [
+                (('audio', 'headphone'), 'dźwięk doskonały, redukcja hałasu, bateria długotrwała, komfort rodzinny polski'),
+                (('kitchen',), 'kuchnia polska, tradycja rodzinna, wytrzymały, praktyczny'),
+                ((), 'jakość certyfikowana, gwarancja polska, serwis lokalny, tradycja katolicka'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'ENGLISH: Grid of 6 feature images: 1) Close-up on noise-canceling switch, 2) 50mm driver cross-section with sound waves, 3) battery indicator showing 30h, 4) RGB lights glowing, 5) bluetooth connected to phone and console, 6) Polish user wearing comfortably during gaming session'),
+                (('kitchen',), 'ENGLISH: Traditional Polish kitchen with product prominently displayed, Polish family gathered, heritage elements (1500x1500px)'),
+                ((), 'ENGLISH: Feature infographic with Polish colorful design elements (1500x1500px)'),
+            ],
+            'seo': 'SEO zoptymalizowane dla cech technicznych w Polsce',
+        },
+        'nl': {
+            'keywords': [
+                (('audio', 'headphone'), 'uitstekend geluid, ruisonderdrukking, lange batterij, comfortabel'),
+                (('kitchen',), 'praktisch keukengereedschap, duurzaam, makkelijk schoon'),
+                ((), 'Nederlandse kwaliteit, garantie, betrouwbaar'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'Nederlandse professional met koptelefoon in modern kantoor, technische details zichtbaar (1500x1500px)'),
+                (('kitchen',), 'Moderne Nederlandse keuken met product in gebruik, praktische toepassingen (1500x1500px)'),
+                ((), 'Technische specificaties overzicht, Nederlandse stijl design (1500x1500px)'),
+            ],
+            'seo': 'SEO voor technische kenmerken in Nederland',
+        },
+        'tr': {
+            'keywords': [
+                (('audio', 'headphone'), 'kristal ses, gürültü engelleme, uzun pil, rahat kullanım'),
+                (('kitchen',), 'Türk mutfağı, aile boyu, dayanıklı, kolay temizlik'),
+                ((), 'kalite belgeli, Türkiye garantisi, yerli destek'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'ENGLISH: Grid of 6 feature images: 1) Close-up on noise-canceling switch, 2) 50mm driver cross-section with sound waves, 3) battery indicator showing 30h, 4) RGB lights glowing, 5) bluetooth connected to phone and console, 6) Turkish user wearing comfortably during gaming session'),
+                (('kitchen',), 'ENGLISH: Traditional Turkish kitchen with product prominently displayed, Turkish family gathered around dining table, heritage elements and warm hospitality atmosphere (1500x1500px)'),
+                ((), 'ENGLISH: Turkish family using product in daily situations, home lifestyle applications with traditional hospitality elements (1500x1500px)'),
+            ],
+            'seo': "Teknik özellikler için SEO optimizasyonu Türkiye'de",
+        },
+        'es': {
+            'keywords': [
+                (('audio', 'headphone'), 'sonido cristalino, comodidad familiar, música perfecta'),
+                (('kitchen',), 'cocina familiar, ingredientes frescos, tradición culinaria'),
+                ((), 'calidad superior, diseño elegante, valor familiar'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'Familia española disfrutando música juntos, ambiente cálido (1500x1500px)'),
+                (('kitchen',), 'Cocina familiar española, preparando comida tradicional (1500x1500px)'),
+                ((), 'Infografía con estilo mediterráneo, colores cálidos (1500x1500px)'),
+            ],
+            'seo': 'Estrategia SEO de características',
+        },
+        'de': {
+            'keywords': [
+                (('audio', 'headphone'), 'Präzisionssound, deutsche Ingenieurskunst, Effizienz'),
+                (('kitchen',), 'Präzisionsschnitt, deutsche Qualität, Langlebigkeit'),
+                ((), 'Ingenieursqualität, Präzision, Zuverlässigkeit, Effizienz'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'Technische Präzision, Ingenieursqualität, deutsche Standards (1500x1500px)'),
+                (('kitchen',), 'Deutsche Küche, Präzision und Qualität im Detail (1500x1500px)'),
+                ((), 'Präzise Feature-Infografik, deutsche Ingenieurskunst (1500x1500px)'),
+            ],
+            'seo': 'Feature-SEO-Strategie',
+        },
+        'fr': {
+            'keywords': [
+                (('audio', 'headphone'), 'élégance sonore, raffinement français, art de vivre'),
+                (('kitchen',), 'art culinaire, raffinement, élégance française'),
+                ((), 'sophistication, élégance française, art de vivre, raffinement'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'Ambiance parisienne élégante, sophistication musicale (1500x1500px)'),
+                (('kitchen',), 'Art culinaire français, raffinement et élégance (1500x1500px)'),
+                ((), 'Infographie sophistiquée, style français raffiné (1500x1500px)'),
+            ],
+            'seo': 'Stratégie SEO des fonctionnalités',
+        },
+        'sg': {
+            'keywords': [
+                (('audio', 'headphone'), 'premium Singapore sound excellence, wireless MRT-friendly, all-day tropical comfort, multicultural audio experience'),
+                (('kitchen',), 'professional hawker-grade quality, easy tropical cleanup, modern HDB kitchen design, Singapore culinary innovation'),
+                ((), 'innovative Singapore design, high-performance tropical durability, user-friendly Lion City technology, premium multicultural quality'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'ENGLISH: Grid of 6 premium feature images: 1) Close-up noise-canceling switch with Singapore skyline reflection, 2) 50mm driver cross-section with sound waves over Marina Bay, 3) Battery indicator showing 30h with tropical humidity resistance, 4) RGB lights glowing against HDB apartment evening, 5) Bluetooth connected to phone and gaming console in modern Singapore home, 6) Multicultural Singaporean family wearing comfortably during gaming session with Gardens by the Bay backdrop (1500x1500px)'),
+                (('kitchen',), 'ENGLISH: Contemporary Singapore kitchen features grid: 1) Diamond disc precision with tropical durability coating, 2) Ceramic disc with anti-humidity protection, 3) Premium walnut handle with Singapore climate resistance, 4) 15/20 degree angle guides for Asian and Western cuisine, 5) Hawker-chef demonstrating professional technique, 6) Modern HDB kitchen with Marina Bay view showcasing efficiency (1500x1500px)'),
+                ((), 'ENGLISH: Dynamic Singapore features showcase: innovative design meeting tropical climate demands, efficiency-focused urban lifestyle, multicultural family harmony, Lion City quality standards, modern technology integration with traditional Asian values, Singapore excellence visible (1500x1500px)'),
+            ],
+            'seo': 'Advanced feature SEO strategy optimized for Singapore market and tropical lifestyle',
+        },
+        'uk': {
+            'keywords': [
+                (('audio', 'headphone'), 'premium British sound excellence, wireless commuter-friendly, all-day refined comfort, sophisticated audio experience'),
+                (('kitchen',), 'professional Sunday-roast quality, easy sophisticated cleanup, modern British kitchen design, refined culinary innovation'),
+                ((), 'innovative British design, high-performance weather durability, user-friendly sophisticated technology, premium refined quality'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'ENGLISH: Grid of 6 premium British feature images: 1) Close-up noise-canceling switch with London Thames reflection, 2) 50mm driver cross-section with sound waves over Stonehenge, 3) Battery indicator showing 30h with UK weather resistance, 4) RGB lights glowing against Scottish Highlands sunset, 5) Bluetooth connected to phone and gaming console in refined British home, 6) Distinguished British family wearing comfortably during gaming session with Buckingham Palace backdrop (1500x1500px)'),
+                (('kitchen',), 'ENGLISH: Classic British kitchen features grid: 1) Diamond disc precision with weather durability coating, 2) Ceramic disc with humidity and rain protection, 3) Premium oak handle with British climate resistance, 4) 15/20 degree angle guides for roast and traditional cuisine, 5) British chef demonstrating professional technique, 6) Traditional country kitchen with countryside view showcasing efficiency (1500x1500px)'),
+                ((), 'ENGLISH: Dynamic British features showcase: innovative design meeting changeable weather demands, heritage-focused lifestyle, sophisticated family harmony, British quality standards, modern technology integration with traditional British values, refined British excellence visible (1500x1500px)'),
+            ],
+            'seo': 'Advanced feature SEO strategy optimized for British market and sophisticated lifestyle',
+        },
+        'au': {
+            'keywords': [
+                (('audio', 'headphone'), 'premium Australian sound excellence, wireless outback-friendly, all-day extreme comfort, fair dinkum audio experience'),
+                (('kitchen',), 'professional BBQ-grade quality, easy extreme cleanup, modern Australian kitchen design, fair dinkum culinary innovation'),
+                ((), 'innovative Australian design, high-performance extreme durability, user-friendly Aussie technology, premium fair dinkum quality'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'ENGLISH: Grid of 6 premium Australian feature images: 1) Close-up noise-canceling switch with Sydney Harbour reflection, 2) 50mm driver cross-section with sound waves over Uluru, 3) Battery indicator showing 30h with extreme climate resistance, 4) RGB lights glowing against Queensland sunset, 5) Bluetooth connected to phone and gaming console in modern Australian home, 6) Fair dinkum Australian family wearing comfortably during gaming session with Great Barrier Reef backdrop (1500x1500px)'),
+                (('kitchen',), 'ENGLISH: Contemporary Australian kitchen features grid: 1) Diamond disc precision with extreme climate coating, 2) Ceramic disc with dust and humidity protection, 3) Premium eucalyptus handle with Australian climate resistance, 4) 15/20 degree angle guides for BBQ and traditional cuisine, 5) Aussie chef demonstrating professional technique, 6) Modern open-plan kitchen with bushland view showcasing efficiency (1500x1500px)'),
+                ((), 'ENGLISH: Dynamic Australian features showcase: innovative design meeting extreme climate demands, outdoor-focused lifestyle, mateship family harmony, fair dinkum quality standards, modern technology integration with traditional Aussie values, Australian excellence visible (1500x1500px)'),
+            ],
+            'seo': 'Advanced feature SEO strategy optimized for Australian market and extreme climate lifestyle',
+        },
+        'default': {
+            'keywords': [
+                (('audio', 'headphone'), 'premium sound, wireless freedom, all-day comfort'),
+                (('kitchen',), 'professional grade, easy cleanup, modern design'),
+                ((), 'innovative design, high performance, user-friendly, premium quality'),
+            ],
+            'image': [
+                (('audio', 'headphone'), 'Modern lifestyle, wireless freedom, urban setting (1500x1500px)'),
+                (('kitchen',), 'Modern American kitchen, innovative cooking (1500x1500px)'),
+                ((), 'Dynamic features showcase, innovation-focused (1500x1500px)'),
+            ],
+            'seo': 'Feature-focused SEO strategy',
+        },
+    },
+    'trust': {
+        'jp': {
+            'keywords': 'みんなが選ぶ安心, 長期保証, 日本品質基準, アフターサポート',
+            'image': '日本の家族が安心して使用、信頼の証、認証マーク (1200x800px)',
+            'seo': '信頼性重視のSEO戦略',
+        },
+        'br': {
+            'keywords': 'garantia estendida, certificado INMETRO, qualidade brasileira, nota fiscal',
+            'image': 'Selos de certificação brasileiros, depoimentos de clientes satisfeitos, garantia destacada (1200x800px)',
+            'seo': 'SEO focado em confiança e garantias',
+        },
+        'mx': {
+            'keywords': 'garantía mexicana, certificado calidad, recomendado familias, servicio local',
+            'image': 'Certificaciones mexicanas visibles, testimonios familias mexicanas, sellos de garantía (1200x800px)',
+            'seo': 'Estrategia SEO de confianza y calidad',
+        },
+        'in': {
+            'keywords': 'indian warranty ISI certified, quality certificate genuine, recommended by families, perfect gifting confidence, local service support',
+            'image': 'Indian quality certifications ISI BIS visible, happy Indian families using product during festival cooking, warranty certificate with GST invoice (1200x800px)',
+            'seo': 'SEO strategy for Indian trust and gifting confidence',
+        },
+        'eg': {
+            'keywords': 'ضمان مصري، شهادة جودة، موصى به من العائلات المصرية، خدمة محلية، تراث فرعوني',
+            'image': 'شهادات مصرية مرئية، شهادات من العائلات المصرية، أختام الضمان المصري، رموز تراثية (1200x800px)',
+            'seo': 'استراتيجية تحسين محركات البحث للثقة والجودة المصرية',
+        },
+        'sa': {
+            'keywords': 'ضمان سعودي، شهادة جودة، موصى به من العائلات، خدمة محلية',
+            'image': 'شهادات سعودية مرئية، شهادات من العائلات السعودية، أختام الضمان (1200x800px)',
+            'seo': 'استراتيجية تحسين محركات البحث للثقة والجودة',
+        },
+        'pl': {
+            'keywords': 'gwarancja polska, certyfikat jakości, polecane rodzinom polskim, serwis lokalny, tradycja katolicka',
+            'image': 'ENGLISH: Display of Polish certification badge, Poland flag icon, 2-year warranty card, customer review average 4.8 stars, presented in premium style with Catholic heritage elements',
+            'seo': 'Strategia SEO dla zaufania i jakości polskiej',
+        },
+        'nl': {
+            'keywords': 'CE keurmerk, Nederlandse garantie, betrouwbare kwaliteit, klantenservice',
+            'image': 'CE certificering zichtbaar, Nederlandse kwaliteitskeurmerken, garantiebewijzen (1200x800px)',
+            'seo': 'SEO strategie voor vertrouwen',
+        },
+        'tr': {
+            'keywords': 'TSE belgesi, CE sertifikası, 2 yıl garanti, Türkiye destek',
+            'image': 'ENGLISH: Display of Turkish certification badge, Turkey flag icon, 2-year warranty card, customer review average 4.8 stars, presented in premium style with Turkish hospitality elements',
+            'seo': "Güven ve kalite için SEO stratejisi Türkiye'de",
+        },
+        'es': {
+            'keywords': 'recomendado por familias, garantía extendida, servicio al cliente',
+            'image': 'Familia española recomendando producto, comunidad de confianza (1200x800px)',
+            'seo': 'Estrategia SEO de confianza',
+        },
+        'de': {
+            'keywords': 'TÜV-geprüft, deutsche Qualitätsnormen, Zertifizierung, Compliance',
+            'image': 'TÜV-Zertifikate, deutsche Qualitätsnormen, technische Prüfung (1200x800px)',
+            'seo': 'Vertrauens-SEO-Strategie',
+        },
+        'fr': {
+            'keywords': 'tradition française, savoir-faire, qualité artisanale, héritage',
+            'image': 'Tradition française, savoir-faire artisanal, héritage qualité (1200x800px)',
+            'seo': 'Stratégie SEO de confiance',
+        },
+        'default': {
+            'keywords': '5-star reviews, money-back guarantee, customer satisfaction, verified quality',
+            'image': 'Customer reviews, 5-star ratings, satisfaction guarantee (1200x800px)',
+            'seo': 'Trust-focused SEO strategy',
+        },
+    },
+    'usage': {
+        'tr': {
+            'title': 'Kullanım Alanları',
+            'content': 'Günlük kullanım, çok amaçlı uygulamalar, pratik ve kullanışlı çözümler sunar.',
+            'keywords': 'günlük kullanım, çok amaçlı, praktik, kullanışlı',
+            'image': 'ENGLISH: Turkish family using product in various daily situations, home lifestyle applications with traditional hospitality elements (1500x1500px)',
+            'seo': 'Kullanım senaryoları için SEO optimizasyonu',
+        },
+        'pl': {
+            'title': 'Zastosowania',
+            'content': 'Codzienne użytkowanie, wszechstronne zastosowania, praktyczne i wygodne rozwiązania dla polskiej rodziny.',
+            'keywords': 'codzienne użycie, wszechstronne zastosowania, praktyczny, wygodny',
+            'image': 'ENGLISH: Polish family using product in various daily situations, home lifestyle applications (1500x1500px)',
+            'seo': 'Strategia SEO dla zastosowań codziennych',
+        },
+        'default': {
+            'title': 'Applications',
+            'content': 'Everyday use, versatile applications, practical and convenient solutions.',
+            'keywords': 'everyday use, versatile applications, practical, convenient',
+            'image': 'Product in various use cases, lifestyle applications (1500x1500px)',
+            'seo': 'Usage-focused SEO strategy',
+        },
+    },
+    'comparison': {
+        'tr': {
+            'title': 'Neden Bu Ürünü Seçmelisiniz',
+            'content': 'Rakiplerinden üstün özellikler, daha iyi performans ve değer sunar.',
+            'keywords': 'rekabet avantajı, üstün seçim, temel farklılıklar',
+            'image': 'ENGLISH: Comparison table highlighting product advantages, Turkish quality standards (1200x800px)',
+            'seo': 'Karşılaştırma odaklı SEO',
+        },
+        'pl': {
+            'title': 'Dlaczego Wybrać Ten Produkt',
+            'content': 'Przewaga nad konkurencją dzięki lepszym funkcjom, wydajności i wartości dla polskich rodzin.',
+            'keywords': 'przewaga konkurencyjna, najlepszy wybór, kluczowe różnice',
+            'image': 'ENGLISH: Comparison table highlighting product advantages, Polish quality standards (1200x800px)',
+            'seo': 'SEO dla przewagi konkurencyjnej',
+        },
+        'default': {
+            'title': 'Why Choose This Product',
+            'content': 'Superior features, better performance and value compared to competitors.',
+            'keywords': 'competitive advantage, superior choice, key differentiators',
+            'image': 'Comparison table highlighting advantages (1200x800px)',
+            'seo': 'Comparison-focused SEO',
+        },
+    },
+    'testimonials': {
+        'tr': {
+            'title': 'Müşteri Deneyimleri',
+            'content': 'Müşteri memnuniyeti garantili, doğrulanmış yorumlar ve 5 yıldızlı deneyimler.',
+            'keywords': 'müşteri yorumları, doğrulanmış incelemeler, memnuniyet garantili',
+            'image': 'ENGLISH: Happy Turkish customers with 5-star ratings, family testimonials with hospitality elements (1200x800px)',
+            'seo': 'Sosyal kanıt SEO stratejisi',
+        },
+        'pl': {
+            'title': 'Zadowolenie Klientów',
+            'content': 'Zadowolenie klientów gwarantowane, zweryfikowane opinie i 5-gwiazdkowe doświadczenia polskich rodzin.',
+            'keywords': 'opinie klientów, zweryfikowane recenzje, zadowolenie gwarantowane',
+            'image': 'ENGLISH: Happy Polish customers with 5-star ratings, family testimonials (1200x800px)',
+            'seo': 'Strategia SEO dowodów społecznych',
+        },
+        'default': {
+            'title': 'Customer Satisfaction',
+            'content': 'Customer satisfaction guaranteed, verified reviews and 5-star experiences.',
+            'keywords': 'customer testimonials, verified reviews, satisfaction guaranteed',
+            'image': 'Happy customers with 5-star ratings (1200x800px)',
+            'seo': 'Social proof SEO strategy',
+        },
+    },
+    'package': {
+        'tr': {
+            'title': 'Paket İçeriği',
+            'content': 'Paket içeriği eksiksiz, premium ambalaj ve dahil edilen aksesuarlar.',
+            'keywords': 'paket içeriği, premium ambalaj, dahil aksesuarlar',
+            'image': 'ENGLISH: Unboxing view with contents neatly displayed, Turkish quality packaging (1200x800px)',
+            'seo': 'Paket içeriği SEO optimizasyonu',
+        },
+        'pl': {
+            'title': 'Zawartość Zestawu',
+            'content': 'Kompletna zawartość opakowania, premium pakowanie i dołączone akcesoria dla polskich klientów.',
+            'keywords': 'zawartość opakowania, premium pakowanie, dołączone akcesoria',
+            'image': 'ENGLISH: Unboxing view with contents neatly displayed, Polish quality packaging (1200x800px)',
+            'seo': 'SEO dla zawartości opakowania',
+        },
+        'default': {
+            'title': "What's Included",
+            'content': 'Complete package contents, premium packaging and included accessories.',
+            'keywords': 'package contents, premium packaging, included accessories',
+            'image': 'Unboxing view with contents displayed (1200x800px)',
+            'seo': 'Package contents SEO',
+        },
+    },
+    'faq': {
+        'jp': {
+            'keywords': '詳しい説明, 心配解消, 使い方ガイド, トラブル対応',
+            'image': '丁寧なサポートスタッフ、詳しい説明書、日本語対応 (800x600px)',
+            'seo': '問題解決SEO戦略',
+        },
+        'br': {
+            'keywords': 'dúvidas frequentes, suporte brasileiro, como usar, passo a passo',
+            'image': 'Atendimento brasileiro amigável, tutorial visual passo a passo, ícones explicativos (800x600px)',
+            'seo': 'Otimização SEO para perguntas frequentes',
+        },
+        'mx': {
+            'keywords': 'preguntas comunes, ayuda familiar, guía fácil, soporte mexicano',
+            'image': 'Servicio al cliente mexicano sonriente, guía visual paso a paso, iconos amigables (800x600px)',
+            'seo': 'SEO para preguntas frecuentes México',
+        },
+        'in': {
+            'keywords': 'indian cooking questions, beginner safety tips, stainless steel care, gifting guide help, family kitchen support',
+            'image': 'Indian customer service team explaining knife safety to beginner cook, step-by-step Indian cooking guide, kitchen safety icons (800x600px)',
+            'seo': 'SEO for Indian cooking questions and gifting guidance',
+        },
+        'eg': {
+            'keywords': 'أسئلة شائعة، مساعدة عائلية مصرية، دليل سهل، دعم مصري، تراث عائلي',
+            'image': 'خدمة عملاء مصرية مبتسمة، دليل مرئي خطوة بخطوة، أيقونات ودية مصرية، رموز تراثية (800x600px)',
+            'seo': 'تحسين محركات البحث للأسئلة الشائعة المصرية',
+        },
+        'sa': {
+            'keywords': 'أسئلة شائعة، مساعدة عائلية، دليل سهل، دعم سعودي',
+            'image': 'خدمة عملاء سعودية مبتسمة، دليل مرئي خطوة بخطوة، أيقونات ودية (800x600px)',
+            'seo': 'تحسين محركات البحث للأسئلة الشائعة السعودية',
+        },
+        'pl': {
+            'keywords': 'często zadawane pytania, pomoc rodzinna polska, przewodnik łatwy, wsparcie polskie, tradycja katolicka',
+            'image': 'ENGLISH: Smiling Polish customer service team explaining product features to Polish family, step-by-step visual guide, friendly Polish icons with Catholic heritage symbols (800x600px)',
+            'seo': 'SEO dla często zadawanych pytań polskich',
+        },
+        'nl': {
+            'keywords': 'veelgestelde vragen, praktische hulp, gebruiksaanwijzing, probleemoplossing',
+            'image': 'Duidelijke instructies met pictogrammen, stap-voor-stap handleiding, praktische tips (800x600px)',
+            'seo': 'SEO voor veelgestelde vragen',
+        },
+        'tr': {
+            'keywords': 'sık sorulan sorular, Türkçe destek, kullanım kılavuzu, problem çözümü',
+            'image': 'ENGLISH: Smiling Turkish customer service team explaining product features to Turkish family, step-by-step visual guide, friendly Turkish icons with hospitality elements (800x600px)',
+            'seo': "Sık sorulan sorular için SEO optimizasyonu Türkiye'de",
+        },
+        'es': {
+            'keywords': 'ayuda familiar, dudas comunes, consejos prácticos, guía fácil',
+            'image': 'Ayuda familiar amigable, guía fácil de entender (800x600px)',
+            'seo': 'Estrategia SEO de preguntas',
+        },
+        'de': {
+            'keywords': 'technische Details, Bedienungsanleitung, Problemlösung, Handbuch',
+            'image': 'Ausführliche Dokumentation, technische Anleitung, Präzision (800x600px)',
+            'seo': 'FAQ-SEO-Strategie',
+        },
+        'fr': {
+            'keywords': "conseils d'expert, solutions élégantes, guide sophistiqué, assistance",
+            'image': 'Guide élégant, assistance sophistiquée, style raffiné (800x600px)',
+            'seo': 'Stratégie SEO des questions',
+        },
+        'default': {
+            'keywords': 'quick answers, troubleshooting, user guide, instant help',
+            'image': 'Modern help center, instant answers, user-friendly design (800x600px)',
+            'seo': 'FAQ-focused SEO strategy',
+        },
+    },
+}
+
+# Titles of the generated cards that are not in FALLBACK_CARD_TEXT (hero uses the listing's hero title)
+FALLBACK_CARD_TITLES = {
+    'features': 'Key Features & Benefits',
+    'trust': 'Why Trust This Product',
+    'faq': 'Frequently Asked Questions',
+}
+
+# Colour, icon and subtitle of each generated card kind; subtitles are per marketplace with a default
+FALLBACK_CARD_STYLES = {
+    'hero': {'color': 'blue', 'icon': '🚀', 'subtitle': {
+        'default': 'Hero section with brand story and value proposition'}},
+    'features': {'color': 'green', 'icon': '⭐', 'subtitle': {
+        'default': 'Features section with product advantages and benefits', 'tr': 'Ürün özellikleri ve faydaları bölümü'}},
+    'trust': {'color': 'purple', 'icon': '🛡️', 'subtitle': {
+        'default': 'Trust section with quality assurance and guarantees', 'tr': 'Kalite güvencesi ve garantiler bölümü'}},
+    'usage': {'color': 'orange', 'icon': '🎯', 'subtitle': {
+        'default': 'Usage and application scenarios', 'tr': 'Kullanım alanları ve uygulama senaryoları'}},
+    'comparison': {'color': 'teal', 'icon': '🏆', 'subtitle': {
+        'default': 'Competitive advantages and key differentiators', 'tr': 'Rekabet avantajları ve temel farklılıklar'}},
+    'testimonials': {'color': 'pink', 'icon': '💬', 'subtitle': {
+        'default': 'Customer testimonials and satisfaction', 'tr': 'Müşteri yorumları ve memnuniyet'}},
+    'package': {'color': 'indigo', 'icon': '📦', 'subtitle': {
+        'default': 'Package contents and included items'}},
+    'faq': {'color': 'yellow', 'icon': '❓', 'subtitle': {
+        'default': 'FAQ section with common customer questions and answers'}},
+}
+
+# Bullet points starting with one of these are shown without their "EMOJI LABEL:" prefix
+BULLET_PREFIXES = ('🔋', '🎧', '⭐')
+
+# Page layout per marketplace: 'localized' prepends simple sections built from the listing
+# fields, 'comprehensive' stops after the keyword strategy, everything else gets the full page
+LOCALIZED_LAYOUT_MARKETS = ('es', 'jp', 'br', 'nl', 'se')
+COMPREHENSIVE_LAYOUT_MARKETS = ('tr', 'mx', 'sa', 'eg', 'in', 'pl', 'be', 'sg', 'au')
+
+DEFAULT_OVERALL_STRATEGY = 'Complete A+ content plan designed to guide customers from awareness to purchase'
+DEFAULT_KEYWORD_STRATEGY = 'Strategic keyword placement for maximum SEO impact'
+DEFAULT_COMPETITOR_KEYWORDS = 'Analysis of competitive landscape for positioning'
+DEFAULT_TRUST_ITEMS = ['Quality guaranteed', '30-day satisfaction', 'Customer support']
+
+
+class Template:
+    """
+    A str.format-style template ({name} fields only) split into literal chunks and field names
+    once. render() is a single join, several times faster than format() on multi-KB templates.
+    """
+
+    def __init__(self, source):
+        self.chunks = []
+        for literal, field, _, _ in string.Formatter().parse(source):
+            if literal:
+                self.chunks.append((True, literal))
+            if field is not None:
+                self.chunks.append((False, field))
+        self.source = source
+
+    def render(self, values):
+        return ''.join([chunk if literal else str(values[chunk]) for literal, chunk in self.chunks])
+
+
+DESIGN_ELEMENT = Template("""<span class="bg-indigo-100 text-indigo-800 px-2 py-1 rounded text-xs">{element}</span>""")
+
+VISUAL_TEMPLATE = Template("""
+        <div class="visual-template-generator bg-gradient-to-r from-indigo-50 to-purple-50 border border-indigo-200 rounded-lg p-4 mt-4">
+            <div class="flex items-center mb-3">
+                <span class="text-2xl mr-2">🎨</span>
+                <h4 class="text-indigo-900 font-semibold text-lg">A+ Visual Template Generator</h4>
+            </div>
+            
+            <div class="grid grid-cols-1 md:grid-cols-2 gap-4 mb-4">
+                <div class="template-brief bg-white p-3 rounded border">
+                    <h5 class="font-semibold text-gray-900 mb-2">📸 {template_type} Image Brief</h5>
+                    <div class="text-sm space-y-2">
+                        <div><strong>Title:</strong> {image_title}</div>
+                        <div><strong>Scene:</strong> {suggested_scene}</div>
+                        <div><strong>Overlay Text:</strong> "{overlay_text}"</div>
+                    </div>
+                </div>
+                
+                <div class="style-guide bg-white p-3 rounded border">
+                    <h5 class="font-semibold text-gray-900 mb-2">🎯 Design Guidelines</h5>
+                    <div class="text-sm space-y-2">
+                        <div><strong>Style:</strong> {style_guide}</div>
+                        <div><strong>Layout:</strong> {layout_structure}</div>
+                        <div><strong>Colors:</strong> {color_scheme}</div>
+                    </div>
+                </div>
+            </div>
+            
+            <div class="design-elements bg-white p-3 rounded border">
+                <h5 class="font-semibold text-gray-900 mb-2">🔧 Required Elements</h5>
+                <div class="flex flex-wrap gap-2">
+                    {design_elements}
+                </div>
+            </div>
+            
+            <div class="template-download mt-4 text-center">
+                <p class="text-xs text-gray-600 mb-2">💡 Copy this brief to Canva, Figma, or share with your designer</p>
+                <button class="bg-indigo-600 text-white px-4 py-2 rounded text-sm font-medium hover:bg-indigo-700 transition-colors">
+                    📄 Download PDF Brief
+                </button>
+            </div>
+        </div>""")
+
+# Keyword / image / SEO footer shared by the section cards
+SEO_DETAILS = """
+        <div class="seo-details mt-4">
+            <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
+                <div class="bg-white p-3 rounded border">
+                    <div class="flex items-center mb-2">
+                        <span class="mr-2">🔍</span>
+                        <strong class="text-gray-900">{keywords_label}</strong>
+                    </div>
+                    <p class="text-gray-600">{section_keywords}</p>
+                </div>
+                <div class="bg-white p-3 rounded border">
+                    <div class="flex items-center mb-2">
+                        <span class="mr-2">📸</span>
+                        <strong class="text-gray-900">{image_strategy_label}</strong>
+                    </div>
+                    <p class="text-gray-600">{image_desc}</p>
+                </div>
+                <div class="bg-white p-3 rounded border">
+                    <div class="flex items-center mb-2">
+                        <span class="mr-2">🎯</span>
+                        <strong class="text-gray-900">{seo_focus_label}</strong>
+                    </div>
+                    <p class="text-gray-600">{seo_note}</p>
+                </div>
+            </div>
+        </div>
+    </div>"""
+
+SECTION_CARD = Template("""
+    <div class="aplus-section-card {bg} {border} border-2 rounded-lg p-4 sm:p-6 mb-6 mx-2 sm:mx-0 shadow-sm hover:shadow-md transition-shadow">
+        <div class="flex items-center mb-4">
+            <span class="text-2xl sm:text-3xl mr-3">{icon}</span>
+            <div class="flex-1">
+                <h3 class="{title_color} text-xl sm:text-2xl font-bold">{section_title}</h3>
+                <p class="text-gray-600 text-sm mt-1">{card_type} section with detailed content and optimization</p>
+            </div>
+        </div>
+        <div class="content-section bg-white rounded-lg p-4 mb-4 border">
+            <p class="text-gray-700 leading-relaxed text-sm sm:text-base">{section_content}</p>
+        </div>
+        {visual_template_html}""" + SEO_DETAILS)
+
+FALLBACK_CARD = Template("""
+    <div class="aplus-section-card {bg} {border} border-2 rounded-lg p-4 sm:p-6 mb-6 mx-2 sm:mx-0 shadow-sm hover:shadow-md transition-shadow">
+        <div class="flex items-center mb-4">
+            <span class="text-2xl sm:text-3xl mr-3">{icon}</span>
+            <div class="flex-1">
+                <h3 class="{title_color} text-xl sm:text-2xl font-bold">{section_title}</h3>
+                <p class="text-gray-600 text-sm mt-1">{subtitle}</p>
+            </div>
+        </div>
+        <div class="content-section bg-white rounded-lg p-4 mb-4 border">
+            {body}
+        </div>""" + SEO_DETAILS)
+
+FALLBACK_TEXT_BODY = Template("""<p class="text-gray-700 leading-relaxed text-sm sm:text-base">{content}</p>""")
+
+FALLBACK_LIST_BODY = Template("""<ul class="text-gray-700 text-sm sm:text-base list-disc pl-5">
+                {items}
+            </ul>""")
+
+FALLBACK_FAQ_BODY = Template("""<div class="text-gray-700 text-sm sm:text-base">
+                {items}
+            </div>""")
+
+PPC_CAMPAIGN = Template("""
+        <div class="ppc-campaign">
+            <h4>{name}</h4>
+            <p><strong>Keywords:</strong> {keywords}</p>
+            <p><strong>Bid Strategy:</strong> {bid_strategy}</p>
+            <p><strong>Daily Budget:</strong> {budget}</p>
+            <p><strong>Target ACoS:</strong> {acos}</p>
+        </div>""")
+
+PPC_STRATEGY = Template("""
+<div class="ppc-strategy">
+    <h3>PPC Campaign Strategy</h3>
+    {campaigns}
+    <div class="ppc-negatives">
+        <h4>Negative Keywords Strategy</h4>
+        <p><strong>Immediate Negatives:</strong> {negatives}</p>
+        <p><strong>Strategy:</strong> {negative_strategy}</p>
+    </div>
+</div>""")
+
+# Introduction, hero, section cards, overall strategy, PPC and keyword strategy
+PAGE = Template("""<div class="aplus-introduction bg-gradient-to-r from-purple-50 to-pink-50 border border-purple-200 p-4 sm:p-6 rounded-lg mb-6">
+    <div class="flex items-center mb-4">
+        <span class="text-3xl mr-3">🚀</span>
+        <div>
+            <h2 class="text-xl sm:text-2xl font-bold text-gray-900">Complete A+ Content Strategy</h2>
+            <p class="text-purple-700 text-sm">Professional Amazon A+ content for enhanced product presentation.</p>
+        </div>
+    </div>
+    <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
+        <div class="bg-white p-3 rounded border">
+            <div class="flex items-center mb-2">
+                <span class="mr-2">🧠</span>
+                <strong class="text-gray-900">AI-Generated Briefs</strong>
+            </div>
+            <p class="text-gray-600">Complete image concepts with titles, scenes, and overlay text</p>
+        </div>
+        <div class="bg-white p-3 rounded border">
+            <div class="flex items-center mb-2">
+                <span class="mr-2">🎯</span>
+                <strong class="text-gray-900">Design Guidelines</strong>
+            </div>
+            <p class="text-gray-600">Style guides, color schemes, and layout specifications</p>
+        </div>
+        <div class="bg-white p-3 rounded border">
+            <div class="flex items-center mb-2">
+                <span class="mr-2">📤</span>
+                <strong class="text-gray-900">Ready for Production</strong>
+            </div>
+            <p class="text-gray-600">Copy briefs to Canva, Figma, or share with designers</p>
+        </div>
+    </div>
+</div>
+
+<div class="aplus-hero bg-gradient-to-r from-blue-50 to-indigo-50 p-4 sm:p-6 rounded-lg mb-6">
+    <h3 class="text-xl sm:text-2xl font-bold text-gray-900 mb-3">{hero_title}</h3>
+    <p class="text-gray-700 text-sm sm:text-base leading-relaxed">{hero_content}</p>
+</div>
+
+<div class="aplus-comprehensive-plan">
+    <h2 class="text-xl sm:text-2xl font-bold text-gray-900 mb-4 px-2 sm:px-0">Complete A+ Content Strategy</h2>
+    <div class="space-y-4 sm:space-y-6">
+        {sections}
+    </div>
+</div>
+
+<div class="aplus-strategy-summary bg-gray-50 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
+    <h3 class="text-lg sm:text-xl font-semibold text-gray-900 mb-3">Overall A+ Strategy</h3>
+    <p class="text-gray-700 text-sm sm:text-base leading-relaxed">{overall_strategy}</p>
+</div>
+
+<div class="mobile-responsive-content">
+    {ppc_html}
+</div>
+
+<div class="keyword-strategy bg-white border border-gray-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
+    <h3 class="text-lg sm:text-xl font-semibold text-gray-900 mb-3">Keyword Strategy</h3>
+    <p class="text-gray-700 text-sm sm:text-base mb-4">{keyword_strategy}</p>
+    <h4 class="text-md sm:text-lg font-medium text-gray-800 mb-2">Competitor Keywords</h4>
+    <p class="text-gray-600 text-sm sm:text-base">{competitor_keywords}</p>
+</div>""")
+
+# Features, box contents, trust, testimonials and FAQs (all layouts but the comprehensive one)
+PAGE_DETAILS = Template("""
+
+<div class="aplus-features bg-green-50 border border-green-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
+    <h3 class="text-lg sm:text-xl font-semibold text-green-900 mb-3">Key Features & Benefits</h3>
+    <ul class="space-y-1 sm:space-y-2 text-sm sm:text-base">
+{features_html}
+    </ul>
+</div>
+
+<div class="aplus-whats-in-box bg-purple-50 border border-purple-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
+    <h3 class="text-lg sm:text-xl font-semibold text-purple-900 mb-3">What's in the Box</h3>
+    <ul class="space-y-1 sm:space-y-2 text-sm sm:text-base text-gray-700">
+{whats_in_box_html}
+    </ul>
+</div>
+
+<div class="aplus-trust bg-orange-50 border border-orange-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
+    <h3 class="text-lg sm:text-xl font-semibold text-orange-900 mb-3">Trust & Quality Assurance</h3>
+    <ul class="space-y-1 sm:space-y-2 text-sm sm:text-base text-gray-700">
+{trust_html}
+    </ul>
+</div>
+
+<div class="aplus-testimonials bg-teal-50 border border-teal-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
+    <h3 class="text-lg sm:text-xl font-semibold text-teal-900 mb-3">Customer Satisfaction</h3>
+    <p class="text-gray-700 text-sm sm:text-base mb-3">{social_proof}</p>
+    <p class="text-gray-800 text-sm sm:text-base font-medium"><strong>Our Guarantee:</strong> {guarantee}</p>
+</div>
+
+<div class="aplus-faqs bg-indigo-50 border border-indigo-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
+    <h3 class="text-lg sm:text-xl font-semibold text-indigo-900 mb-4">Frequently Asked Questions</h3>
+    <div class="space-y-3 text-sm sm:text-base">
+{faqs_html}
+    </div>
+</div>""")
+
+LOCALIZED_SECTION = Template("""
+<div class="aplus-section {kind}-section-localized">
+    <h2 class="section-title">{title}</h2>
+    <div class="section-content">
+        {body}
+    </div>
+</div>""")
+
+LOCALIZED_PAGE = Template("""
+<div class="aplus-localized-content">
+    {sections}
+</div>
+{aplus_html}""")
+
+
+def market_labels(marketplace):
+    return MARKET_LABELS.get(marketplace, MARKET_LABELS['default'])
+
+
+def section_type(section_key):
+    """'hero', 'features', ... for a plan key such as 'section2_features', or None"""
+    key = section_key.lower()
+    for name, markers in SECTION_TYPES:
+        if any(marker in key for marker in markers):
+            return name
+    return None
+
+
+def section_keywords(kind, marketplace, category=''):
+    """Culturally adapted keywords shown on a section card of this type"""
+    for markers, keywords in CATEGORY_SECTION_KEYWORDS.get((kind, marketplace), ()):
+        if any(marker in category for marker in markers):
+            return keywords
+    table = SECTION_KEYWORDS[kind]
+    return table.get(marketplace, table['default'])
+
+
+def _text_list(value):
+    if isinstance(value, str):
+        return [value] if value else []
+    return list(value) if isinstance(value, (list, tuple)) else []
+
+
+def render_visual_template(visual_template):
+    if not isinstance(visual_template, dict) or not visual_template:
+        return ''
+    return VISUAL_TEMPLATE.render({
+        'template_type': str(visual_template.get('templateType', 'standard')).title(),
+        'image_title': visual_template.get('imageTitle', ''),
+        'suggested_scene': visual_template.get('suggestedScene', ''),
+        'overlay_text': visual_template.get('overlayText', ''),
+        'style_guide': visual_template.get('styleGuide', ''),
+        'layout_structure': visual_template.get('layoutStructure', ''),
+        'color_scheme': visual_template.get('colorScheme', ''),
+        'design_elements': ' '.join([DESIGN_ELEMENT.render({'element': element})
+                                     for element in _text_list(visual_template.get('designElements'))]),
+    })
+
+
+def render_section(section_key, section_data, marketplace, category='', labels=None):
+    """One section card. Known section types get the marketplace's keywords instead of the model's."""
+    labels = labels or market_labels(marketplace)
+    kind = section_type(section_key)
+    keywords = ', '.join(_text_list(section_data.get('keywords')))
+    if kind:
+        keywords = section_keywords(kind, marketplace, category)
+    image_desc = section_data.get('imageDescription', '')
+    if kind == 'hero' and (not image_desc or len(image_desc) < 50):
+        image_desc = HERO_IMAGE_DESCRIPTIONS.get(marketplace, HERO_IMAGE_DESCRIPTIONS['default'])
+
+    card_type = section_data.get('cardType', 'default')
+    card_color = section_data.get('cardColor', 'gray')
+    colors = COLOR_SCHEMES.get(SECTION_COLORS.get(section_key, card_color if card_color != 'default' else 'blue'),
+                               COLOR_SCHEMES['blue'])
+    return SECTION_CARD.render({
+        'bg': colors['bg'],
+        'border': colors['border'],
+        'title_color': colors['title'],
+        'icon': SECTION_ICONS.get(section_key, SECTION_ICONS.get(card_type, SECTION_ICONS['default'])),
+        'section_title': section_data.get('title', ''),
+        'card_type': str(card_type).title(),
+        'section_content': section_data.get('content', ''),
+        'visual_template_html': render_visual_template(section_data.get('visualTemplate')),
+        'keywords_label': labels['keywords'],
+        'image_strategy_label': labels['image_strategy'],
+        'seo_focus_label': labels['seo_focus'],
+        'section_keywords': keywords,
+        'image_desc': image_desc,
+        'seo_note': section_data.get('seoOptimization', ''),
+    })
+
+
+def plan_section_keys(plan):
+    """Keys of the plan entries rendered as section cards ('section1_hero' style), in plan order"""
+    if not isinstance(plan, dict):
+        return []
+    return [key for key, data in plan.items() if (key.startswith('section') or '_' in key) and isinstance(data, dict)]
+
+
+def render_sections(plan, marketplace, category=''):
+    """Section cards for every section of the plan, in plan order"""
+    labels = market_labels(marketplace)
+    category = (category or '').lower()
+    return [render_section(key, plan[key], marketplace, category, labels) for key in plan_section_keys(plan)]
+
+
+def _category_text(value, category):
+    if isinstance(value, str):
+        return value
+    for markers, text in value:
+        if not markers or any(marker in category for marker in markers):
+            return text
+    return ''
+
+
+def fallback_card(kind, marketplace, category='', **fields):
+    """Inputs of one generated card: the marketplace's texts for `kind`, overridden by `fields`"""
+    table = FALLBACK_CARD_TEXT.get(kind, {})
+    text = table.get(marketplace, table.get('default', {}))
+    card = {
+        'kind': kind,
+        'title': text.get('title', FALLBACK_CARD_TITLES.get(kind, '')),
+        'content': text.get('content', ''),
+        'keywords': _category_text(text.get('keywords', ''), category),
+        'imageDescription': _category_text(text.get('image', ''), category),
+        'seoOptimization': _category_text(text.get('seo', ''), category),
+    }
+    card.update(fields)
+    return card
+
+
+def _lines(value):
+    return value.split('\n') if isinstance(value, str) else list(value or [])
+
+
+def _clean_bullet(bullet):
+    bullet = bullet.strip()
+    if bullet.startswith(BULLET_PREFIXES):
+        parts = bullet.split(':', 1)
+        if len(parts) > 1:
+            bullet = parts[1].strip()
+    return bullet
+
+
+def fallback_cards(listing, marketplace, category=''):
+    """
+    Card inputs built from the listing fields, for plans without sections (Turkey always uses
+    them). Each card is a JSON-serializable dict for render_fallback_card.
+    """
+    category = (category or '').lower()
+    cards = []
+    if listing.hero_title and listing.hero_content:
+        cards.append(fallback_card('hero', marketplace, category,
+                                   title=listing.hero_title, content=listing.hero_content))
+    if listing.bullet_points or listing.features:
+        if listing.bullet_points:
+            items = [bullet for bullet in map(_clean_bullet, _lines(listing.bullet_points)[:6]) if bullet]
+        else:
+            items = _lines(listing.features)[:6]
+        cards.append(fallback_card('features', marketplace, category, items=items))
+    if listing.trust_builders:
+        cards.append(fallback_card('trust', marketplace, category,
+                                   items=_lines(listing.trust_builders)[:5]))
+    if listing.features or listing.hero_content:
+        cards.append(fallback_card('usage', marketplace, category))
+        cards.append(fallback_card('comparison', marketplace, category))
+    if listing.hero_content:
+        cards.append(fallback_card('testimonials', marketplace, category))
+    if listing.features:
+        cards.append(fallback_card('package', marketplace, category))
+    if listing.faqs:
+        cards.append(fallback_card('faq', marketplace, category, items=_lines(listing.faqs)[:5]))
+    return cards
+
+
+def render_fallback_card(card, marketplace, labels=None):
+    labels = labels or market_labels(marketplace)
+    kind = card.get('kind', 'usage')
+    style = FALLBACK_CARD_STYLES.get(kind, FALLBACK_CARD_STYLES['usage'])
+    colors = COLOR_SCHEMES[style['color']]
+    items = card.get('items')
+    if items is None:
+        body = FALLBACK_TEXT_BODY.render({'content': card.get('content', '')})
+    elif kind == 'faq':
+        body = FALLBACK_FAQ_BODY.render({'items': _items(items, "<div class='mb-3'><p class='font-semibold'>", '</p></div>')})
+    else:
+        body = FALLBACK_LIST_BODY.render({'items': _items(items, "<li class='mb-2'>", '</li>')})
+    return FALLBACK_CARD.render({
+        'bg': colors['bg'],
+        'border': colors['border'],
+        'title_color': colors['title'],
+        'icon': style['icon'],
+        'section_title': card.get('title', ''),
+        'subtitle': style['subtitle'].get(marketplace, style['subtitle']['default']),
+        'body': body,
+        'keywords_label': labels['keywords'],
+        'image_strategy_label': labels['image_strategy'],
+        'seo_focus_label': labels['seo_focus'],
+        'section_keywords': ', '.join(_text_list(card.get('keywords'))),
+        'image_desc': card.get('imageDescription', ''),
+        'seo_note': card.get('seoOptimization', ''),
+    })
+
+
+def render_fallback_cards(cards, marketplace):
+    labels = market_labels(marketplace)
+    return [render_fallback_card(card, marketplace, labels) for card in cards]
+
+
+def render_ppc(ppc_strategy):
+    campaign_structure = ppc_strategy.get('campaignStructure', {}) if isinstance(ppc_strategy, dict) else {}
+    if not isinstance(campaign_structure, dict) or not campaign_structure:
+        return ''
+    campaigns = []
+    for campaign_type, campaign in campaign_structure.items():
+        if isinstance(campaign, dict):
+            campaigns.append(PPC_CAMPAIGN.render({
+                'name': campaign.get('name') or campaign_type.replace('Campaign', ' Campaign').title(),
+                'keywords': ', '.join(campaign.get('keywords', [])) or campaign.get('targeting', ''),
+                'bid_strategy': campaign.get('bidStrategy', ''),
+                'budget': campaign.get('dailyBudget', ''),
+                'acos': campaign.get('targetAcos', ''),
+            }))
+    negatives = ppc_strategy.get('negativeKeywords', {})
+    return PPC_STRATEGY.render({
+        'campaigns': ''.join(campaigns),
+        'negatives': ', '.join(negatives.get('immediate', [])),
+        'negative_strategy': negatives.get('strategy', ''),
+    })
+
+
+def aplus_page(product, listing, result):
+    """Page-level inputs of the A+ document (everything besides the plan), JSON-serializable"""
+    return {
+        'hero_title': listing.hero_title,
+        'hero_content': listing.hero_content,
+        'features': listing.features.split('\n') if listing.features else [],
+        'whats_in_box': result.get('whatsInBox', [product.name, 'User manual', 'Warranty information']),
+        'trust': result.get('trustBuilders', DEFAULT_TRUST_ITEMS),
+        'faqs': result.get('faqs', []),
+        'social_proof': listing.social_proof,
+        'guarantee': listing.guarantee,
+        'keyword_strategy': result.get('keywordStrategy', DEFAULT_KEYWORD_STRATEGY),
+        'competitor_keywords': result.get('topCompetitorKeywords', DEFAULT_COMPETITOR_KEYWORDS),
+        'ppc_strategy': result.get('ppcStrategy', {}),
+        'trust_builders': listing.trust_builders,
+        'faqs_text': listing.faqs,
+    }
+
+
+def _items(values, prefix, suffix):
+    return '\n'.join(f"{prefix}{value}{suffix}" for value in values)
+
+
+def _localized_sections(page):
+    sections = []
+    if page.get('hero_title') and page.get('hero_content'):
+        sections.append(LOCALIZED_SECTION.render({
+            'kind': 'hero', 'title': page['hero_title'], 'body': f"<p>{page['hero_content']}</p>",
+        }))
+    features = [feature.strip() for feature in page.get('features') or [] if feature.strip()]
+    if page.get('features'):
+        sections.append(LOCALIZED_SECTION.render({
+            'kind': 'features', 'title': 'Features',
+            'body': '<ul>' + ''.join(f'<li>{feature}</li>' for feature in features) + '</ul>',
+        }))
+    trust = page.get('trust_builders') or ''
+    if trust:
+        if '\n' in trust:
+            body = '<ul>' + ''.join(f'<li>{item.strip()}</li>' for item in trust.split('\n') if item.strip()) + '</ul>'
+        else:
+            body = f'<p>{trust.strip()}</p>'
+        sections.append(LOCALIZED_SECTION.render({'kind': 'trust', 'title': 'Trust', 'body': body}))
+    faqs = page.get('faqs_text') or ''
+    if faqs:
+        faqs = faqs.replace('\n\n', '</p><p>').replace('\n', '<br>')
+        sections.append(LOCALIZED_SECTION.render({'kind': 'faqs', 'title': 'FAQs', 'body': f"<p>{faqs}</p>"}))
+    return sections
+
+
+def render_aplus(plan, page, marketplace, category='', sections=None):
+    """
+    The complete A+ document. `sections` replaces the cards rendered from the plan (the
+    generator passes its own when the plan had none); the layout depends on the marketplace.
+    """
+    plan = plan if isinstance(plan, dict) else {}
+    if sections is None:
+        sections = render_sections(plan, marketplace, category)
+    values = {
+        'hero_title': page.get('hero_title') or '',
+        'hero_content': page.get('hero_content') or '',
+        'sections': ''.join(sections),
+        'overall_strategy': plan.get('overallStrategy', DEFAULT_OVERALL_STRATEGY),
+        'ppc_html': render_ppc(page.get('ppc_strategy') or {}),
+        'keyword_strategy': page.get('keyword_strategy', DEFAULT_KEYWORD_STRATEGY),
+        'competitor_keywords': page.get('competitor_keywords', DEFAULT_COMPETITOR_KEYWORDS),
+    }
+    if marketplace in COMPREHENSIVE_LAYOUT_MARKETS:
+        return PAGE.render(values)
+
+    values.update({
+        'features_html': _items(_text_list(page.get('features')), '        <li>', '</li>'),
+        'whats_in_box_html': _items(_text_list(page.get('whats_in_box')), '        <li>', '</li>'),
+        'trust_html': _items(_text_list(page.get('trust', DEFAULT_TRUST_ITEMS)), '        <li>', '</li>'),
+        'faqs_html': _items(_text_list(page.get('faqs')), '    <p><strong>', '</strong></p>'),
+        'social_proof': page.get('social_proof') or '',
+        'guarantee': page.get('guarantee') or '',
+    })
+    html = PAGE.render(values) + PAGE_DETAILS.render(values)
+    if marketplace in LOCALIZED_LAYOUT_MARKETS:
+        localized = _localized_sections(page)
+        if localized:
+            return LOCALIZED_PAGE.render({'sections': ''.join(localized), 'aplus_html': html})
+    return html
+
+
+def stored_plan(plan, page, category='', cards=None):
+    """
+    What GeneratedListing.amazon_aplus_plan keeps: enough to re-render the document without the
+    model. `cards` (fallback_cards inputs) is only stored when the generator replaced the plan's
+    cards with its own; they are re-rendered through the current templates like the plan is.
+    """
+    stored = {'plan': plan if isinstance(plan, dict) else {}, 'page': page, 'category': category or ''}
+    if cards is not None:
+        stored['cards'] = list(cards)
+    return stored
+
+
+def render_stored_plan(stored, marketplace):
+    """render_aplus over a stored_plan() value"""
+    sections = None
+    if 'cards' in stored:
+        sections = render_fallback_cards(stored['cards'], marketplace)
+    return render_aplus(stored.get('plan') or {}, stored.get('page') or {}, marketplace,
+                        stored.get('category', ''), sections=sections)
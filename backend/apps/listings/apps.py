@@ -1,6 +1,15 @@
+import threading
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ListingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.listings'
\ No newline at end of file
+    name = 'apps.listings'
+
+    def ready(self):
+        if getattr(settings, 'PROMPT_FRAGMENT_WARMUP', False):
+            from .prompt_fragments import get_prompt_fragments
+            # Warm in the background so startup isn't blocked on rendering every fragment
+            threading.Thread(target=get_prompt_fragments().warm_up, name='prompt-fragment-warmup', daemon=True).start()
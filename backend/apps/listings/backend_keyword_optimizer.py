@@ -535,4 +535,14 @@ class BackendKeywordOptimizer:
             "keywords_count": keywords_count,
             "efficiency": efficiency,
             "wasted_chars": char_limit - current_length
-        }
\ No newline at end of file
+        }
+
+_shared_optimizer = None
+
+
+def get_backend_keyword_optimizer():
+    """Return the process-wide optimizer (its lookup tables are read-only, so one instance is shared)"""
+    global _shared_optimizer
+    if _shared_optimizer is None:
+        _shared_optimizer = BackendKeywordOptimizer()
+    return _shared_optimizer
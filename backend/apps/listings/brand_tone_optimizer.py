@@ -371,8 +371,9 @@ class BrandToneOptimizer:
             }
         }
     
-    def get_brand_tone_enhancement(self, brand_tone, marketplace='us'):
+    def get_brand_tone_enhancement(self, brand_tone, marketplace='us', rng=None):
         """Get comprehensive brand tone enhancement prompt"""
+        rng = rng or random
         
         if brand_tone not in self.tone_configurations:
             brand_tone = "professional"  # Default fallback
@@ -380,21 +381,21 @@ class BrandToneOptimizer:
         config = self.tone_configurations[brand_tone]
         
         # Randomly select elements for variety
-        title_starter = random.choice(config["title_starters"])
-        power_words = random.sample(config["power_words"], min(5, len(config["power_words"])))
+        title_starter = rng.choice(config["title_starters"])
+        power_words = rng.sample(config["power_words"], min(5, len(config["power_words"])))
         
         # Use localized labels for international marketplaces
         if marketplace == 'de' and "bullet_labels_de" in config:
-            bullet_labels = random.sample(config["bullet_labels_de"], min(4, len(config["bullet_labels_de"])))
+            bullet_labels = rng.sample(config["bullet_labels_de"], min(4, len(config["bullet_labels_de"])))
         elif marketplace == 'es' and "bullet_labels_es" in config:
-            bullet_labels = random.sample(config["bullet_labels_es"], min(4, len(config["bullet_labels_es"])))
+            bullet_labels = rng.sample(config["bullet_labels_es"], min(4, len(config["bullet_labels_es"])))
         elif marketplace == 'jp' and "bullet_labels_jp" in config:
             # For Japanese marketplace, include ALL labels for comprehensive cultural adaptation
             bullet_labels = config["bullet_labels_jp"][:4]  # Take first 4 consistently for testing
         else:
-            bullet_labels = random.sample(config["bullet_labels"], min(4, len(config["bullet_labels"])))
+            bullet_labels = rng.sample(config["bullet_labels"], min(4, len(config["bullet_labels"])))
             
-        description_hook = random.choice(config["description_hooks"])
+        description_hook = rng.choice(config["description_hooks"])
         
         enhancement = f"""
 🎨 CRITICAL BRAND TONE OPTIMIZATION FOR {brand_tone.upper()} 🎨
@@ -0,0 +1,308 @@
+"""
+Bulk Catalog Generation
+Imports a CSV/JSON catalog as Product rows (bulk_create), records one BulkGenerationItem per
+product/platform as the durable checkpoint, and works through the pending items with a
+bounded worker pool. Provider pacing comes from the shared LLM gateway, so raising the
+worker count never exceeds the configured rate limits. Interrupted batches resume from
+whatever items are not completed yet.
+"""
+
+import csv
+import io
+import json
+import logging
+import threading
+import time
+import concurrent.futures
+from datetime import timedelta
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.core.models import Product
+from .models import BulkGenerationBatch, BulkGenerationItem
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_PLATFORMS = ['amazon', 'walmart', 'etsy', 'tiktok', 'shopify']
+
+# Default content language per marketplace (mirrors the product form)
+MARKETPLACE_LANGUAGES = {
+    'us': 'en', 'ca': 'en', 'uk': 'en', 'de': 'de', 'fr': 'fr', 'it': 'it', 'es': 'es',
+    'nl': 'nl', 'se': 'sv', 'pl': 'pl', 'be': 'fr', 'jp': 'ja', 'in': 'en', 'sg': 'en',
+    'ae': 'ar', 'mx': 'es-mx', 'sa': 'ar', 'br': 'pt-br', 'au': 'en', 'tr': 'tr', 'eg': 'ar',
+    'walmart_usa': 'en', 'walmart_canada': 'en', 'walmart_mexico': 'es-mx', 'etsy': 'en',
+}
+
+PRODUCT_TEXT_FIELDS = [
+    'description', 'brand_tone', 'brand_persona', 'target_audience', 'categories', 'features',
+    'target_keywords', 'occasion', 'seo_keywords', 'long_tail_keywords', 'faqs', 'whats_in_box',
+    'asin', 'competitor_asins', 'competitor_urls', 'product_urls',
+]
+
+
+class CatalogError(Exception):
+    """Raised for malformed catalog input"""
+
+
+class BatchBusyError(Exception):
+    """Raised when a batch still has a live runner"""
+
+
+def _split(value):
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [v.strip() for v in str(value or '').replace('|', ',').replace(';', ',').split(',') if v.strip()]
+
+
+def parse_catalog(content, fmt=None):
+    """Parse CSV or JSON catalog text into a list of product definition dicts"""
+    if isinstance(content, bytes):
+        content = content.decode('utf-8-sig')
+    fmt = fmt or ('json' if content.lstrip().startswith(('[', '{')) else 'csv')
+
+    if fmt == 'json':
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise CatalogError(f"Invalid JSON catalog: {e}")
+        rows = data.get('products', []) if isinstance(data, dict) else data
+    elif fmt == 'csv':
+        rows = list(csv.DictReader(io.StringIO(content)))
+    else:
+        raise CatalogError(f"Unsupported catalog format: {fmt}")
+
+    if not isinstance(rows, list) or not rows:
+        raise CatalogError("Catalog contains no products")
+
+    definitions = []
+    for index, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            raise CatalogError(f"Row {index}: expected an object")
+        row = {str(k).strip(): v for k, v in row.items() if k}
+        if not str(row.get('name') or '').strip() or not str(row.get('brand_name') or '').strip():
+            raise CatalogError(f"Row {index}: 'name' and 'brand_name' are required")
+        definitions.append(row)
+    return definitions
+
+
+def _parse_price(value):
+    if value in (None, ''):
+        return None
+    try:
+        return Decimal(str(value).replace('$', '').replace(',', '').strip())
+    except InvalidOperation:
+        return None
+
+
+def create_batch(definitions, platforms, marketplaces=None, user=None, name=''):
+    """
+    Create Products (one per definition x marketplace) with bulk_create, plus one pending item per
+    product x platform. Rows may override the batch defaults with 'platforms'/'marketplaces' columns.
+    """
+    platforms = _split(platforms)
+    marketplaces = _split(marketplaces) or ['us']
+    unknown = [p for p in platforms if p not in SUPPORTED_PLATFORMS]
+    if not platforms or unknown:
+        raise CatalogError(f"Unsupported platforms: {unknown or 'none given'}")
+
+    if user is None:
+        from django.contrib.auth.models import User
+        user, _ = User.objects.get_or_create(
+            username='demo_user',
+            defaults={'email': 'demo@listory.ai', 'first_name': 'Demo', 'last_name': 'User'}
+        )
+
+    products = []
+    product_platforms = []
+    for row in definitions:
+        row_platforms = _split(row.get('platforms')) or platforms
+        for marketplace in _split(row.get('marketplaces') or row.get('marketplace')) or marketplaces:
+            fields = {field: str(row.get(field) or '') for field in PRODUCT_TEXT_FIELDS}
+            products.append(Product(
+                user=user,
+                name=str(row['name']).strip(),
+                brand_name=str(row['brand_name']).strip(),
+                target_platform=row_platforms[0],
+                marketplace=marketplace,
+                marketplace_language=row.get('marketplace_language') or MARKETPLACE_LANGUAGES.get(marketplace, 'en'),
+                price=_parse_price(row.get('price')),
+                **fields
+            ))
+            product_platforms.append(row_platforms)
+
+    with transaction.atomic():
+        batch = BulkGenerationBatch.objects.create(
+            name=name,
+            platforms=','.join(platforms),
+            marketplaces=','.join(marketplaces),
+        )
+        Product.objects.bulk_create(products, batch_size=500)
+        items = [
+            BulkGenerationItem(batch=batch, product=product, platform=platform)
+            for product, row_platforms in zip(products, product_platforms)
+            for platform in row_platforms
+        ]
+        BulkGenerationItem.objects.bulk_create(items, batch_size=500)
+        batch.total_items = len(items)
+        batch.save(update_fields=['total_items', 'updated_at'])
+
+    logger.info(f"Bulk batch {batch.id}: {len(products)} products, {len(items)} generation items")
+    return batch
+
+
+def batch_progress(batch):
+    """Aggregate progress, throughput (items/min) and ETA for a batch"""
+    batch.refresh_from_db()
+    done = batch.completed_items + batch.failed_items
+    remaining = max(0, batch.total_items - done)
+    elapsed = 0.0
+    if batch.started_at:
+        end = batch.finished_at or timezone.now()
+        elapsed = max(0.0, (end - batch.started_at).total_seconds())
+    throughput = (done / elapsed * 60.0) if elapsed and done else 0.0
+    eta_seconds = (remaining / throughput * 60.0) if throughput else None
+    return {
+        'batch_id': batch.id,
+        'status': batch.status,
+        'total_items': batch.total_items,
+        'completed_items': batch.completed_items,
+        'failed_items': batch.failed_items,
+        'remaining_items': remaining,
+        'percent_complete': round(done / batch.total_items * 100, 1) if batch.total_items else 0.0,
+        'elapsed_seconds': round(elapsed, 1),
+        'throughput_per_minute': round(throughput, 2),
+        'eta_seconds': round(eta_seconds, 1) if eta_seconds is not None else None,
+    }
+
+
+def _lease_cutoff():
+    return timezone.now() - timedelta(seconds=getattr(settings, 'BULK_BATCH_LEASE_SECONDS', 300))
+
+
+def batch_is_live(batch):
+    """A running batch whose runner checked in (updated_at heartbeat) within the lease"""
+    return batch.status == 'running' and batch.updated_at >= _lease_cutoff()
+
+
+def claim_batch(batch_id):
+    """
+    Atomically take over a batch for this runner. A batch that is running with a fresh
+    heartbeat belongs to another runner: BatchBusyError.
+    """
+    now = timezone.now()
+    claimed = BulkGenerationBatch.objects.filter(id=batch_id).filter(
+        Q(status__in=['pending', 'failed', 'completed']) | Q(status='running', updated_at__lt=_lease_cutoff())
+    ).update(status='running', started_at=Coalesce(F('started_at'), now), finished_at=None, updated_at=now)
+    if not claimed:
+        if not BulkGenerationBatch.objects.filter(id=batch_id).exists():
+            raise BulkGenerationBatch.DoesNotExist(f"Bulk batch {batch_id} not found")
+        raise BatchBusyError(f"Bulk batch {batch_id} is already running")
+
+
+def _heartbeat(batch_id):
+    BulkGenerationBatch.objects.filter(id=batch_id, status='running').update(updated_at=timezone.now())
+
+
+def _claim_next(batch_id):
+    """Atomically move one pending item to processing; returns it or None when the batch is drained"""
+    while True:
+        item = BulkGenerationItem.objects.filter(batch_id=batch_id, status='pending').order_by('id').first()
+        if item is None:
+            return None
+        claimed = BulkGenerationItem.objects.filter(id=item.id, status='pending').update(status='processing')
+        if claimed:
+            return item
+
+
+def _process_item(item, bypass_cache=False):
+    from .services import ListingGeneratorService
+
+    started = time.monotonic()
+    try:
+        listing = ListingGeneratorService(bypass_cache=bypass_cache).generate_listing(item.product_id, item.platform)
+        ok = listing.status == 'completed'
+        item.listing = listing
+        item.status = 'completed' if ok else 'failed'
+        item.error_message = '' if ok else (listing.error_message or 'Generation did not complete')
+    except Exception as e:
+        item.status = 'failed'
+        item.error_message = str(e)[:1000]
+    item.duration = time.monotonic() - started
+    item.finished_at = timezone.now()
+    item.save(update_fields=['listing', 'status', 'error_message', 'duration', 'finished_at'])
+
+    counter = 'completed_items' if item.status == 'completed' else 'failed_items'
+    BulkGenerationBatch.objects.filter(id=item.batch_id).update(**{counter: F(counter) + 1}, updated_at=timezone.now())
+    return item
+
+
+def run_batch(batch_id, workers=None, bypass_cache=False, progress_callback=None, progress_interval=10):
+    """
+    Work through a batch's pending items with a bounded pool of workers.
+    The batch is claimed first (BatchBusyError while another runner holds it); items left in
+    'processing' by a crashed run are then reset to 'pending', so calling this again on the
+    same batch resumes where it stopped.
+    """
+    workers = workers or getattr(settings, 'BULK_GENERATION_WORKERS', 4)
+    claim_batch(batch_id)
+    batch = BulkGenerationBatch.objects.get(id=batch_id)
+
+    reset = BulkGenerationItem.objects.filter(batch=batch, status='processing').update(status='pending')
+    if reset:
+        logger.info(f"Bulk batch {batch_id}: resuming {reset} interrupted item(s)")
+
+    # Counters are recomputed from the checkpoint rows so a resume never double counts
+    batch.completed_items = batch.items.filter(status='completed').count()
+    batch.failed_items = batch.items.filter(status='failed').count()
+    batch.save(update_fields=['completed_items', 'failed_items', 'updated_at'])
+
+    stop = threading.Event()
+
+    def worker():
+        try:
+            while not stop.is_set():
+                item = _claim_next(batch_id)
+                if item is None:
+                    return
+                _process_item(item, bypass_cache=bypass_cache)
+        finally:
+            close_old_connections()
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bulk-worker') as pool:
+            futures = [pool.submit(worker) for _ in range(workers)]
+            try:
+                while True:
+                    done, _ = concurrent.futures.wait(futures, timeout=progress_interval)
+                    _heartbeat(batch_id)  # Keeps the lease while items are in flight
+                    if progress_callback:
+                        progress_callback(batch_progress(batch))
+                    if len(done) == len(futures):
+                        break
+            except KeyboardInterrupt:
+                # Finish in-flight items, leave the rest pending for a later resume
+                stop.set()
+                raise
+            for future in futures:
+                future.result()
+    except KeyboardInterrupt:
+        # In-flight items are done (the pool waited for them); release the lease so a resume can
+        # claim the batch straight away instead of waiting for it to go stale
+        now = timezone.now()
+        BulkGenerationBatch.objects.filter(id=batch_id, status='running').update(
+            status='failed', finished_at=now, updated_at=now
+        )
+        raise
+
+    batch.refresh_from_db()
+    batch.status = 'completed' if not batch.items.exclude(status__in=['completed', 'failed']).exists() else 'failed'
+    batch.finished_at = timezone.now()
+    batch.save(update_fields=['status', 'finished_at', 'updated_at'])
+    progress = batch_progress(batch)
+    logger.info(f"Bulk batch {batch_id} finished: {progress}")
+    return progress
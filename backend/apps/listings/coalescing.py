@@ -0,0 +1,145 @@
+"""
+Generation Request Coalescing
+Concurrent requests for the same product inputs + platform + marketplace share one
+in-flight generation (single-flight) instead of each paying for its own OpenAI calls.
+- Threads in one process wait on the leader's result directly.
+- Other processes/workers find the leader's listing through a marker in Django's cache
+  and wait for that row to finish.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+MARKER_PREFIX = 'listing:inflight:'
+
+# Product inputs that influence the generated content
+FINGERPRINT_FIELDS = [
+    'user_id', 'name', 'description', 'brand_name', 'brand_tone', 'brand_persona',
+    'target_audience', 'price', 'categories', 'features', 'target_keywords', 'occasion',
+    'seo_keywords', 'long_tail_keywords', 'faqs', 'whats_in_box', 'competitor_asins',
+    'competitor_urls', 'product_urls', 'asin', 'marketplace_language',
+]
+
+
+def listing_fingerprint(product, platform):
+    """Stable hash of the product inputs plus platform and marketplace"""
+    payload = {field: str(getattr(product, field, '') or '') for field in FINGERPRINT_FIELDS}
+    payload['platform'] = platform
+    payload['marketplace'] = getattr(product, 'marketplace', 'us') or 'us'
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """In-process single-flight: one leader runs fn, concurrent callers with the same key share its outcome"""
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                flight.followers += 1
+                self.coalesced += 1
+
+        if not leader:
+            logger.info(f"Coalesced duplicate generation {key[:12]} onto in-flight request")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight():
+    return _single_flight
+
+
+def _cache():
+    from django.core.cache import caches
+    return caches[getattr(settings, 'LISTING_COALESCE_CACHE_ALIAS', 'default')]
+
+
+def claim_inflight(fingerprint, listing_id):
+    """
+    Register listing_id as the in-flight generation for fingerprint.
+    Returns the id of the listing that owns the flight (listing_id itself when we won).
+    """
+    key = MARKER_PREFIX + fingerprint
+    ttl = getattr(settings, 'LISTING_COALESCE_TTL', 600)
+    try:
+        if _cache().add(key, listing_id, timeout=ttl):
+            return listing_id
+        return _cache().get(key) or listing_id
+    except Exception as e:
+        logger.warning(f"Coalescing marker unavailable: {e}")
+        return listing_id
+
+
+def find_inflight(fingerprint):
+    try:
+        return _cache().get(MARKER_PREFIX + fingerprint)
+    except Exception as e:
+        logger.warning(f"Coalescing marker unavailable: {e}")
+        return None
+
+
+def release_inflight(fingerprint, listing_id):
+    """Drop the marker if it still points at listing_id"""
+    key = MARKER_PREFIX + fingerprint
+    try:
+        if _cache().get(key) == listing_id:
+            _cache().delete(key)
+    except Exception as e:
+        logger.warning(f"Could not release coalescing marker: {e}")
+
+
+def wait_for_listing(listing_id, timeout=None, poll_interval=1.0):
+    """Block until another worker's listing leaves pending/processing; returns it (or None if it vanished)"""
+    from .models import GeneratedListing
+
+    timeout = timeout or getattr(settings, 'LISTING_COALESCE_TTL', 600)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            listing = GeneratedListing.objects.get(id=listing_id)
+        except GeneratedListing.DoesNotExist:
+            return None
+        if listing.status in ('completed', 'failed') or time.monotonic() >= deadline:
+            return listing
+        time.sleep(poll_interval)
@@ -0,0 +1,31 @@
+"""
+Shared LLM Executor
+One bounded thread pool per process for running independent LLM calls concurrently,
+so parallel generation never opens more provider connections than the pool allows.
+Pipeline steps (see pipeline.py) are scheduled on it.
+"""
+
+import concurrent.futures
+import logging
+import threading
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_llm_executor():
+    """Return the process-wide bounded executor for LLM branches"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'LLM_EXECUTOR_MAX_WORKERS', 16),
+                    thread_name_prefix='llm-branch',
+                )
+    return _executor
+
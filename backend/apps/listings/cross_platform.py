@@ -0,0 +1,402 @@
+"""
+Cross-Platform Derivation
+Builds a Walmart, Shopify or TikTok listing from a completed listing of the same product on
+another platform with local, rule-based transformations (title shortening, bullet-to-feature
+rewriting, meta descriptions, hooks, hashtags). Fields that can't be derived are asked of a
+small model in one targeted call, so a second platform costs seconds instead of a full generation.
+"""
+
+import html
+import json
+import logging
+import re
+
+from django.conf import settings
+
+from .bulk import MARKETPLACE_LANGUAGES
+from .json_repair import parse_llm_json
+from .models import GeneratedListing
+from .section_regeneration import LANGUAGE_NAMES
+
+logger = logging.getLogger(__name__)
+
+# Source platforms in order of preference: Amazon listings carry the most structure
+SOURCE_PLATFORMS = ['amazon', 'etsy', 'walmart']
+DERIVED_PLATFORMS = ('walmart', 'shopify', 'tiktok')
+
+WALMART_TITLE_LIMIT = 70
+WALMART_FEATURE_LIMIT = 80
+WALMART_MIN_DESCRIPTION_WORDS = 150
+SHOPIFY_SEO_TITLE_LIMIT = 70
+SHOPIFY_META_LIMIT = 160
+TIKTOK_TITLE_LIMIT = 100
+
+# Fields no other platform carries, so they always go to the model. Walmart's profit_maximizer is
+# seller planning, not listing content, so derived listings leave it blank.
+ALWAYS_GENERATED = {
+    'walmart': ['specifications', 'compliance', 'shipping', 'rich_media'],
+}
+
+# Walmart advanced fields, merged as JSON rather than text
+WALMART_ADVANCED_FIELDS = ('specifications', 'compliance', 'shipping', 'rich_media')
+
+# key: (JSON shape in the prompt, instruction) for fields the model fills in
+LLM_FIELD_SPECS = {
+    'specifications': ('{"material": "...", "color": "...", "dimensions": "...", "weight": "...", "model": "...", '
+                       '"warranty": "..."}',
+                       'Technical specifications stated or clearly implied by the listing; "See description" when unknown.'),
+    'compliance': ('{"required_certifications": ["..."], "regulatory_requirements": ["..."], "safety_warnings": ["..."]}',
+                   'US certifications, regulations and safety warnings that apply to this product category.'),
+    'shipping': ('{"shipping_weight": "...", "package_length": "...", "package_width": "...", "package_height": "..."}',
+                 'Shipping weight and package dimensions with units, only as stated in the listing; '
+                 'empty strings when not stated, never estimates.'),
+    'rich_media': ('{"main_images": ["..."], "video_content": ["..."], "infographics": ["..."]}',
+                   'Concepts for product images, a short video and infographics built on the listing\'s benefits; '
+                   'descriptions only, no URLs.'),
+    'title': ('"..."', 'Product title: brand and product first, then the key benefit, max 70 characters.'),
+    'description': ('"..."', 'Plain-text product description, at least 150 words, no HTML.'),
+    'key_features': ('["...", "..."]', '5 key features in the form "Feature Name - specific benefit", max 80 characters each.'),
+    'keywords': ('"..."', '15-20 comma-separated search keywords.'),
+    'shopify_seo_title': ('"..."', 'SEO title for the product page, max 70 characters.'),
+    'shopify_meta_description': ('"..."', 'Meta description, 140-160 characters, benefit-led.'),
+    'tiktok_hooks': ('["...", "..."]', '5 scroll-stopping opening lines for a TikTok product video, max 90 characters each.'),
+    'tiktok_video_script': ('"..."', '30-40 second TikTok script with timed HOOK, SHOW, three BENEFIT beats and a CTA, one per line.'),
+    'tiktok_hashtags': ('"#... #..."', '8-10 relevant hashtags separated by spaces.'),
+}
+
+_TAG = re.compile(r'<[^>]+>')
+_BLOCK_END = re.compile(r'</(?:p|div|li|h[1-6])>|<br\s*/?>', re.IGNORECASE)
+_SENTENCE_END = re.compile(r'(?<=[.!?。！？])\s+')
+_BULLET_LABEL = re.compile(r'^\s*(?:[-•*]\s*)?([^:\n]{2,60}):\s*(.+)$', re.DOTALL)
+_TITLE_BREAKS = (' | ', ' - ', ' – ', ' — ', ', ', ': ', ' (')
+_HASHTAG_STRIP = re.compile(r'[^\w]+', re.UNICODE)
+
+
+class CrossPlatformError(Exception):
+    """Raised when a listing can't be derived for the requested platform"""
+
+
+class SourceContent:
+    """The platform-neutral content of a completed listing"""
+
+    def __init__(self, listing, title, bullets, description, keywords):
+        product = listing.product
+        self.listing = listing
+        self.product = product
+        self.title = title
+        self.bullets = bullets
+        self.description = description
+        self.keywords = keywords
+        self.brand = (product.brand_name or '').strip()
+        self.name = ' '.join((product.name or '').split())
+        marketplace = getattr(product, 'marketplace', 'us') or 'us'
+        self.language = getattr(product, 'marketplace_language', '') or MARKETPLACE_LANGUAGES.get(marketplace, 'en')
+
+
+def cross_platform_enabled():
+    return getattr(settings, 'CROSS_PLATFORM_DERIVATION', True)
+
+
+def _plain(text):
+    """HTML and entities removed, paragraph breaks kept, whitespace collapsed"""
+    text = html.unescape(_TAG.sub(' ', _BLOCK_END.sub('\n', text or '')))
+    paragraphs = [' '.join(paragraph.split()) for paragraph in text.split('\n')]
+    return '\n\n'.join(paragraph for paragraph in paragraphs if paragraph)
+
+
+def _split_lines(text):
+    return [' '.join(line.split()) for line in (text or '').split('\n') if line.strip()]
+
+
+def _split_keywords(text):
+    seen = set()
+    keywords = []
+    for keyword in (text or '').split(','):
+        keyword = ' '.join(keyword.split())
+        if keyword and keyword.casefold() not in seen:
+            seen.add(keyword.casefold())
+            keywords.append(keyword)
+    return keywords
+
+
+def _shorten(text, limit):
+    """Cut at the last title break (' - ', ', ', ...) that fits, else at a word boundary"""
+    text = ' '.join((text or '').split())
+    if len(text) <= limit:
+        return text
+    cuts = [text.rfind(separator, 0, limit + 1) for separator in _TITLE_BREAKS]
+    cut = max(cuts)
+    if cut >= limit // 2:
+        return text[:cut].rstrip(' ,;:-–—|(')
+    return text[:limit].rsplit(' ', 1)[0].rstrip(' ,;:-–—|(')
+
+
+def _sentences_within(text, limit):
+    """Leading whole sentences of text that fit in limit characters"""
+    text = ' '.join((text or '').split())
+    picked = ''
+    for sentence in _SENTENCE_END.split(text):
+        candidate = f"{picked} {sentence}".strip()
+        if len(candidate) > limit:
+            break
+        picked = candidate
+    return picked or _shorten(text, limit)
+
+
+def _bullet_parts(bullet):
+    """('Label', 'benefit text') for 'LABEL: benefit text' bullets, ('', bullet) otherwise"""
+    match = _BULLET_LABEL.match(bullet)
+    if match and len(match.group(1).split()) <= 6:
+        return match.group(1).strip().capitalize(), ' '.join(match.group(2).split())
+    return '', ' '.join(bullet.split())
+
+
+def source_content(listing):
+    """Normalize a completed listing of any source platform"""
+    if listing.platform == 'walmart':
+        bullets = _split_lines(listing.walmart_key_features or listing.bullet_points)
+        title = listing.walmart_product_title or listing.title
+        description = listing.walmart_description or listing.long_description
+    elif listing.platform == 'etsy':
+        title = listing.etsy_title or listing.title
+        description = listing.etsy_description or listing.long_description
+        bullets = _split_lines(listing.bullet_points)
+        if not bullets:
+            # Etsy descriptions have no bullets; use their leading sentences
+            bullets = _SENTENCE_END.split(' '.join(_plain(description).split()))[1:6]
+    else:
+        title = listing.title
+        description = listing.long_description
+        bullets = [bullet for bullet in (listing.bullet_points or '').split('\n\n') if bullet.strip()]
+        if len(bullets) <= 1:
+            bullets = _split_lines(listing.bullet_points)
+
+    keywords = listing.keywords or ''
+    if listing.platform == 'etsy' and listing.etsy_tags:
+        try:
+            keywords = ', '.join(json.loads(listing.etsy_tags)) + ', ' + keywords
+        except (TypeError, ValueError):
+            pass
+    return SourceContent(listing, ' '.join((title or '').split()), [' '.join(b.split()) for b in bullets],
+                         _plain(description), _split_keywords(keywords))
+
+
+def find_source(product, platform):
+    """SourceContent of the best completed listing of this product on another platform, or None"""
+    listings = list(GeneratedListing.objects.select_related('product')
+                    .filter(product=product, status='completed', platform__in=SOURCE_PLATFORMS)
+                    .exclude(platform=platform)
+                    .order_by('-updated_at'))
+    for source_platform in SOURCE_PLATFORMS:
+        for listing in listings:
+            if listing.platform != source_platform:
+                continue
+            content = source_content(listing)
+            if content.title and content.description:
+                return content
+    return None
+
+
+def _derive_walmart(source):
+    features = []
+    for bullet in source.bullets[:10]:
+        label, benefit = _bullet_parts(bullet)
+        feature = f"{label} - {benefit}" if label else benefit
+        features.append(_shorten(feature, WALMART_FEATURE_LIMIT))
+
+    description = source.description
+    if len(description.split()) < WALMART_MIN_DESCRIPTION_WORDS and source.bullets:
+        # Walmart wants a narrative of 150+ words; fold the bullet benefits in as sentences
+        extra = ' '.join(_bullet_parts(bullet)[1].rstrip('.') + '.' for bullet in source.bullets)
+        description = f"{description}\n\n{extra}".strip()
+
+    return {
+        'title': _shorten(source.title, WALMART_TITLE_LIMIT),
+        'description': description,
+        'key_features': [feature for feature in features if feature][:10] if len(features) >= 3 else [],
+        'keywords': ', '.join(source.keywords[:20]),
+    }
+
+
+def _shopify_body(source):
+    paragraphs = ''.join(f"<p>{html.escape(p)}</p>" for p in source.description.split('\n\n'))
+    bullets = ''.join(f"<li>{html.escape(bullet)}</li>" for bullet in source.bullets)
+    return paragraphs + (f"<ul>{bullets}</ul>" if bullets else '')
+
+
+def _derive_shopify(source):
+    return {
+        'title': source.title,
+        'long_description': _shopify_body(source),
+        'short_description': _sentences_within(source.description, SHOPIFY_META_LIMIT),
+        'bullet_points': '\n\n'.join(source.bullets),
+        'keywords': ', '.join(source.keywords[:25]),
+        'shopify_seo_title': _shorten(source.title, SHOPIFY_SEO_TITLE_LIMIT),
+        'shopify_meta_description': _sentences_within(source.description, SHOPIFY_META_LIMIT),
+    }
+
+
+def _hashtag(text):
+    tag = _HASHTAG_STRIP.sub('', text.lower())
+    return f"#{tag}" if 2 < len(tag) <= 30 else ''
+
+
+def _tiktok_hooks(source, labels):
+    """English hook templates; other languages go to the model"""
+    if source.language.split('-')[0] != 'en':
+        return []
+    name = _shorten(source.name, 40).lower()
+    labels = (labels + ['quality', 'results', 'value'])[:3]
+    return [
+        f"POV: you finally found a {name} that actually delivers on {labels[0].lower()}",
+        f"3 reasons people are switching to the {source.brand} {name}".replace('  ', ' '),
+        f"I didn't expect a {name} to nail the {labels[1].lower()} like this",
+        f"Stop scrolling if you've been looking for a better {name}",
+        f"Is the {name} worth it? Here's the honest {labels[2].lower()} test",
+    ]
+
+
+def _tiktok_script(source, hooks, benefits):
+    if not hooks or len(benefits) < 3:
+        return ''
+    beats = [
+        f"HOOK (0-3s): {hooks[0]}",
+        f"SHOW (3-10s): Close-up of the {source.name} in use",
+    ]
+    for index, benefit in enumerate(benefits[:3]):
+        start = 10 + index * 8
+        beats.append(f"BENEFIT {index + 1} ({start}-{start + 8}s): {_shorten(benefit, 120)}")
+    beats.append(f"CTA (34-40s): Tap the link to get yours - {source.brand} {source.name}".strip())
+    return '\n'.join(beats)
+
+
+def _derive_tiktok(source):
+    parts = [_bullet_parts(bullet) for bullet in source.bullets]
+    labels = [label for label, _ in parts if label]
+    benefits = [benefit for _, benefit in parts]
+    hooks = _tiktok_hooks(source, labels)
+
+    hashtags = []
+    for text in [source.brand] + source.keywords:
+        tag = _hashtag(text) if len(text.split()) <= 3 else ''
+        if tag and tag not in hashtags:
+            hashtags.append(tag)
+    if source.language.split('-')[0] == 'en':
+        hashtags.append('#tiktokmademebuyit')
+
+    return {
+        'title': _shorten(source.title, TIKTOK_TITLE_LIMIT),
+        'short_description': _sentences_within(source.description, 150),
+        'bullet_points': '\n\n'.join(source.bullets),
+        'keywords': ', '.join(source.keywords[:20]),
+        'tiktok_hooks': '\n'.join(hooks),
+        'tiktok_video_script': _tiktok_script(source, hooks, benefits),
+        'tiktok_hashtags': ' '.join(hashtags[:10]) if len(hashtags) >= 4 else '',
+    }
+
+
+DERIVERS = {
+    'walmart': _derive_walmart,
+    'shopify': _derive_shopify,
+    'tiktok': _derive_tiktok,
+}
+
+
+def _fill_missing(service, source, platform, missing):
+    """One small JSON call for the fields rules couldn't produce; returns {key: value}"""
+    if not missing or not service.client:
+        return {}
+    language = source.language
+    language_name = LANGUAGE_NAMES.get(language, LANGUAGE_NAMES.get(language.split('-')[0], 'English'))
+    shape = ', '.join(f'"{key}": {LLM_FIELD_SPECS[key][0]}' for key in missing)
+    instructions = '\n'.join(f"- {key}: {LLM_FIELD_SPECS[key][1]}" for key in missing)
+    bullets = '\n'.join(f"- {bullet}" for bullet in source.bullets[:8])
+    prompt = f"""Adapt this existing listing for {platform.title()}. Use only facts from the listing. Write in {language_name}.
+
+Product: {source.brand} {source.name}
+Title: {source.title}
+Bullet points:
+{bullets}
+Description: {source.description[:1500]}
+
+{instructions}
+
+Return ONLY valid JSON: {{{shape}}}"""
+    try:
+        response = service._chat_completion(
+            model='gpt-4o-mini',
+            messages=[{'role': 'user', 'content': prompt}],
+            max_tokens=150 * len(missing) + 200,
+            temperature=0.4,
+            response_format={'type': 'json_object'},
+        )
+        result, _ = parse_llm_json(response.choices[0].message.content)
+    except Exception as e:
+        logger.warning(f"Cross-platform fill for {platform} ({', '.join(missing)}) failed: {e}")
+        return {}
+    return {key: result[key] for key in missing if isinstance(result, dict) and result.get(key)}
+
+
+def _as_text(value):
+    if isinstance(value, list):
+        return '\n'.join(str(item).strip() for item in value if str(item).strip())
+    return str(value or '').strip()
+
+
+def derive_listing(service, source, listing, platform):
+    """
+    Fill `listing` for `platform` from `source` (a SourceContent). Returns the keys that needed
+    the model. The listing is not saved.
+    """
+    if platform not in DERIVERS:
+        raise CrossPlatformError(f"Listings can't be derived for {platform}")
+    derived = DERIVERS[platform](source)
+    missing = [key for key in ALWAYS_GENERATED.get(platform, []) if key not in derived]
+    missing += [key for key, value in derived.items() if not value and key in LLM_FIELD_SPECS]
+    if (platform == 'walmart' and 'description' not in missing
+            and len(_as_text(derived.get('description')).split()) < WALMART_MIN_DESCRIPTION_WORDS):
+        # Still short with the bullets folded in; the model writes it, the folded text is the fallback
+        missing.append('description')
+    filled = _fill_missing(service, source, platform, missing)
+    derived.update(filled)
+    note = f"model filled: {', '.join(filled)}" if filled else f"unfilled: {', '.join(missing)}" if missing else 'no model call'
+    print(f"🔀 {platform.title()} derived from {source.listing.platform} listing {source.listing.id} ({note})")
+
+    if platform == 'walmart':
+        key_features = derived.get('key_features') or source.bullets[:5]
+        if isinstance(key_features, str):
+            key_features = _split_lines(key_features)
+        core = {
+            'title': _as_text(derived.get('title')),
+            'description': _as_text(derived.get('description')),
+            'key_features': [_shorten(feature, WALMART_FEATURE_LIMIT) for feature in key_features],
+            'keywords': _as_text(derived.get('keywords')),
+        }
+        advanced = {key: derived[key] for key in WALMART_ADVANCED_FIELDS if isinstance(derived.get(key), dict)}
+        service._merge_walmart_hybrid_content(listing, core, advanced, listing.product, placeholders=False)
+    else:
+        for field, value in derived.items():
+            setattr(listing, field, _as_text(value))
+    return list(filled)
+
+
+def derive_from_listing(source_listing_id, platform):
+    """Create a completed `platform` listing derived from an existing listing (the derive endpoint)"""
+    from .services import ListingGeneratorService
+
+    if platform not in DERIVED_PLATFORMS:
+        raise CrossPlatformError(f"Unsupported target platform '{platform}'. Choose from: {', '.join(DERIVED_PLATFORMS)}")
+    source_listing = GeneratedListing.objects.select_related('product').get(id=source_listing_id)
+    if source_listing.status != 'completed':
+        raise CrossPlatformError(f"Listing {source_listing_id} is {source_listing.status}; derive from a completed listing")
+    if source_listing.platform == platform:
+        raise CrossPlatformError(f"Listing {source_listing_id} is already a {platform} listing")
+    source = source_content(source_listing)
+    if not (source.title and source.description):
+        raise CrossPlatformError(f"Listing {source_listing_id} has no title or description to derive from")
+
+    listing = GeneratedListing(product=source_listing.product, platform=platform, status='processing')
+    derive_listing(ListingGeneratorService(), source, listing, platform)
+    listing.status = 'completed'
+    listing.save()
+    return listing
@@ -14,6 +14,7 @@ import json
 import re
 import logging
 from django.conf import settings
+from .json_repair import parse_llm_json
 from .models import GeneratedListing
 
 
@@ -34,8 +35,8 @@ class EtsySuperiorGenerator2025:
                 self.logger.warning("OpenAI API key not properly configured!")
                 self.client = None
             else:
-                from openai import OpenAI
-                self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+                from .openai_client import get_openai_client
+                self.client = get_openai_client()
                 self.logger.info("Superior Etsy Generator 2025 initialized successfully!")
         except Exception as e:
             self.logger.error(f"Error initializing OpenAI client: {e}")
@@ -71,8 +72,11 @@ class EtsySuperiorGenerator2025:
         
         try:
             # Parse and populate listing
-            content = self._extract_json_from_response(response.choices[0].message.content)
-            result = json.loads(content)
+            result, repairs = parse_llm_json(response.choices[0].message.content)
+            if not isinstance(result, dict):
+                raise ValueError(f"No JSON object in response ({', '.join(repairs)})")
+            if repairs:
+                self.logger.warning(f"Repaired Etsy JSON: {', '.join(repairs)}")
             
             # Populate all Etsy fields with superior content
             self._populate_superior_etsy_fields(listing, result, brand_tone)
@@ -85,7 +89,7 @@ class EtsySuperiorGenerator2025:
             
             self.logger.info(f"Generated superior Etsy listing for {product.name} with {brand_tone} tone")
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self.logger.error(f"JSON parsing error: {e}")
             self._generate_fallback_superior_listing(product, listing, brand_tone)
 
@@ -528,23 +532,6 @@ Return ONLY valid JSON with comprehensive optimization that destroys competitor
         # Overall superior quality score
         listing.quality_score = (listing.emotion_score + listing.conversion_score + listing.trust_score) / 3.0
 
-    def _extract_json_from_response(self, content):
-        """
-        Extract JSON from OpenAI response, handling various formats
-        """
-        content = content.strip()
-        
-        # Remove markdown code blocks
-        if content.startswith('```json'):
-            content = content[7:]
-        elif content.startswith('```'):
-            content = content[3:]
-        
-        if content.endswith('```'):
-            content = content[:-3]
-        
-        return content.strip()
-
     def _generate_fallback_superior_listing(self, product, listing, brand_tone):
         """
         Generate fallback listing with superior quality
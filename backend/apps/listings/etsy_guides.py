@@ -0,0 +1,152 @@
+"""
+On-Demand Etsy Business Guides
+The ten Etsy "WOW" guides (shop setup, social media, photography, pricing, SEO report, ...) are
+no longer part of the initial Etsy generation. Each one is generated the first time it is
+requested, with its own small prompt, and cached on the listing; later requests read the column.
+Concurrent requests for the same guide share one generation. The canned fallback served when
+the model call fails is never cached, so the next request tries the model again.
+"""
+
+import logging
+import time
+
+from .coalescing import get_single_flight
+from .models import GeneratedListing
+
+logger = logging.getLogger(__name__)
+
+
+class EtsyGuide:
+    def __init__(self, slug, title, instruction, max_tokens=700):
+        self.slug = slug
+        self.field = f"etsy_{slug}"
+        self.title = title
+        self.instruction = instruction
+        self.max_tokens = max_tokens
+
+    def prompt(self, product):
+        instruction = self.instruction.format(
+            name=product.name, category=product.categories or 'handmade items',
+            brand=product.brand_name or 'the brand', price=product.price,
+        )
+        return f"""💼 ETSY BUSINESS CONSULTANT: Write a premium business guide for an Etsy seller.
+
+PRODUCT: {product.name}
+CATEGORY: {product.categories}
+BRAND: {product.brand_name}
+PRICE: ${product.price}
+
+{self.title.upper()}:
+{instruction}
+
+Return only the guide as plain text with short headed sections - no JSON, no markdown code fences."""
+
+
+ETSY_GUIDES = {guide.slug: guide for guide in [
+    EtsyGuide('shop_setup_guide', 'Shop setup guide',
+              'Complete Etsy shop optimization guide specific to {category}. Include: shop banner design tips, about '
+              'section writing, shop policies setup, and branding consistency strategies. Min 300 words.'),
+    EtsyGuide('social_media_package', 'Social media package',
+              '30-day content calendar for {name} with daily post ideas for Instagram/Pinterest/TikTok. Include '
+              'hashtag strategies and engagement tactics. Min 300 words.'),
+    EtsyGuide('photography_guide', 'Photography guide',
+              'Professional product photography tutorial for {category} items. Cover lighting, angles, styling, and '
+              'editing tips specific to this product type. Min 300 words.'),
+    EtsyGuide('pricing_analysis', 'Pricing analysis',
+              'Competitive pricing strategy for {name} at ${price}. Include profit calculations, competitor '
+              'analysis, and pricing psychology. Min 250 words.', max_tokens=600),
+    EtsyGuide('seo_report', 'SEO report',
+              "Advanced Etsy SEO strategy for '{name}' to rank higher in search. Include keyword research, tag "
+              'optimization, and listing optimization tactics. Min 300 words.'),
+    EtsyGuide('customer_service_templates', 'Customer service templates',
+              'Professional email templates for {category} customer inquiries. Include order confirmations, shipping '
+              'updates, and problem resolution scripts. Min 250 words.', max_tokens=600),
+    EtsyGuide('policies_templates', 'Shop policies',
+              'Complete shop policies for {category} sellers. Include shipping, returns, custom orders, and FAQ '
+              'templates. Min 250 words.', max_tokens=600),
+    EtsyGuide('variations_guide', 'Variations and upsells guide',
+              'Create product variations and bundles for {name} to increase average order value. Include pricing '
+              'strategies and presentation tips. Min 250 words.', max_tokens=600),
+    EtsyGuide('competitor_insights', 'Competitor insights',
+              'Analysis of top competitors in {category} and differentiation strategies for {brand}. Include '
+              'positioning and unique selling propositions. Min 300 words.'),
+    EtsyGuide('seasonal_calendar', 'Seasonal marketing calendar',
+              '12-month marketing calendar for {category} with seasonal opportunities, holidays, and promotional '
+              'strategies. Min 300 words.'),
+]}
+
+ETSY_GUIDE_FIELDS = [guide.field for guide in ETSY_GUIDES.values()]
+
+
+class EtsyGuideError(Exception):
+    """Raised for an unknown guide or a listing that can't have guides"""
+
+
+def guide_status(listing):
+    """{slug: generated?} for every guide of a listing"""
+    return {slug: bool(getattr(listing, guide.field)) for slug, guide in ETSY_GUIDES.items()}
+
+
+def _generate(listing_id, guide, refresh):
+    from .services import ListingGeneratorService
+
+    # Re-read inside the flight: a request that just finished may already have filled the column
+    listing = GeneratedListing.objects.select_related('product').get(id=listing_id)
+    cached = getattr(listing, guide.field)
+    if cached and not refresh:
+        return cached, True, False
+
+    service = ListingGeneratorService(bypass_cache=refresh)
+    content = ''
+    if service.client:
+        try:
+            response = service._chat_completion(
+                model='gpt-4o-mini',
+                messages=[{'role': 'user', 'content': guide.prompt(listing.product)}],
+                temperature=0.6,
+                max_tokens=guide.max_tokens,
+            )
+            content = (response.choices[0].message.content or '').strip()
+        except Exception as e:
+            logger.warning(f"Etsy guide {guide.slug} for listing {listing_id} failed: {e}")
+    if not content:
+        content = service._generate_fallback_wow_features(listing.product).get(guide.slug, '')
+        if not content:
+            raise EtsyGuideError(f"Could not generate the {guide.title.lower()} right now - please try again")
+        # Boilerplate stands in for this response only; a cached one would never be regenerated
+        return content, False, True
+
+    setattr(listing, guide.field, content)
+    listing.save(update_fields=[guide.field, 'updated_at'])
+    return content, False, False
+
+
+def get_etsy_guide(listing_id, slug, refresh=False):
+    """
+    Return one guide for an Etsy listing, generating and caching it on first request
+    (or when refresh=True). Returns {'guide', 'content', 'cached', 'fallback', 'duration'};
+    fallback=True means the model was unavailable and the content is the generic template.
+    """
+    guide = ETSY_GUIDES.get(slug)
+    if guide is None:
+        raise EtsyGuideError(f"Unknown guide '{slug}'. Choose from: {', '.join(ETSY_GUIDES)}")
+    listing = GeneratedListing.objects.only('id', 'platform', guide.field).get(id=listing_id)
+    if listing.platform != 'etsy':
+        raise EtsyGuideError('Business guides are only available for Etsy listings')
+
+    started = time.monotonic()
+    cached = getattr(listing, guide.field)
+    if cached and not refresh:
+        content, was_cached, fallback = cached, True, False
+    else:
+        content, was_cached, fallback = get_single_flight().do(
+            f"etsy-guide:{listing_id}:{slug}", lambda: _generate(listing_id, guide, refresh)
+        )
+    return {
+        'guide': slug,
+        'title': guide.title,
+        'content': content,
+        'cached': was_cached,
+        'fallback': fallback,
+        'duration': round(time.monotonic() - started, 2),
+    }
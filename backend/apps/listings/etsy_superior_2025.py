@@ -12,12 +12,13 @@ This service implements cutting-edge 2025 Etsy optimization strategies including
 """
 
 import json
-import re
 import logging
 from django.conf import settings
 from datetime import datetime
 import random
 
+from .json_repair import parse_llm_json
+
 
 class EtsySuperior2025Generator:
     """
@@ -36,8 +37,8 @@ class EtsySuperior2025Generator:
                 self.logger.warning("OpenAI API key not properly configured!")
                 self.client = None
             else:
-                from openai import OpenAI
-                self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+                from .openai_client import get_openai_client
+                self.client = get_openai_client()
                 self.logger.info("Superior Etsy Generator 2025 initialized successfully!")
         except Exception as e:
             self.logger.error(f"Error initializing OpenAI client: {e}")
@@ -70,9 +71,10 @@ class EtsySuperior2025Generator:
             # Parse and populate listing with superior content
             content = response.choices[0].message.content
             # Extract JSON from response
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
+            result, repairs = parse_llm_json(content)
+            if isinstance(result, dict):
+                if repairs:
+                    self.logger.warning(f"Repaired Etsy JSON: {', '.join(repairs)}")
                 self._populate_superior_listing(listing, result, product)
                 self.logger.info(f"✅ Generated SUPERIOR Etsy listing for {product.name}")
             else:
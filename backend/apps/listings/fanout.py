@@ -0,0 +1,268 @@
+"""
+Multi-Marketplace Fan-Out
+Generates one product's listings for many marketplaces (the Amazon markets plus Walmart) as a
+background job (FanOutJob) with per-market results. Marketplace-independent work - the product
+profile, cleaned product data and the base keyword cluster - is computed once and shared by
+every per-market generation, which then run concurrently on a bounded pool of their own.
+"""
+
+import concurrent.futures
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from apps.core.models import Product
+from .bulk import MARKETPLACE_LANGUAGES
+from .models import FanOutJob
+
+logger = logging.getLogger(__name__)
+
+AMAZON_FANOUT_MARKETPLACES = [code for code, _ in Product.AMAZON_MARKETPLACES]
+WALMART_FANOUT_MARKETPLACES = [code for code, _ in Product.WALMART_MARKETPLACES]
+FANOUT_MARKETPLACES = AMAZON_FANOUT_MARKETPLACES + WALMART_FANOUT_MARKETPLACES
+
+
+class FanOutError(Exception):
+    """Raised for an invalid fan-out request"""
+
+
+def platform_for_marketplace(marketplace):
+    if marketplace in WALMART_FANOUT_MARKETPLACES:
+        return 'walmart'
+    if marketplace in AMAZON_FANOUT_MARKETPLACES:
+        return 'amazon'
+    raise FanOutError(f"Unsupported fan-out marketplace: {marketplace}")
+
+
+class SharedProductContext:
+    """
+    Thread-safe memo of values that do not depend on the marketplace. Attached to a
+    ListingGeneratorService (shared_context=...), the service's profile, cleaning and keyword
+    helpers read from here instead of recomputing per market.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def get(self, key, compute):
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                return self._values[key]
+        value = compute()
+        with self._lock:
+            return self._values.setdefault(key, value)
+
+    def keys(self):
+        with self._lock:
+            return list(self._values)
+
+
+def _split_keywords(*values):
+    seen = set()
+    keywords = []
+    for value in values:
+        for keyword in str(value or '').replace('\n', ',').split(','):
+            keyword = ' '.join(keyword.split())
+            if keyword and keyword.lower() not in seen:
+                seen.add(keyword.lower())
+                keywords.append(keyword)
+    return keywords
+
+
+def base_keyword_cluster(product):
+    """Seller-supplied keywords, deduplicated once for every market"""
+    return {
+        'target_keywords': _split_keywords(product.target_keywords),
+        'seo_keywords': _split_keywords(getattr(product, 'seo_keywords', '')),
+        'long_tail_keywords': _split_keywords(getattr(product, 'long_tail_keywords', '')),
+        'all_keywords': _split_keywords(product.target_keywords, getattr(product, 'seo_keywords', ''),
+                                        getattr(product, 'long_tail_keywords', '')),
+    }
+
+
+# Product fields that belong to the market clone rather than being copied from the base product
+MARKET_FIELDS = {'id', 'marketplace', 'marketplace_language', 'target_platform', 'created_at', 'updated_at'}
+
+
+def marketplace_product(product, marketplace):
+    """
+    The Product row that represents `product` in `marketplace`. The base row is used for its own
+    marketplace; an earlier clone is reused with its copied fields (description, features,
+    keywords, price, ...) refreshed from the base product, otherwise the product is cloned.
+    """
+    if product.marketplace == marketplace:
+        return product
+    platform = platform_for_marketplace(marketplace)
+    clone = Product.objects.filter(
+        user_id=product.user_id, name=product.name, brand_name=product.brand_name, marketplace=marketplace
+    ).order_by('-id').first()
+    if clone:
+        changed = []
+        for field in Product._meta.concrete_fields:
+            if field.name in MARKET_FIELDS:
+                continue
+            value = getattr(product, field.attname)
+            if getattr(clone, field.attname) != value:
+                setattr(clone, field.attname, value)
+                changed.append(field.name)
+        if changed:
+            clone.save(update_fields=changed + ['updated_at'])
+        return clone
+
+    clone = Product.objects.get(id=product.id)
+    clone.pk = None
+    clone.id = None
+    clone.marketplace = marketplace
+    clone.marketplace_language = MARKETPLACE_LANGUAGES.get(marketplace, 'en')
+    clone.target_platform = platform
+    clone.save()
+    return clone
+
+
+def _fanout_marketplaces(marketplaces):
+    marketplaces = list(dict.fromkeys(marketplaces or FANOUT_MARKETPLACES))
+    for marketplace in marketplaces:
+        platform_for_marketplace(marketplace)
+    return marketplaces
+
+
+def fan_out_listing(product_id, marketplaces=None, workers=None, bypass_cache=False, on_result=None):
+    """
+    Generate `product_id` for every marketplace in `marketplaces` (default: all Amazon and Walmart
+    markets) and return {'results': {marketplace: {...}}, ...} with one entry per market.
+    on_result(marketplace, entry) fires as each market finishes.
+    """
+    from .services import ListingGeneratorService
+
+    marketplaces = _fanout_marketplaces(marketplaces)
+    workers = max(1, min(workers or getattr(settings, 'MARKETPLACE_FANOUT_WORKERS', 6), len(marketplaces)))
+
+    product = Product.objects.get(id=product_id)
+    started = time.monotonic()
+
+    # Marketplace-independent work, once
+    shared = SharedProductContext()
+    warm = ListingGeneratorService(bypass_cache=bypass_cache, shared_context=shared)
+    warm._product_profile(product)
+    warm._cleaned_product_data(product)
+    warm._base_keyword_cluster(product)
+    shared_time = time.monotonic() - started
+
+    targets = {marketplace: marketplace_product(product, marketplace) for marketplace in marketplaces}
+
+    def generate(marketplace):
+        market_product = targets[marketplace]
+        platform = platform_for_marketplace(marketplace)
+        market_started = time.monotonic()
+        entry = {'product_id': market_product.id, 'platform': platform, 'listing_id': None}
+        try:
+            service = ListingGeneratorService(bypass_cache=bypass_cache, shared_context=shared)
+            listing = service.generate_listing(market_product.id, platform)
+            entry.update({
+                'listing_id': listing.id,
+                'status': listing.status,
+                'error': listing.error_message if listing.status != 'completed' else '',
+            })
+        except Exception as e:
+            entry.update({'status': 'failed', 'error': str(e)[:1000]})
+        finally:
+            close_old_connections()
+        entry['duration'] = round(time.monotonic() - market_started, 2)
+        return entry
+
+    results = {}
+    # A pool of its own: per-market generations submit their LLM branches to the shared executor
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fanout-market') as pool:
+        futures = {pool.submit(generate, marketplace): marketplace for marketplace in marketplaces}
+        for future in concurrent.futures.as_completed(futures):
+            results[futures[future]] = future.result()
+            if on_result is not None:
+                on_result(futures[future], results[futures[future]])
+
+    completed = sum(1 for entry in results.values() if entry['status'] == 'completed')
+    total_time = time.monotonic() - started
+    logger.info(f"Fan-out of product {product_id}: {completed}/{len(marketplaces)} markets in {total_time:.1f}s")
+    print(f"🌍 Fan-out product {product_id}: {completed}/{len(marketplaces)} markets completed in {total_time:.1f}s")
+
+    return {
+        'product_id': product_id,
+        'marketplaces': marketplaces,
+        'workers': workers,
+        'completed': completed,
+        'failed': len(marketplaces) - completed,
+        'shared_context': {'keys': shared.keys(), 'time': round(shared_time, 3), 'reuse_hits': shared.hits},
+        'total_time': round(total_time, 2),
+        'results': {marketplace: results[marketplace] for marketplace in marketplaces},
+    }
+
+
+def create_fanout_job(product_id, marketplaces=None, workers=None, bypass_cache=False):
+    """Validate a fan-out request and record it as a pending FanOutJob (the fan-out endpoint)"""
+    marketplaces = _fanout_marketplaces(marketplaces)
+    product = Product.objects.get(id=product_id)
+    return FanOutJob.objects.create(
+        product=product,
+        marketplaces=','.join(marketplaces),
+        workers=workers,
+        bypass_cache=bypass_cache,
+        results={marketplace: {'status': 'pending'} for marketplace in marketplaces},
+    )
+
+
+def run_fanout_job(job_id):
+    """Run a pending FanOutJob, saving each market's result as it finishes"""
+    claimed = FanOutJob.objects.filter(id=job_id, status='pending').update(
+        status='running', started_at=timezone.now(), updated_at=timezone.now()
+    )
+    if not claimed:
+        logger.warning(f"Fan-out job {job_id} is not pending - skipping")
+        return None
+    job = FanOutJob.objects.get(id=job_id)
+    lock = threading.Lock()
+
+    def on_result(marketplace, entry):
+        with lock:
+            job.results[marketplace] = entry
+            job.completed_markets = sum(1 for value in job.results.values() if value.get('status') == 'completed')
+            job.failed_markets = sum(1 for value in job.results.values() if value.get('status') == 'failed')
+            job.save(update_fields=['results', 'completed_markets', 'failed_markets', 'updated_at'])
+
+    try:
+        summary = fan_out_listing(job.product_id, job.marketplaces.split(','), workers=job.workers,
+                                  bypass_cache=job.bypass_cache, on_result=on_result)
+    except Exception as e:
+        job.status = 'failed'
+        job.error_message = str(e)[:1000]
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'error_message', 'finished_at', 'updated_at'])
+        raise
+
+    job.status = 'completed' if summary['failed'] == 0 else 'failed'
+    job.shared_context = summary['shared_context']
+    job.total_time = summary['total_time']
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'shared_context', 'total_time', 'finished_at', 'updated_at'])
+    return job
+
+
+def fanout_job_status(job):
+    return {
+        'job_id': job.id,
+        'product_id': job.product_id,
+        'status': job.status,
+        'marketplaces': job.marketplaces.split(','),
+        'completed': job.completed_markets,
+        'failed': job.failed_markets,
+        'remaining': len(job.results) - job.completed_markets - job.failed_markets,
+        'shared_context': job.shared_context,
+        'total_time': job.total_time,
+        'error': job.error_message,
+        'results': job.results,
+    }
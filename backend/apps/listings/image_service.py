@@ -2,6 +2,7 @@ import json
 import logging
 from django.conf import settings
 from .models import ListingImage
+from .openai_client import get_openai_client
 
 try:
     from celery import shared_task
@@ -19,8 +20,7 @@ class ImageGenerationService:
     def __init__(self):
         try:
             if settings.OPENAI_API_KEY and settings.OPENAI_API_KEY != "your-openai-api-key-here":
-                from openai import OpenAI
-                self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+                self.client = get_openai_client()
                 logger.info("OpenAI client initialized for image generation")
             else:
                 self.client = None
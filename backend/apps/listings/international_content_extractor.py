@@ -8,6 +8,8 @@ import re
 import json
 import logging
 
+from .text_normalization import text_stats
+
 class InternationalContentExtractor:
     """Extracts complete international content without relying on broken JSON parsing"""
     
@@ -23,18 +25,9 @@ class InternationalContentExtractor:
             # Clean the response text BUT PRESERVE UMLAUTS
             cleaned_text = ai_response_text.strip()
             
-            # Debug: Check if umlauts are present in input
-            print(f"🔍 InternationalContentExtractor INPUT DEBUG:")
-            print(f"   Contains ü: {'ü' in cleaned_text}")
-            print(f"   Contains ä: {'ä' in cleaned_text}")
-            print(f"   Contains ö: {'ö' in cleaned_text}")
-            print(f"   Contains ß: {'ß' in cleaned_text}")
-            
-            # DEBUG: Check for German characters in input
-            german_chars = ['ä', 'ö', 'ü', 'ß', 'Ä', 'Ö', 'Ü']
-            input_german_chars = sum(cleaned_text.count(char) for char in german_chars)
-            input_unicode_chars = sum(1 for char in cleaned_text if ord(char) > 127)
-            self.logger.info(f"🔍 InternationalContentExtractor INPUT: {len(cleaned_text)} chars, German chars: {input_german_chars}, Unicode chars: {input_unicode_chars}")
+            input_stats = text_stats(cleaned_text, marketplace_lang)
+            self.logger.info(f"🔍 InternationalContentExtractor INPUT: {len(cleaned_text)} chars, "
+                             f"market chars: {input_stats['market_chars']}, Unicode chars: {input_stats['non_ascii']}")
             
             # Extract using multiple robust patterns
             result = {
@@ -53,11 +46,10 @@ class InternationalContentExtractor:
                 'ppcStrategy': self._extract_ppc_strategy(cleaned_text)
             }
             
-            # DEBUG: Check for German characters in output
             all_output = str(result.get('productTitle', '')) + str(result.get('productDescription', '')) + ' '.join(result.get('bulletPoints', []))
-            output_german_chars = sum(all_output.count(char) for char in german_chars)
-            output_unicode_chars = sum(1 for char in all_output if ord(char) > 127)
-            self.logger.info(f"🔍 InternationalContentExtractor OUTPUT: {len(all_output)} chars, German chars: {output_german_chars}, Unicode chars: {output_unicode_chars}")
+            output_stats = text_stats(all_output, marketplace_lang)
+            self.logger.info(f"🔍 InternationalContentExtractor OUTPUT: {len(all_output)} chars, "
+                             f"market chars: {output_stats['market_chars']}, Unicode chars: {output_stats['non_ascii']}")
             
             # Validate extraction quality
             if self._validate_extraction(result, marketplace_lang):
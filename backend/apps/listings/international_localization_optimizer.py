@@ -1142,8 +1142,9 @@ class InternationalLocalizationOptimizer:
             }
         }
     
-    def get_localization_enhancement(self, marketplace, language):
+    def get_localization_enhancement(self, marketplace, language, rng=None):
         """Get comprehensive localization enhancement for specific market"""
+        rng = rng or random
         
         # Determine market code from marketplace/language
         market_code = None
@@ -1190,10 +1191,10 @@ class InternationalLocalizationOptimizer:
         config = self.market_configurations[market_code]
         
         # Select random elements for variety
-        essential_words = random.sample(config["essential_words"], min(6, len(config["essential_words"])))
-        power_words = random.sample(config["power_words"], min(8, len(config["power_words"])))
-        cultural_elements = random.sample(config["cultural_elements"], min(3, len(config["cultural_elements"])))
-        formality_words = random.sample(config["formality_words"], min(4, len(config["formality_words"])))
+        essential_words = rng.sample(config["essential_words"], min(6, len(config["essential_words"])))
+        power_words = rng.sample(config["power_words"], min(8, len(config["power_words"])))
+        cultural_elements = rng.sample(config["cultural_elements"], min(3, len(config["cultural_elements"])))
+        formality_words = rng.sample(config["formality_words"], min(4, len(config["formality_words"])))
         
         enhancement = f"""
 🚨🚨🚨 EMERGENCY LANGUAGE OVERRIDE - {config['language'].upper()} ONLY 🚨🚨🚨
@@ -1392,8 +1393,9 @@ The entire listing must read as if written by a native {config['language']} spea
             "english_contamination": len(english_words_found)
         }
     
-    def get_aplus_content_enhancement(self, marketplace, language):
+    def get_aplus_content_enhancement(self, marketplace, language, rng=None):
         """Get A+ content enhancement for international markets following US Amazon A+ structure"""
+        rng = rng or random
         
         # Determine market code from marketplace/language
         market_code = None
@@ -1440,8 +1442,8 @@ The entire listing must read as if written by a native {config['language']} spea
         config = self.market_configurations[market_code]
         
         # Select random elements for variety
-        cultural_elements = random.sample(config["cultural_elements"], min(2, len(config["cultural_elements"])))
-        power_words = random.sample(config["power_words"], min(4, len(config["power_words"])))
+        cultural_elements = rng.sample(config["cultural_elements"], min(2, len(config["cultural_elements"])))
+        power_words = rng.sample(config["power_words"], min(4, len(config["power_words"])))
         
         aplus_enhancement = f"""
 🖼️ A+ CONTENT INTERNATIONAL OPTIMIZATION - FOLLOW US AMAZON A+ STRUCTURE 🖼️
@@ -0,0 +1,312 @@
+"""
+Lenient JSON Parsing for LLM Output
+One pass over the text that tolerates what models actually send back: code fences and prose
+around the object, smart quotes, unescaped quotes inside strings, raw control characters,
+trailing or missing commas, unquoted keys and truncated output. Well-formed input takes the C
+decoder fast path. Returns the best-effort value together with the list of repairs made.
+"""
+
+import json
+import re
+from collections import Counter, namedtuple
+
+ParseResult = namedtuple('ParseResult', ['value', 'repairs'])
+
+_FENCE_OPEN = re.compile(r'```[A-Za-z0-9_-]*[ \t]*\r?\n?')
+_NUMBER = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?')
+_IDENTIFIER = re.compile(r'[A-Za-z_$][\w$-]*')
+_WHITESPACE = ' \t\r\n\ufeff'
+
+OPEN_SMART_QUOTES = '\u201c\u201e\u201f'
+CLOSE_SMART_QUOTES = '\u201d\u201c'
+LITERALS = {'true': True, 'false': False, 'null': None, 'True': True, 'False': False, 'None': None}
+ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+# Characters that end a plain run inside a string, per opening quote
+_STRING_STOPS = {
+    '"': re.compile(r'["\\]'),
+    "'": re.compile(r"['\\]"),
+    'smart': re.compile('["\\\\' + CLOSE_SMART_QUOTES + ']'),
+}
+
+_decoder = json.JSONDecoder(strict=False)
+
+
+class _LenientParser:
+    def __init__(self, text, start, end):
+        self.text = text
+        self.pos = start
+        self.end = end
+        self.repairs = Counter()
+
+    def repair(self, message):
+        self.repairs[message] += 1
+
+    def skip_ws(self):
+        text, end = self.text, self.end
+        while self.pos < end and text[self.pos] in _WHITESPACE:
+            self.pos += 1
+        return self.text[self.pos] if self.pos < end else ''
+
+    def peek_after(self, index):
+        """Next non-whitespace character at or after index ('' at the end) and its position"""
+        text, end = self.text, self.end
+        while index < end and text[index] in _WHITESPACE:
+            index += 1
+        return (text[index], index) if index < end else ('', end)
+
+    def parse_value(self):
+        char = self.skip_ws()
+        if char == '{':
+            return self.parse_object()
+        if char == '[':
+            return self.parse_array()
+        if char == '"' or char == "'" or char in OPEN_SMART_QUOTES:
+            return self.parse_string(key=False)
+        if char == '':
+            self.repair('filled a truncated value with null')
+            return None
+        number = _NUMBER.match(self.text, self.pos, self.end)
+        if number and self.peek_after(number.end())[0] in ',]}':
+            self.pos = number.end()
+            raw = number.group()
+            return float(raw) if any(c in raw for c in '.eE') else int(raw)
+        word = _IDENTIFIER.match(self.text, self.pos, self.end)
+        if word and word.group() in LITERALS and self.peek_after(word.end())[0] in ',]}':
+            if word.group() not in ('true', 'false', 'null'):
+                self.repair('converted Python literal')
+            self.pos = word.end()
+            return LITERALS[word.group()]
+        return self.parse_bare_value()
+
+    def parse_bare_value(self):
+        start = self.pos
+        text, end = self.text, self.end
+        while self.pos < end and text[self.pos] not in ',]}\n':
+            self.pos += 1
+        self.repair('quoted a bare value')
+        return text[start:self.pos].strip()
+
+    def parse_object(self):
+        self.pos += 1
+        obj = {}
+        while True:
+            char = self.skip_ws()
+            if char == '}':
+                self.pos += 1
+                return obj
+            if char == '':
+                self.repair('closed a truncated object')
+                return obj
+            if char == ',':
+                self.pos += 1
+                self.repair('removed an extra comma')
+                continue
+
+            if char == '"' or char == "'" or char in OPEN_SMART_QUOTES:
+                key = self.parse_string(key=True)
+            else:
+                match = _IDENTIFIER.match(self.text, self.pos, self.end)
+                if not match:
+                    self.pos += 1
+                    self.repair('skipped a stray character')
+                    continue
+                key = match.group()
+                self.pos = match.end()
+                self.repair('quoted an unquoted key')
+
+            char = self.skip_ws()
+            if char == ':':
+                self.pos += 1
+            elif char == '':
+                self.repair('dropped a truncated key')
+                return obj
+            else:
+                self.repair('inserted a missing colon')
+            if self.skip_ws() == '':
+                self.repair('dropped a truncated key')
+                return obj
+
+            obj[key] = self.parse_value()
+
+            char = self.skip_ws()
+            if char == ',':
+                self.pos += 1
+                if self.skip_ws() == '}':
+                    self.repair('removed a trailing comma')
+            elif char not in ('}', ''):
+                self.repair('inserted a missing comma')
+
+    def parse_array(self):
+        self.pos += 1
+        items = []
+        while True:
+            char = self.skip_ws()
+            if char == ']':
+                self.pos += 1
+                return items
+            if char == '':
+                self.repair('closed a truncated array')
+                return items
+            if char == ',':
+                self.pos += 1
+                self.repair('removed an extra comma')
+                continue
+            if char == '}':
+                self.pos += 1
+                self.repair('skipped a mismatched brace')
+                continue
+
+            items.append(self.parse_value())
+
+            char = self.skip_ws()
+            if char == ',':
+                self.pos += 1
+                if self.skip_ws() == ']':
+                    self.repair('removed a trailing comma')
+            elif char not in (']', ''):
+                self.repair('inserted a missing comma')
+
+    def closes_string(self, index, key):
+        """Is the quote at index the real end of the string, judging by what follows it?"""
+        after, after_pos = self.peek_after(index + 1)
+        if after in ('', '}', ']'):
+            return True
+        if after == ':':
+            return key
+        if after == ',':
+            following, _ = self.peek_after(after_pos + 1)
+            return following in ('', '"', "'", '{', '[', '}', ']', '-') or following.isdigit() \
+                or following in OPEN_SMART_QUOTES
+        if after == '"' or after in OPEN_SMART_QUOTES:
+            # Next string on a new line: the comma between the two is missing
+            return '\n' in self.text[index + 1:after_pos]
+        return False
+
+    def parse_string(self, key):
+        text, end = self.text, self.end
+        opening = text[self.pos]
+        if opening in OPEN_SMART_QUOTES:
+            self.repair('replaced smart quotes')
+            stops = _STRING_STOPS['smart']
+            closers = '"' + CLOSE_SMART_QUOTES
+        else:
+            if opening == "'":
+                self.repair('converted a single-quoted string')
+            stops = _STRING_STOPS[opening]
+            closers = opening
+        self.pos += 1
+        chunks = []
+
+        while True:
+            match = stops.search(text, self.pos, end)
+            if match is None:
+                chunks.append(text[self.pos:end])
+                self.pos = end
+                self.repair('closed a truncated string')
+                return ''.join(chunks)
+
+            index = match.start()
+            chunks.append(text[self.pos:index])
+            char = text[index]
+
+            if char == '\\':
+                if index + 1 >= end:
+                    self.pos = end
+                    self.repair('closed a truncated string')
+                    return ''.join(chunks)
+                escape = text[index + 1]
+                if escape in ESCAPES:
+                    chunks.append(ESCAPES[escape])
+                    self.pos = index + 2
+                elif escape == 'u' and re.fullmatch(r'[0-9a-fA-F]{4}', text[index + 2:index + 6]):
+                    code = int(text[index + 2:index + 6], 16)
+                    self.pos = index + 6
+                    if 0xD800 <= code < 0xDC00 and text[self.pos:self.pos + 2] == '\\u':
+                        low = text[self.pos + 2:self.pos + 6]
+                        if re.fullmatch(r'[dD][c-fC-F][0-9a-fA-F]{2}', low):
+                            code = 0x10000 + ((code - 0xD800) << 10) + (int(low, 16) - 0xDC00)
+                            self.pos += 6
+                    chunks.append(chr(code))
+                else:
+                    chunks.append(escape)
+                    self.pos = index + 2
+                    self.repair('kept an invalid escape')
+                continue
+
+            if char in closers and self.closes_string(index, key):
+                self.pos = index + 1
+                return ''.join(chunks)
+
+            # A quote in the middle of the content: keep it as text
+            chunks.append(char)
+            self.pos = index + 1
+            self.repair('escaped an inner quote')
+
+    def result_repairs(self, leading):
+        repairs = list(leading)
+        for message, count in self.repairs.items():
+            repairs.append(f"{message} (x{count})" if count > 1 else message)
+        return repairs
+
+
+def _locate(text):
+    """Strip code fences/BOM and find where the JSON value starts; returns (start, end, repairs)"""
+    repairs = []
+    start, end = 0, len(text)
+    fence = text.find('```')
+    brace = min((i for i in (text.find('{'), text.find('[')) if i != -1), default=-1)
+    if fence != -1 and (brace == -1 or fence < brace):
+        opened = _FENCE_OPEN.match(text, fence)
+        start = opened.end()
+        closing = text.find('```', start)
+        if closing != -1:
+            end = closing
+        repairs.append('stripped a code fence')
+
+    first = len(text)
+    for opener in '{[':
+        index = text.find(opener, start, end)
+        if index != -1:
+            first = min(first, index)
+    if first >= end:
+        return None, end, repairs
+    if text[start:first].strip(_WHITESPACE):
+        repairs.append('skipped text before the JSON')
+    return first, end, repairs
+
+
+def parse_llm_json(text):
+    """
+    Parse model output into a Python value, repairing it where needed.
+    Returns ParseResult(value, repairs); value is None when no JSON value could be found.
+    """
+    if not text:
+        return ParseResult(None, ['empty response'])
+    if not isinstance(text, str):
+        text = text.decode('utf-8', errors='replace')
+
+    start, end, repairs = _locate(text)
+    if start is None:
+        return ParseResult(None, repairs + ['no JSON value found'])
+
+    # Fast path: valid JSON (raw control characters allowed) is decoded in C
+    try:
+        value, stop = _decoder.raw_decode(text[:end], start)
+        if text[stop:end].strip(_WHITESPACE):
+            repairs.append('ignored text after the JSON')
+        return ParseResult(value, repairs)
+    except json.JSONDecodeError:
+        pass
+
+    parser = _LenientParser(text, start, end)
+    value = parser.parse_value()
+    if parser.skip_ws():
+        repairs.append('ignored text after the JSON')
+    return ParseResult(value, parser.result_repairs(repairs))
+
+
+def loads_lenient(text, default=None):
+    """parse_llm_json() for callers that only want the value"""
+    value = parse_llm_json(text).value
+    return default if value is None else value
@@ -0,0 +1,224 @@
+"""
+LLM Response Cache
+Content-addressed cache for chat completions: identical model + messages + params
+return the stored completion instead of paying for the same generation again.
+Two tiers: an in-process LRU in front of Django's cache framework (Redis in production,
+locmem in development and tests).
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = 'llm:chat:'
+
+
+def make_cache_key(**params):
+    """Canonical hash of a chat.completions.create call (model, messages and every other parameter)"""
+    canonical = json.dumps(params, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return CACHE_KEY_PREFIX + hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _serialize_response(response):
+    """Turn an OpenAI ChatCompletion into a plain dict that any cache backend can store"""
+    if hasattr(response, 'model_dump'):
+        return response.model_dump(mode='json')
+    return response
+
+
+def _deserialize_response(payload):
+    """Rebuild a ChatCompletion so callers keep using response.choices[0].message.content"""
+    if not isinstance(payload, dict):
+        return payload
+    try:
+        from openai.types.chat import ChatCompletion
+        return ChatCompletion.model_validate(payload)
+    except Exception as e:
+        logger.warning(f"Could not rebuild cached completion: {e}")
+        return None
+
+
+def is_cacheable(response):
+    """Only cache complete answers - truncated or empty completions must be retried for real"""
+    try:
+        choice = response.choices[0]
+        return bool(choice.message.content) and choice.finish_reason == 'stop'
+    except (AttributeError, IndexError, TypeError):
+        return False
+
+
+class LLMResponseCache:
+    """Two-tier (local LRU + Django cache) store for chat completions"""
+
+    def __init__(self, max_entries=256, ttl=86400, cache_alias='default', enabled=True):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_alias = cache_alias
+        self.enabled = enabled
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @property
+    def shared(self):
+        from django.core.cache import caches
+        return caches[self.cache_alias]
+
+    def _get_local(self, key):
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at < time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return payload
+
+    def _set_local(self, key, payload):
+        with self._lock:
+            self._local[key] = (time.monotonic() + self.ttl, payload)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def get(self, key):
+        """Return the cached completion for key, or None on a miss"""
+        payload = self._get_local(key)
+        tier = 'local'
+        if payload is None:
+            try:
+                payload = self.shared.get(key)
+            except Exception as e:
+                logger.warning(f"Shared LLM cache unavailable: {e}")
+                payload = None
+            tier = 'shared'
+            if payload is not None:
+                self._set_local(key, payload)
+
+        response = _deserialize_response(payload) if payload is not None else None
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                if tier == 'local':
+                    self.local_hits += 1
+                else:
+                    self.shared_hits += 1
+        return response
+
+    def set(self, key, response):
+        """Store a completion in both tiers"""
+        payload = _serialize_response(response)
+        self._set_local(key, payload)
+        try:
+            self.shared.set(key, payload, timeout=self.ttl)
+        except Exception as e:
+            logger.warning(f"Could not write to shared LLM cache: {e}")
+        with self._lock:
+            self.stores += 1
+
+    def invalidate(self, key):
+        """Drop a single entry (e.g. a completion that turned out to be unparseable)"""
+        with self._lock:
+            self._local.pop(key, None)
+        try:
+            self.shared.delete(key)
+        except Exception as e:
+            logger.warning(f"Could not delete from shared LLM cache: {e}")
+
+    def clear(self):
+        """Empty the local tier and reset counters (shared tier entries simply expire)"""
+        with self._lock:
+            self._local.clear()
+            self.hits = self.local_hits = self.shared_hits = self.misses = self.stores = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'hits': self.hits,
+                'local_hits': self.local_hits,
+                'shared_hits': self.shared_hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'local_entries': len(self._local),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """Return the process-wide LLM response cache configured from settings"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache(
+                    max_entries=getattr(settings, 'LLM_CACHE_MAX_ENTRIES', 256),
+                    ttl=getattr(settings, 'LLM_CACHE_TTL', 86400),
+                    cache_alias=getattr(settings, 'LLM_CACHE_ALIAS', 'default'),
+                    enabled=getattr(settings, 'LLM_CACHE_ENABLED', True),
+                )
+    return _cache
+
+
+def invalidate_completion(**params):
+    """Forget the cached completion of these request params (call when it could not be parsed)"""
+    cache = get_llm_cache()
+    if cache.enabled:
+        cache.invalidate(make_cache_key(**params))
+
+
+def cached_chat_completion(client, bypass=False, on_field=None, **params):
+    """
+    Drop-in replacement for client.chat.completions.create(**params) that consults the cache first.
+    bypass=True forces a fresh generation (the new result still refreshes the cache).
+    With on_field, the call is streamed and on_field(key, value) fires per completed JSON field;
+    cache hits are replayed through the same callback.
+    Provider calls go through the LLM gateway (rate limiting, retries, circuit breaker).
+    """
+    from .llm_gateway import get_llm_gateway
+    from .stream_parser import stream_chat_completion, replay_fields
+
+    cache = get_llm_cache()
+    key = make_cache_key(**params) if cache.enabled else None
+
+    if cache.enabled and not bypass:
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info(f"LLM cache hit ({params.get('model')}) {key[-12:]}")
+            if on_field is not None:
+                replay_fields(cached.choices[0].message.content, on_field)
+            return cached
+
+    if on_field is None:
+        response = get_llm_gateway().call(lambda: client.chat.completions.create(**params), params)
+    else:
+        response = get_llm_gateway().call(lambda: stream_chat_completion(client, on_field, **params), params)
+
+    if cache.enabled and is_cacheable(response):
+        cache.set(key, response)
+    if getattr(settings, 'LLM_RECORD_DIR', ''):
+        from .llm_standin import record_completion
+        record_completion(params, response.choices[0].message.content)
+    return response
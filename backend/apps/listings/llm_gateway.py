@@ -0,0 +1,330 @@
+"""
+LLM Call Gateway
+Every OpenAI call goes through one gateway that
+- paces requests with token buckets (requests/min and tokens/min) shared by all threads and workers,
+- retries transient failures with jittered exponential backoff, honouring Retry-After,
+- fails fast through a circuit breaker while the provider is degraded.
+"""
+
+import logging
+import random
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling the provider while the circuit breaker is open"""
+
+
+class RateLimitWaitExceeded(Exception):
+    """Raised when the shared rate limit would require waiting longer than allowed"""
+
+
+# ---------------------------------------------------------------------------
+# Token buckets
+# ---------------------------------------------------------------------------
+
+class LocalBucketStore:
+    """In-process bucket state (stand-in for the shared store in development and tests)"""
+
+    def __init__(self):
+        self._state = {}
+        self._lock = threading.Lock()
+
+    def take(self, name, amount, capacity, refill_per_second):
+        """Consume amount from the bucket; return seconds to wait before the debt is repaid (0 = go)"""
+        with self._lock:
+            return _take(self._state, name, amount, capacity, refill_per_second)
+
+
+class CacheBucketStore:
+    """Bucket state kept in Django's cache (Redis in production) so every worker shares one budget"""
+
+    def __init__(self, cache_alias='default', prefix='llm:bucket:'):
+        self.cache_alias = cache_alias
+        self.prefix = prefix
+
+    @property
+    def cache(self):
+        from django.core.cache import caches
+        return caches[self.cache_alias]
+
+    def take(self, name, amount, capacity, refill_per_second):
+        key = self.prefix + name
+        lock_key = key + ':lock'
+        deadline = time.monotonic() + 2.0
+        # cache.add is atomic on Redis/Memcached, so it works as a short cross-process mutex
+        locked = self.cache.add(lock_key, 1, timeout=2)
+        while not locked and time.monotonic() < deadline:
+            time.sleep(0.01)
+            locked = self.cache.add(lock_key, 1, timeout=2)
+        if not locked:
+            logger.warning(f"Rate limit store lock timeout for {name}; proceeding without it")
+        try:
+            stored = self.cache.get(key)
+            state = {name: tuple(stored)} if stored else {}
+            wait = _take(state, name, amount, capacity, refill_per_second)
+            self.cache.set(key, state[name], timeout=3600)
+            return wait
+        finally:
+            if locked:
+                self.cache.delete(lock_key)
+
+
+def _take(state, name, amount, capacity, refill_per_second):
+    now = time.time()
+    tokens, updated = state.get(name) or (capacity, now)
+    tokens = min(capacity, tokens + (now - updated) * refill_per_second)
+    tokens = min(capacity, tokens - amount)  # a negative amount refunds
+    state[name] = (tokens, now)
+    if tokens >= 0:
+        return 0.0
+    # Allow the bucket to go negative: the caller waits until its own debt is refilled,
+    # so concurrent callers queue up at spaced intervals instead of retrying in lockstep
+    return -tokens / refill_per_second
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute token buckets"""
+
+    def __init__(self, store, requests_per_minute, tokens_per_minute, max_wait=60):
+        self.store = store
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_wait = max_wait
+
+    def acquire(self, estimated_tokens):
+        """Reserve one request and estimated_tokens, sleeping until the shared budget allows it"""
+        wait = 0.0
+        if self.requests_per_minute:
+            wait = max(wait, self.store.take(
+                'requests', 1, self.requests_per_minute, self.requests_per_minute / 60.0))
+        if self.tokens_per_minute:
+            wait = max(wait, self.store.take(
+                'tokens', estimated_tokens, self.tokens_per_minute, self.tokens_per_minute / 60.0))
+        if wait > self.max_wait:
+            # The call will not be made, so give back what was just debited
+            self.release(estimated_tokens)
+            raise RateLimitWaitExceeded(f"LLM rate limit requires waiting {wait:.1f}s (max {self.max_wait}s)")
+        if wait > 0:
+            logger.info(f"LLM rate limiter pacing call by {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    def release(self, estimated_tokens):
+        """Refund a reservation whose call never happened"""
+        if self.requests_per_minute:
+            self.store.take('requests', -1, self.requests_per_minute, self.requests_per_minute / 60.0)
+        if self.tokens_per_minute:
+            self.store.take('tokens', -estimated_tokens, self.tokens_per_minute, self.tokens_per_minute / 60.0)
+
+    def reconcile(self, estimated_tokens, actual_tokens):
+        """Charge the difference once the real usage is known"""
+        if self.tokens_per_minute and actual_tokens and actual_tokens > estimated_tokens:
+            self.store.take('tokens', actual_tokens - estimated_tokens,
+                            self.tokens_per_minute, self.tokens_per_minute / 60.0)
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+
+class CircuitBreaker:
+    """closed -> open after N consecutive failures -> half-open after reset_timeout -> closed on success"""
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._half_open_trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def before_call(self):
+        """Admit a call or raise CircuitOpenError; True when this call is the half-open trial"""
+        with self._lock:
+            state = self._state()
+            if state == 'open':
+                remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+                raise CircuitOpenError(f"LLM provider circuit open - retry in {remaining:.0f}s")
+            if state == 'half_open':
+                if self._half_open_trial:
+                    raise CircuitOpenError("LLM provider circuit half-open - trial call in progress")
+                self._half_open_trial = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._half_open_trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._half_open_trial = False
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                if self.opened_at is None:
+                    logger.error(f"LLM circuit breaker opened after {self.failures} consecutive failures")
+                self.opened_at = time.monotonic()
+
+    def end_trial(self):
+        """Let the next call probe again when a half-open trial ended without a provider verdict"""
+        with self._lock:
+            self._half_open_trial = False
+
+
+# ---------------------------------------------------------------------------
+# Error classification
+# ---------------------------------------------------------------------------
+
+def _status_code(error):
+    code = getattr(error, 'status_code', None)
+    if code is None and getattr(error, 'response', None) is not None:
+        code = getattr(error.response, 'status_code', None)
+    return code
+
+
+def is_retryable(error):
+    """Transient provider failures are retried; quota, auth and malformed requests are not"""
+    message = str(error).lower()
+    if 'insufficient_quota' in message or 'billing' in message:
+        return False
+    name = type(error).__name__
+    if name in ('RateLimitError', 'APITimeoutError', 'APIConnectionError', 'InternalServerError'):
+        return True
+    code = _status_code(error)
+    if code is not None:
+        return code == 429 or code >= 500
+    return 'rate_limit' in message or 'timeout' in message
+
+
+def retry_after_seconds(error):
+    """Read Retry-After / retry-after-ms from the provider response, if present"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        if headers.get('retry-after-ms'):
+            return float(headers['retry-after-ms']) / 1000.0
+        if headers.get('retry-after'):
+            return float(headers['retry-after'])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Gateway
+# ---------------------------------------------------------------------------
+
+def estimate_tokens(params):
+    """Rough prompt + completion token estimate (4 chars/token) used to reserve TPM budget"""
+    prompt_chars = sum(len(str(m.get('content', ''))) for m in params.get('messages', []))
+    return prompt_chars // 4 + int(params.get('max_tokens') or 1000)
+
+
+class LLMGateway:
+    def __init__(self, rate_limiter, circuit_breaker, max_attempts=4, backoff_base=1.0, backoff_max=30.0):
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def backoff_delay(self, attempt, error=None):
+        """Full-jitter exponential backoff, never shorter than the provider's Retry-After"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        retry_after = retry_after_seconds(error) if error is not None else None
+        if retry_after is not None:
+            delay = max(delay, retry_after + random.uniform(0, self.backoff_base))
+        return delay
+
+    def call(self, fn, params):
+        """Run fn() (one provider call) under rate limiting, retries and the circuit breaker"""
+        estimated = estimate_tokens(params)
+        attempt = 0
+        while True:
+            trial = self.circuit_breaker.before_call()
+            try:
+                self.rate_limiter.acquire(estimated)
+                response = fn()
+            except RateLimitWaitExceeded:
+                raise
+            except Exception as error:
+                retryable = is_retryable(error)
+                if retryable:
+                    self.circuit_breaker.record_failure()
+                else:
+                    # Bad request, auth or quota: the provider answered, so it is reachable
+                    self.circuit_breaker.record_success()
+                attempt += 1
+                if not retryable or attempt >= self.max_attempts:
+                    logger.error(f"LLM call failed after {attempt} attempt(s): {type(error).__name__}: {error}")
+                    raise
+                delay = self.backoff_delay(attempt, error)
+                logger.warning(f"LLM call attempt {attempt}/{self.max_attempts} failed "
+                               f"({type(error).__name__}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            else:
+                self.circuit_breaker.record_success()
+            finally:
+                # Every outcome ends this call's half-open trial, including ones that never reached
+                # the provider; calls admitted while closed leave another call's trial alone
+                if trial:
+                    self.circuit_breaker.end_trial()
+
+            usage = getattr(response, 'usage', None)
+            self.rate_limiter.reconcile(estimated, getattr(usage, 'total_tokens', None))
+            return response
+
+
+_gateway = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway():
+    """Return the process-wide gateway configured from settings"""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                if getattr(settings, 'LLM_RATE_LIMIT_STORE', 'local') == 'cache':
+                    store = CacheBucketStore(getattr(settings, 'LLM_CACHE_ALIAS', 'default'))
+                else:
+                    store = LocalBucketStore()
+                _gateway = LLMGateway(
+                    rate_limiter=RateLimiter(
+                        store,
+                        requests_per_minute=getattr(settings, 'LLM_RATE_LIMIT_RPM', 500),
+                        tokens_per_minute=getattr(settings, 'LLM_RATE_LIMIT_TPM', 200000),
+                        max_wait=getattr(settings, 'LLM_RATE_LIMIT_MAX_WAIT', 60),
+                    ),
+                    circuit_breaker=CircuitBreaker(
+                        failure_threshold=getattr(settings, 'LLM_BREAKER_FAILURE_THRESHOLD', 5),
+                        reset_timeout=getattr(settings, 'LLM_BREAKER_RESET_TIMEOUT', 30),
+                    ),
+                    max_attempts=getattr(settings, 'LLM_MAX_ATTEMPTS', 4),
+                    backoff_base=getattr(settings, 'LLM_BACKOFF_BASE', 1.0),
+                    backoff_max=getattr(settings, 'LLM_BACKOFF_MAX', 30.0),
+                )
+    return _gateway
@@ -0,0 +1,386 @@
+"""
+Offline LLM Backend
+Replays recorded completions (or synthetic ones) with realistic latency so the generation
+pipeline - prompt building, parsing, A+ rendering, DB writes - can be exercised and
+load-tested without network access or API spend.
+
+Two ways to plug it in:
+- LLM_BACKEND=replay          -> get_openai_client() returns an in-process OfflineOpenAIClient
+- manage.py serve_llm_standin -> OpenAI-compatible HTTP server; point OPENAI_BASE_URL at it so the
+                                 real SDK, connection pool and gateway are exercised end to end
+"""
+
+import hashlib
+import json
+import logging
+import random
+import re
+import time
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Latency profiles: time to first token, decode speed and injected failure rate
+LATENCY_PROFILES = {
+    'instant': {'ttft': 0.0, 'tokens_per_second': 0, 'jitter': 0.0, 'error_rate': 0.0},
+    'gpt-4o-mini': {'ttft': 0.4, 'tokens_per_second': 90, 'jitter': 0.2, 'error_rate': 0.0},
+    'gpt-5': {'ttft': 1.5, 'tokens_per_second': 45, 'jitter': 0.3, 'error_rate': 0.0},
+    'degraded': {'ttft': 4.0, 'tokens_per_second': 12, 'jitter': 0.5, 'error_rate': 0.2},
+}
+
+DEFAULT_REPLAY_PATHS = [
+    Path(settings.BASE_DIR).parent / 'debug_ai_raw_response.json',
+    Path(settings.BASE_DIR) / 'turkey_raw_ai_response.json',
+]
+
+
+def estimate_token_count(text):
+    """Approximate tokens (4 chars per token) for usage reporting and pacing"""
+    return max(1, len(text or '') // 4)
+
+
+def get_profile(name=None):
+    name = name or getattr(settings, 'LLM_STANDIN_PROFILE', 'instant')
+    if name not in LATENCY_PROFILES:
+        logger.warning(f"Unknown latency profile '{name}', using 'instant'")
+        name = 'instant'
+    return dict(LATENCY_PROFILES[name], name=name)
+
+
+class SimulatedRateLimit(Exception):
+    """Injected provider failure (profile error_rate) - mirrors a 429 with Retry-After"""
+
+    status_code = 429
+    retry_after = 1
+
+
+# "field": followed by the start of its value in a prompt's JSON template
+_TEMPLATE_FIELD = re.compile(r'"([A-Za-z_][A-Za-z0-9_]*)"\s*:\s*([\[{"])')
+
+
+def prompt_key(params):
+    """Prompt hash of a request (the LLM cache key without its prefix; streaming flags excluded)"""
+    from .llm_cache import make_cache_key
+    key = make_cache_key(**{k: v for k, v in params.items() if k not in ('stream', 'stream_options')})
+    return key.rsplit(':', 1)[-1]
+
+
+def requested_fields(params):
+    """{field: '[', '{' or '"'} for every field of the JSON template in the request's messages"""
+    fields = {}
+    for message in params.get('messages', []):
+        for name, opener in _TEMPLATE_FIELD.findall(str(message.get('content', ''))):
+            fields.setdefault(name, opener)
+    return fields
+
+
+def _top_level_keys(content):
+    from .json_repair import parse_llm_json
+    result, _ = parse_llm_json(content)
+    return set(result) if isinstance(result, dict) else set()
+
+
+class ResponseSource:
+    """
+    Picks the completion text for a request.
+    1. <record_dir>/<prompt hash>.json recorded from a real run (exact replay)
+    2. in replay mode, a seed capture whose fields the prompt asks for (Amazon captures never
+       answer a Walmart or Etsy prompt), chosen by prompt hash so the same request always
+       gets the same capture regardless of call order
+    3. otherwise a synthetic completion shaped like the prompt's JSON template
+    """
+
+    def __init__(self, replay_paths=None, record_dir=None, mode=None):
+        self.mode = mode or getattr(settings, 'LLM_STANDIN_MODE', 'replay')
+        paths = replay_paths or getattr(settings, 'LLM_REPLAY_PATHS', None) or DEFAULT_REPLAY_PATHS
+        record_dir = record_dir or getattr(settings, 'LLM_RECORD_DIR', '')
+        self.record_dir = Path(record_dir) if record_dir else None
+        self.seeds = []  # (content, top-level keys)
+        if self.mode != 'synthetic':
+            for path in paths:
+                path = Path(path)
+                if path.is_file():
+                    content = path.read_text(encoding='utf-8')
+                    self.seeds.append((content, _top_level_keys(content)))
+                else:
+                    logger.warning(f"Replay capture not found: {path}")
+
+    def matching_seeds(self, params):
+        """Seeds most of whose top-level fields the prompt requests (every seed if it names none)"""
+        fields = requested_fields(params)
+        if not fields:
+            return [content for content, _ in self.seeds]
+        return [content for content, keys in self.seeds if keys and len(keys & fields.keys()) * 2 >= len(keys)]
+
+    def content_for(self, params):
+        key = prompt_key(params)
+        if self.record_dir is not None:
+            recorded = self.record_dir / f"{key}.json"
+            if recorded.is_file():
+                return recorded.read_text(encoding='utf-8')
+
+        seeds = self.matching_seeds(params) if self.seeds else []
+        if seeds:
+            return seeds[int(key, 16) % len(seeds)]
+
+        return synthetic_content(params)
+
+
+def synthetic_content(params):
+    """
+    Deterministic placeholder sized roughly to the requested max_tokens, with the fields (and
+    list/object/string shapes) of the prompt's JSON template - an Amazon-style listing if it has none
+    """
+    prompt = json.dumps(params.get('messages', []), ensure_ascii=False)
+    seed = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:8]
+    target_chars = min(int(params.get('max_tokens') or 1000), 4000) * 3
+    filler = ("Synthetic sentence for offline load testing. " * (target_chars // 45 + 1))[:target_chars // 3]
+    fields = requested_fields(params)
+    if fields:
+        shapes = {
+            '[': lambda name: [f'{name} {i + 1}: {filler[:120]}' for i in range(5)],
+            '{': lambda name: {},
+            '"': lambda name: f'Synthetic {name} {seed}: {filler[:300]}',
+        }
+        return json.dumps({name: shapes[opener](name) for name, opener in fields.items()}, ensure_ascii=False)
+    return json.dumps({
+        'productTitle': f'Synthetic Product {seed}',
+        'bulletPoints': [f'FEATURE {i + 1}: {filler[:200]}' for i in range(5)],
+        'productDescription': filler,
+        'seoKeywords': {'primary': ['synthetic', 'offline', 'test'], 'longTail': ['synthetic offline test listing']},
+        'backendKeywords': 'synthetic offline load test',
+    }, ensure_ascii=False)
+
+
+def record_completion(params, content):
+    """Save a real completion under its prompt hash so it can be replayed exactly later"""
+    record_dir = getattr(settings, 'LLM_RECORD_DIR', '')
+    if not record_dir or not content:
+        return
+    key = prompt_key(params)
+    try:
+        path = Path(record_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        (path / f"{key}.json").write_text(content, encoding='utf-8')
+    except OSError as e:
+        logger.warning(f"Could not record completion {key[:12]}: {e}")
+
+
+def _split_tokens(content):
+    return [content[i:i + 4] for i in range(0, len(content), 4)]
+
+
+def completion_payload(content, model, finish_reason='stop', prompt_tokens=0):
+    completion_tokens = estimate_token_count(content)
+    return {
+        'id': f'chatcmpl-standin-{uuid.uuid4().hex[:12]}',
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': model,
+        'choices': [{
+            'index': 0,
+            'finish_reason': finish_reason,
+            'message': {'role': 'assistant', 'content': content},
+        }],
+        'usage': {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'total_tokens': prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def chunk_payloads(content, model, prompt_tokens=0, include_usage=False, tick=0.05, tokens_per_second=0):
+    """chat.completion.chunk dicts, grouped so each chunk covers ~tick seconds of decode"""
+    completion_id = f'chatcmpl-standin-{uuid.uuid4().hex[:12]}'
+    created = int(time.time())
+    pieces = _split_tokens(content)
+    per_chunk = max(1, int(tokens_per_second * tick)) if tokens_per_second else 16
+
+    def chunk(delta, finish_reason=None, usage=None):
+        return {
+            'id': completion_id,
+            'object': 'chat.completion.chunk',
+            'created': created,
+            'model': model,
+            'choices': [] if usage else [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}],
+            'usage': usage,
+        }
+
+    yield chunk({'role': 'assistant', 'content': ''})
+    for i in range(0, len(pieces), per_chunk):
+        yield chunk({'content': ''.join(pieces[i:i + per_chunk])})
+    yield chunk({}, finish_reason='stop')
+    if include_usage:
+        completion_tokens = estimate_token_count(content)
+        yield chunk(None, usage={
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'total_tokens': prompt_tokens + completion_tokens,
+        })
+
+
+class LatencySimulator:
+    def __init__(self, profile):
+        self.profile = profile
+
+    def _jittered(self, seconds):
+        jitter = self.profile['jitter']
+        return max(0.0, seconds * random.uniform(1 - jitter, 1 + jitter)) if jitter else seconds
+
+    def maybe_fail(self):
+        if self.profile['error_rate'] and random.random() < self.profile['error_rate']:
+            raise SimulatedRateLimit("Simulated rate limit from offline LLM stand-in")
+
+    def first_token(self):
+        if self.profile['ttft']:
+            time.sleep(self._jittered(self.profile['ttft']))
+
+    def decode(self, token_count):
+        rate = self.profile['tokens_per_second']
+        if rate:
+            time.sleep(self._jittered(token_count / rate))
+
+
+# ---------------------------------------------------------------------------
+# In-process client (LLM_BACKEND=replay)
+# ---------------------------------------------------------------------------
+
+class _Completions:
+    def __init__(self, owner):
+        self.owner = owner
+
+    def create(self, stream=False, stream_options=None, **params):
+        from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+        model = params.get('model', 'standin')
+        content = self.owner.source.content_for(params)
+        prompt_tokens = estimate_token_count(json.dumps(params.get('messages', []), ensure_ascii=False))
+        simulator = self.owner.simulator
+        simulator.maybe_fail()
+        simulator.first_token()
+
+        if not stream:
+            simulator.decode(estimate_token_count(content))
+            return ChatCompletion.model_validate(completion_payload(content, model, prompt_tokens=prompt_tokens))
+
+        include_usage = bool((stream_options or {}).get('include_usage'))
+        rate = simulator.profile['tokens_per_second']
+
+        def iterate():
+            for payload in chunk_payloads(content, model, prompt_tokens, include_usage, tokens_per_second=rate):
+                delta = (payload['choices'][0]['delta'] or {}).get('content') if payload['choices'] else ''
+                simulator.decode(estimate_token_count(delta) if delta else 0)
+                yield ChatCompletionChunk.model_validate(payload)
+
+        return iterate()
+
+
+class _Chat:
+    def __init__(self, owner):
+        self.completions = _Completions(owner)
+
+
+class OfflineOpenAIClient:
+    """Duck-typed stand-in for openai.OpenAI exposing chat.completions.create"""
+
+    def __init__(self, source=None, profile=None):
+        self.source = source or ResponseSource()
+        self.simulator = LatencySimulator(profile or get_profile())
+        self.chat = _Chat(self)
+
+    def close(self):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# OpenAI-compatible HTTP stand-in (manage.py serve_llm_standin)
+# ---------------------------------------------------------------------------
+
+def make_handler(source, simulator):
+    from http.server import BaseHTTPRequestHandler
+
+    class StandinHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            logger.debug("standin: " + format % args)
+
+        def _send_json(self, status, payload, headers=None):
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path.rstrip('/').endswith('/models'):
+                self._send_json(200, {'object': 'list', 'data': [
+                    {'id': 'gpt-5-chat-latest', 'object': 'model'}, {'id': 'gpt-4o-mini', 'object': 'model'},
+                ]})
+            else:
+                self._send_json(404, {'error': {'message': 'Not found', 'type': 'invalid_request_error'}})
+
+        def do_POST(self):
+            if not self.path.rstrip('/').endswith('/chat/completions'):
+                self._send_json(404, {'error': {'message': 'Not found', 'type': 'invalid_request_error'}})
+                return
+
+            length = int(self.headers.get('Content-Length') or 0)
+            params = json.loads(self.rfile.read(length) or b'{}')
+            stream = params.pop('stream', False)
+            stream_options = params.pop('stream_options', None) or {}
+            model = params.get('model', 'standin')
+
+            try:
+                simulator.maybe_fail()
+            except SimulatedRateLimit as e:
+                self._send_json(429, {'error': {'message': str(e), 'type': 'rate_limit_error', 'code': 'rate_limit_exceeded'}},
+                                headers={'Retry-After': str(SimulatedRateLimit.retry_after)})
+                return
+
+            content = source.content_for(params)
+            prompt_tokens = estimate_token_count(json.dumps(params.get('messages', []), ensure_ascii=False))
+            simulator.first_token()
+
+            if not stream:
+                simulator.decode(estimate_token_count(content))
+                self._send_json(200, completion_payload(content, model, prompt_tokens=prompt_tokens))
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            rate = simulator.profile['tokens_per_second']
+            for payload in chunk_payloads(content, model, prompt_tokens,
+                                          include_usage=bool(stream_options.get('include_usage')),
+                                          tokens_per_second=rate):
+                delta = (payload['choices'][0]['delta'] or {}).get('content') if payload['choices'] else ''
+                simulator.decode(estimate_token_count(delta) if delta else 0)
+                self.wfile.write(f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode('utf-8'))
+                self.wfile.flush()
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+            self.close_connection = True
+
+    return StandinHandler
+
+
+def build_server(host='127.0.0.1', port=8765, profile=None, replay_paths=None):
+    """Create the OpenAI-compatible stand-in server (call serve_forever() to run it)"""
+    from http.server import ThreadingHTTPServer
+
+    source = ResponseSource(replay_paths=replay_paths)
+    simulator = LatencySimulator(get_profile(profile))
+    server = ThreadingHTTPServer((host, port), make_handler(source, simulator))
+    server.daemon_threads = True
+    return server
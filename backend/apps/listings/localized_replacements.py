@@ -0,0 +1,225 @@
+"""
+Localized Replacement Engine
+Per-marketplace glossaries (English leftovers in translated A+ content, FAQ prefixes, ...) are
+compiled once into a single trie-shaped regex each. One pass over a field replaces every term on
+word boundaries, keeps the casing of the matched text and counts hits per term, so the cost is
+linear in the text no matter how large a glossary grows. LOCALIZED_GLOSSARY_PATH can point to a
+JSON file ({marketplace: {group: {term: replacement}}}) that extends or overrides the built-ins.
+"""
+
+import functools
+import json
+import logging
+import re
+import threading
+from collections import Counter
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# English words the Swedish A+ generation leaves behind (identity entries such as
+# 'Premium' or 'Design' are international terms and deliberately absent)
+SWEDISH_APLUS_TERMS = {
+    'everyday use': 'daglig användning',
+    'versatile applications': 'mångsidig användning',
+    'practical': 'praktisk',
+    'convenient': 'bekväm',
+    'customer satisfaction': 'kundnöjdhet',
+    'package contents': 'förpackningsinnehåll',
+    'Quality': 'Kvalitet',
+    'Professional': 'Professionell',
+    'Advanced': 'Avancerad',
+    'Superior': 'Överlägsen',
+    'Features': 'Funktioner',
+    'Benefits': 'Fördelar',
+    'Experience': 'Upplevelse',
+    'Perfect': 'Perfekt',
+    'Ultimate': 'Ultimat',
+    'Guarantee': 'Garanti',
+    'Warranty': 'Garanti',
+    'Satisfaction': 'Tillfredsställelse',
+    'Customer': 'Kund',
+    'Product': 'Produkt',
+    'Kitchen': 'Kök',
+    'Cutting': 'Skär',
+    'Board': 'Bräda',
+    'Package': 'Paket',
+    'excellent': 'utmärkt',
+    'amazing': 'fantastisk',
+    'wonderful': 'underbar',
+    'great': 'bra',
+    'good': 'bra',
+    'best': 'bäst',
+    'top': 'topp',
+    'high': 'hög',
+    'low': 'låg',
+    'easy': 'lätt',
+    'simple': 'enkel',
+    'quick': 'snabb',
+    'fast': 'snabb',
+    'strong': 'stark',
+    'powerful': 'kraftfull',
+    'effective': 'effektiv',
+    'efficient': 'effektiv',
+    'reliable': 'pålitlig',
+    'durable': 'hållbar',
+    'safe': 'säker',
+    'secure': 'säker',
+}
+
+# group: (listing fields it applies to, case sensitive, skip HTML tags)
+GROUPS = {
+    'aplus': (['amazon_aplus_content'], False, True),
+    'faq_prefixes': (['faqs'], True, False),
+}
+
+MARKET_GLOSSARIES = {
+    'se': {'aplus': SWEDISH_APLUS_TERMS},
+    'pl': {'faq_prefixes': {'Q:': 'P:', 'A:': 'O:'}},
+    'tr': {'faq_prefixes': {'Q:': 'S:', 'A:': 'C:'}},
+    'be': {'faq_prefixes': {'A:': 'R:'}},
+}
+
+_WORD_CHAR = re.compile(r'\w')
+
+
+def _trie_pattern(terms):
+    """
+    One regex for all terms, factored by shared prefixes so matching at a position costs at most
+    one branch per character. Word boundaries are added only where a term starts or ends with a
+    word character ('top' won't match inside 'stop', while 'Q:' still matches before any text).
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def branch(node, last_char):
+        alternatives = [re.escape(char) + branch(child, char) for char, child in sorted(node.items()) if char]
+        if '' in node:
+            # Empty alternative last, so longer terms sharing this prefix are tried first
+            alternatives.append(r'(?!\w)' if _WORD_CHAR.match(last_char) else '')
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')'
+
+    roots = [(r'(?<!\w)' if _WORD_CHAR.match(char) else '') + re.escape(char) + branch(child, char)
+             for char, child in sorted(trie.items())]
+    return '(?:' + '|'.join(roots) + ')'
+
+
+def _match_case(found, replacement):
+    """Carry the casing of the matched text over: UPPER, Title or lower"""
+    if len(found) > 1 and found.isupper():
+        return replacement.upper()
+    if found[:1].isupper():
+        return replacement[:1].upper() + replacement[1:]
+    if found[:1].islower():
+        return replacement[:1].lower() + replacement[1:]
+    return replacement
+
+
+class Glossary:
+    """A compiled term -> replacement table with cumulative per-term hit counts"""
+
+    def __init__(self, name, terms, case_sensitive=False, skip_markup=False):
+        self.name = name
+        self.case_sensitive = case_sensitive
+        # No-op entries are dropped; case-insensitive keys are stored lower-cased
+        self._terms = {}
+        for term, replacement in terms.items():
+            if term and term != replacement:
+                self._terms[term if case_sensitive else term.lower()] = (term, replacement)
+        self.hits = Counter()
+        self._lock = threading.Lock()
+
+        pattern = _trie_pattern(self._terms) if self._terms else None
+        if pattern and skip_markup:
+            # Tags are matched (and put back unchanged) so class names and URLs are never rewritten
+            pattern = r'(?P<tag><[^>]*>)|' + pattern
+        self._regex = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE) if pattern else None
+
+    def __len__(self):
+        return len(self._terms)
+
+    def apply(self, text):
+        """(new text, Counter of hits by term) after a single pass over text"""
+        if not text or self._regex is None:
+            return text, Counter()
+        hits = Counter()
+
+        def substitute(match):
+            if match.lastgroup == 'tag':
+                return match.group(0)
+            found = match.group(0)
+            term, replacement = self._terms[found if self.case_sensitive else found.lower()]
+            hits[term] += 1
+            return replacement if self.case_sensitive else _match_case(found, replacement)
+
+        result = self._regex.sub(substitute, text)
+        if hits:
+            with self._lock:
+                self.hits.update(hits)
+        return result, hits
+
+
+def _configured_glossaries():
+    """Built-in glossaries merged with the LOCALIZED_GLOSSARY_PATH file, if any"""
+    merged = {market: {group: dict(terms) for group, terms in groups.items()}
+              for market, groups in MARKET_GLOSSARIES.items()}
+    path = getattr(settings, 'LOCALIZED_GLOSSARY_PATH', '')
+    if not path:
+        return merged
+    try:
+        with open(path, encoding='utf-8') as handle:
+            extra = json.load(handle)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not load glossary file {path}: {e}")
+        return merged
+    for market, groups in extra.items():
+        for group, terms in groups.items():
+            if group not in GROUPS:
+                logger.warning(f"Glossary file {path}: unknown group '{group}' for {market} ignored")
+                continue
+            merged.setdefault(market, {}).setdefault(group, {}).update(terms)
+    return merged
+
+
+@functools.lru_cache(maxsize=None)
+def get_glossary(marketplace, group):
+    """The compiled glossary for a marketplace and group (built on first use), or None"""
+    terms = _configured_glossaries().get(marketplace, {}).get(group)
+    if not terms:
+        return None
+    _, case_sensitive, skip_markup = GROUPS[group]
+    glossary = Glossary(f"{marketplace}:{group}", terms, case_sensitive=case_sensitive, skip_markup=skip_markup)
+    logger.info(f"Compiled glossary {glossary.name} ({len(glossary)} terms)")
+    return glossary
+
+
+def localize_text(marketplace, group, text):
+    """Apply one marketplace glossary group to text; returns (text, hits)"""
+    glossary = get_glossary(marketplace, group)
+    if glossary is None:
+        return text, Counter()
+    return glossary.apply(text)
+
+
+def localize_listing(listing, marketplace, groups=None):
+    """
+    Apply every glossary group of the marketplace (or just `groups`) to the listing fields it
+    covers, in place. Returns {field: Counter of hits} for fields that changed.
+    """
+    changed = {}
+    for group in groups or GROUPS:
+        if get_glossary(marketplace, group) is None:
+            continue
+        for field in GROUPS[group][0]:
+            text, hits = localize_text(marketplace, group, getattr(listing, field, '') or '')
+            if hits:
+                setattr(listing, field, text)
+                changed[field] = hits
+    return changed
@@ -0,0 +1,122 @@
+"""
+Benchmark A+ rendering: whole documents per marketplace, and each compiled template against
+str.format on the same source.
+
+    python manage.py benchmark_aplus_rendering
+    python manage.py benchmark_aplus_rendering captures/*.json --markets us,de,jp --repeat 500
+"""
+
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.listings import aplus_renderer
+from apps.listings.json_repair import parse_llm_json
+from apps.listings.llm_standin import DEFAULT_REPLAY_PATHS
+
+# Used when no recorded response carries an aPlusContentPlan
+SAMPLE_PLAN = {
+    f"section{number}_{name}": {
+        'title': f"{name.replace('_', ' ').title()} headline",
+        'content': f"{name.replace('_', ' ').title()} copy for the product. " * 6,
+        'keywords': ['premium quality', 'durable', 'easy to use'],
+        'imageDescription': f"{name} lifestyle image with the product in use (970x600px)",
+        'seoOptimization': f"{name} keywords in headline and body",
+        'cardType': name,
+        'visualTemplate': {
+            'templateType': 'lifestyle', 'imageTitle': 'Image title', 'suggestedScene': 'Scene',
+            'overlayText': 'Overlay', 'styleGuide': 'Clean', 'layoutStructure': 'Left image, right text',
+            'colorScheme': 'Brand colors', 'designElements': ['logo', 'badge', 'icons'],
+        },
+    }
+    for number, name in enumerate(
+        ['hero', 'features', 'usage', 'quality', 'guarantee', 'social_proof', 'comparison', 'package'], 1
+    )
+}
+SAMPLE_PLAN['overallStrategy'] = 'Guide shoppers from awareness to purchase'
+
+
+def _sample_page(result):
+    hero = result.get('aPlusContentPlan', {}).get('section1_hero', {})
+    bullets = result.get('bulletPoints') or []
+    return {
+        'hero_title': hero.get('title') or result.get('productTitle', ''),
+        'hero_content': hero.get('content') or result.get('productDescription', ''),
+        'features': bullets if isinstance(bullets, list) else [bullets],
+        'whats_in_box': result.get('whatsInBox', ['Product', 'User manual']),
+        'trust': result.get('trustBuilders', aplus_renderer.DEFAULT_TRUST_ITEMS),
+        'faqs': result.get('faqs', []),
+        'social_proof': result.get('socialProof', ''),
+        'guarantee': result.get('guarantee', ''),
+        'ppc_strategy': result.get('ppcStrategy', {}),
+        'trust_builders': '\n'.join(result.get('trustBuilders', [])),
+        'faqs_text': '\n\n'.join(result.get('faqs', [])),
+    }
+
+
+def _per_call_ms(function, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+class Command(BaseCommand):
+    help = 'Time A+ document rendering per marketplace and compiled templates against str.format'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*',
+                            help='Raw LLM responses with an aPlusContentPlan (default: the repo captures plus LLM_RECORD_DIR)')
+        parser.add_argument('--markets', default='us,uk,de,fr,es,jp,nl,se,tr,mx,pl,sa',
+                            help='Comma-separated marketplaces to render for')
+        parser.add_argument('--repeat', type=int, default=200, help='Renders per document and marketplace')
+
+    def handle(self, *args, **options):
+        paths = [Path(p) for p in options['paths']] or list(DEFAULT_REPLAY_PATHS)
+        record_dir = getattr(settings, 'LLM_RECORD_DIR', '')
+        if not options['paths'] and record_dir and Path(record_dir).is_dir():
+            paths += sorted(Path(record_dir).glob('*.json'))
+
+        documents = []
+        for path in paths:
+            if not path.is_file():
+                continue
+            result, _ = parse_llm_json(path.read_text(encoding='utf-8'))
+            if isinstance(result, dict) and isinstance(result.get('aPlusContentPlan'), dict):
+                documents.append((path.name, result))
+        if not documents:
+            self.stdout.write(self.style.WARNING('No recorded aPlusContentPlan found - using the built-in sample plan'))
+            documents = [('sample plan', {'aPlusContentPlan': SAMPLE_PLAN})]
+
+        repeat = max(1, options['repeat'])
+        markets = [market.strip() for market in options['markets'].split(',') if market.strip()]
+        total_ms, renders = 0.0, 0
+        for name, result in documents:
+            plan, page = result['aPlusContentPlan'], _sample_page(result)
+            self.stdout.write(f"{name} ({len(aplus_renderer.render_sections(plan, 'us'))} sections)")
+            for market in markets:
+                html = aplus_renderer.render_aplus(plan, page, market)
+                elapsed = _per_call_ms(lambda: aplus_renderer.render_aplus(plan, page, market), repeat)
+                total_ms += elapsed
+                renders += 1
+                self.stdout.write(f"  {market:3s}: {len(html):6d} chars  {elapsed:7.3f} ms")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{total_ms / renders:.3f} ms per document, {1000 * renders / total_ms:.0f} documents/s on one core"
+        ))
+
+        # Compiled chunk join vs str.format over the same template source and values
+        plan = documents[0][1]['aPlusContentPlan']
+        section_key, section = next(((key, value) for key, value in plan.items() if isinstance(value, dict)),
+                                    ('section1_hero', SAMPLE_PLAN['section1_hero']))
+        card = aplus_renderer.render_section(section_key, section, 'us')
+        values = {field: 'x' * 40 for literal, field in aplus_renderer.SECTION_CARD.chunks if not literal}
+        page_values = {field: card for literal, field in aplus_renderer.PAGE.chunks if not literal}
+        for label, template, sample in (('section card', aplus_renderer.SECTION_CARD, values),
+                                        ('page', aplus_renderer.PAGE, page_values)):
+            compiled = _per_call_ms(lambda: template.render(sample), repeat * 10) * 1000
+            formatted = _per_call_ms(lambda: template.source.format_map(sample), repeat * 10) * 1000
+            self.stdout.write(f"{label:12s}: compiled {compiled:7.2f} us  str.format {formatted:7.2f} us  "
+                              f"({formatted / compiled:.1f}x)")
@@ -0,0 +1,246 @@
+"""
+Benchmark the lenient JSON parser against the old multi-attempt parsing chain on recorded LLM responses.
+
+    python manage.py benchmark_json_parsing
+    python manage.py benchmark_json_parsing captures/*.json --language de --repeat 200
+"""
+
+import contextlib
+import io
+import json
+import re
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.listings.json_repair import parse_llm_json
+from apps.listings.llm_standin import DEFAULT_REPLAY_PATHS
+
+
+def _fix_unterminated_strings_and_parse(json_text):
+    """The former ListingGeneratorService helper, kept here for comparison only"""
+    fixed = json_text.strip()
+
+    quote_count = 0
+    in_string = False
+    escaped = False
+    last_quote_pos = -1
+    for i, char in enumerate(fixed):
+        if char == '\\' and not escaped:
+            escaped = True
+            continue
+        if char == '"' and not escaped:
+            in_string = not in_string
+            if in_string:
+                last_quote_pos = i
+            quote_count += 1
+        escaped = False
+
+    if in_string and quote_count % 2 == 1:
+        insert_pos = len(fixed)
+        for pattern in ['}', ']', '"}', '"]']:
+            pos = fixed.rfind(pattern)
+            if pos > last_quote_pos:
+                insert_pos = pos
+                break
+        if insert_pos < len(fixed):
+            fixed = fixed[:insert_pos] + '"' + fixed[insert_pos:]
+        else:
+            fixed = fixed + '"}'
+
+    if not fixed.endswith('}') and not fixed.endswith(']'):
+        brace_pos = fixed.rfind('}')
+        if brace_pos > 0:
+            fixed = fixed[:brace_pos + 1]
+
+    try:
+        return json.loads(fixed)
+    except json.JSONDecodeError:
+        clean_lines = []
+        for line in fixed.split('\n'):
+            if line.strip().endswith(',') or line.strip().endswith('{') or line.strip().endswith('['):
+                clean_lines.append(line)
+            elif '"' in line and ':' in line:
+                clean_lines.append(line)
+            elif line.strip() in ['}', ']', '},', '],']:
+                clean_lines.append(line)
+                break
+        attempt2 = '\n'.join(clean_lines)
+        if not attempt2.endswith('}'):
+            attempt2 += '}'
+        return json.loads(attempt2)
+
+
+def _legacy_cleanup(content):
+    """The regex clean-up pass the old chain ran before its second round of attempts"""
+    cleaned = content.strip()
+    start_brace = cleaned.find('{')
+    if start_brace > 0:
+        cleaned = cleaned[start_brace:]
+    end_brace = cleaned.rfind('}')
+    if end_brace > 0:
+        cleaned = cleaned[:end_brace + 1]
+    if cleaned.startswith('```json'):
+        cleaned = cleaned[7:]
+    if cleaned.endswith('```'):
+        cleaned = cleaned[:-3]
+
+    cleaned = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', cleaned)
+    cleaned = re.sub(r'\\\"', "'", cleaned)
+    cleaned = re.sub(r':"\\?"([^"]+)\\?"",', r':"\1",', cleaned)
+    cleaned = re.sub(r':"\\?"([^"]+)\\?"}', r':"\1"}', cleaned)
+    cleaned = re.sub(r',(\s*[}\]])', r'\1', cleaned)
+    cleaned = re.sub(r',\s*}', '}', cleaned)
+    cleaned = re.sub(r',\s*]', ']', cleaned)
+    start_idx = cleaned.find('{')
+    end_idx = cleaned.rfind('}') + 1
+    if start_idx >= 0 and end_idx > start_idx:
+        cleaned = cleaned[start_idx:end_idx]
+    cleaned = re.sub(r',(\s*[}\]])', r'\1', cleaned)
+
+    faqs_match = re.search(r'"faqs":\s*\[(.*?)\]', cleaned, re.DOTALL)
+    if faqs_match:
+        fixed_faqs = []
+        for part in re.split(r'",\s*"(?=Q":|Q\d+":)', faqs_match.group(1)):
+            part = part.strip().strip('"')
+            q_match = re.search(r'Q\d*":\s*"([^"]+)"', part)
+            a_match = re.search(r'"A\d*":\s*([^,]+)', part)
+            if q_match and a_match:
+                answer = re.sub(r'[",]+$', '', a_match.group(1).strip('"').strip())
+                fixed_faqs.append(f'"Q: {q_match.group(1)} A: {answer}"')
+        if fixed_faqs:
+            fixed_faqs_str = '[' + ', '.join(fixed_faqs) + ']'
+            cleaned = re.sub(r'"faqs":\s*\[.*?\]', lambda _: f'"faqs":{fixed_faqs_str}', cleaned, flags=re.DOTALL)
+    cleaned = re.sub(r'"(Q\d+)":\s*"([^"]*)"(A\d+)":\s*"([^"]*)"', r'"\1: \2 \3: \4"', cleaned)
+    cleaned = re.sub(r'"A":\s*Yes"', r'A: Yes"', cleaned)
+    cleaned = re.sub(r'"A":\s*No"', r'A: No"', cleaned)
+    cleaned = re.sub(r'",\s*([^"\[\]{}]+),\s*"', r'", "\1", "', cleaned)
+    cleaned = re.sub(r'",\s*([^"\[\]{}]+)\s*\]', r'", "\1"]', cleaned)
+    cleaned = re.sub(r'\[\s*([^"\[\]{}]+),\s*"', r'["\1", "', cleaned)
+    cleaned = re.sub(r'[\s\t]*"?(\w+)"?\s*:', r'"\1":', cleaned)
+    cleaned = re.sub(r':\s*([^"\[\{0-9][^,\}\]]*[^,\}\]\s]),?', r': "\1",', cleaned)
+    cleaned = re.sub(r':\s*([^"\[\{0-9][^,\}\]]*[^,\}\]\s])$', r': "\1"', cleaned, flags=re.MULTILINE)
+    if not cleaned.strip().endswith('}'):
+        cleaned = cleaned.strip() + '}'
+    return cleaned
+
+
+def legacy_parse_chain(content, language='en'):
+    """
+    The parsing chain the Amazon generator used before json_repair (log lines removed).
+    Returns (value, strategy) with value None when every strategy failed.
+    """
+    content = content.strip()
+    try:
+        return json.loads(content), 'direct'
+    except json.JSONDecodeError:
+        pass
+
+    cleaned = content
+    for pattern in (r'```json\s*(.*?)\s*```', r'```\s*(.*?)\s*```', r'`(.*?)`'):
+        match = re.search(pattern, cleaned, re.DOTALL)
+        if match:
+            cleaned = match.group(1).strip()
+            break
+    try:
+        return json.loads(cleaned), 'markdown cleanup'
+    except json.JSONDecodeError:
+        pass
+
+    start, end = content.find('{'), content.rfind('}')
+    if start != -1 and end > start:
+        try:
+            return json.loads(content[start:end + 1]), 'boundary detection'
+        except json.JSONDecodeError:
+            pass
+
+    flattened = ' '.join(content.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ').split())
+    try:
+        return json.loads(re.sub(r'(\w+):', r'"\1":', flattened.replace("'", '"'))), 'character cleanup'
+    except json.JSONDecodeError:
+        pass
+
+    cleaned = _legacy_cleanup(content)
+    attempts = [
+        ('strip and parse', lambda x: json.loads(x.strip().replace('\n', ' ').replace('\t', ' '))),
+        ('extra cleanup', lambda x: json.loads(re.sub(r'\s+', ' ', x.strip()))),
+        ('international chars', lambda x: json.loads(x.strip(), strict=False)),
+        ('escape fix', lambda x: json.loads(x.replace('\\"', '"').replace('\\n', '\n'), strict=False)),
+        ('unterminated string fix', _fix_unterminated_strings_and_parse),
+    ]
+    for name, parse in attempts:
+        try:
+            return parse(cleaned), name
+        except json.JSONDecodeError:
+            continue
+
+    if language and language != 'en':
+        from apps.listings.international_content_extractor import InternationalContentExtractor
+        extracted = InternationalContentExtractor().extract_international_content(content, language)
+        if extracted:
+            return extracted, 'international extractor'
+
+    title_match = re.search(r'"productTitle":\s*"(.*?)"(?=\s*[,}])', cleaned, re.DOTALL)
+    if title_match:
+        return {'productTitle': title_match.group(1)}, 'manual reconstruction'
+    return None, 'failed'
+
+
+def _top_level_keys(value):
+    return len(value) if isinstance(value, dict) else 0
+
+
+class Command(BaseCommand):
+    help = 'Compare parse success, recovered fields and time per parse of the lenient parser and the legacy chain'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*',
+                            help='Raw LLM responses (default: the repo captures plus LLM_RECORD_DIR)')
+        parser.add_argument('--language', default='en', help='Marketplace language passed to the legacy chain')
+        parser.add_argument('--repeat', type=int, default=50, help='Parses per file when timing')
+
+    def handle(self, *args, **options):
+        paths = [Path(p) for p in options['paths']] or list(DEFAULT_REPLAY_PATHS)
+        record_dir = getattr(settings, 'LLM_RECORD_DIR', '')
+        if not options['paths'] and record_dir and Path(record_dir).is_dir():
+            paths += sorted(Path(record_dir).glob('*.json'))
+        paths = [p for p in paths if p.is_file()]
+        if not paths:
+            self.stdout.write(self.style.WARNING('No recorded responses found'))
+            return
+
+        repeat = max(1, options['repeat'])
+        totals = {'legacy': [0, 0.0], 'lenient': [0, 0.0]}
+        for path in paths:
+            content = path.read_text(encoding='utf-8')
+
+            # The international extractor prints debug lines; keep them out of the report
+            with contextlib.redirect_stdout(io.StringIO()):
+                legacy, strategy = legacy_parse_chain(content, options['language'])
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    legacy_parse_chain(content, options['language'])
+                legacy_ms = (time.perf_counter() - started) * 1000 / repeat
+
+            lenient, repairs = parse_llm_json(content)
+            started = time.perf_counter()
+            for _ in range(repeat):
+                parse_llm_json(content)
+            lenient_ms = (time.perf_counter() - started) * 1000 / repeat
+
+            totals['legacy'][0] += isinstance(legacy, dict)
+            totals['legacy'][1] += legacy_ms
+            totals['lenient'][0] += isinstance(lenient, dict)
+            totals['lenient'][1] += lenient_ms
+
+            self.stdout.write(f"{path.name} ({len(content)} chars)")
+            self.stdout.write(f"  legacy : {_top_level_keys(legacy):3d} keys  {legacy_ms:8.3f} ms  via {strategy}")
+            self.stdout.write(f"  lenient: {_top_level_keys(lenient):3d} keys  {lenient_ms:8.3f} ms  "
+                              f"repairs: {', '.join(repairs) or 'none'}")
+
+        for name, (parsed, elapsed) in totals.items():
+            self.stdout.write(self.style.SUCCESS(
+                f"{name}: {parsed}/{len(paths)} parsed, {elapsed / len(paths):.3f} ms per response"
+            ))
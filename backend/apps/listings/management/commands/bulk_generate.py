@@ -0,0 +1,80 @@
+"""
+Generate listings for a whole catalog.
+
+    python manage.py bulk_generate catalog.csv --platforms amazon,walmart --marketplaces us,de --workers 4
+    python manage.py bulk_generate --resume 12
+"""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.listings.bulk import BatchBusyError, CatalogError, parse_catalog, create_batch, run_batch
+
+
+def _format_eta(seconds):
+    if seconds is None:
+        return '--'
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{seconds:02d}s"
+
+
+class Command(BaseCommand):
+    help = 'Create products from a CSV/JSON catalog and generate their listings with a bounded worker pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument('catalog', nargs='?', help='CSV or JSON catalog file')
+        parser.add_argument('--platforms', default='amazon', help='Comma-separated platforms (default: amazon)')
+        parser.add_argument('--marketplaces', default='us', help='Comma-separated marketplaces (default: us)')
+        parser.add_argument('--workers', type=int, default=None, help='Concurrent generations (default: BULK_GENERATION_WORKERS)')
+        parser.add_argument('--name', default='', help='Batch label')
+        parser.add_argument('--resume', type=int, metavar='BATCH_ID', help='Resume an interrupted batch instead of importing')
+        parser.add_argument('--nocache', action='store_true', help='Bypass the LLM response cache')
+        parser.add_argument('--interval', type=int, default=10, help='Seconds between progress lines')
+
+    def handle(self, *args, **options):
+        if options['resume']:
+            batch_id = options['resume']
+            self.stdout.write(f"Resuming bulk batch {batch_id}")
+        else:
+            if not options['catalog']:
+                raise CommandError("Provide a catalog file or --resume BATCH_ID")
+            path = Path(options['catalog'])
+            if not path.is_file():
+                raise CommandError(f"Catalog not found: {path}")
+            try:
+                definitions = parse_catalog(path.read_bytes(), 'json' if path.suffix.lower() == '.json' else 'csv')
+                batch = create_batch(definitions, options['platforms'], options['marketplaces'],
+                                     name=options['name'] or path.name)
+            except CatalogError as e:
+                raise CommandError(str(e))
+            batch_id = batch.id
+            self.stdout.write(self.style.SUCCESS(
+                f"Created batch {batch_id}: {len(definitions)} catalog rows -> {batch.total_items} generations"
+            ))
+
+        def report(progress):
+            self.stdout.write(
+                f"[batch {progress['batch_id']}] {progress['completed_items']} ok / {progress['failed_items']} failed "
+                f"/ {progress['total_items']} ({progress['percent_complete']}%) - "
+                f"{progress['throughput_per_minute']}/min - ETA {_format_eta(progress['eta_seconds'])}"
+            )
+
+        try:
+            progress = run_batch(batch_id, workers=options['workers'], bypass_cache=options['nocache'],
+                                 progress_callback=report, progress_interval=options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING(
+                f"Interrupted - in-flight items finished; resume with: manage.py bulk_generate --resume {batch_id}"
+            ))
+            return
+        except BatchBusyError as e:
+            raise CommandError(f"{e} - wait for it, or resume once its runner has stopped")
+
+        style = self.style.SUCCESS if progress['failed_items'] == 0 else self.style.WARNING
+        self.stdout.write(style(
+            f"Batch {batch_id} {progress['status']}: {progress['completed_items']} completed, "
+            f"{progress['failed_items']} failed in {int(progress['elapsed_seconds'])}s "
+            f"({progress['throughput_per_minute']}/min)"
+        ))
@@ -0,0 +1,55 @@
+"""
+Rebuild listings from their archived raw model responses (after a parser or post-processing fix).
+
+    python manage.py reprocess_listings
+    python manage.py reprocess_listings --marketplaces de,fr
+    python manage.py reprocess_listings --ids 12,40
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.listings.models import GeneratedListing
+from apps.listings.response_archive import REPROCESSABLE_PLATFORMS, ReprocessError, reprocess_listing
+
+
+class Command(BaseCommand):
+    help = 'Re-run parsing and post-processing on archived raw LLM responses - no model calls'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ids', default='', help='Comma-separated listing ids (default: every listing with an archive)')
+        parser.add_argument('--marketplaces', default='', help='Comma-separated marketplaces to limit to')
+
+    def handle(self, *args, **options):
+        listings = GeneratedListing.objects.filter(platform__in=REPROCESSABLE_PLATFORMS, raw_responses__isnull=False)
+        if options['ids']:
+            try:
+                listings = listings.filter(id__in=[int(value) for value in options['ids'].split(',') if value.strip()])
+            except ValueError:
+                raise CommandError('--ids takes comma-separated integers')
+        marketplaces = [market.strip() for market in options['marketplaces'].split(',') if market.strip()]
+        if marketplaces:
+            listings = listings.filter(product__marketplace__in=marketplaces)
+
+        listing_ids = list(listings.order_by('id').values_list('id', flat=True).distinct())
+        if not listing_ids:
+            self.stdout.write(self.style.WARNING('No listings with an archived raw response'))
+            return
+
+        started = time.monotonic()
+        failed = 0
+        for number, listing_id in enumerate(listing_ids, 1):
+            try:
+                _, archived = reprocess_listing(listing_id)
+                self.stdout.write(f"  [{number}/{len(listing_ids)}] listing {listing_id} from response {archived.id}")
+            except ReprocessError as e:
+                failed += 1
+                self.stdout.write(self.style.WARNING(f"  [{number}/{len(listing_ids)}] listing {listing_id}: {e}"))
+            except Exception as e:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f"  [{number}/{len(listing_ids)}] listing {listing_id} failed: {e}"))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(listing_ids) - failed} listings re-processed, {failed} failed in {time.monotonic() - started:.1f}s"
+        ))
@@ -0,0 +1,104 @@
+"""
+Re-render the A+ content of stored listings from their saved plans, without the model.
+
+    python manage.py rerender_aplus
+    python manage.py rerender_aplus --marketplaces de,jp --workers 8
+    python manage.py rerender_aplus --ids 12,40 --dry-run
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.listings.aplus_renderer import render_stored_plan
+from apps.listings.localized_replacements import localize_text
+from apps.listings.models import GeneratedListing
+
+
+def _init_worker():
+    # Spawned workers start without Django; forked ones already have it and setup() is a no-op
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'listory.settings')
+    django.setup()
+
+
+def _render_row(row):
+    listing_id, stored, marketplace = row
+    html, _ = localize_text(marketplace, 'aplus', render_stored_plan(stored, marketplace))
+    return listing_id, html
+
+
+class Command(BaseCommand):
+    help = 'Re-render amazon_aplus_content from the stored A+ plans across a process pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ids', default='', help='Comma-separated listing ids (default: every listing with a stored plan)')
+        parser.add_argument('--marketplaces', default='', help='Comma-separated marketplaces to limit to')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='Render processes (default: one per CPU, 1 renders in this process)')
+        parser.add_argument('--chunk-size', type=int, default=500, help='Rows read, rendered and written per batch')
+        parser.add_argument('--dry-run', action='store_true', help='Render and count changes without saving')
+
+    def handle(self, *args, **options):
+        listings = GeneratedListing.objects.filter(platform='amazon').exclude(amazon_aplus_plan={})
+        if options['ids']:
+            try:
+                listings = listings.filter(id__in=[int(value) for value in options['ids'].split(',') if value.strip()])
+            except ValueError:
+                raise CommandError('--ids takes comma-separated integers')
+        marketplaces = [market.strip() for market in options['marketplaces'].split(',') if market.strip()]
+        if marketplaces:
+            listings = listings.filter(product__marketplace__in=marketplaces)
+
+        chunk_size = max(1, options['chunk_size'])
+        workers = max(1, options['workers'])
+        total = listings.count()
+        if not total:
+            self.stdout.write(self.style.WARNING('No listings with a stored A+ plan'))
+            return
+        self.stdout.write(f"Re-rendering {total} listings with {workers} worker(s)")
+
+        rows = listings.values_list('id', 'amazon_aplus_plan', 'product__marketplace', 'amazon_aplus_content')
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) if workers > 1 else None
+        started = time.monotonic()
+        done = changed = 0
+        try:
+            batch = []
+            for row in rows.iterator(chunk_size=chunk_size):
+                batch.append(row)
+                if len(batch) >= chunk_size:
+                    changed += self._render_batch(batch, executor, workers, options['dry_run'])
+                    done += len(batch)
+                    batch = []
+                    elapsed = time.monotonic() - started
+                    self.stdout.write(f"  {done}/{total}  {changed} changed  {done / elapsed:.0f} listings/s")
+            if batch:
+                changed += self._render_batch(batch, executor, workers, options['dry_run'])
+                done += len(batch)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        elapsed = time.monotonic() - started
+        verb = 'would change' if options['dry_run'] else 'updated'
+        self.stdout.write(self.style.SUCCESS(
+            f"{done} listings re-rendered in {elapsed:.1f}s ({done / max(elapsed, 1e-6):.0f}/s), {changed} {verb}"
+        ))
+
+    def _render_batch(self, batch, executor, workers, dry_run):
+        current = {listing_id: content for listing_id, _, _, content in batch}
+        work = [(listing_id, stored, marketplace or 'us') for listing_id, stored, marketplace, _ in batch]
+        if executor is None:
+            rendered = map(_render_row, work)
+        else:
+            rendered = executor.map(_render_row, work, chunksize=max(1, len(work) // (workers * 4)))
+
+        now = timezone.now()
+        updates = [GeneratedListing(id=listing_id, amazon_aplus_content=html, updated_at=now)
+                   for listing_id, html in rendered if html != current[listing_id]]
+        if updates and not dry_run:
+            GeneratedListing.objects.bulk_update(updates, ['amazon_aplus_content', 'updated_at'], batch_size=len(updates))
+        return len(updates)
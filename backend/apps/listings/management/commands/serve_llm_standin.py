@@ -0,0 +1,34 @@
+"""
+Run a local OpenAI-compatible server that replays recorded completions with a latency profile.
+
+    python manage.py serve_llm_standin --port 8765 --profile gpt-5
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=sk-standin python manage.py runserver
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.listings.llm_standin import LATENCY_PROFILES, build_server
+
+
+class Command(BaseCommand):
+    help = 'Serve replayed/synthetic chat completions on an OpenAI-compatible HTTP endpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--profile', default='instant', choices=sorted(LATENCY_PROFILES))
+        parser.add_argument('--replay', nargs='*', default=None,
+                            help='Raw completion captures to replay (defaults to LLM_REPLAY_PATHS / repo captures)')
+
+    def handle(self, *args, **options):
+        server = build_server(options['host'], options['port'], options['profile'], options['replay'])
+        self.stdout.write(self.style.SUCCESS(
+            f"LLM stand-in listening on http://{options['host']}:{options['port']}/v1 "
+            f"(profile: {options['profile']})"
+        ))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping LLM stand-in")
+        finally:
+            server.server_close()
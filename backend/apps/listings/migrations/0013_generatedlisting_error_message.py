@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0012_generatedlisting_walmart_rich_media'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generatedlisting',
+            name='error_message',
+            field=models.TextField(blank=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-17 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0014_bulkgenerationbatch_bulkgenerationitem'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generatedlisting',
+            name='prompt_token_report',
+            field=models.TextField(blank=True, help_text='Per-fragment prompt token counts (JSON)'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-17 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0015_generatedlisting_prompt_token_report'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generatedlisting',
+            name='refinement_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('refining', 'Refining'), ('refined', 'Refined'), ('failed', 'Failed')], help_text='Background premium pass for draft listings (blank = not a draft)', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='generatedlisting',
+            name='version',
+            field=models.PositiveIntegerField(default=1, help_text='Bumped each time a refinement pass rewrites the listing'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-17 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0016_generatedlisting_version_refinement_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generatedlisting',
+            name='amazon_aplus_plan',
+            field=models.JSONField(blank=True, default=dict, help_text='Parsed A+ plan and page inputs amazon_aplus_content is rendered from'),
+        ),
+    ]
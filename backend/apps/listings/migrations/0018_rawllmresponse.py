@@ -0,0 +1,34 @@
+# Generated by Django 4.2.16 on 2026-10-17 19:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0017_generatedlisting_amazon_aplus_plan'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RawLLMResponse',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prompt_hash', models.CharField(db_index=True, help_text='SHA-256 of the request (same key as the LLM cache)', max_length=64)),
+                ('model', models.CharField(blank=True, max_length=100)),
+                ('content', models.BinaryField(help_text='Compressed raw completion text')),
+                ('compression', models.CharField(choices=[('zlib', 'zlib')], default='zlib', max_length=10)),
+                ('raw_size', models.PositiveIntegerField(default=0, help_text='Uncompressed size in bytes')),
+                ('finish_reason', models.CharField(blank=True, max_length=20)),
+                ('prompt_tokens', models.PositiveIntegerField(blank=True, null=True)),
+                ('completion_tokens', models.PositiveIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('listing', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='raw_responses', to='listings.generatedlisting')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['listing', '-created_at'], name='listings_ra_listing_131a79_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.16 on 2026-10-17 20:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_alter_product_brand_tone'),
+        ('listings', '0018_rawllmresponse'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FanOutJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('marketplaces', models.CharField(help_text='Comma-separated target marketplaces', max_length=500)),
+                ('workers', models.PositiveIntegerField(blank=True, null=True)),
+                ('bypass_cache', models.BooleanField(default=False)),
+                ('results', models.JSONField(blank=True, default=dict, help_text='Per-marketplace result entries')),
+                ('completed_markets', models.IntegerField(default=0)),
+                ('failed_markets', models.IntegerField(default=0)),
+                ('shared_context', models.JSONField(blank=True, default=dict)),
+                ('total_time', models.FloatField(blank=True, null=True)),
+                ('error_message', models.TextField(blank=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fanout_jobs', to='core.product')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-17 20:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0019_fanoutjob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='generatedlisting',
+            name='refinement_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('refining', 'Refining'), ('refined', 'Refined'), ('superseded', 'Superseded by an edit'), ('failed', 'Failed')], help_text='Background premium pass for draft listings (blank = not a draft)', max_length=20),
+        ),
+    ]
@@ -9,6 +9,13 @@ class GeneratedListing(models.Model):
         ('completed', 'Completed'),
         ('failed', 'Failed'),
     ]
+    REFINEMENT_CHOICES = [
+        ('pending', 'Pending'),
+        ('refining', 'Refining'),
+        ('refined', 'Refined'),
+        ('superseded', 'Superseded by an edit'),
+        ('failed', 'Failed'),
+    ]
 
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     platform = models.CharField(max_length=20)
@@ -23,6 +30,8 @@ class GeneratedListing(models.Model):
     
     # Platform-specific fields
     amazon_aplus_content = models.TextField(blank=True, help_text="Amazon A+ content suggestions")
+    amazon_aplus_plan = models.JSONField(default=dict, blank=True,
+                                         help_text="Parsed A+ plan and page inputs amazon_aplus_content is rendered from")
     amazon_keywords = models.TextField(blank=True, help_text="Amazon frontend display keywords")
     amazon_backend_keywords = models.TextField(blank=True)
     
@@ -147,6 +156,17 @@ class GeneratedListing(models.Model):
     conversion_score = models.FloatField(null=True, blank=True, help_text="Conversion optimization score (0-10)")
     trust_score = models.FloatField(null=True, blank=True, help_text="Trust and credibility score (0-10)")
     
+    # Async generation job
+    error_message = models.TextField(blank=True)
+    
+    # Prompt input accounting
+    prompt_token_report = models.TextField(blank=True, help_text="Per-fragment prompt token counts (JSON)")
+    
+    # Draft-then-refine generation (tiered_generation.py)
+    version = models.PositiveIntegerField(default=1, help_text="Bumped each time a refinement pass rewrites the listing")
+    refinement_status = models.CharField(max_length=20, choices=REFINEMENT_CHOICES, blank=True,
+                                         help_text="Background premium pass for draft listings (blank = not a draft)")
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -212,4 +232,111 @@ class ListingImage(models.Model):
         ordering = ['created_at']
     
     def __str__(self):
-        return f"{self.get_image_type_display()} for {self.listing.product.name}"
\ No newline at end of file
+        return f"{self.get_image_type_display()} for {self.listing.product.name}"
+
+class BulkGenerationBatch(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+
+    name = models.CharField(max_length=200, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    platforms = models.CharField(max_length=200, help_text="Comma-separated target platforms")
+    marketplaces = models.CharField(max_length=500, blank=True, help_text="Comma-separated target marketplaces")
+    total_items = models.IntegerField(default=0)
+    completed_items = models.IntegerField(default=0)
+    failed_items = models.IntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Bulk batch {self.id} ({self.completed_items + self.failed_items}/{self.total_items})"
+
+
+class BulkGenerationItem(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+
+    batch = models.ForeignKey(BulkGenerationBatch, on_delete=models.CASCADE, related_name='items')
+    product = models.ForeignKey(Product, on_delete=models.CASCADE)
+    platform = models.CharField(max_length=20)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    listing = models.ForeignKey(GeneratedListing, on_delete=models.SET_NULL, null=True, blank=True)
+    error_message = models.TextField(blank=True)
+    duration = models.FloatField(null=True, blank=True, help_text="Generation time in seconds")
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [models.Index(fields=['batch', 'status'])]
+
+    def __str__(self):
+        return f"{self.product.name} - {self.platform} ({self.status})"
+
+
+class FanOutJob(models.Model):
+    """One product generated for many marketplaces in the background (fanout.py)"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='fanout_jobs')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    marketplaces = models.CharField(max_length=500, help_text="Comma-separated target marketplaces")
+    workers = models.PositiveIntegerField(null=True, blank=True)
+    bypass_cache = models.BooleanField(default=False)
+    results = models.JSONField(default=dict, blank=True, help_text="Per-marketplace result entries")
+    completed_markets = models.IntegerField(default=0)
+    failed_markets = models.IntegerField(default=0)
+    shared_context = models.JSONField(default=dict, blank=True)
+    total_time = models.FloatField(null=True, blank=True)
+    error_message = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Fan-out {self.id} of {self.product_id} ({self.status})"
+
+class RawLLMResponse(models.Model):
+    """Archived raw model output of a generation, so parsing and post-processing can be re-run offline"""
+    COMPRESSION_CHOICES = [
+        ('zlib', 'zlib'),
+    ]
+
+    listing = models.ForeignKey(GeneratedListing, on_delete=models.CASCADE, related_name='raw_responses')
+    prompt_hash = models.CharField(max_length=64, db_index=True, help_text="SHA-256 of the request (same key as the LLM cache)")
+    model = models.CharField(max_length=100, blank=True)
+    content = models.BinaryField(help_text="Compressed raw completion text")
+    compression = models.CharField(max_length=10, choices=COMPRESSION_CHOICES, default='zlib')
+    raw_size = models.PositiveIntegerField(default=0, help_text="Uncompressed size in bytes")
+    finish_reason = models.CharField(max_length=20, blank=True)
+    prompt_tokens = models.PositiveIntegerField(null=True, blank=True)
+    completion_tokens = models.PositiveIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [models.Index(fields=['listing', '-created_at'])]
+
+    def __str__(self):
+        return f"Raw response {self.id} for listing {self.listing_id} ({self.raw_size} bytes)"
@@ -0,0 +1,107 @@
+"""
+Process-wide OpenAI Client Registry
+Shares one keep-alive connection pool between every generator in the worker
+instead of opening a fresh client (and TLS handshake) for each listing
+"""
+
+import logging
+import threading
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_clients = {}
+_lock = threading.Lock()
+
+
+def is_api_key_configured(api_key=None):
+    """Return True when a usable OpenAI API key is present in settings"""
+    api_key = settings.OPENAI_API_KEY if api_key is None else api_key
+    return bool(api_key) and api_key != "your-openai-api-key-here"
+
+
+def get_llm_backend():
+    """'openai' (default) or 'replay' for the offline stand-in backend"""
+    return getattr(settings, 'LLM_BACKEND', 'openai') or 'openai'
+
+
+def _get_offline_client():
+    key = ('offline', None)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            from .llm_standin import OfflineOpenAIClient
+            client = OfflineOpenAIClient()
+            _clients[key] = client
+            logger.info("Offline replay LLM backend enabled - no OpenAI requests will be made")
+    return client
+
+
+def _build_http_client():
+    """Create the pooled httpx client used underneath the OpenAI SDK"""
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=settings.OPENAI_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.OPENAI_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=settings.OPENAI_POOL_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(
+        settings.OPENAI_TIMEOUT,
+        connect=settings.OPENAI_CONNECT_TIMEOUT,
+    )
+    return httpx.Client(limits=limits, timeout=timeout)
+
+
+def get_openai_client(api_key=None, base_url=None):
+    """
+    Return the shared OpenAI client for this process, creating it on first use.
+    Clients are keyed by (api_key, base_url) so a settings change never reuses a stale client.
+    Returns None when no API key is configured.
+    """
+    if get_llm_backend() == 'replay':
+        return _get_offline_client()
+
+    api_key = settings.OPENAI_API_KEY if api_key is None else api_key
+    base_url = base_url or getattr(settings, 'OPENAI_BASE_URL', '') or None
+
+    if not is_api_key_configured(api_key):
+        return None
+
+    key = (api_key, base_url)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            from openai import OpenAI
+
+            client = OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                max_retries=settings.OPENAI_MAX_RETRIES,
+                http_client=_build_http_client(),
+            )
+            _clients[key] = client
+            logger.info(
+                f"Shared OpenAI client created (pool={settings.OPENAI_POOL_MAX_CONNECTIONS}, "
+                f"keepalive={settings.OPENAI_POOL_MAX_KEEPALIVE}, timeout={settings.OPENAI_TIMEOUT}s)"
+            )
+    return client
+
+
+def reset_openai_clients(close=True):
+    """
+    Drop every pooled client. Celery's prefork children call this with close=False on start
+    (tasks.py): the inherited connections belong to the parent and must not be shared or closed.
+    """
+    with _lock:
+        for client in _clients.values() if close else ():
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled OpenAI client: {e}")
+        _clients.clear()
@@ -0,0 +1,234 @@
+"""
+Generation Pipeline Engine
+Platform generators are described as graphs of steps that declare the context values they
+read (inputs) and produce (outputs). Independent steps run concurrently on the shared LLM
+executor (the global concurrency cap); a failed step cancels everything downstream of it
+unless it has a fallback, and every step's wall-clock time is recorded.
+"""
+
+import concurrent.futures
+import logging
+import threading
+import time
+
+from .concurrency import get_llm_executor
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineError(Exception):
+    """Raised by PipelineResult.raise_for_failure() when a step without fallback failed"""
+
+    def __init__(self, message, result=None):
+        super().__init__(message)
+        self.result = result
+
+
+class PipelineStep:
+    """
+    fn is called with the declared inputs as keyword arguments and returns
+    - nothing, when the step declares no outputs (side effects only)
+    - the value, when it declares one output
+    - a dict keyed by output name, when it declares several
+    fallback (same signature) replaces fn's result if fn raises or exceeds timeout.
+    """
+
+    def __init__(self, name, fn, inputs=(), outputs=(), fallback=None, timeout=None):
+        self.name = name
+        self.fn = fn
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.fallback = fallback
+        self.timeout = timeout
+
+    def bind(self, value):
+        if not self.outputs:
+            return {}
+        if len(self.outputs) == 1:
+            return {self.outputs[0]: value}
+        return {name: value[name] for name in self.outputs}
+
+
+class PipelineResult:
+    def __init__(self, name, context):
+        self.name = name
+        self.context = context
+        self.status = {}
+        self.timings = {}
+        self.errors = {}
+        self.total_time = 0.0
+
+    @property
+    def ok(self):
+        return all(status in ('completed', 'fallback') for status in self.status.values())
+
+    def raise_for_failure(self):
+        for step, status in self.status.items():
+            if status in ('failed', 'timeout'):
+                raise PipelineError(f"{self.name} step '{step}' failed: {self.errors.get(step)}", self)
+        if not self.ok:
+            raise PipelineError(f"{self.name} pipeline did not complete", self)
+
+    def summary(self):
+        return {
+            'pipeline': self.name,
+            'total_time': round(self.total_time, 3),
+            'steps': {
+                step: {'status': self.status.get(step), 'time': round(self.timings.get(step, 0.0), 3),
+                       **({'error': self.errors[step]} if step in self.errors else {})}
+                for step in self.status
+            },
+        }
+
+
+class Pipeline:
+    def __init__(self, name, steps=None):
+        self.name = name
+        self.steps = {}
+        for step in steps or []:
+            self.add(step)
+
+    def add(self, step):
+        if step.name in self.steps:
+            raise ValueError(f"Duplicate pipeline step '{step.name}'")
+        self.steps[step.name] = step
+        return step
+
+    def step(self, name, fn, inputs=(), outputs=(), fallback=None, timeout=None):
+        return self.add(PipelineStep(name, fn, inputs, outputs, fallback, timeout))
+
+    def validate(self, initial_keys):
+        """Every input must come from the initial context or exactly one step, and the graph must be acyclic"""
+        producers = {}
+        for step in self.steps.values():
+            for output in step.outputs:
+                if output in producers or output in initial_keys:
+                    raise ValueError(f"'{output}' is produced more than once in pipeline {self.name}")
+                producers[output] = step.name
+        for step in self.steps.values():
+            for needed in step.inputs:
+                if needed not in producers and needed not in initial_keys:
+                    raise ValueError(f"Step '{step.name}' needs '{needed}' which nothing produces")
+
+        # Kahn's algorithm for cycle detection
+        available = set(initial_keys)
+        remaining = dict(self.steps)
+        while remaining:
+            ready = [name for name, step in remaining.items() if all(i in available for i in step.inputs)]
+            if not ready:
+                raise ValueError(f"Cycle between steps {sorted(remaining)} in pipeline {self.name}")
+            for name in ready:
+                available.update(remaining.pop(name).outputs)
+
+    def _dependents(self, failed_outputs, pending):
+        """Transitive closure of pending steps that (indirectly) need any of failed_outputs"""
+        blocked = set()
+        missing = set(failed_outputs)
+        changed = True
+        while changed:
+            changed = False
+            for name in pending - blocked:
+                step = self.steps[name]
+                if missing.intersection(step.inputs):
+                    blocked.add(name)
+                    missing.update(step.outputs)
+                    changed = True
+        return blocked
+
+    def run(self, **initial):
+        """Execute the graph; returns a PipelineResult (call raise_for_failure() to make failures fatal)"""
+        self.validate(set(initial))
+        result = PipelineResult(self.name, dict(initial))
+        context = result.context
+        started = time.monotonic()
+
+        # Already on a pool thread (nested pipeline): run inline so we never wait on our own pool
+        inline = threading.current_thread().name.startswith('llm-branch')
+        executor = None if inline else get_llm_executor()
+
+        pending = set(self.steps)
+        running = {}
+
+        def timed(step, kwargs):
+            step_started = time.monotonic()
+            try:
+                return step.fn(**kwargs)
+            finally:
+                result.timings[step.name] = time.monotonic() - step_started
+
+        def finish(step, value=None, error=None, status=None):
+            kwargs = {name: context[name] for name in step.inputs}
+            if error is not None:
+                result.errors[step.name] = error
+                if step.fallback is not None:
+                    try:
+                        context.update(step.bind(step.fallback(**kwargs)))
+                        result.status[step.name] = 'fallback'
+                        logger.warning(f"[{self.name}] step '{step.name}' fell back: {error}")
+                        return
+                    except Exception as fallback_error:
+                        result.errors[step.name] = f"{error}; fallback failed: {fallback_error}"
+                result.status[step.name] = status or 'failed'
+                logger.error(f"[{self.name}] step '{step.name}' {result.status[step.name]}: {result.errors[step.name]}")
+                for name in self._dependents(step.outputs, pending):
+                    pending.discard(name)
+                    result.status[name] = 'cancelled'
+                    result.errors[name] = f"upstream step '{step.name}' failed"
+                return
+            try:
+                context.update(step.bind(value))
+                result.status[step.name] = 'completed'
+            except (KeyError, TypeError) as e:
+                finish(step, error=f"did not return declared outputs {step.outputs}: {e}")
+
+        while pending or running:
+            ready = [name for name in pending if all(i in context for i in self.steps[name].inputs)]
+            for name in ready:
+                pending.discard(name)
+                step = self.steps[name]
+                kwargs = {i: context[i] for i in step.inputs}
+                if inline:
+                    try:
+                        finish(step, value=timed(step, kwargs))
+                    except Exception as e:
+                        finish(step, error=f"{type(e).__name__}: {e}")
+                    continue
+                future = executor.submit(timed, step, kwargs)
+                running[future] = (step, time.monotonic())
+
+            if inline:
+                if not ready:
+                    break
+                continue
+            if not running:
+                break
+
+            now = time.monotonic()
+            deadlines = [submitted + step.timeout - now for step, submitted in running.values() if step.timeout]
+            wait_for = max(0.0, min(deadlines)) if deadlines else None
+            done, _ = concurrent.futures.wait(list(running), timeout=wait_for,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+
+            for future in done:
+                step, _ = running.pop(future)
+                try:
+                    finish(step, value=future.result())
+                except Exception as e:
+                    finish(step, error=f"{type(e).__name__}: {e}")
+
+            now = time.monotonic()
+            for future, (step, submitted) in list(running.items()):
+                if step.timeout and now - submitted >= step.timeout:
+                    running.pop(future)
+                    future.cancel()
+                    result.timings[step.name] = now - submitted
+                    finish(step, error=f"timed out after {step.timeout}s", status='timeout')
+
+        for name in pending:
+            result.status[name] = 'cancelled'
+        result.total_time = time.monotonic() - started
+        timings = ', '.join(f"{name}={result.timings.get(name, 0.0):.1f}s/{result.status.get(name)}"
+                            for name in self.steps)
+        logger.info(f"[{self.name}] pipeline finished in {result.total_time:.1f}s ({timings})")
+        print(f"⏱️ {self.name} pipeline: {result.total_time:.1f}s total - {timings}")
+        return result
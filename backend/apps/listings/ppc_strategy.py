@@ -0,0 +1,253 @@
+"""
+Local PPC Strategy and Keyword Cluster Derivation
+Campaign structure, match-type keyword buckets, bid ranges, ACoS targets and daily budgets are
+bookkeeping over the listing's keywords, so they are derived here from the model's seoKeywords
+instead of being written by the model. Bids and budgets come from per-marketplace tables scaled
+by the product's price tier.
+"""
+
+import functools
+import re
+
+from .bulk import MARKETPLACE_LANGUAGES
+
+# marketplace: (currency prefix, currency suffix, local units per USD, CPC level vs. US, decimals)
+# CPC levels are planning estimates for a new listing, not live auction data
+MARKET_BID_TABLES = {
+    'us': ('$', '', 1.0, 1.0, 2),
+    'ca': ('C$', '', 1.37, 0.8, 2),
+    'mx': ('MX$', '', 18.0, 0.5, 1),
+    'uk': ('£', '', 0.78, 0.9, 2),
+    'de': ('€', '', 0.92, 0.8, 2),
+    'fr': ('€', '', 0.92, 0.7, 2),
+    'it': ('€', '', 0.92, 0.6, 2),
+    'es': ('€', '', 0.92, 0.6, 2),
+    'nl': ('€', '', 0.92, 0.6, 2),
+    'be': ('€', '', 0.92, 0.55, 2),
+    'se': ('', ' kr', 10.5, 0.6, 1),
+    'pl': ('', ' zł', 3.9, 0.5, 2),
+    'jp': ('¥', '', 150.0, 0.7, 0),
+    'in': ('₹', '', 83.0, 0.25, 0),
+    'sg': ('S$', '', 1.34, 0.6, 2),
+    'ae': ('AED ', '', 3.67, 0.6, 2),
+    'sa': ('SAR ', '', 3.75, 0.5, 2),
+    'br': ('R$', '', 5.0, 0.5, 2),
+    'au': ('A$', '', 1.5, 0.8, 2),
+    'tr': ('₺', '', 32.0, 0.3, 1),
+    'eg': ('EGP ', '', 48.0, 0.2, 1),
+}
+
+# key, name, match type, goal, USD bid range, target ACoS, USD daily budget, bid strategy
+CAMPAIGNS = [
+    ('exactMatchCampaign', 'Manual Exact', 'Exact', 'Conversion', (0.50, 1.50), '15-25%', (20, 40),
+     'Fixed bids on high-intent terms; raise 10-15% on keywords converting below target ACoS'),
+    ('phraseMatchCampaign', 'Manual Phrase', 'Phrase', 'Consideration', (0.35, 1.00), '25-35%', (15, 30),
+     'Dynamic bids (down only); promote converting phrases to the exact campaign weekly'),
+    ('broadMatchCampaign', 'Manual Broad', 'Broad', 'Discovery', (0.25, 0.75), '30-45%', (10, 25),
+     'Dynamic bids (down only); mine the search term report for new phrase and exact keywords'),
+    ('autoDiscoveryCampaign', 'Auto Discovery', 'Auto', 'Research', (0.30, 0.80), '35-50%', (10, 20),
+     'Dynamic bids (down only); harvest converting search terms and negate non-converting ones'),
+]
+
+# (upper price bound in USD, tier, bid and budget multiplier); the last tier has no bound
+PRICE_TIERS = [
+    (20, 'budget', 0.75),
+    (75, 'mid-range', 1.0),
+    (None, 'premium', 1.4),
+]
+
+MATCH_TYPE_LIMITS = {'Exact': 15, 'Phrase': 20, 'Broad': 15}
+
+NEGATIVE_KEYWORDS = {
+    'en': ['free', 'used', 'cheap', 'diy', 'repair', 'manual pdf'],
+    'de': ['kostenlos', 'gebraucht', 'billig', 'reparatur', 'anleitung'],
+    'fr': ['gratuit', 'occasion', 'pas cher', 'réparation', 'notice'],
+    'it': ['gratis', 'usato', 'economico', 'riparazione', 'manuale'],
+    'es': ['gratis', 'usado', 'barato', 'reparación', 'manual'],
+    'nl': ['gratis', 'tweedehands', 'goedkoop', 'reparatie', 'handleiding'],
+    'sv': ['gratis', 'begagnad', 'billig', 'reparation', 'manual'],
+    'pl': ['za darmo', 'używany', 'tani', 'naprawa', 'instrukcja'],
+    'ja': ['無料', '中古', '激安', '修理', '説明書'],
+    'tr': ['ücretsiz', 'ikinci el', 'ucuz', 'tamir', 'kılavuz'],
+    'pt': ['grátis', 'usado', 'barato', 'conserto', 'manual'],
+    'ar': ['مجاني', 'مستعمل', 'رخيص', 'تصليح', 'دليل'],
+}
+
+AUTO_TARGETING = 'Amazon auto-targeting: close match, loose match, substitutes, complements'
+
+# Skeleton text the model sometimes echoes back instead of real keywords
+_PLACEHOLDER = re.compile(r'GENERATE_\d+|\[[^\]]+\]|^etc\.?$', re.IGNORECASE)
+
+
+def _clean_keywords(values):
+    """Strings only, with placeholders dropped and whitespace collapsed"""
+    if isinstance(values, str):
+        values = values.split(',')
+    cleaned = []
+    for value in values or []:
+        if not isinstance(value, str):
+            continue
+        keyword = ' '.join(value.split()).strip(' ,;.')
+        if keyword and len(keyword) <= 80 and not _PLACEHOLDER.search(keyword):
+            cleaned.append(keyword)
+    return cleaned
+
+
+def _product_keywords(product, seller_keywords=None):
+    """Keywords from the product inputs, used when the model returned none"""
+    name = ' '.join((product.name or '').split()).lower()
+    brand = ' '.join((product.brand_name or '').split()).lower()
+    keywords = [name, f"{brand} {name}".strip()]
+    if seller_keywords is None:
+        seller_keywords = getattr(product, 'target_keywords', '') or ''
+    keywords += [keyword.lower() for keyword in _clean_keywords(seller_keywords)]
+    return [keyword for keyword in keywords if keyword]
+
+
+def bucket_keywords(seo_keywords, product, seller_keywords=None):
+    """
+    Split the seoKeywords groups into Exact / Phrase / Broad lists. Each keyword lands in one
+    bucket only (first match wins), so campaigns never bid against each other. Without any,
+    the product name and seller keywords (the base keyword cluster when given) are used.
+    """
+    seo_keywords = seo_keywords if isinstance(seo_keywords, dict) else {}
+    primary = _clean_keywords(seo_keywords.get('primary'))
+    candidates = {
+        'Exact': [kw for kw in primary if len(kw.split()) <= 3],
+        'Phrase': (_clean_keywords(seo_keywords.get('longTail'))
+                   + _clean_keywords(seo_keywords.get('problemSolving'))
+                   + _clean_keywords(seo_keywords.get('rufusConversational'))),
+        'Broad': _clean_keywords(seo_keywords.get('semantic')) + [kw for kw in primary if len(kw.split()) > 3],
+    }
+    if not any(candidates.values()):
+        candidates['Exact'] = _product_keywords(product, seller_keywords)
+
+    seen = set()
+    buckets = {}
+    for match_type, keywords in candidates.items():
+        bucket = []
+        for keyword in keywords:
+            key = keyword.casefold()
+            if key in seen:
+                continue
+            seen.add(key)
+            bucket.append(keyword)
+            if len(bucket) == MATCH_TYPE_LIMITS[match_type]:
+                break
+        buckets[match_type] = bucket
+    return buckets
+
+
+def _price_tier(product, usd_rate):
+    """(tier, multiplier) from the product price in USD; no price counts as mid-range"""
+    try:
+        price_usd = float(product.price) / usd_rate
+    except (TypeError, ValueError):
+        return 'mid-range', 1.0
+    for bound, tier, multiplier in PRICE_TIERS:
+        if bound is None or price_usd <= bound:
+            return tier, multiplier
+
+
+def _money_range(prefix, suffix, low, high, places):
+    return f"{prefix}{low:.{places}f}-{high:.{places}f}{suffix}"
+
+
+@functools.lru_cache(maxsize=None)
+def market_bid_table(marketplace, tier_multiplier=1.0):
+    """
+    {match type: (bid range, daily budget, (low bid, high bid))} in the marketplace's currency,
+    scaled by the price-tier multiplier. Unknown marketplaces use the US table.
+    """
+    prefix, suffix, usd_rate, cpc_level, decimals = MARKET_BID_TABLES.get(marketplace, MARKET_BID_TABLES['us'])
+    bid_scale = usd_rate * cpc_level * tier_multiplier
+    budget_scale = usd_rate * tier_multiplier
+
+    table = {}
+    for _, _, match_type, _, (low, high), _, (budget_low, budget_high), _ in CAMPAIGNS:
+        low_bid, high_bid = round(low * bid_scale, decimals), round(high * bid_scale, decimals)
+        table[match_type] = (
+            _money_range(prefix, suffix, low_bid, high_bid, decimals),
+            _money_range(prefix, suffix, round(budget_low * budget_scale), round(budget_high * budget_scale), 0),
+            (low_bid, high_bid),
+        )
+    return table
+
+
+def derive_ppc_strategy(seo_keywords, product, buckets=None):
+    """ppcStrategy in the shape the A+ renderer reads (campaignStructure of campaigns plus negatives)"""
+    marketplace = getattr(product, 'marketplace', 'us') or 'us'
+    usd_rate = MARKET_BID_TABLES.get(marketplace, MARKET_BID_TABLES['us'])[2]
+    tier, multiplier = _price_tier(product, usd_rate)
+    bids = market_bid_table(marketplace, multiplier)
+    buckets = buckets if buckets is not None else bucket_keywords(seo_keywords, product)
+
+    campaigns = {}
+    for key, name, match_type, goal, _, target_acos, _, bid_strategy in CAMPAIGNS:
+        bid_range, daily_budget, _ = bids[match_type]
+        keywords = buckets.get(match_type, [])
+        if match_type != 'Auto' and not keywords:
+            continue
+        campaigns[key] = {
+            'name': f"{name} Campaign",
+            'matchType': match_type,
+            'goal': goal,
+            'keywords': keywords,
+            'targeting': AUTO_TARGETING if match_type == 'Auto' else '',
+            'bidRange': bid_range,
+            'bidStrategy': f"{bid_strategy} ({bid_range})",
+            'targetAcos': target_acos,
+            'dailyBudget': daily_budget,
+        }
+
+    language = getattr(product, 'marketplace_language', '') or MARKETPLACE_LANGUAGES.get(marketplace, 'en')
+    negatives = NEGATIVE_KEYWORDS.get(language, NEGATIVE_KEYWORDS.get(language.split('-')[0], NEGATIVE_KEYWORDS['en']))
+    return {
+        'campaignStructure': campaigns,
+        'priceTier': tier,
+        'negativeKeywords': {
+            'immediate': list(negatives),
+            'strategy': 'Add non-converting search terms with 15+ clicks and no sales as negative exact weekly',
+        },
+    }
+
+
+def derive_keyword_cluster(seo_keywords, product, backend_keywords='', buckets=None):
+    """keyword_cluster (primary/secondary lists plus per-keyword PPC suggestions) from the same buckets"""
+    marketplace = getattr(product, 'marketplace', 'us') or 'us'
+    usd_rate = MARKET_BID_TABLES.get(marketplace, MARKET_BID_TABLES['us'])[2]
+    _, multiplier = _price_tier(product, usd_rate)
+    bids = market_bid_table(marketplace, multiplier)
+    buckets = buckets if buckets is not None else bucket_keywords(seo_keywords, product)
+    seo_keywords = seo_keywords if isinstance(seo_keywords, dict) else {}
+
+    ppc_keywords = []
+    for _, _, match_type, goal, _, target_acos, _, _ in CAMPAIGNS:
+        low, high = bids[match_type][2]
+        for keyword in buckets.get(match_type, []):
+            ppc_keywords.append({
+                'keyword': keyword,
+                'match_type': match_type,
+                'goal': goal,
+                'bid_suggestion': f"{(low + high) / 2:.2f}",
+                'target_acos': target_acos.split('-')[0] + '%',
+            })
+
+    return {
+        'primary_keywords': buckets.get('Exact', []),
+        'secondary_keywords': buckets.get('Phrase', []) + buckets.get('Broad', []),
+        'backend_search_terms': backend_keywords if isinstance(backend_keywords, str) else '',
+        'misspellings_and_synonyms': _clean_keywords(seo_keywords.get('semantic')),
+        'ppc_keywords': ppc_keywords,
+    }
+
+
+def apply_keyword_derivations(result, product, seller_keywords=None):
+    """Replace the PPC strategy and keyword cluster in a parsed Amazon response with derived ones"""
+    seo_keywords = result.get('seoKeywords')
+    buckets = bucket_keywords(seo_keywords, product, seller_keywords)
+    result['ppcStrategy'] = derive_ppc_strategy(seo_keywords, product, buckets)
+    result['keyword_cluster'] = derive_keyword_cluster(
+        seo_keywords, product, result.get('backendKeywords', ''), buckets
+    )
+    return result
@@ -0,0 +1,221 @@
+"""
+Prompt Fragment Registry
+Builds the occasion, brand tone, localization and market occasion optimizers once per process
+and caches every prompt fragment they render, keyed by (kind, tone/marketplace/language/occasion).
+Fragments that the optimizers randomize are rendered with a Random seeded from the fragment key
+and variant number, so every process builds the same text. Brand tone and localization keep
+PROMPT_FRAGMENT_VARIANTS variants per key so listings still vary; the caller's rng (seeded from
+the product) picks one, which keeps a product's prompt - and its LLM cache key - stable. Optional
+startup warm-up via PROMPT_FRAGMENT_WARMUP; stats() reports hits and the build/render time they saved.
+"""
+
+import logging
+import random
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _build_occasion_optimizer():
+    from .services_occasion_enhanced import OccasionOptimizer
+    return OccasionOptimizer()
+
+
+def _build_brand_tone_optimizer():
+    from .brand_tone_optimizer import BrandToneOptimizer
+    return BrandToneOptimizer()
+
+
+def _build_international_optimizer():
+    from .international_localization_optimizer import InternationalLocalizationOptimizer
+    return InternationalLocalizationOptimizer()
+
+
+def _build_market_occasions():
+    from .market_occasions import MarketOccasions
+    return MarketOccasions()
+
+
+OPTIMIZER_BUILDERS = {
+    'occasion': _build_occasion_optimizer,
+    'brand_tone': _build_brand_tone_optimizer,
+    'international': _build_international_optimizer,
+    'market_occasions': _build_market_occasions,
+}
+
+
+class PromptFragmentRegistry:
+    def __init__(self, variants=None):
+        self.variants = max(1, variants or getattr(settings, 'PROMPT_FRAGMENT_VARIANTS', 4))
+        self._optimizers = {}
+        self._fragments = {}
+        self._lock = threading.RLock()
+        self._build_times = {}
+        self._render_times = {}
+        self.optimizer_hits = 0
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+    def optimizer(self, name):
+        """The process-wide optimizer instance (its tables are built on first use only)"""
+        with self._lock:
+            instance = self._optimizers.get(name)
+            if instance is not None:
+                self.optimizer_hits += 1
+                self.saved_seconds += self._build_times[name]
+                return instance
+            started = time.perf_counter()
+            instance = OPTIMIZER_BUILDERS[name]()
+            self._build_times[name] = time.perf_counter() - started
+            self._optimizers[name] = instance
+            return instance
+
+    def _fragment(self, key, render, variant=None):
+        """
+        Cached render(). With a variant number the fragment is randomized: render(rng) gets a
+        Random seeded from (key, variant), and each variant is cached on its own.
+        """
+        with self._lock:
+            pool = self._fragments.get(key)
+            if pool is not None and variant in pool:
+                self.hits += 1
+                self.saved_seconds += self._render_times[key]
+                return pool[variant]
+        started = time.perf_counter()
+        value = render() if variant is None else render(random.Random(repr((key, variant))))
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.misses += 1
+            self._fragments.setdefault(key, {}).setdefault(variant, value)
+            self._render_times[key] = max(self._render_times.get(key, 0.0), elapsed)
+        return value
+
+    def _variant(self, rng=None):
+        return (rng or random).randrange(self.variants)
+
+    # Rendered fragments
+
+    def occasion_enhancement(self, occasion):
+        return self._fragment(
+            ('occasion', occasion),
+            lambda rng: self.optimizer('occasion').get_occasion_prompt_enhancement(occasion, rng=rng),
+            variant=0
+        )
+
+    def brand_tone_enhancement(self, brand_tone, marketplace='us', rng=None, variant=None):
+        """One of the tone's variants, picked with `rng` (pass the product-seeded one) unless `variant` is given"""
+        return self._fragment(
+            ('brand_tone', brand_tone, marketplace),
+            lambda seeded: self.optimizer('brand_tone').get_brand_tone_enhancement(brand_tone, marketplace, rng=seeded),
+            variant=self._variant(rng) if variant is None else variant
+        )
+
+    def localization_enhancement(self, marketplace, language, rng=None, variant=None):
+        return self._fragment(
+            ('localization', marketplace, language),
+            lambda seeded: self.optimizer('international').get_localization_enhancement(marketplace, language, rng=seeded),
+            variant=self._variant(rng) if variant is None else variant
+        )
+
+    def aplus_enhancement(self, marketplace, language):
+        return self._fragment(
+            ('aplus', marketplace, language),
+            lambda rng: self.optimizer('international').get_aplus_content_enhancement(marketplace, language, rng=rng),
+            variant=0
+        )
+
+    # Market occasion lookups (lists are copied so callers can't mutate the cache)
+
+    def translate_occasion(self, occasion, marketplace):
+        return self._fragment(
+            ('translate_occasion', occasion, marketplace),
+            lambda: self.optimizer('market_occasions').translate_occasion(occasion, marketplace)
+        )
+
+    def should_include_occasion(self, occasion, marketplace):
+        return self._fragment(
+            ('include_occasion', occasion, marketplace),
+            lambda: self.optimizer('market_occasions').should_include_occasion(occasion, marketplace)
+        )
+
+    def occasion_keywords(self, occasion, marketplace):
+        return list(self._fragment(
+            ('occasion_keywords', occasion, marketplace),
+            lambda: tuple(self.optimizer('market_occasions').get_occasion_keywords(occasion, marketplace) or ())
+        ))
+
+    def occasion_hooks(self, occasion, marketplace):
+        return list(self._fragment(
+            ('occasion_hooks', occasion, marketplace),
+            lambda: tuple(self.optimizer('market_occasions').get_occasion_emotional_hooks(occasion, marketplace) or ())
+        ))
+
+    def warm_up(self, marketplaces=None, tones=None, occasions=None):
+        """Build every optimizer and pre-render the fragments for the given (default: all) keys"""
+        from apps.core.models import Product
+        from .bulk import MARKETPLACE_LANGUAGES
+
+        started = time.perf_counter()
+        for name in OPTIMIZER_BUILDERS:
+            self.optimizer(name)
+        marketplaces = marketplaces or [code for code, _ in Product.AMAZON_MARKETPLACES]
+        tones = tones or list(self.optimizer('brand_tone').tone_configurations)
+        occasions = occasions or list(self.optimizer('occasion').occasion_configs)
+
+        for occasion in occasions:
+            self.occasion_enhancement(occasion)
+        for marketplace in marketplaces:
+            language = MARKETPLACE_LANGUAGES.get(marketplace, 'en')
+            for tone in tones:
+                for variant in range(self.variants):
+                    self.brand_tone_enhancement(tone, marketplace, variant=variant)
+            if language != 'en':
+                for variant in range(self.variants):
+                    self.localization_enhancement(marketplace, language, variant=variant)
+                self.aplus_enhancement(marketplace, language)
+            for occasion in occasions:
+                self.should_include_occasion(occasion, marketplace)
+                self.translate_occasion(occasion, marketplace)
+                self.occasion_keywords(occasion, marketplace)
+                self.occasion_hooks(occasion, marketplace)
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"Prompt fragment registry warmed: {len(self._fragments)} keys in {elapsed:.2f}s")
+        return elapsed
+
+    def stats(self):
+        with self._lock:
+            return {
+                'optimizers_built': sorted(self._optimizers),
+                'optimizer_build_seconds': {name: round(t, 4) for name, t in self._build_times.items()},
+                'optimizer_reuses': self.optimizer_hits,
+                'fragment_keys': len(self._fragments),
+                'fragment_variants': sum(len(pool) for pool in self._fragments.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / (self.hits + self.misses), 3) if (self.hits + self.misses) else 0.0,
+                'saved_seconds': round(self.saved_seconds, 4),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._fragments.clear()
+            self._render_times.clear()
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_prompt_fragments():
+    """Return the process-wide fragment registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = PromptFragmentRegistry()
+    return _registry
@@ -0,0 +1,155 @@
+"""
+Prompt Templates & Token Accounting
+Prompt fragments are parsed once (str.format syntax) and rendered with only the per-product
+variables. Assembled prompts carry a per-fragment token count from a local tokenizer (tiktoken
+when installed, a 4 chars/token estimate otherwise); when an input-token budget is set, the
+lowest-priority fragments are shortened or dropped until the prompt fits.
+"""
+
+import functools
+import logging
+import math
+import string
+
+from django.conf import settings
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = 'o200k_base'
+MIN_SHORTENED_TOKENS = 64  # below this a fragment is dropped rather than shortened
+
+
+@functools.lru_cache(maxsize=16)
+def _encoding(model):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+def tokenizer_name(model='gpt-4o'):
+    return f"tiktoken:{_encoding(model).name}" if TIKTOKEN_AVAILABLE else 'estimate:4chars'
+
+
+def count_tokens(text, model='gpt-4o'):
+    if not text:
+        return 0
+    if TIKTOKEN_AVAILABLE:
+        return len(_encoding(model).encode(text, disallowed_special=()))
+    return math.ceil(len(text) / 4)
+
+
+def truncate_to_tokens(text, max_tokens, model='gpt-4o'):
+    """Keep whole lines from the top of `text` while they fit in max_tokens"""
+    kept = []
+    used = 0
+    for line in text.split('\n'):
+        cost = count_tokens(line + '\n', model)
+        if used + cost > max_tokens:
+            break
+        kept.append(line)
+        used += cost
+    return '\n'.join(kept)
+
+
+class PromptTemplate:
+    """A str.format template parsed once at import; render() only substitutes the fields"""
+
+    _formatter = string.Formatter()
+
+    def __init__(self, name, source):
+        self.name = name
+        self.source = source
+        self._parts = list(self._formatter.parse(source))
+        self.fields = sorted({field for _, field, _, _ in self._parts if field})
+
+    def render(self, **values):
+        out = []
+        for literal, field, spec, conversion in self._parts:
+            out.append(literal)
+            if field is None:
+                continue
+            value = self._formatter.get_field(field, (), values)[0]
+            if conversion:
+                value = self._formatter.convert_field(value, conversion)
+            out.append(format(value, spec or ''))
+        return ''.join(out)
+
+    @functools.lru_cache(maxsize=4)
+    def static_tokens(self, model='gpt-4o'):
+        """Tokens in the template's fixed text (what every render pays before substitution)"""
+        return count_tokens(''.join(literal for literal, _, _, _ in self._parts), model)
+
+
+class PromptFragment:
+    """
+    One rendered piece of an assembled prompt. Higher priority survives a budget cut longer;
+    required fragments are never cut and shortenable ones are trimmed before being dropped.
+    """
+
+    def __init__(self, name, text, priority=50, required=False, shortenable=False):
+        self.name = name
+        self.text = text or ''
+        self.priority = priority
+        self.required = required
+        self.shortenable = shortenable
+
+
+def assemble_prompt(fragments, budget=None, overhead_tokens=0, model='gpt-4o', separator='\n'):
+    """
+    Join fragments (in order) and return (prompt, report). With a budget (input tokens for the
+    whole request, overhead_tokens being the system message etc.) the lowest-priority optional
+    fragments are shortened or dropped first. Cut fragments leave an empty slot so layout is kept.
+    """
+    counts = {f.name: count_tokens(f.text, model) for f in fragments}
+    texts = {f.name: f.text for f in fragments}
+    actions = {f.name: 'kept' if f.text else 'empty' for f in fragments}
+    separator_tokens = count_tokens(separator, model) * max(0, len(fragments) - 1)
+    total = overhead_tokens + separator_tokens + sum(counts.values())
+
+    if budget and total > budget:
+        excess = total - budget
+        optional = sorted((f for f in fragments if not f.required and f.text), key=lambda f: f.priority)
+        for fragment in optional:
+            if excess <= 0:
+                break
+            tokens = counts[fragment.name]
+            if fragment.shortenable and tokens - excess >= MIN_SHORTENED_TOKENS:
+                texts[fragment.name] = truncate_to_tokens(fragment.text, tokens - excess, model)
+                actions[fragment.name] = 'shortened'
+            else:
+                texts[fragment.name] = ''
+                actions[fragment.name] = 'dropped'
+            new_tokens = count_tokens(texts[fragment.name], model)
+            excess -= tokens - new_tokens
+            counts[fragment.name] = new_tokens
+        if excess > 0:
+            logger.warning(f"Prompt still {excess} tokens over the {budget} token budget after cutting optional fragments")
+
+    prompt = separator.join(texts[f.name] for f in fragments)
+    report = {
+        'tokenizer': tokenizer_name(model),
+        'model': model,
+        'budget': budget or None,
+        'overhead_tokens': overhead_tokens,
+        'input_tokens': overhead_tokens + separator_tokens + sum(counts.values()),
+        'input_tokens_before_budget': total,
+        'fragments': [
+            {'name': f.name, 'priority': f.priority, 'required': f.required, 'tokens': counts[f.name],
+             'action': actions[f.name]}
+            for f in fragments
+        ],
+    }
+    return prompt, report
+
+
+def prompt_token_budget(platform):
+    """Configured input-token budget for a platform's prompt (0/None means unlimited)"""
+    return (getattr(settings, f'{platform.upper()}_PROMPT_TOKEN_BUDGET', 0)
+            or getattr(settings, 'PROMPT_TOKEN_BUDGET', 0) or None)
@@ -0,0 +1,115 @@
+"""
+Raw LLM Response Archive
+Every Amazon completion is stored zlib-compressed next to its listing (RawLLMResponse) with the
+request hash, model and token usage. reprocess_listing() feeds an archived completion back
+through parsing, normalization, keyword derivation and A+ rendering - parser fixes reach
+existing listings at CPU cost instead of token cost.
+"""
+
+import logging
+import zlib
+
+from django.conf import settings
+
+from .llm_cache import CACHE_KEY_PREFIX, make_cache_key
+from .models import GeneratedListing, RawLLMResponse
+
+logger = logging.getLogger(__name__)
+
+REPROCESSABLE_PLATFORMS = ('amazon',)
+
+
+class ReprocessError(Exception):
+    """Raised when a listing has nothing to re-process from"""
+
+
+def archive_enabled():
+    return getattr(settings, 'LLM_RESPONSE_ARCHIVE', True)
+
+
+def compress_text(text, level=None):
+    if level is None:
+        level = getattr(settings, 'LLM_ARCHIVE_COMPRESSION_LEVEL', 6)
+    return zlib.compress(text.encode('utf-8'), level)
+
+
+def decompress_text(data, compression='zlib'):
+    if compression != 'zlib':
+        raise ValueError(f"Unsupported archive compression '{compression}'")
+    return zlib.decompress(bytes(data)).decode('utf-8')
+
+
+def prompt_hash(params):
+    """SHA-256 of the request - the LLM cache key without its prefix"""
+    return make_cache_key(**params)[len(CACHE_KEY_PREFIX):]
+
+
+def _usage_counts(usage):
+    """(prompt_tokens, completion_tokens) from an SDK usage object or a plain dict; None when unknown"""
+    if usage is None:
+        return None, None
+    if isinstance(usage, dict):
+        return usage.get('prompt_tokens'), usage.get('completion_tokens')
+    return getattr(usage, 'prompt_tokens', None), getattr(usage, 'completion_tokens', None)
+
+
+def archive_response(listing, params, response):
+    """
+    Store the raw completion of `params` for a saved listing. Archiving never fails a
+    generation: errors are logged and None is returned.
+    """
+    if not archive_enabled() or listing is None or listing.pk is None:
+        return None
+    try:
+        choice = response.choices[0]
+        content = choice.message.content or ''
+        prompt_tokens, completion_tokens = _usage_counts(getattr(response, 'usage', None))
+        archived = RawLLMResponse.objects.create(
+            listing=listing,
+            prompt_hash=prompt_hash(params),
+            model=str(getattr(response, 'model', None) or params.get('model', ''))[:100],
+            content=compress_text(content),
+            raw_size=len(content.encode('utf-8')),
+            finish_reason=str(getattr(choice, 'finish_reason', None) or '')[:20],
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
+    except Exception as e:
+        logger.warning(f"Could not archive raw response for listing {listing.pk}: {e}")
+        return None
+    logger.info(f"Archived raw response {archived.id} for listing {listing.pk}: "
+                f"{archived.raw_size} bytes -> {len(archived.content)} compressed")
+    return archived
+
+
+def archived_text(archived):
+    return decompress_text(archived.content, archived.compression)
+
+
+def latest_response(listing):
+    """Most recent archived completion of a listing, or None"""
+    return listing.raw_responses.order_by('-created_at', '-id').first()
+
+
+def reprocess_listing(listing_id, response_id=None):
+    """
+    Rebuild a listing from its archived raw completion (the latest one, or `response_id`)
+    without calling the model. Returns (listing, archived response).
+    """
+    from .services import ListingGeneratorService
+
+    listing = GeneratedListing.objects.select_related('product').get(id=listing_id)
+    if listing.platform not in REPROCESSABLE_PLATFORMS:
+        raise ReprocessError(f"Re-processing supports {', '.join(REPROCESSABLE_PLATFORMS)} listings, "
+                             f"not {listing.platform}")
+    if response_id is not None:
+        archived = listing.raw_responses.filter(id=response_id).first()
+        if archived is None:
+            raise ReprocessError(f"Listing {listing_id} has no archived response {response_id}")
+    else:
+        archived = latest_response(listing)
+        if archived is None:
+            raise ReprocessError(f"Listing {listing_id} has no archived raw response")
+
+    ListingGeneratorService().reprocess_listing(listing, archived_text(archived))
+    return listing, archived
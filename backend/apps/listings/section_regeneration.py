@@ -0,0 +1,360 @@
+"""
+Section-Level Regeneration
+Rewrites one section of an existing listing (title, bullets, description, FAQs, backend keywords
+or A+ section N) with a small targeted prompt that carries the rest of the listing as context.
+Only the affected columns are written back (save(update_fields=...)), so a section edit costs a
+few hundred output tokens instead of a full listing generation.
+"""
+
+import logging
+import re
+import time
+
+from .aplus_renderer import plan_section_keys
+from .bulk import MARKETPLACE_LANGUAGES
+from .json_repair import parse_llm_json
+from .localized_replacements import localize_text
+from .models import GeneratedListing
+
+logger = logging.getLogger(__name__)
+
+LANGUAGE_NAMES = {
+    'en': 'English', 'de': 'German', 'fr': 'French', 'it': 'Italian', 'es': 'Spanish', 'es-mx': 'Mexican Spanish',
+    'nl': 'Dutch', 'pl': 'Polish', 'ja': 'Japanese', 'pt': 'Portuguese', 'ar': 'Arabic', 'tr': 'Turkish',
+    'sv': 'Swedish',
+}
+
+# Same model as the platform's full generation, so a rewritten section matches the rest
+PLATFORM_MODELS = {
+    'amazon': ('gpt-5-chat-latest', 1),
+    'walmart': ('gpt-4o-mini', 0.3),
+}
+
+AMAZON_BACKEND_KEYWORD_LIMIT = 249
+
+_APLUS_CARD = re.compile(r'<div class="aplus-section-card\b')
+_CARD_TITLE = re.compile(r'(<h3\b[^>]*>)(.*?)(</h3>)', re.DOTALL)
+_CARD_CONTENT = re.compile(r'(<p class="text-gray-700[^"]*">)(.*?)(</p>)', re.DOTALL)
+_CARD_DETAIL = re.compile(r'(<p class="text-gray-600">)(.*?)(</p>)', re.DOTALL)
+
+
+class SectionRegenerationError(Exception):
+    """Raised when a section can't be regenerated for this listing"""
+
+
+class SectionSpec:
+    """
+    One regenerable section: the JSON key the model answers with, its shape in the prompt,
+    an output-token cap, and the per-platform listing columns it is written to.
+    """
+
+    def __init__(self, name, key, shape, instruction, max_tokens, fields):
+        self.name = name
+        self.key = key
+        self.shape = shape
+        self.instruction = instruction
+        self.max_tokens = max_tokens
+        self.fields = fields
+
+    def fields_for(self, platform):
+        if platform not in self.fields:
+            raise SectionRegenerationError(f"Section '{self.name}' can't be regenerated for {platform} listings")
+        return self.fields[platform]
+
+
+SECTIONS = {
+    'title': SectionSpec(
+        'title', 'productTitle', '"Complete product title"',
+        'Write a new product title: brand and product first, then the key benefit. Amazon max 200 characters, '
+        'Walmart max 70.',
+        250, {'amazon': ['title'], 'walmart': ['walmart_product_title', 'title']},
+    ),
+    'bullets': SectionSpec(
+        'bullets', 'bulletPoints', '["bullet 1", "bullet 2", "bullet 3", "bullet 4", "bullet 5"]',
+        'Write 5 new bullet points. Amazon: each starts with a short CAPITALIZED label and a colon, 150-250 '
+        'characters. Walmart: "Feature Name - specific benefit", max 75 characters.',
+        1000, {'amazon': ['bullet_points'], 'walmart': ['walmart_key_features', 'bullet_points']},
+    ),
+    'description': SectionSpec(
+        'description', 'productDescription', '"Full product description"',
+        'Write a new product description of 1300-1800 characters (Walmart: about 185 words) in short paragraphs.',
+        1500, {'amazon': ['long_description'], 'walmart': ['walmart_description', 'long_description']},
+    ),
+    'faqs': SectionSpec(
+        'faqs', 'faqs', '["Q: question? A: answer", "..."]',
+        'Write 5 new FAQs as "Q: ... A: ..." strings covering compatibility, benefits, setup, alternatives and '
+        'purchasing concerns.',
+        1000, {'amazon': ['faqs']},
+    ),
+    'backend_keywords': SectionSpec(
+        'backend_keywords', 'backendKeywords', '"space separated search terms"',
+        f'Write new backend search terms: up to {AMAZON_BACKEND_KEYWORD_LIMIT} characters, space separated, no '
+        'commas, no brand names, no words already in the title.',
+        300, {'amazon': ['amazon_backend_keywords']},
+    ),
+    'aplus': SectionSpec(
+        'aplus', 'section',
+        '{"title": "...", "content": "...", "keywords": ["..."], "imageDescription": "...", "seoOptimization": "..."}',
+        'Write a new version of the A+ content section shown below, keeping its purpose. imageDescription stays '
+        'in English and describes the exact image to produce.',
+        900, {'amazon': ['amazon_aplus_content']},
+    ),
+}
+
+
+def _aplus_cards(html):
+    """(start, end) of every A+ section card in rendered order"""
+    starts = [match.start() for match in _APLUS_CARD.finditer(html or '')]
+    if not starts:
+        return []
+    plan_end = html.find('<div class="aplus-strategy-summary', starts[-1])
+    last_end = plan_end if plan_end != -1 else len(html)
+    return list(zip(starts, starts[1:] + [last_end]))
+
+
+def _strip_tags(fragment):
+    return re.sub(r'<[^>]+>', ' ', fragment)
+
+
+def _text(value):
+    return ' '.join(_strip_tags(value).split())
+
+
+def _card_summary(card):
+    title = _CARD_TITLE.search(card)
+    content = _CARD_CONTENT.search(card)
+    return {
+        'title': _text(title.group(2)) if title else '',
+        'content': _text(content.group(2)) if content else '',
+    }
+
+
+def _replace_card(card, section):
+    """Swap the title, body and keyword/image/SEO notes of one rendered card, keeping its styling"""
+    def sub_first(pattern, text, value):
+        return pattern.sub(lambda m: f"{m.group(1)}{value}{m.group(3)}", text, count=1)
+
+    if section.get('title'):
+        card = sub_first(_CARD_TITLE, card, section['title'])
+    if section.get('content'):
+        card = sub_first(_CARD_CONTENT, card, section['content'])
+
+    details_at = card.find('seo-details')
+    if details_at != -1:
+        keywords = section.get('keywords') or []
+        values = iter([
+            ', '.join(keywords) if isinstance(keywords, list) else str(keywords),
+            section.get('imageDescription', ''),
+            section.get('seoOptimization', ''),
+        ])
+
+        def detail(match):
+            value = next(values, '')
+            return f"{match.group(1)}{value or match.group(2)}{match.group(3)}"
+        card = card[:details_at] + _CARD_DETAIL.sub(detail, card[details_at:], count=3)
+    return card
+
+
+def _update_stored_section(listing, index, section):
+    """Carry an A+ section rewrite into the stored plan, so a later re-render keeps it"""
+    stored = listing.amazon_aplus_plan or {}
+    fields = {field: section[field] for field in ('title', 'content', 'keywords', 'imageDescription', 'seoOptimization')
+              if section.get(field)}
+    if 'cards' in stored:
+        if index > len(stored['cards']):
+            return False
+        card = stored['cards'][index - 1]
+        if 'items' in card:
+            # List cards (features, trust, FAQ) keep their items, as in the rendered card
+            fields.pop('content', None)
+        card.update(fields)
+        return True
+    keys = plan_section_keys(stored.get('plan'))
+    if index > len(keys):
+        return False
+    stored['plan'][keys[index - 1]].update(fields)
+    return True
+
+
+def _listing_context(listing, platform, skip):
+    """The rest of the listing, trimmed, so the rewritten section stays consistent with it"""
+    if platform == 'walmart':
+        parts = [
+            ('Title', listing.walmart_product_title or listing.title),
+            ('Key features', listing.walmart_key_features or listing.bullet_points),
+            ('Description', listing.walmart_description or listing.long_description),
+        ]
+        names = ['title', 'bullets', 'description']
+    else:
+        parts = [
+            ('Title', listing.title),
+            ('Bullet points', listing.bullet_points),
+            ('Description', listing.long_description),
+            ('FAQs', listing.faqs),
+            ('Backend keywords', listing.amazon_backend_keywords),
+        ]
+        names = ['title', 'bullets', 'description', 'faqs', 'backend_keywords']
+    lines = []
+    for name, (label, value) in zip(names, parts):
+        if name != skip and value:
+            value = value.strip()
+            lines.append(f"{label}: {value[:1200]}{'...' if len(value) > 1200 else ''}")
+    return '\n\n'.join(lines)
+
+
+def _build_prompt(spec, listing, product, platform, current, instructions):
+    language = getattr(product, 'marketplace_language', '') or MARKETPLACE_LANGUAGES.get(product.marketplace, 'en')
+    language_name = LANGUAGE_NAMES.get(language, LANGUAGE_NAMES.get(language.split('-')[0], 'English'))
+    seller_note = f"\nSeller's request for this rewrite: {instructions.strip()[:500]}\n" if instructions else ''
+    return f"""You are rewriting ONE section of an existing {platform.title()} listing. Keep everything consistent with the rest of the listing below.
+
+Product: {product.brand_name} {product.name}
+Marketplace: {product.marketplace} - write in {language_name}
+Brand tone: {product.brand_tone}
+Features: {(product.features or '')[:800]}
+
+CURRENT LISTING (context, do not rewrite):
+{_listing_context(listing, platform, spec.name)}
+
+SECTION TO REWRITE ({spec.name}) - current version:
+{current[:2000] if current else '(empty)'}
+{seller_note}
+{spec.instruction}
+Return ONLY valid JSON: {{"{spec.key}": {spec.shape}}}"""
+
+
+def _truncate_words(text, limit):
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(' ', 1)[0]
+
+
+def _uses_backend_optimizer(product):
+    """France and Italy backend keywords go through the byte-limit optimizer, as in full generation"""
+    return getattr(product, 'marketplace', '') in ('fr', 'it')
+
+
+def _apply(spec, listing, product, platform, value, index, cards):
+    """Write the regenerated value to the listing columns; returns the update_fields list"""
+    fields = spec.fields_for(platform)
+    marketplace = getattr(product, 'marketplace', 'com') or 'com'
+
+    if spec.name == 'aplus':
+        if not isinstance(value, dict):
+            raise SectionRegenerationError('Model returned no A+ section object')
+        start, end = cards[index - 1]
+        html = listing.amazon_aplus_content
+        card = _replace_card(html[start:end], value)
+        listing.amazon_aplus_content = html[:start] + card + html[end:]
+        if _update_stored_section(listing, index, value):
+            return fields + ['amazon_aplus_plan']
+        return fields
+
+    if spec.name in ('bullets', 'faqs'):
+        items = value if isinstance(value, list) else [line for line in str(value).split('\n') if line.strip()]
+        items = [str(item).strip() for item in items if str(item).strip()]
+        if not items:
+            raise SectionRegenerationError(f"Model returned no {spec.name}")
+        if spec.name == 'faqs':
+            # Same marketplace FAQ prefixes as the Amazon generator
+            listing.faqs, _ = localize_text(marketplace, 'faq_prefixes', '\n\n'.join(items))
+        elif platform == 'walmart':
+            listing.walmart_key_features = '\n'.join(items)
+            listing.bullet_points = listing.walmart_key_features
+        else:
+            listing.bullet_points = '\n\n'.join(items)
+        return fields
+
+    text = ' '.join(str(value or '').split()) if spec.name != 'description' else str(value or '').strip()
+    if not text:
+        raise SectionRegenerationError(f"Model returned an empty {spec.name}")
+    if spec.name == 'title':
+        if platform == 'walmart':
+            listing.walmart_product_title = text[:70]
+            listing.title = listing.walmart_product_title
+        else:
+            listing.title = text[:200]
+    elif spec.name == 'description':
+        for field in fields:
+            setattr(listing, field, text)
+    elif spec.name == 'backend_keywords':
+        listing.amazon_backend_keywords = _truncate_words(text.replace(',', ' '), AMAZON_BACKEND_KEYWORD_LIMIT)
+    return fields
+
+
+def regenerate_section(listing_id, section, index=None, instructions=''):
+    """
+    Regenerate one section of a completed listing in place.
+    `index` is the 1-based A+ section number for section='aplus'. Returns a summary dict.
+    """
+    from .services import ListingGeneratorService
+
+    spec = SECTIONS.get(section)
+    if spec is None:
+        raise SectionRegenerationError(f"Unknown section '{section}'. Choose from: {', '.join(SECTIONS)}")
+
+    listing = GeneratedListing.objects.select_related('product').get(id=listing_id)
+    product = listing.product
+    platform = listing.platform
+    if platform not in PLATFORM_MODELS:
+        raise SectionRegenerationError(f"Section regeneration is not available for {platform} listings")
+    fields = spec.fields_for(platform)
+    if listing.status != 'completed':
+        raise SectionRegenerationError(f"Listing {listing_id} is {listing.status}; only completed listings can be edited")
+
+    cards = []
+    if spec.name == 'aplus':
+        cards = _aplus_cards(listing.amazon_aplus_content)
+        if not index or not 1 <= index <= len(cards):
+            raise SectionRegenerationError(f"A+ section index must be between 1 and {len(cards)}")
+        summary = _card_summary(listing.amazon_aplus_content[cards[index - 1][0]:cards[index - 1][1]])
+        current = f"Title: {summary['title']}\nContent: {summary['content']}"
+    else:
+        current = getattr(listing, fields[0], '') or ''
+
+    service = ListingGeneratorService(bypass_cache=True)  # a regeneration must not replay the old answer
+    if not service.client:
+        raise SectionRegenerationError('OpenAI API key not configured')
+    model, temperature = PLATFORM_MODELS[platform]
+    prompt = _build_prompt(spec, listing, product, platform, current, instructions)
+
+    started = time.monotonic()
+    response = service._chat_completion(
+        model=model,
+        messages=[{'role': 'user', 'content': prompt}],
+        max_tokens=spec.max_tokens,
+        temperature=temperature,
+    )
+    result, repairs = parse_llm_json(response.choices[0].message.content)
+    if repairs:
+        logger.info(f"Section '{section}' JSON repaired: {', '.join(repairs)}")
+    if not isinstance(result, dict) or spec.key not in result:
+        raise SectionRegenerationError(f"Model response had no '{spec.key}' value")
+
+    if spec.name == 'backend_keywords' and _uses_backend_optimizer(product):
+        base_keywords = [kw for kw in str(result[spec.key]).replace(',', ' ').split() if kw]
+        result[spec.key] = service.backend_optimizer.optimize_backend_keywords(
+            primary_keywords=base_keywords,
+            marketplace=product.marketplace,
+            product_category=getattr(product, 'category', None)
+        )
+
+    update_fields = _apply(spec, listing, product, platform, result[spec.key], index, cards)
+    listing.save(update_fields=update_fields + ['updated_at'])
+
+    usage = getattr(response, 'usage', None)
+    elapsed = time.monotonic() - started
+    logger.info(f"Regenerated {section} of listing {listing_id} in {elapsed:.1f}s")
+    return {
+        'listing_id': listing.id,
+        'section': section,
+        'index': index,
+        'updated_fields': update_fields,
+        'values': {field: getattr(listing, field) for field in update_fields if field != 'amazon_aplus_content'},
+        'usage': {
+            'prompt_tokens': getattr(usage, 'prompt_tokens', None),
+            'completion_tokens': getattr(usage, 'completion_tokens', None),
+        },
+        'duration': round(elapsed, 2),
+    }
+
@@ -1,24 +1,48 @@
 import json
-import time
 import re
 import logging
 import random
+from collections import Counter
 from django.conf import settings
+from django.db import transaction
 from .models import GeneratedListing, KeywordResearch
 from apps.core.models import Product
-from .backend_keyword_optimizer import BackendKeywordOptimizer
+from .backend_keyword_optimizer import get_backend_keyword_optimizer
+from .openai_client import get_openai_client, get_llm_backend
+from .llm_cache import cached_chat_completion, invalidate_completion
+from .pipeline import Pipeline, PipelineStep
+from .prompt_fragments import get_prompt_fragments
+from .json_repair import parse_llm_json
+from .structured_output import complete_missing_sections, get_listing_schema, structured_output_enabled
+from .ppc_strategy import apply_keyword_derivations
+from .localized_replacements import localize_text
+from .aplus_renderer import (
+    aplus_page, fallback_cards, render_aplus, render_fallback_cards, render_sections, stored_plan,
+)
+from .text_normalization import normalize_result
+from .response_archive import archive_response
+from .cross_platform import cross_platform_enabled, derive_listing, find_source
+from .prompt_templates import PromptFragment, assemble_prompt, count_tokens, prompt_token_budget
+from .amazon_prompts import AMAZON_TONE_TEMPLATES, UK_ENHANCEMENT_TEMPLATE, AMAZON_CORE_TEMPLATE, amazon_market_phrases
+from .coalescing import (listing_fingerprint, get_single_flight, find_inflight,
+                         claim_inflight, release_inflight, wait_for_listing)
 
 
 class ListingGeneratorService:
-    def __init__(self):
+    def __init__(self, bypass_cache=False, shared_context=None):
         self.logger = logging.getLogger(__name__)
-        self.backend_optimizer = BackendKeywordOptimizer()  # Initialize backend keyword optimizer
+        self.bypass_cache = bypass_cache  # Force fresh LLM completions for this request
+        self.shared_context = shared_context  # Marketplace-independent values shared by a fan-out (see fanout.py)
+        self.backend_optimizer = get_backend_keyword_optimizer()  # Shared process-wide optimizer
         try:
             self.logger.info("Checking OpenAI configuration...")
             self.logger.info(f"API Key exists: {bool(settings.OPENAI_API_KEY)}")
             
             # Check if OpenAI key is set and valid
-            if not settings.OPENAI_API_KEY or settings.OPENAI_API_KEY == "your-openai-api-key-here":
+            if get_llm_backend() != 'openai':
+                self.client = get_openai_client()
+                self.logger.info(f"Using offline LLM backend '{get_llm_backend()}' - AI generation replayed locally")
+            elif not settings.OPENAI_API_KEY or settings.OPENAI_API_KEY == "your-openai-api-key-here":
                 self.logger.warning("OpenAI API key not properly configured!")
                 self.logger.warning("Please set your real OpenAI API key in the .env file")
                 self.client = None
@@ -27,10 +51,8 @@ class ListingGeneratorService:
                 self.logger.warning("OpenAI keys should start with 'sk-'")
                 self.client = None
             else:
-                # Use new OpenAI client
-                from openai import OpenAI
-                self.logger.info(f"Creating OpenAI client with key starting: {settings.OPENAI_API_KEY[:10]}...")
-                self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+                # Reuse the pooled process-wide OpenAI client
+                self.client = get_openai_client()
                 self.logger.info("OpenAI client initialized successfully - AI generation enabled!")
         except Exception as e:
             self.logger.error(f"Error initializing OpenAI client: {e}")
@@ -38,6 +60,14 @@ class ListingGeneratorService:
             self.logger.error(f"Traceback: {traceback.format_exc()}")
             self.client = None
 
+    def _chat_completion(self, on_field=None, **params):
+        """
+        Call chat.completions.create through the shared LLM response cache and call gateway.
+        With on_field, the completion is streamed and on_field(key, value) fires as each
+        top-level JSON field finishes decoding.
+        """
+        return cached_chat_completion(self.client, bypass=self.bypass_cache, on_field=on_field, **params)
+
     def _generate_fallback_profit_maximizer(self, product):
         """Generate fallback profit maximizer content when AI fails to generate it"""
         return {
@@ -1422,17 +1452,70 @@ Use culturally appropriate phrases and expressions for {country} shoppers.
 🚨🚨🚨 END CRITICAL LANGUAGE REQUIREMENT 🚨🚨🚨
 """
     
-    def generate_listing(self, product_id, platform):
+    def generate_listing(self, product_id, platform, listing=None, on_field=None, draft=False):
+        """
+        Generate a listing, optionally filling in a pre-created (queued) listing.
+        on_field(key, value) receives Amazon fields as they stream in.
+        draft=True returns a fast small-model draft and queues the premium pass (tiered_generation.py).
+        Concurrent duplicate requests (same product inputs, platform and marketplace)
+        share one in-flight generation and receive the same listing.
+        """
+        if listing is not None or on_field is not None:
+            return self._generate_listing(product_id, platform, listing=listing, on_field=on_field, draft=draft)
+
+        product = Product.objects.get(id=product_id)
+        fingerprint = listing_fingerprint(product, platform) + (':draft' if draft else '')
+        return get_single_flight().do(
+            fingerprint, lambda: self._generate_listing_once(product, platform, fingerprint, draft)
+        )
+
+    def _generate_listing_once(self, product, platform, fingerprint, draft=False):
+        """Join another worker's in-flight generation for this fingerprint, or run and publish our own"""
+        owner_id = find_inflight(fingerprint)
+        listing = None
+        if not owner_id:
+            listing = GeneratedListing.objects.create(product=product, platform=platform, status='processing')
+            owner_id = claim_inflight(fingerprint, listing.id)
+            if owner_id != listing.id:
+                # Lost the race to another worker - drop our row and wait on theirs
+                listing.delete()
+                listing = None
+
+        if listing is None:
+            print(f"🔁 Joining in-flight generation (listing {owner_id}) for identical request")
+            existing = wait_for_listing(owner_id)
+            if existing is not None and existing.status == 'completed':
+                return existing
+            raise Exception(
+                (existing.error_message if existing is not None else '') or "Coalesced generation did not complete"
+            )
+
+        try:
+            return self._generate_listing(product.id, platform, listing=listing, draft=draft)
+        finally:
+            release_inflight(fingerprint, listing.id)
+
+    def _generate_listing(self, product_id, platform, listing=None, on_field=None, draft=False):
         try:
             product = Product.objects.get(id=product_id)
-            listing = GeneratedListing.objects.create(
-                product=product,
-                platform=platform,
-                status='processing'
-            )
+            if listing is None:
+                listing = GeneratedListing.objects.create(
+                    product=product,
+                    platform=platform,
+                    status='processing'
+                )
+            else:
+                listing.status = 'processing'
+                listing.save(update_fields=['status', 'updated_at'])
             
+            drafted = False
             if platform == 'amazon':
-                self._generate_amazon_listing(product, listing)
+                if draft:
+                    from .tiered_generation import generate_draft
+                    drafted = generate_draft(self, product, listing)
+                if not drafted:
+                    result = self._amazon_pipeline().run(product=product, listing=listing, on_field=on_field)
+                    result.raise_for_failure()
             elif platform == 'walmart':
                 self._generate_walmart_listing(product, listing)
             elif platform == 'etsy':
@@ -1446,109 +1529,115 @@ Use culturally appropriate phrases and expressions for {country} shoppers.
             
             listing.status = 'completed'
             
-            # SWEDEN SPECIFIC: Post-process A+ content to replace English keywords with Swedish
-            marketplace_code = getattr(product, 'marketplace', 'us')
-            if marketplace_code == 'se' and hasattr(listing, 'amazon_aplus_content') and listing.amazon_aplus_content:
-                print(f"🇸🇪 Post-processing A+ content for Swedish keywords...")
-                original_length = len(listing.amazon_aplus_content)
-                
-                # Check for English keywords before replacement
-                english_keywords = ['everyday use', 'versatile applications', 'practical', 'convenient']
-                english_found_before = sum(listing.amazon_aplus_content.count(kw) for kw in english_keywords)
-                print(f"🇸🇪 Found {english_found_before} English keywords in A+ content before replacement")
-                
-                # Apply comprehensive English-to-Swedish replacements
-                english_to_swedish = {
-                    # Original specific keywords
-                    'everyday use': 'daglig användning',
-                    'versatile applications': 'mångsidig användning', 
-                    'practical': 'praktisk',
-                    'convenient': 'bekväm',
-                    'customer satisfaction': 'kundnöjdhet',
-                    'package contents': 'förpackningsinnehåll',
-                    # Common English words in A+ content
-                    'Premium': 'Premium',  # Keep as is (international term)
-                    'Quality': 'Kvalitet',
-                    'Professional': 'Professionell',
-                    'Advanced': 'Avancerad',
-                    'Superior': 'Överlägsen',
-                    'Features': 'Funktioner',
-                    'Benefits': 'Fördelar',
-                    'Experience': 'Upplevelse',
-                    'Perfect': 'Perfekt',
-                    'Ultimate': 'Ultimat',
-                    'Guarantee': 'Garanti',
-                    'Warranty': 'Garanti',
-                    'Satisfaction': 'Tillfredsställelse',
-                    'Customer': 'Kund',
-                    'Product': 'Produkt',
-                    'Kitchen': 'Kök',
-                    'Cutting': 'Skär',
-                    'Board': 'Bräda',
-                    'Design': 'Design',  # Keep as is (international term)
-                    'Material': 'Material',  # Keep as is
-                    'Package': 'Paket',
-                    'excellent': 'utmärkt',
-                    'amazing': 'fantastisk',
-                    'wonderful': 'underbar',
-                    'great': 'bra',
-                    'good': 'bra',
-                    'best': 'bäst',
-                    'top': 'topp',
-                    'high': 'hög',
-                    'low': 'låg',
-                    'easy': 'lätt',
-                    'simple': 'enkel',
-                    'quick': 'snabb',
-                    'fast': 'snabb',
-                    'strong': 'stark',
-                    'powerful': 'kraftfull',
-                    'effective': 'effektiv',
-                    'efficient': 'effektiv',
-                    'reliable': 'pålitlig',
-                    'durable': 'hållbar',
-                    'safe': 'säker',
-                    'secure': 'säker'
-                }
-                
-                # Apply replacements
-                for english, swedish in english_to_swedish.items():
-                    if english in listing.amazon_aplus_content:
-                        listing.amazon_aplus_content = listing.amazon_aplus_content.replace(english, swedish)
-                        print(f"🇸🇪 Replaced '{english}' with '{swedish}'")
-                
-                # Check for English keywords after replacement
-                english_found_after = sum(listing.amazon_aplus_content.count(kw) for kw in english_keywords)
-                swedish_keywords = ['daglig användning', 'mångsidig användning', 'praktisk', 'bekväm']
-                swedish_found = sum(listing.amazon_aplus_content.count(kw) for kw in swedish_keywords)
-                
-                new_length = len(listing.amazon_aplus_content)
-                print(f"🇸🇪 A+ content processing complete:")
-                print(f"   Length: {original_length} → {new_length} characters")
-                print(f"   English keywords: {english_found_before} → {english_found_after}")
-                print(f"   Swedish keywords: {swedish_found}")
-                print(f"   ✅ Swedish keyword replacement successful!")
-            
+            self._localize_aplus_keywords(product, listing)
             listing.save()
             
+            if drafted:
+                from .tasks import enqueue_listing_refinement
+                enqueue_listing_refinement(listing)
+            
             # Note: Image generation is now triggered separately from frontend
             # This allows the listing to be shown immediately
             
             return listing
             
         except Exception as e:
-            if 'listing' in locals():
+            if listing is not None:
                 listing.status = 'failed'
+                listing.error_message = str(e)[:1000]
                 listing.save()
             raise e
 
-    def _generate_amazon_listing(self, product, listing):
+    def refine_listing(self, listing, claimed_at=None):
+        """
+        Premium pass over a draft: the full Amazon generation on the same listing, then a version bump.
+        The full save would overwrite anything saved meanwhile, so with claimed_at the result is
+        discarded (RefinementSuperseded) when the listing changed after that moment - e.g. a
+        section rewritten through the regeneration endpoint during the premium pass.
+        """
+        from .tiered_generation import RefinementSuperseded
+
+        product = listing.product
+        result = self._amazon_pipeline().run(product=product, listing=listing, on_field=None)
+        result.raise_for_failure()
+        self._localize_aplus_keywords(product, listing)
+        listing.version += 1
+        listing.refinement_status = 'refined'
+        listing.error_message = ''
+        with transaction.atomic():
+            if claimed_at is not None:
+                updated_at = GeneratedListing.objects.select_for_update().values_list(
+                    'updated_at', flat=True).get(id=listing.id)
+                if updated_at > claimed_at:
+                    raise RefinementSuperseded(f"Listing {listing.id} was edited during the premium pass")
+            listing.save()
+        return listing
+
+    def reprocess_listing(self, listing, raw_response):
+        """Rebuild an Amazon listing from an archived raw completion (no model call), then save it"""
+        product = listing.product
+        self._generate_amazon_listing(product, listing, raw_response=raw_response)
+        self._localize_aplus_keywords(product, listing)
+        listing.status = 'completed'
+        listing.error_message = ''
+        listing.save()
+        return listing
+
+    def _localize_aplus_keywords(self, product, listing):
+        # Post-process A+ content: replace English leftovers using the marketplace glossary
+        marketplace_code = getattr(product, 'marketplace', 'us')
+        if not getattr(listing, 'amazon_aplus_content', ''):
+            return
+        text, hits = localize_text(marketplace_code, 'aplus', listing.amazon_aplus_content)
+        if hits:
+            listing.amazon_aplus_content = text
+            top = ', '.join(f"{term} x{count}" for term, count in hits.most_common(5))
+            print(f"🌍 A+ glossary ({marketplace_code}): {sum(hits.values())} replacements of {len(hits)} terms ({top})")
+
+    def _amazon_pipeline(self):
+        """Amazon is one completion followed by sequential post-processing, so a single step for now"""
+        return Pipeline('amazon', [
+            PipelineStep('amazon_content', self._generate_amazon_listing,
+                         inputs=['product', 'listing', 'on_field']),
+        ])
+
+    def _walmart_pipeline(self):
+        timeout = getattr(settings, 'LLM_BRANCH_TIMEOUT', 90)
+        return Pipeline('walmart', [
+            PipelineStep('core', self._generate_walmart_core_content,
+                         inputs=['product'], outputs=['core_content'], timeout=timeout),
+            # Merge already substitutes defaults for every advanced field, so an empty dict is a safe fallback
+            PipelineStep('advanced', self._generate_walmart_advanced_content,
+                         inputs=['product'], outputs=['advanced_content'], timeout=timeout,
+                         fallback=lambda product: {}),
+            PipelineStep('merge', self._merge_walmart_hybrid_content,
+                         inputs=['listing', 'core_content', 'advanced_content', 'product']),
+        ])
+
+    def _etsy_pipeline(self):
+        timeout = getattr(settings, 'LLM_BRANCH_TIMEOUT', 90)
+        return Pipeline('etsy', [
+            PipelineStep('emotional_core', self._generate_etsy_emotional_core,
+                         inputs=['product'], outputs=['core_result'], timeout=timeout,
+                         fallback=self._generate_fallback_emotional_core),
+            PipelineStep('conversion_elements', self._generate_etsy_conversion_elements,
+                         inputs=['product'], outputs=['conversion_result'], timeout=timeout,
+                         fallback=self._generate_fallback_conversion_elements),
+            # The ten business guides are generated on first request (etsy_guides.py), not here
+            PipelineStep('populate', self._populate_etsy_listing_fields,
+                         inputs=['listing', 'core_result', 'conversion_result', 'product'],
+                         outputs=['populated']),
+            PipelineStep('quality_scores', lambda listing, populated: self._calculate_etsy_quality_scores(listing),
+                         inputs=['listing', 'populated']),
+        ])
+
+    def _generate_amazon_listing(self, product, listing, on_field=None, raw_response=None):
+        """
+        The Amazon generation. With raw_response (an archived completion), the model call is
+        skipped and only parsing and post-processing run - see response_archive.py.
+        """
         import json
         import re
-        from .services_occasion_enhanced import OccasionOptimizer
-        from .brand_tone_optimizer import BrandToneOptimizer
-        from .international_localization_optimizer import InternationalLocalizationOptimizer
-        from .market_occasions import MarketOccasions
         
         self.logger.info(f"GENERATING AMAZON LISTING FOR {product.name}")
         self.logger.info(f"OpenAI client status: {'AVAILABLE' if self.client else 'NOT AVAILABLE'}")
@@ -1556,18 +1645,15 @@ Use culturally appropriate phrases and expressions for {country} shoppers.
         self.logger.info(f"Occasion: {getattr(product, 'occasion', 'None')}")
         self.logger.info(f"Brand Tone: {getattr(product, 'brand_tone', 'professional')}")
         
-        if not self.client:
+        if not self.client and raw_response is None:
             self.logger.error("OpenAI client is None - using fallback content")
             self.logger.error(f"API Key exists: {bool(settings.OPENAI_API_KEY)}")
             if settings.OPENAI_API_KEY:
                 self.logger.error(f"API Key starts with 'sk-': {settings.OPENAI_API_KEY.startswith('sk-') if settings.OPENAI_API_KEY else False}")
             raise Exception("OpenAI API key not configured. Please set your OPENAI_API_KEY in the .env file to generate AI content.")
             
-        # Initialize optimizers
-        occasion_optimizer = OccasionOptimizer()
-        brand_tone_optimizer = BrandToneOptimizer()
-        international_optimizer = InternationalLocalizationOptimizer()
-        market_occasions = MarketOccasions()
+        # Process-wide optimizer tables and cached prompt fragments
+        fragments = get_prompt_fragments()
         
         
         # Generate product-specific keywords and context
@@ -1609,8 +1695,10 @@ Use culturally appropriate phrases and expressions for {country} shoppers.
             'structure': 'Problem narrative → Solution introduction → Key benefits → Trust elements → Clear CTA'
         }
         
-        # Generate dynamic, human-centered prompt with heavy anti-template randomization
-        import random
+        # Generate dynamic, human-centered prompt with heavy anti-template randomization.
+        # Seeded from the product inputs: different products still vary, while regenerating the same
+        # product builds the same prompt, so the LLM response cache can answer it.
+        rng = random.Random(listing_fingerprint(product, 'amazon'))
         
         # Create radical variation systems to prevent templating
         
@@ -1653,189 +1741,19 @@ Use culturally appropriate phrases and expressions for {country} shoppers.
         ]
         
         # Randomly select elements to inject variety
-        chosen_hook = random.choice(emotional_hooks)
-        chosen_approach = random.choice(description_approaches)
-        chosen_structure = random.choice(structure_variants)
+        chosen_hook = rng.choice(emotional_hooks)
+        chosen_approach = rng.choice(description_approaches)
+        chosen_structure = rng.choice(structure_variants)
         
         # Anti-template instructions based on tone
         tone_style = product.brand_tone.lower()
         
-        # Create completely different writing approaches for each brand tone
-        tone_specific_prompts = {
-            'professional': f"""
-WRITE AS A HUMAN EXPERT, NOT A MARKETING ROBOT
-
-You're a respected professional who genuinely knows this field. Your job is to write like you're personally recommending this to a colleague, not creating marketing copy.
-
-CRITICAL ANTI-ROBOT RULES:
-❌ NEVER use "revolutionary", "game-changing", "cutting-edge", "state-of-the-art"
-❌ NEVER start with brand name in title unless it naturally fits
-❌ NEVER use the same bullet structure as other products
-❌ NEVER start description with "Are you tired of..." or "Experience the..."
-❌ NEVER use "**FEATURE NAME:**" format in bullets
-
-HUMAN WRITING APPROACH:
-✅ Write like you're explaining to a smart colleague
-✅ Use specific, unusual details that show you actually understand the product
-✅ Include subtle professional insights that only an expert would know
-✅ Vary sentence structure dramatically - mix very short and longer explanations
-✅ Use unexpected but professional language
-
-TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
-DESCRIPTION STYLE: "{chosen_approach}"  
-STRUCTURAL APPROACH: "{chosen_structure}"
-
-TITLE VARIATION: Create something that sounds like a professional wrote it, not a marketing team
-BULLET VARIATION: Write each bullet completely differently - some short, some detailed, varied formats
-DESCRIPTION VARIATION: Tell the story from a professional's perspective, not marketing copy
-""",
-            
-            'casual': f"""
-WRITE LIKE A REAL FRIEND WHO FOUND SOMETHING AMAZING
-
-You're that friend who discovers cool stuff and can't wait to share it. Write like you're texting someone you care about, not creating an ad.
-
-CRITICAL ANTI-ROBOT RULES:
-❌ NEVER use "game-changer", "life-saver", "must-have"
-❌ NEVER start bullets with "MAKES LIFE EASIER:" or similar templates
-❌ NEVER use the same casual phrases everyone uses
-❌ NEVER sound like you're trying to sell something
-❌ NEVER use forced enthusiasm
-
-HUMAN FRIEND APPROACH:
-✅ Write like you're actually excited about this thing
-✅ Use specific, quirky details that make it feel real
-✅ Include slightly imperfect, conversational language
-✅ Share it like you'd tell a story to a friend
-✅ Use casual language that doesn't sound forced
-
-TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
-DESCRIPTION STYLE: "{chosen_approach}"  
-STRUCTURAL APPROACH: "{chosen_structure}"
-
-TITLE VARIATION: Write it like a casual recommendation, not marketing copy
-BULLET VARIATION: Each bullet should sound completely different - some chatty, some quick, varied styles
-DESCRIPTION VARIATION: Tell it like you're sharing a personal discovery with a friend
-""",
-            
-            'luxury': f"""
-WRITE AS A SOPHISTICATED CONNOISSEUR, NOT A LUXURY SALES PERSON
-
-You appreciate true quality and understand what makes something genuinely exceptional. Write like you're sharing a rare discovery with someone who appreciates fine things.
-
-CRITICAL ANTI-ROBOT RULES:
-❌ NEVER use "exquisite", "handcrafted", "premium experience", "discerning"
-❌ NEVER start with "for the discerning" or "exclusive collection"
-❌ NEVER use obvious luxury buzzwords
-❌ NEVER sound pretentious or trying-too-hard
-❌ NEVER use "EXCEPTIONAL CRAFTSMANSHIP:" bullet format
-
-SOPHISTICATED HUMAN APPROACH:
-✅ Write with quiet confidence about genuine quality
-✅ Use subtle language that shows real appreciation for quality
-✅ Include specific details that only someone who knows quality would notice
-✅ Let the quality speak for itself without shouting about it
-✅ Use refined but not pretentious language
-
-TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
-DESCRIPTION STYLE: "{chosen_approach}"  
-STRUCTURAL APPROACH: "{chosen_structure}"
-
-TITLE VARIATION: Something that quietly suggests quality without screaming luxury
-BULLET VARIATION: Each should demonstrate quality through specific details, not declarations
-DESCRIPTION VARIATION: Show appreciation for quality through informed perspective
-""",
-            
-            'playful': f"""
-WRITE WITH GENUINE CREATIVITY, NOT FORCED ENTHUSIASM
-
-You're naturally creative and see fun possibilities everywhere. Write like you're sharing something that genuinely delights you, not trying to be quirky.
-
-CRITICAL ANTI-ROBOT RULES:
-❌ NEVER use "seriously cool", "totally awesome", "mind-blowing", "game-changer"
-❌ NEVER start bullets with "TOTALLY AWESOME:" or similar
-❌ NEVER force quirky comparisons that don't fit
-❌ NEVER sound like you're trying too hard to be fun
-❌ NEVER use obviously playful templates
-
-GENUINELY CREATIVE APPROACH:
-✅ Find unexpected but fitting ways to describe things
-✅ Use creativity that flows naturally from the product
-✅ Include surprising details that make people smile
-✅ Let your natural creativity show without forcing it
-✅ Write with energy that feels authentic
-
-TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
-DESCRIPTION STYLE: "{chosen_approach}"  
-STRUCTURAL APPROACH: "{chosen_structure}"
-
-TITLE VARIATION: Something creative that fits the product naturally
-BULLET VARIATION: Each should surprise in a different way - some clever, some simple, varied approaches
-DESCRIPTION VARIATION: Share the creative possibility in a way that feels natural
-""",
-            
-            'minimal': f"""
-WRITE WITH PURPOSEFUL CLARITY, NOT STRIPPED-DOWN MARKETING
-
-You understand that the best things are simple and clear. Write like someone who values substance over style and knows what really matters.
-
-CRITICAL ANTI-ROBOT RULES:
-❌ NEVER use "essential", "simply better", "pure", "refined"
-❌ NEVER use "CLEAR BENEFIT:" bullet format
-❌ NEVER artificially strip away all personality
-❌ NEVER sound cold or robotic in pursuit of minimalism
-❌ NEVER use obvious minimal buzzwords
-
-THOUGHTFUL SIMPLICITY APPROACH:
-✅ Say exactly what needs to be said, nothing more
-✅ Use clear language that gets to the point
-✅ Include only details that truly matter
-✅ Let simplicity emerge from clarity, not force it
-✅ Write with calm confidence in the essentials
-
-TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
-DESCRIPTION STYLE: "{chosen_approach}"  
-STRUCTURAL APPROACH: "{chosen_structure}"
-
-TITLE VARIATION: Clear and direct without unnecessary words
-BULLET VARIATION: Each should be as long as it needs to be - some short, some longer, all clear
-DESCRIPTION VARIATION: Focus on what matters most, explained clearly
-""",
-            
-            'bold': f"""
-WRITE WITH AUTHENTIC CONFIDENCE, NOT MARKETING HYPERBOLE
-
-You believe strongly in what you're sharing and aren't afraid to make confident claims you can back up. Write like someone with genuine conviction, not a salesperson.
-
-CRITICAL ANTI-ROBOT RULES:
-❌ NEVER use "revolutionary", "breakthrough", "destroys", "shatters", "unleashes"
-❌ NEVER start bullets with "BREAKTHROUGH POWER:" or similar
-❌ NEVER use obvious bold/power buzzwords
-❌ NEVER sound like you're compensating with volume
-❌ NEVER use dramatic language that doesn't fit the product
-
-GENUINELY CONFIDENT APPROACH:
-✅ Make strong claims that you can actually support
-✅ Use confident language that feels earned, not manufactured
-✅ Include specific evidence for your bold statements
-✅ Let your conviction show through substance, not adjectives
-✅ Write with power that comes from genuine belief
-
-TODAY'S EMOTIONAL APPROACH: "{chosen_hook}"
-DESCRIPTION STYLE: "{chosen_approach}"  
-STRUCTURAL APPROACH: "{chosen_structure}"
-
-TITLE VARIATION: Confident but specific, not generically bold
-BULLET VARIATION: Each should demonstrate confidence in different ways - some direct, some detailed
-DESCRIPTION VARIATION: Show conviction through evidence and specific benefits
-"""
-        }
-        
-        # Get the tone-specific prompt
-        base_prompt = tone_specific_prompts.get(tone_style, tone_specific_prompts['professional'])
+        # Create completely different writing approaches for each brand tone (templates compiled once in amazon_prompts)
+        tone_template = AMAZON_TONE_TEMPLATES.get(tone_style, AMAZON_TONE_TEMPLATES['professional'])
+        base_prompt = tone_template.render(chosen_hook=chosen_hook, chosen_approach=chosen_approach,
+                                           chosen_structure=chosen_structure)
         
         # Add variety through randomization techniques
-        import random
         variety_elements = [
             "Avoid using these overused phrases in ANY section: 'Experience the difference', 'Take your [X] to the next level', 'Game-changing', 'Revolutionary', 'Unparalleled', 'Amazing', 'Incredible', 'You'll wonder how you managed without it', 'Trust me', 'You'll be the hero', 'Your new best friend'",
             "Use unexpected analogies and comparisons that fit the brand tone",
@@ -1863,7 +1781,7 @@ DESCRIPTION VARIATION: Show conviction through evidence and specific benefits
             "MOBILE SCAN-FIRST BULLETS RULE: The first 6-8 words of each bullet must serve as a micro-headline (main benefit or emotional payoff), followed by supportive detail",
             "BENEFIT STACKING: At least 2 bullets should combine feature + emotional benefit + trust element in a single flow (e.g., 'LOCKS IN COLD — Double-wall insulation keeps water icy fresh, giving you confidence on long commutes')"
         ]
-        random.shuffle(variety_elements)
+        rng.shuffle(variety_elements)
         
         # Create truly randomized product insights to prevent templating
         product_category = product.categories.split(',')[0].strip() if product.categories else "product"
@@ -1876,21 +1794,21 @@ DESCRIPTION VARIATION: Show conviction through evidence and specific benefits
             "unexpected_benefit", "specific_use_case", "problem_solving", "lifestyle_enhancement",
             "technical_advantage", "emotional_satisfaction", "practical_convenience", "unique_approach"
         ]
-        chosen_focus = random.choice(content_focus_options)
+        chosen_focus = rng.choice(content_focus_options)
         
         # Random title approaches (completely different each time)
         title_approaches = [
             "benefit_led", "problem_solution", "category_specific", "user_focused", 
             "feature_highlight", "outcome_driven", "comparison_based", "story_driven"
         ]
-        chosen_title_approach = random.choice(title_approaches)
+        chosen_title_approach = rng.choice(title_approaches)
         
         # Random FAQ styles (break the Q&A template)
         faq_styles = [
             "conversational_honest", "technical_explained_simply", "comparison_focused", 
             "concern_addressing", "story_based", "practical_focused"
         ]
-        chosen_faq_style = random.choice(faq_styles)
+        chosen_faq_style = rng.choice(faq_styles)
 
         # Get language instruction if not English
         language_instruction = ""
@@ -1924,21 +1842,21 @@ DESCRIPTION VARIATION: Show conviction through evidence and specific benefits
         
         if occasion and occasion != 'None':
             # Translate occasion to local market version
-            local_occasion = market_occasions.translate_occasion(occasion, marketplace)
+            local_occasion = fragments.translate_occasion(occasion, marketplace)
             
             # Check if this occasion is appropriate for this market
-            if not market_occasions.should_include_occasion(occasion, marketplace):
+            if not fragments.should_include_occasion(occasion, marketplace):
                 self.logger.info(f"Skipping US-specific occasion '{occasion}' for market {marketplace}")
                 occasion = 'general'  # Fall back to general
                 local_occasion = 'general'
             
             # Get localized occasion keywords
-            occasion_keywords = market_occasions.get_occasion_keywords(occasion, marketplace)
+            occasion_keywords = fragments.occasion_keywords(occasion, marketplace)
             
             # Get localized emotional hooks
-            occasion_hooks = market_occasions.get_occasion_emotional_hooks(occasion, marketplace)
+            occasion_hooks = fragments.occasion_hooks(occasion, marketplace)
             
-            occasion_enhancement = occasion_optimizer.get_occasion_prompt_enhancement(occasion)
+            occasion_enhancement = fragments.occasion_enhancement(occasion)
             
             # Add localized occasion context
             if occasion_keywords or occasion_hooks:
@@ -1953,7 +1871,7 @@ DESCRIPTION VARIATION: Show conviction through evidence and specific benefits
         # Get brand tone-specific enhancements with marketplace context
         brand_tone = getattr(product, 'brand_tone', 'professional')
         marketplace = getattr(product, 'marketplace', 'us')
-        brand_tone_enhancement = brand_tone_optimizer.get_brand_tone_enhancement(brand_tone, marketplace)
+        brand_tone_enhancement = fragments.brand_tone_enhancement(brand_tone, marketplace, rng=rng)
         self.logger.info(f"Applied brand tone enhancement for: {brand_tone} (marketplace: {marketplace})")
         
         # Get international localization enhancements if applicable
@@ -1961,8 +1879,8 @@ DESCRIPTION VARIATION: Show conviction through evidence and specific benefits
         localization_enhancement = ""
         aplus_enhancement = ""
         if marketplace_lang and marketplace_lang != 'en':
-            localization_enhancement = international_optimizer.get_localization_enhancement(marketplace, marketplace_lang)
-            aplus_enhancement = international_optimizer.get_aplus_content_enhancement(marketplace, marketplace_lang)
+            localization_enhancement = fragments.localization_enhancement(marketplace, marketplace_lang, rng=rng)
+            aplus_enhancement = fragments.aplus_enhancement(marketplace, marketplace_lang)
             self.logger.info(f"Applied international localization for: {marketplace} ({marketplace_lang})")
             self.logger.info(f"Applied A+ content international enhancement for: {marketplace} ({marketplace_lang})")
         
@@ -1973,112 +1891,7 @@ DESCRIPTION VARIATION: Show conviction through evidence and specific benefits
             occasion = getattr(product, 'occasion', 'general')
             
             # UK Cultural Enhancement - EXACT MEXICO PATTERN FOR GUARANTEED 10/10 QUALITY
-            uk_enhancement = f"""
-🇬🇧 UNITED KINGDOM MARKET - EXACT MEXICO PATTERN REPLICATION FOR 10/10 QUALITY
-=================================================================================
-
-🚨🚨🚨 MANDATORY REQUIREMENTS - NO EXCEPTIONS ALLOWED 🚨🚨🚨
-
-⭐ CRITICAL SUCCESS FACTORS - FOLLOW MEXICO'S PROVEN FORMULA EXACTLY:
-
-1. BULLET STRUCTURE - EXACT MEXICO REPLICATION:
-   🎯 ALL 5 bullets MUST start with ★ symbol
-   🎯 Follow Mexico's emotional intensity pattern exactly
-   🎯 Each bullet MUST contain ONE British formality phrase
-   🎯 Length: 180-250 characters per bullet (Mexico standard)
-
-2. MANDATORY BRITISH FORMALITY PHRASES (USE ONE PER BULLET):
-   ✓ "We're delighted to offer" ✓ "Rest assured" ✓ "You'll find" 
-   ✓ "We're confident" ✓ "Proudly British" ✓ "You can be certain"
-   ✓ "It's our pleasure to provide" ✓ "We guarantee you'll notice"
-
-3. BRITISH CULTURAL INTEGRATION (MINIMUM 5 REFERENCES):
-   ✓ UK occasions: {occasion}, Boxing Day, Sunday roast, afternoon tea
-   ✓ British weather/climate considerations ✓ British homes/lifestyle
-   ✓ UK families/customers ✓ British standards/engineering ✓ British heritage
-
-4. EMOTIONAL POWER UPGRADE (BEAT COMPETITORS):
-   ❌ good → ✓ brilliant/exceptional ❌ nice → ✓ splendid/outstanding
-   ❌ great → ✓ remarkable/superb ❌ quality → ✓ premium excellence
-
-🔥 MANDATORY 5-BULLET PATTERN (FOLLOW MEXICO'S EXACT STRUCTURE):
-
-★ BULLET 1 - BRITISH EXCELLENCE SHOWCASE:
-"★ BRITISH ENGINEERING EXCELLENCE: [Premium feature] engineered to British Standards for [exceptional result]. We're confident you'll find [refined benefit] that transforms your [UK lifestyle scenario]."
-
-★ BULLET 2 - HERITAGE MEETS INNOVATION:
-"★ HERITAGE CRAFTSMANSHIP: [Quality element] combining traditional British excellence with [modern innovation]. Rest assured, [guarantee/quality promise] with full UK warranty backing."
-
-★ BULLET 3 - PERFECT FOR BRITISH HOMES:
-"★ PERFECT FOR BRITISH LIFESTYLE: [Lifestyle feature] ideal for {occasion}, Sunday roasts, and [weather considerations]. You'll find it brilliant for [specific British use case]."
-
-★ BULLET 4 - TRUSTED BY UK FAMILIES:
-"★ TRUSTED ACROSS BRITAIN: [Social proof] chosen by thousands of British families from London to Edinburgh. We're delighted to offer [exclusive British benefit]."
-
-★ BULLET 5 - EXCEPTIONAL BRITISH GIFT:
-"★ THOUGHTFUL BRITISH GIFT: Perfect {occasion} present with [British packaging/service]. Proudly presented with British customer service excellence and next-day delivery."
-
-💪 MANDATORY ELEMENTS TO INCLUDE (10/10 QUALITY CHECKPOINT):
-🎯 5 bullets with ★ symbols ✓ 🎯 British formality in every bullet ✓
-🎯 UK cultural references (min 5) ✓ 🎯 Occasion integration: {occasion} ✓
-🎯 British spelling (colour, favourite) ✓ 🎯 Weather considerations ✓
-🎯 Trust signals (warranty, CE, standards) ✓ 🎯 Emotional intensity ✓
-
-🇬🇧 UK DESCRIPTION STRUCTURE (1400-1600 chars - FOLLOW EXACTLY):
-Para 1: "Experience the difference British excellence makes. [Product] represents the finest in [category] engineering, designed specifically for discerning British customers who appreciate [quality aspect]..."
-Para 2: "From [British scenario] to [UK lifestyle activity], this [sophisticated feature] delivers [premium benefit]. Perfect for British homes and weather conditions..."
-Para 3: "Whether you're preparing for {occasion} or enjoying [British tradition], you'll find [product] provides [exceptional benefit] that exceeds expectations..."
-Para 4: "Join thousands of satisfied British families. Rest assured, with [UK warranty] and British customer service, you're investing in proven excellence."
-
-🚨 FINAL QUALITY ASSURANCE - VERIFY BEFORE SUBMISSION:
-✅ All 5 bullets start with ★ ✅ British formality in each bullet
-✅ Cultural integration present ✅ Emotional power words used  
-✅ Trust signals included ✅ British spelling consistent
-✅ Occasion '{occasion}' referenced ✅ Weather considerations mentioned
-
-FAILURE TO MEET ALL REQUIREMENTS = AUTOMATIC REJECTION
-
-🚨🚨🚨 CRITICAL BULLET FORMAT REQUIREMENT 🚨🚨🚨
-JSON OUTPUT REQUIREMENT FOR UK MARKET:
-"bulletPoints": [
-    "★ BRITISH ENGINEERING EXCELLENCE: [content with British formality]",
-    "★ HERITAGE CRAFTSMANSHIP: [content with British formality]", 
-    "★ PERFECT FOR BRITISH LIFESTYLE: [content with British formality]",
-    "★ TRUSTED ACROSS BRITAIN: [content with British formality]",
-    "★ THOUGHTFUL BRITISH GIFT: [content with British formality]"
-]
-
-EVERY SINGLE BULLET MUST START WITH ★ SYMBOL - NO EXCEPTIONS!
-DO NOT USE "•" OR "-" OR ANY OTHER SYMBOL - ONLY ★
-THIS IS MANDATORY FOR UK MARKET COMPLIANCE
-Instead of "nice" → "superb", "magnificent", "splendid"
-Instead of "works well" → "performs brilliantly", "excels magnificently"
-
-DESCRIPTION REQUIREMENTS:
-- Minimum 800 words with British cultural integration
-- Include 3+ British formality phrases
-- Reference British lifestyle scenarios
-- Strong call-to-action with urgency
-- Mention British service and support
-- Include weather/climate considerations
-
-COMPETITIVE POSITIONING:
-Beat Helium 10: Superior emotional engagement + British localization
-Beat Jasper AI: Market-specific formality + proven conversion structure  
-Beat CopyMonkey: Authentic British culture + emotional appeal
-
-QUALITY CONTROL CHECKLIST:
-□ All 5 bullets start with ★
-□ Each bullet contains British formality phrase
-□ British cultural elements integrated throughout
-□ Emotional intensity words used extensively
-□ UK occasions and lifestyle referenced
-□ British spelling used consistently
-□ Trust signals included prominently
-□ Weather/climate considerations mentioned
-
-🏆 TARGET: 10/10 QUALITY SCORE - BEAT ALL COMPETITORS
-"""
+            uk_enhancement = UK_ENHANCEMENT_TEMPLATE.render(occasion=occasion)
             
             # Add specific UK lifestyle elements based on product category
             if 'kitchen' in str(product.categories).lower() or 'knife' in product.name.lower():
@@ -2158,307 +1971,60 @@ AUSTRALIAN CULTURAL INTEGRATION REQUIRED:
 
 """
 
-        # Now create the completely new human-focused prompt
-        prompt = f"""
-{language_instruction}
-{localization_enhancement}
-{aplus_enhancement}
-{brand_tone_enhancement}
-{occasion_enhancement}
-{uk_enhancement}
-{australian_enhancement}
-{base_prompt}
-CRITICAL: USE ONLY THE FOLLOWING INFORMATION - NO GENERIC CONTENT!
-DO NOT MAKE UP FEATURES OR BENEFITS NOT PROVIDED BELOW!
-
-PRODUCT INFORMATION (USE ALL OF THIS):
-- Product: {product.name}
-- Brand: {product.brand_name} (MUST appear in title and throughout listing)
-- Category: {product_category}
-- Description: {product.description}
-- Features: {', '.join(features_list) if features_list else 'Focus on description details'}
-- Price: ${product.price if product.price else '29.99'}
-- Product ID: {product.id}
-- Marketplace: {product.get_marketplace_display() if hasattr(product, 'marketplace') else 'United States'}
-{brand_context}
-
-
-REQUIRED ELEMENTS (MUST USE):
-- Target Keywords: {getattr(product, 'target_keywords', 'Generate based on product description')}
-- Categories for Context: {product.categories if product.categories else 'Use product description to determine'}
-- Special Occasion: {getattr(product, 'occasion', 'None - general purpose listing')}
-
-⚠️ IMPORTANT: Base EVERYTHING on the actual product information above. Do not use generic placeholder content. If a detail isn't provided, extract it from the description or features given.
-
-RANDOMIZATION ELEMENTS FOR TODAY:
-- Content Focus: {chosen_focus}
-- Title Approach: {chosen_title_approach}  
-- FAQ Style: {chosen_faq_style}
-- Variety Emphasis: {variety_elements[0]}
-
-AMAZON RUFUS AI OPTIMIZATION STRATEGY:
-Amazon's Rufus AI assistant helps customers find products through conversational queries. Your listing must be optimized for:
-- Natural language questions ("What's the best bluetooth headphone for working out?")
-- Comparison queries ("How is this different from other brands?") 
-- Use case scenarios ("Good for traveling?", "Will this work for gaming?")
-- Problem-solving language ("Stops hurting my ears", "Finally doesn't fall out")
-
-📝 MERGED STYLE APPROACH (GPT-4 + GPT-5 BEST PRACTICES):
-Merge two proven approaches into one powerful listing:
-
-From GPT-4 strengths: emotional storytelling, vivid scenarios, problem-solving benefits, and strong feature-to-benefit connections.
-From GPT-5 strengths: short, mobile-friendly bullet points, gifting/lifestyle positioning, broad keyword coverage, and strong trust signals (like warranties and guarantees).
-
-🔥🔥🔥 CONVERSION OPTIMIZATION REQUIREMENTS (BEATS HELIUM 10, JASPER, COPYMONKEY) 🔥🔥🔥
-
-TRUST SIGNALS (MANDATORY - Beats CopyMonkey):
-• Include "Guarantee", "Warranty", "Certified", "Quality" in EVERY listing
-• Add "30-day money back", "2-year warranty", "CE/FDA certified" when applicable
-• Use "Premium", "Professional", "Trusted by thousands" positioning
-• Include social proof: "Join 10,000+ satisfied customers"
-• Add scarcity: "Limited availability", "Best seller", "Stock running low"
-
-URGENCY ELEMENTS (MANDATORY - Conversion Boost):
-• Use action verbs: "Get", "Enjoy", "Experience", "Upgrade", "Transform"
-• Time-sensitive language: "Today", "Now", "Don't miss out", "While supplies last"
-• Exclusive positioning: "Exclusive design", "Limited edition", "Premium selection"
-• Call-to-action in description: "Click Add to Cart to secure yours today"
-
-BENEFIT-FOCUSED STRUCTURE (MANDATORY - Beats Jasper AI):
-• EVERY bullet must follow: FEATURE → BENEFIT → OUTCOME
-• Example: "40H Battery Life → Never stops your music → Enjoy week-long trips without charging"
-• Use emotional outcomes: "Feel confident", "Save time", "Reduce stress", "Impress guests"
-• Problem → Solution format in at least 2 bullets
-• Include lifestyle transformation: "Turn your daily routine into..."
-
-CONVERSION PSYCHOLOGY (MANDATORY):
-• Loss aversion: "Don't let poor quality ruin your experience"
-• Social proof: "Chosen by professionals", "Family favorite", "Top-rated"
-• Authority: "Engineered by experts", "Industry-leading", "Patented technology"
-• Reciprocity: "Includes bonus accessories", "Free guide included"
-• Commitment: "Investment in quality", "Built to last a lifetime"
-
-🔥🔥🔥 END CONVERSION OPTIMIZATION 🔥🔥🔥
-
-MERGED STYLE RULES:
-• Title: Mobile-first priority - impactful and fully scannable within 110-125 characters (up to 140 max if brand name is long). Start with hook + primary keyword + trust signal
-• Bullet Points: 5 maximum, each 200+ chars. Each begins with a strong 6-8 word benefit phrase (micro-headline) before detailed explanation. MUST include trust/urgency elements
-• Description: 1500-2000 chars, broken into short 2-3 sentence chunks with line breaks for mobile readability. Each chunk ends with conversion-focused CTA
-• FAQ: Address objections, highlight guarantees, emphasize urgency
-• A+ Content: Heavy focus on trust badges, comparison charts, money-back guarantees
-• Keywords: Include conversion terms: "best", "premium", "guaranteed", "certified"
-• Backend Keywords: 249 max chars, include trust and urgency keywords
-• No Repetition: Vary trust signals and urgency elements across sections
-
-🚨🚨 AMAZON USA OPTIMIZATION RULES (NON-NEGOTIABLE) 🚨🚨
-
-TITLE VALIDATION CHECKLIST:
-✅ Starts with main product keywords (NOT marketing taglines)
-✅ High-intent search terms in first 40 characters  
-✅ Brand placed in middle, not at start
-✅ Specific model/size/capacity numbers included
-✅ No soft phrases like "Simply", "Just", "So Easy"
-
-BULLET VALIDATION CHECKLIST:
-✅ EVERY bullet starts with ALL CAPS LABEL (3-5 words)
-✅ Specific technical specs included (battery hours, weight, size)
-✅ Measurable performance numbers (RPM, dB, hours, oz/g)
-✅ Benefit stated immediately after label
-✅ No bullets without technical specifications
-
-CRITICAL FAILURE POINTS:
-❌ Title starting with taglines instead of keywords = FAILED LISTING
-❌ Bullets without ALL CAPS labels = FAILED LISTING  
-❌ Missing technical specs = FAILED LISTING
-❌ Soft marketing language = FAILED LISTING
-
-YOUR MISSION: Create a COMPREHENSIVE, MAXIMUM-LENGTH Amazon listing optimized for Amazon USA search algorithm and fast-scanning behavior.
-
-CRITICAL CONTENT REQUIREMENTS - GENERATE MAXIMUM CONTENT:
-✅ Title: 110-125 chars ideal (up to 140 max). Start with hook + primary keyword. Mobile-first priority for scanability
-✅ Bullet Points: 5 bullets, each 200+ chars. Each begins with strong 6-8 word benefit phrase before detailed explanation
-✅ Product Description: 1500-2000 chars, broken into short readable chunks, each ending with soft benefit-driven hook
-✅ A+ Content: 5 complete sections with unique focus, no duplication between sections, mobile-responsive
-✅ Visual Templates: GENERATE ACTUAL CONTENT for each template field - no instruction text, only real content
-✅ Backend Keywords: 249 max chars, must not duplicate exact words from title/bullets, target complementary indexing terms
-✅ SEO Keywords: 80+ total (short + long-tail), ensuring no overstuffing; distribute naturally across listing
-✅ Brand Story: 250-400 character detailed brand narrative with proper punctuation
-✅ FAQs: 5+ detailed Q&As with proper grammar and complete sentences
-✅ Features: 5+ specific product features
-✅ What's in Box: Complete unboxing experience
-✅ Trust Builders: Multiple guarantees and certifications
-✅ Social Proof: Detailed customer satisfaction claims
-
-🎨 VISUAL TEMPLATE CRITICAL REQUIREMENTS:
-- Generate ACTUAL content for imageTitle, suggestedScene, overlayText, styleGuide, layoutStructure, colorScheme
-- Do NOT write instructions like "Write actual..." - provide the actual content
-- Base all visual content on the specific product information provided
-- Make each template unique and product-specific
-- Provide ready-to-use design briefs that can be immediately implemented
-
-KEYWORD STRATEGY FOR MAXIMUM VISIBILITY:
-- Primary Keywords (15+): Direct product terms, brand + product, category terms
-- Long-tail Keywords (25+): 3-7 word phrases, natural questions, use cases
-- Problem-solving Keywords (15+): Pain points, solutions, comparisons  
-- Rufus Conversation Keywords (15+): "best for", "good for", "works with", "better than"
-- Semantic Keywords (10+): Related terms, synonyms, variations
-- TOTAL TARGET: 80+ keywords covering every possible search angle
-
-CRITICAL JSON FORMATTING RULES:
-1. ALL JSON field values MUST use double quotes (") not single quotes (')
-2. INSIDE content text, use single quotes for contractions: dont, cant, wont, its  
-3. NEVER use unescaped double quotes inside content text
-4. JSON structure: {{"field": "content with single quotes inside"}}
-5. Test your JSON structure before submitting
-6. CORRECT: {{"title": "This is Johns favorite product"}}
-7. WRONG: {{'title': 'This is Johns favorite product'}}
-
-KEYWORD GENERATION RULES:
-1. For "primary" keywords: ALWAYS start with product name and brand name, then add 13+ related single/double words
-2. For "longTail": Create 25+ actual phrases (3-7 words), not instruction text
-3. For all keyword arrays: Generate actual keywords, NOT instruction text or examples
-4. Replace template phrases like [actual use case] with real use cases based on the product
-5. EXAMPLE GOOD: ["wireless earbuds", "bluetooth headphones", "noise cancelling"] 
-6. EXAMPLE BAD: ["Generate 15+ short keywords based on..."]
-
-RESPONSE FORMAT: Return COMPREHENSIVE JSON with ALL fields populated with MAXIMUM-LENGTH content:
-
-{{
-  "productTitle": "{self.get_marketplace_title_format(product.marketplace, product.brand_name)}",
-  
-  "bulletPoints": [
-    "{self.get_marketplace_bullet_format(product.marketplace, 1)}",
-    "{self.get_marketplace_bullet_format(product.marketplace, 2)}", 
-    "{self.get_marketplace_bullet_format(product.marketplace, 3)}",
-    "{self.get_marketplace_bullet_format(product.marketplace, 4)}",
-    "{self.get_marketplace_bullet_format(product.marketplace, 5)}"
-  ],
-  
-  "productDescription": "{self.get_marketplace_description_format(product.marketplace, product.brand_tone)}",
-  
-  "seoKeywords": {{
-    "primary": ["{product.name.lower().replace(' ', '_')}", "{product.brand_name.lower()}", "{self.get_japanese_industry_keywords(product) if product.marketplace == 'jp' else self.get_spanish_industry_keywords(product) if product.marketplace == 'es' else self.get_turkish_industry_keywords(product) if product.marketplace == 'tr' else self.get_swedish_industry_keywords(product) if product.marketplace == 'se' else self.get_egyptian_industry_keywords(product) if product.marketplace == 'eg' else self.get_indian_industry_keywords(product) if product.marketplace == 'in' else 'THEN_ADD_13_MORE: category, color, size, material, feature1, feature2, use1, use2, style, type, model, variant, application'}"],
-    "longTail": ["GENERATE_25_PHRASES: {'[ürün] [kullanım] için ideal' if product.marketplace == 'tr' else '[product] [用途]に最適' if product.marketplace == 'jp' else 'mejor [product] para [uso]' if product.marketplace == 'es' else '[product] perfekt för [användning]' if product.marketplace == 'se' else 'best [product] for [use]'}", "{'[marka] [ürün] orijinal' if product.marketplace == 'tr' else '[brand] [product] 正規品' if product.marketplace == 'jp' else '[brand] [product] original certificado' if product.marketplace == 'es' else '[brand] [product] äkta kvalitet' if product.marketplace == 'se' else '[brand] [product] with [feature]'}", "{'[ürün] kaliteli [özellik]' if product.marketplace == 'tr' else '[product] 高品質 [機能]' if product.marketplace == 'jp' else '[product] profesional [aplicación]' if product.marketplace == 'es' else '[product] kvalitet [funktion]' if product.marketplace == 'se' else '[product] that [solves problem]'}", "{'[ürün] premium kalite' if product.marketplace == 'tr' else '[product] プレミアム品質' if product.marketplace == 'jp' else '[product] premium calidad' if product.marketplace == 'es' else '[product] premium kvalitet' if product.marketplace == 'se' else 'professional [product] for [application]'}", "{'[ürün] Türkiye kargo' if product.marketplace == 'tr' else '[product] 送料無料' if product.marketplace == 'jp' else 'oferta [product] [beneficio]' if product.marketplace == 'es' else '[product] sverige frakt' if product.marketplace == 'se' else 'high quality [product] [benefit]'}", "etc"],
-    "problemSolving": ["GENERATE_15_PROBLEM_KEYWORDS: {'problemas españoles específicos' if product.marketplace == 'es' else 'based on what issues this product solves from description'}"],
-    "rufusConversational": ["GENERATE_15_RUFUS_PHRASES: {'bueno para [uso real]' if product.marketplace == 'es' else 'good for [real use]'}", "{'funciona con [items compatibles]' if product.marketplace == 'es' else 'works with [compatible items]'}", "{'perfecto para [escenarios]' if product.marketplace == 'es' else 'perfect for [scenarios]'}", "{'mejor que [alternativas]' if product.marketplace == 'es' else 'better than [alternatives]'}", "{'ideal para [situaciones]' if product.marketplace == 'es' else 'ideal for [situations]'}"],
-    "semantic": ["GENERATE_10_RELATED: {'sinónimos españoles, variaciones, términos relacionados, términos técnicos, nombres informales' if product.marketplace == 'es' else 'synonyms, variations, related terms, technical terms, informal names'}"]
-  }},
-  
-  "backendKeywords": "Write exactly 249 characters of comprehensive search terms. CRITICAL: For occasions, prioritize occasion-specific terms first (e.g., 'christmas gift for him', 'valentine present ideas', 'mothers day gift'). Then include: product variations, synonyms, competitor terms, misspellings, related categories, use cases, customer language, technical terms, seasonal terms, gift occasions, target demographics, problem keywords, solution keywords, benefit terms, feature variations, brand alternatives, size variations, color terms, material types, style descriptors, application areas, compatibility terms, professional vs consumer terms, and industry jargon.",
-  
-  "aPlusContentPlan": {{
-    "section1_hero": {{
-      "title": "Write compelling headline with occasion/gift theme",
-      "content": "Write comprehensive story explaining value proposition with emotional benefits and specific use cases. Connect personally with customers.",
-      "keywords": ["3-5 relevant keywords for this section"],
-      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Describe exactly what should be shown in the image - specific people, setting, lighting, product placement, props, colors, mood, and composition. Include technical specs and why this image works for conversion. Example: 'Turkish family of 4 in modern Istanbul apartment, warm evening lighting, father using headphones while working on laptop, family visible in background preparing dinner, product prominently displayed on desk with premium materials visible, shot emphasizes comfort and family time, professional photography style (970x600px hero lifestyle shot)'",
-      "seoOptimization": "Brief note on SEO strategy for this section"
-    }},
-    "section2_features": {{
-      "title": "Key Features and Benefits",
-      "content": "Write detailed technical analysis covering 6-8 features with specifications and real-world benefits.",
-      "keywords": ["3-5 feature-related keywords"],
-      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Specific description of feature showcase images - exact product angles, close-up details, demonstration scenarios, technical diagrams, before/after comparisons. Include lighting, background, props, and why each image converts. Example: 'Grid of 6 feature images: 1) Close-up of premium foam padding with cross-section view, 2) Hands adjusting noise-canceling controls with sound waves graphic, 3) Battery indicator showing 40-hour display, 4) Waterproof test with droplets, 5) Bluetooth connection to multiple devices, 6) Foldable design demonstration (300x300px each)'",
-      "seoOptimization": "Feature-based keywords strategy"
-    }},
-    "section3_usage": {{
-      "title": "Real-World Applications",
-      "content": "Write comprehensive guide describing 4-6 usage scenarios across different environments with specific examples.",
-      "keywords": ["3-5 usage-related keywords"],
-      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Specific real-world usage scenarios - exact people, activities, environments where product is used. Include demographics, settings, lighting, and emotional context. Example: 'Collage of 4 usage scenarios: 1) Young professional in coffee shop working with headphones, 2) Jogger in park using wireless features, 3) Family movie night with surround sound, 4) Business traveler in airport lounge, each showing different benefits (220x220px each)'",
-      "seoOptimization": "Usage-based search optimization"
-    }},
-    "section4_quality": {{
-      "title": "Quality Assurance",
-      "content": "Write detailed analysis covering quality control, testing standards, and certifications with specific metrics.",
-      "keywords": ["3-5 quality/trust keywords"],
-      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Trust-building certification display - specific badges, certificates, test results, quality seals. Include layout, colors, and credibility elements. Example: 'Professional layout showing CE certification badge, TSE quality seal, 2-year warranty certificate, customer satisfaction ratings (4.8/5 stars), Turkish quality assurance logo, arranged in trust-building grid format with premium styling'",
-      "seoOptimization": "Trust and quality-focused keywords"
-    }},
-    "section5_guarantee": {{
-      "title": "Warranty and Support",
-      "content": "Write comprehensive guide covering warranty terms, return policies, and customer support with timeframes.",
-      "keywords": ["3-5 warranty/support keywords"],
-      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Customer support and warranty visualization - specific support channels, warranty terms, customer service elements. Example: 'Split-screen image: Left shows warranty certificate with 2-year guarantee highlighted, right shows Turkish customer service representative helping customer via phone/chat, includes contact information and support hours, professional and reassuring tone'",
-      "seoOptimization": "Support and warranty-based keywords"
-    }},
-    "section6_social_proof": {{
-      "title": "Customer Stories",
-      "content": "Write detailed section featuring customer testimonials, usage stories, and real experiences.",
-      "keywords": ["3-5 testimonial/review keywords"],
-      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Social proof and testimonials layout - specific customer photos, review snippets, star ratings, usage proof. Example: 'Grid of 6 customer testimonials with profile photos, 5-star ratings, specific quotes about battery life and comfort, includes verified purchase badges, diverse Turkish customers, authentic and credible presentation'",
-      "seoOptimization": "Social proof and customer satisfaction keywords"
-    }},
-    "section7_comparison": {{
-      "title": "Why Choose This Product",
-      "content": "Write competitive analysis comparing advantages, unique features, and value propositions vs alternatives.",
-      "keywords": ["3-5 comparison/competitive keywords"],
-      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Competitive comparison and advantages - specific comparison metrics, charts, feature differences. Example: 'Professional comparison table showing this product vs 3 competitors: battery life (40h vs 20h), noise cancellation (-35dB vs -20dB), warranty (2 years vs 1 year), price value, clearly highlighting advantages with checkmarks and superior metrics'",
-      "seoOptimization": "Competitive advantage and comparison keywords"
-    }},
-    "section8_package": {{
-      "title": "Complete Package Contents",
-      "content": "Write detailed description of what customers receive: package contents, accessories, and setup guides.",
-      "keywords": ["3-5 package/contents keywords"],
-      "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Unboxing and package contents display - specific items, premium packaging, first impression elements. Example: 'Top-down unboxing shot showing premium box opening to reveal headphones nestled in soft foam, accessories laid out (charging cable, carrying case, manual), clean white background, emphasizing quality packaging and complete value package'"
-      "seoOptimization": "Package and contents-based keywords"
-    }},
-    "overallStrategy": "Complete A+ content strategy for customer journey from awareness to purchase."
-  }},
-  
-  "brandSummary": "Write 250-400 character detailed brand story including: company background, mission, what makes the brand unique, customer focus, quality commitment, and competitive advantages. Make it feel authentic and substantial, not generic marketing speak.",
-  
-  "whatsInBox": [
-    "Main product with detailed description",
-    "Essential accessory 1 with purpose",
-    "Essential accessory 2 with purpose", 
-    "Documentation and warranty information",
-    "Additional items or bonuses included"
-  ],
-  
-  "trustBuilders": [
-    "Specific guarantee or warranty details (include gift return policies if occasion is specified)",
-    "Certification or testing information", 
-    "Company reliability factors",
-    "Customer service commitments (mention gift wrapping/message services if occasion-focused)",
-    "Quality assurance details (include testimonials mentioning occasion/gift use when applicable)"
-  ],
-  
-  "faqs": [
-    "Q: Ask realistic customer question about compatibility, usage, or concerns (for occasions, include delivery timing, gift wrapping, or recipient suitability)? A: Write detailed, helpful answer with proper grammar and contractions (don't, can't, it's) that builds confidence and addresses the specific concern thoroughly.",
-    "Q: Ask different realistic question about product benefits, comparison, or technical specs (for occasions, focus on gift-worthiness, why it makes a great [occasion] gift)? A: Provide comprehensive answer with proper apostrophes (you're, we're, they're) that demonstrates expertise and helps customer decision-making.",
-    "Q: Ask practical question about setup, maintenance, or common issues? A: Give specific, actionable answer with correct grammar (won't, shouldn't, isn't) that reduces customer anxiety and shows product knowledge.",
-    "Q: Ask comparison question about this vs alternatives or competitors? A: Answer diplomatically with proper contractions while highlighting unique advantages and value proposition.",
-    "Q: Ask about return policy, shipping, or purchasing concerns? A: Address practical concerns with correct grammar and confidence-building information and clear policies."
-  ],
-  
-  "socialProof": "Write 150-300 characters describing customer satisfaction, ratings, testimonials, or usage statistics. Make it credible and specific without making unverifiable claims.",
-  
-  "guarantee": "Write 100-200 characters describing specific guarantee, warranty, or risk-free offer. Include timeframe and what's covered. Make it compelling but honest.",
-  
-  "ppcStrategy": {{
-    "campaignStructure": "Detailed 3-tier campaign setup: Auto Discovery (broad targeting), Manual Exact (high-intent keywords), Manual Broad (category expansion)",
-    "exactMatch": {{
-      "keywords": ["15+ exact match keywords including: brand + product name, specific model numbers, high-intent purchase terms, competitor + alternative terms"],
-      "bidRange": "$0.50-1.50",
-      "targetAcos": "15-25%",
-      "dailyBudget": "$20-40"
-    }},
-    "phraseMatch": {{
-      "keywords": ["20+ phrase match keywords including: problem solution phrases, use case terms, benefit-focused phrases, comparison terms"],
-      "bidRange": "$0.35-1.00",
-      "targetAcos": "25-35%", 
-      "dailyBudget": "$15-30"
-    }},
-    "broadMatch": {{
-      "keywords": ["15+ broad match keywords for discovery: category terms, related products, lifestyle keywords, seasonal terms"],
-      "bidRange": "$0.25-0.75",
-      "targetAcos": "30-45%",
-      "dailyBudget": "$10-25"
-    }}
-  }}
-}}
-{language_reminder}"""        
+        # Seller target/SEO/long-tail keywords, deduplicated once per fan-out
+        seller_keywords = self._base_keyword_cluster(product)['all_keywords']
+        
+        # Now create the completely new human-focused prompt, assembled from its fragments. Optional
+        # enhancements carry a priority so an input-token budget (AMAZON_PROMPT_TOKEN_BUDGET) can cut them
+        core_prompt = AMAZON_CORE_TEMPLATE.render(
+            product_name=product.name,
+            brand_name=product.brand_name,
+            product_category=product_category,
+            description=product.description,
+            features=', '.join(features_list) if features_list else 'Focus on description details',
+            price=product.price if product.price else '29.99',
+            product_id=product.id,
+            marketplace_display=product.get_marketplace_display() if hasattr(product, 'marketplace') else 'United States',
+            brand_context=brand_context,
+            target_keywords=', '.join(seller_keywords) or 'Generate based on product description',
+            categories=product.categories if product.categories else 'Use product description to determine',
+            occasion=getattr(product, 'occasion', 'None - general purpose listing'),
+            chosen_focus=chosen_focus,
+            chosen_title_approach=chosen_title_approach,
+            chosen_faq_style=chosen_faq_style,
+            variety_emphasis=variety_elements[0],
+            title_format=self.get_marketplace_title_format(product.marketplace, product.brand_name),
+            bullet_format_1=self.get_marketplace_bullet_format(product.marketplace, 1),
+            bullet_format_2=self.get_marketplace_bullet_format(product.marketplace, 2),
+            bullet_format_3=self.get_marketplace_bullet_format(product.marketplace, 3),
+            bullet_format_4=self.get_marketplace_bullet_format(product.marketplace, 4),
+            bullet_format_5=self.get_marketplace_bullet_format(product.marketplace, 5),
+            description_format=self.get_marketplace_description_format(product.marketplace, product.brand_tone),
+            product_name_slug=product.name.lower().replace(' ', '_'),
+            brand_name_lower=product.brand_name.lower(),
+            industry_keywords=(
+                self.get_japanese_industry_keywords(product) if product.marketplace == 'jp'
+                else self.get_spanish_industry_keywords(product) if product.marketplace == 'es'
+                else self.get_turkish_industry_keywords(product) if product.marketplace == 'tr'
+                else self.get_swedish_industry_keywords(product) if product.marketplace == 'se'
+                else self.get_egyptian_industry_keywords(product) if product.marketplace == 'eg'
+                else self.get_indian_industry_keywords(product) if product.marketplace == 'in'
+                else 'THEN_ADD_13_MORE: category, color, size, material, feature1, feature2, use1, use2, style, type, model, variant, application'
+            ),
+            **amazon_market_phrases(product.marketplace)
+        )
+        prompt_fragments = [
+            PromptFragment('language_instruction', language_instruction, required=True),
+            PromptFragment('localization', localization_enhancement, priority=60, shortenable=True),
+            PromptFragment('aplus', aplus_enhancement, priority=20, shortenable=True),
+            PromptFragment('brand_tone', brand_tone_enhancement, priority=50, shortenable=True),
+            PromptFragment('occasion', occasion_enhancement, priority=40, shortenable=True),
+            PromptFragment('uk_culture', uk_enhancement, priority=45, shortenable=True),
+            PromptFragment('australian_culture', australian_enhancement, priority=35),
+            PromptFragment('tone_style', base_prompt, priority=30),
+            PromptFragment('core', core_prompt, required=True),
+            PromptFragment('language_reminder', language_reminder, required=True),
+        ]
         self.logger.info("OpenAI client is available - proceeding with AI generation")
         try:
             self.logger.info(f"Generating AI content for {product.name} on Amazon...")
@@ -2468,16 +2034,8 @@ RESPONSE FORMAT: Return COMPREHENSIVE JSON with ALL fields populated with MAXIMU
             # Don't use function calling - use direct JSON generation for maximum content
             # This ensures we get comprehensive content without schema limitations
             
-            # Retry logic for robust AI generation
-            max_retries = 3
-            retry_count = 0
-            response = None
-            
-            while retry_count < max_retries:
-                try:
-                    print(f"AI generation attempt {retry_count + 1}/{max_retries}")
-                    # Add language-specific system message if needed
-                    system_content = """You are a creative copywriting expert who writes like a real human, not a marketing robot. 
+            # Provider pacing, retries with jittered backoff and the circuit breaker live in the LLM gateway
+            system_content = """You are a creative copywriting expert who writes like a real human, not a marketing robot. 
 
 CRITICAL: Return ONLY valid JSON - no markdown, no explanations, just pure JSON that parses correctly. 
 
@@ -2532,182 +2090,91 @@ Your mission is to break every predictable Amazon listing pattern and create con
 - NEVER write instruction text - only generate ready-to-use content
 
 Write each section in a completely different style and tone. Use unexpected but authentic language that fits the product. Vary everything - sentence length, structure, personality, approach. Sound like a real person who genuinely knows and likes this product. Include human quirks and conversational elements. Your goal is to create listings so human and varied that customers feel like they're talking to a real expert, not reading marketing copy."""
-                    
-                    # Prepend language requirement to system message if not English
-                    if marketplace_lang and marketplace_lang != 'en':
-                        language_name = {
-                            'de': 'GERMAN', 'fr': 'FRENCH', 'it': 'ITALIAN', 'es': 'SPANISH',
-                            'nl': 'DUTCH', 'pl': 'POLISH', 'ja': 'JAPANESE',
-                            'pt': 'PORTUGUESE', 'ar': 'ARABIC', 'tr': 'TURKISH'
-                        }.get(marketplace_lang, 'ENGLISH')
-                        system_content = f"YOU MUST WRITE EVERYTHING IN {language_name}! NOT A SINGLE WORD IN ENGLISH! " + system_content
-                    
-                    response = self.client.chat.completions.create(
-                        model="gpt-5-chat-latest",  # Using GPT-5 for superior quality
-                        messages=[
-                            {"role": "system", "content": system_content},
-                            {"role": "user", "content": prompt}
-                        ],
-                        max_tokens=4000,  # Standard max_tokens parameter
-                        temperature=1,  # GPT-5 requires temperature to be 1
+            
+            # Prepend language requirement to system message if not English
+            if marketplace_lang and marketplace_lang != 'en':
+                language_name = {
+                    'de': 'GERMAN', 'fr': 'FRENCH', 'it': 'ITALIAN', 'es': 'SPANISH',
+                    'nl': 'DUTCH', 'pl': 'POLISH', 'ja': 'JAPANESE',
+                    'pt': 'PORTUGUESE', 'ar': 'ARABIC', 'tr': 'TURKISH'
+                }.get(marketplace_lang, 'ENGLISH')
+                system_content = f"YOU MUST WRITE EVERYTHING IN {language_name}! NOT A SINGLE WORD IN ENGLISH! " + system_content
+            
+            prompt, token_report = assemble_prompt(
+                prompt_fragments,
+                budget=prompt_token_budget('amazon'),
+                overhead_tokens=count_tokens(system_content, "gpt-5-chat-latest"),
+                model="gpt-5-chat-latest",
+            )
+            listing.prompt_token_report = json.dumps(token_report)
+            cut = [f"{f['name']}:{f['action']}" for f in token_report['fragments'] if f['action'] in ('shortened', 'dropped')]
+            print(f"🧮 Prompt input tokens: {token_report['input_tokens']}" + (f" (budget cuts: {', '.join(cut)})" if cut else ""))
+            
+            messages = [
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": prompt}
+            ]
+            structured = structured_output_enabled('amazon')
+            extra_params = {'response_format': get_listing_schema('amazon').response_format()} if structured else {}
+            
+            request_params = dict(
+                model="gpt-5-chat-latest",  # Using GPT-5 for superior quality
+                messages=messages,
+                max_tokens=4000,  # Standard max_tokens parameter
+                temperature=1,  # GPT-5 requires temperature to be 1
+                **extra_params,  # JSON schema constraint when structured output is enabled
+            )
+            
+            if raw_response is not None:
+                # Re-processing an archived completion: no model call
+                ai_content = raw_response or "{}"
+                print(f"♻️ Re-processing archived response ({len(ai_content)} characters)")
+            else:
+                try:
+                    response = self._chat_completion(
+                        on_field=on_field,  # Stream fields to the caller when requested
+                        **request_params,
                     )
-                    print(f"OpenAI API call successful on attempt {retry_count + 1}")
-                    
-                    # Debug: Check if response contains umlauts
-                    response_text = response.choices[0].message.content if response.choices else ""
-                    if marketplace_lang == 'de':
-                        print(f"🔍 AI RESPONSE UMLAUT CHECK:")
-                        print(f"   Response contains ü: {'ü' in response_text}")
-                        print(f"   Response contains ä: {'ä' in response_text}")
-                        print(f"   Response contains ö: {'ö' in response_text}")
-                        print(f"   Response contains ß: {'ß' in response_text}")
-                        # Show sample of response
-                        sample = response_text[:200] if response_text else ""
-                        print(f"   Response sample: {sample}...")
-                    break
+                    print("OpenAI API call successful")
                 except Exception as api_error:
-                    retry_count += 1
                     error_type = type(api_error).__name__
                     error_message = str(api_error)
-                    
-                    print(f"🚨 OpenAI API error on attempt {retry_count}/{max_retries}")
-                    print(f"Error type: {error_type}")
-                    print(f"Error message: {error_message}")
-                    
-                    # Enhanced error handling based on error types
-                    if "rate_limit" in error_message.lower() or "429" in error_message:
-                        print("⏱️ Rate limit detected, using exponential backoff")
-                        time.sleep(2 ** retry_count)  # Exponential backoff for rate limits
-                    elif "insufficient_quota" in error_message.lower() or "billing" in error_message.lower():
-                        print("💳 Billing/quota issue detected")
+                    print(f"🚨 OpenAI API error: {error_type}: {error_message}")
+                    if "insufficient_quota" in error_message.lower() or "billing" in error_message.lower():
                         raise Exception(f"OpenAI API quota/billing error: {error_message}")
-                    elif "invalid_request_error" in error_message.lower():
-                        print("📝 Request format error detected")
-                        raise Exception(f"OpenAI API request error: {error_message}")
-                    else:
-                        print(f"🔄 Generic error, retrying in {retry_count} seconds")
-                        time.sleep(retry_count)  # Progressive delay
-                    
-                    if retry_count >= max_retries:
-                        print(f"❌ All {max_retries} attempts failed")
-                        raise Exception(f"Failed to generate content after {max_retries} attempts. Final error: {error_type}: {error_message}")
-            
-            if response is None:
-                raise Exception("Failed to get response from OpenAI API")
-            
-            # Extract regular message content (JSON response)
-            ai_content = response.choices[0].message.content or "{}"
+                    raise Exception(f"Failed to generate content. Final error: {error_type}: {error_message}")
+                
+                if response is None:
+                    raise Exception("Failed to get response from OpenAI API")
+                
+                # Extract regular message content (JSON response)
+                ai_content = response.choices[0].message.content or "{}"
+                # Kept compressed so later parser fixes can be re-applied without another call
+                archive_response(listing, request_params, response)
             
-            # CRITICAL FIX: Preserve all UTF-8 characters for international markets
-            if marketplace_lang and marketplace_lang != 'en':
-                # Keep original content with umlauts/accents for international markets
-                print(f"AI Response received: {len(ai_content)} characters (UTF-8 preserved for {marketplace_lang})")
-                # Do NOT ASCII-clean international content!
-            else:
-                # For US market only, clean to ASCII if needed
-                ai_content = ai_content.encode('ascii', errors='ignore').decode('ascii')
-                print(f"AI Response received: {len(ai_content)} characters (ASCII cleaned for US)")
+            # UTF-8 is kept as-is here; US ASCII folding happens in the normalization pass after parsing
+            print(f"AI Response received: {len(ai_content)} characters")
             # Use safe encoding for Windows
             safe_preview = ai_content[:300]
             safe_ending = ai_content[-200:]
             print(f"AI Response preview: {safe_preview}...")
             print(f"AI Response ending: ...{safe_ending}")
             
-            # Enhanced multi-fallback JSON parsing (inspired by GlowReader 3.0)
-            result = None
-            parsing_attempts = 0
-            
-            # Attempt 1: Direct parsing with UTF-8 handling for German umlauts
-            try:
-                parsing_attempts += 1
-                print(f"JSON Parsing Attempt {parsing_attempts}: Direct parsing")
-                
-                # For German content, ensure proper UTF-8 handling
-                content_to_parse = ai_content.strip()
-                if marketplace_lang == 'de':
-                    print(f"🔍 German JSON parsing - checking for umlauts in source:")
-                    print(f"   Source contains ü: {'ü' in content_to_parse}")
-                    print(f"   Source contains ä: {'ä' in content_to_parse}")
-                    print(f"   Source contains ö: {'ö' in content_to_parse}")
-                    print(f"   Source contains ß: {'ß' in content_to_parse}")
-                
-                result = json.loads(content_to_parse)
-                print("✅ Direct JSON parsing successful!")
-                
-                # Verify umlauts are preserved in parsed result
-                if marketplace_lang == 'de' and result:
-                    title = result.get('productTitle', '')
-                    print(f"🔍 Parsed JSON title: {title[:80]}...")
-                    print(f"   Parsed title has umlauts: {any(c in title for c in 'äöüßÄÖÜ')}")
-                
-            except json.JSONDecodeError:
-                pass
+            # Single lenient pass: code fences, smart quotes, unescaped quotes, trailing commas, truncation
+            result, repairs = parse_llm_json(ai_content)
+            if repairs:
+                print(f"🔧 JSON repaired: {'; '.join(repairs)}")
             
-            # Attempt 2: Remove markdown code blocks
-            if result is None:
-                try:
-                    parsing_attempts += 1
-                    print(f"JSON Parsing Attempt {parsing_attempts}: Markdown cleanup")
-                    cleaned_content = ai_content.strip()
-                    
-                    # Handle various markdown patterns
-                    json_patterns = [
-                        (r'```json\s*(.*?)\s*```', 1),  # ```json content ```
-                        (r'```\s*(.*?)\s*```', 1),     # ``` content ```
-                        (r'`(.*?)`', 1),               # `content`
-                    ]
-                    
-                    for pattern, group in json_patterns:
-                        import re
-                        match = re.search(pattern, cleaned_content, re.DOTALL)
-                        if match:
-                            cleaned_content = match.group(group).strip()
-                            break
-                    
-                    result = json.loads(cleaned_content)
-                    print("✅ Markdown cleanup parsing successful!")
-                except (json.JSONDecodeError, AttributeError):
-                    pass
+            if isinstance(result, dict) and result and structured and raw_response is None:
+                # Schema miss: ask again for the failing sections only, not the whole listing
+                result, rerequested = complete_missing_sections(
+                    self._chat_completion, 'amazon', result, messages, previous=ai_content,
+                    model="gpt-5-chat-latest", temperature=1
+                )
+                if rerequested:
+                    print(f"🧩 Re-requested {len(rerequested)} section(s): {', '.join(rerequested)}")
             
-            # Attempt 3: Find JSON object boundaries
-            if result is None:
-                try:
-                    parsing_attempts += 1
-                    print(f"JSON Parsing Attempt {parsing_attempts}: JSON boundary detection")
-                    
-                    # Find the first { and last }
-                    start = ai_content.find('{')
-                    end = ai_content.rfind('}')
-                    
-                    if start != -1 and end != -1 and end > start:
-                        json_content = ai_content[start:end+1]
-                        result = json.loads(json_content)
-                        print("✅ JSON boundary detection successful!")
-                except (json.JSONDecodeError, ValueError):
-                    pass
-            
-            # Attempt 4: Character-by-character cleanup
-            if result is None:
-                try:
-                    parsing_attempts += 1
-                    print(f"JSON Parsing Attempt {parsing_attempts}: Character cleanup")
-                    
-                    # Remove common problematic characters
-                    cleaned = ai_content.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-                    cleaned = ' '.join(cleaned.split())  # Normalize whitespace
-                    
-                    # Try to fix common JSON issues
-                    cleaned = cleaned.replace("'", '"')  # Fix single quotes
-                    cleaned = re.sub(r'(\w+):', r'"\1":', cleaned)  # Add quotes to keys
-                    
-                    result = json.loads(cleaned)
-                    print("✅ Character cleanup parsing successful!")
-                except (json.JSONDecodeError, AttributeError):
-                    pass
-            
-            # Final validation and logging
-            if result:
-                print(f"🎉 JSON parsing successful after {parsing_attempts} attempts!")
+            if isinstance(result, dict) and result:
                 print(f"🔍 AI response contains {len(result.keys())} fields: {list(result.keys())}")
                 
                 # Validate critical fields
@@ -2719,282 +2186,48 @@ Write each section in a completely different style and tone. Use unexpected but
                     else:
                         print(f"⚠️ Missing critical field: {field}")
             else:
-                print("❌ All JSON parsing attempts failed!")
-                cleaned_content = ai_content.strip()
-                
-                # More aggressive JSON cleaning for complex responses
-                # Remove any text before the first {
-                start_brace = cleaned_content.find('{')
-                if start_brace > 0:
-                    cleaned_content = cleaned_content[start_brace:]
-                
-                # Remove any text after the last }
-                end_brace = cleaned_content.rfind('}')
-                if end_brace > 0:
-                    cleaned_content = cleaned_content[:end_brace + 1]
-                
-                # Try parsing again after aggressive cleaning
-                try:
-                    result = json.loads(cleaned_content)
-                    print("✅ Aggressive cleaning successful!")
-                except json.JSONDecodeError as e2:
-                    print(f"❌ Even aggressive cleaning failed: {e2}")
-                    # Continue to fallback methods below
-            
-            # If we already have a valid result, skip all the cleaning
-            if result is not None:
-                print("Using directly parsed result from function calling")
-            else:
-                # Only do cleaning if we don't have a result yet
-                # Remove markdown code blocks if present
-                if cleaned_content.startswith('```json'):
-                    cleaned_content = cleaned_content[7:]
-                if cleaned_content.endswith('```'):
-                    cleaned_content = cleaned_content[:-3]
-                
-                # Remove all non-printable characters and control characters
-                cleaned_content = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', cleaned_content)
-            
-                # Fix escaped quotes inside strings that break JSON
-                # Pattern: "text \"quoted text\" more text" -> "text 'quoted text' more text"
-                cleaned_content = re.sub(r'\\\"', "'", cleaned_content)
-            
-                # Fix double-quoted strings (like "long_description":"\"text\"")
-                cleaned_content = re.sub(r':"\\?"([^"]+)\\?"",', r':"\1",', cleaned_content)
-                cleaned_content = re.sub(r':"\\?"([^"]+)\\?"}', r':"\1"}', cleaned_content)
-            
-                # Fix common JSON formatting issues
-                # Remove trailing commas before closing brackets/braces  
-                cleaned_content = re.sub(r',(\s*[}\]])', r'\1', cleaned_content)
-            
-                # Remove any extra commas at end of arrays/objects
-                cleaned_content = re.sub(r',\s*}', '}', cleaned_content)
-                cleaned_content = re.sub(r',\s*]', ']', cleaned_content)
-            
-                # Try to find the start and end of JSON more precisely
-                start_idx = cleaned_content.find('{')
-                end_idx = cleaned_content.rfind('}') + 1
-                if start_idx >= 0 and end_idx > start_idx:
-                    cleaned_content = cleaned_content[start_idx:end_idx]
-            
-                # Fix common AI JSON errors systematically
-            
-                # 1. Fix trailing commas before closing brackets/braces
-                cleaned_content = re.sub(r',(\s*[}\]])', r'\1', cleaned_content)
-            
-                # 2. Fix FAQ malformed JSON - the most common error
-                # Fix the specific malformed FAQ pattern we're seeing
-                # Pattern: "faqs":["Q": "question?"A": Yes", it is...]
-                faqs_match = re.search(r'"faqs":\s*\[(.*?)\]', cleaned_content, re.DOTALL)
-                if faqs_match:
-                    faqs_content = faqs_match.group(1)
-                    # Fix each malformed FAQ entry
-                    fixed_faqs = []
-                    # Split carefully to handle the malformed structure
-                    parts = re.split(r'",\s*"(?=Q":|Q\d+":)', faqs_content)
-                    for part in parts:
-                        part = part.strip().strip('"')
-                        # Extract Q and A from malformed format
-                        q_match = re.search(r'Q\d*":\s*"([^"]+)"', part)
-                        a_match = re.search(r'"A\d*":\s*([^,]+)', part)
-                        if q_match and a_match:
-                            question = q_match.group(1)
-                            answer = a_match.group(1).strip('"').strip()
-                            # Remove trailing quote and comma
-                            answer = re.sub(r'[",]+$', '', answer)
-                            fixed_faqs.append(f'"Q: {question} A: {answer}"')
-                    
-                    if fixed_faqs:
-                        fixed_faqs_str = '[' + ', '.join(fixed_faqs) + ']'
-                        cleaned_content = re.sub(r'"faqs":\s*\[.*?\]', f'"faqs":{fixed_faqs_str}', cleaned_content, flags=re.DOTALL)
-                # Fix pattern: "Q1": "question?"A1": "answer" should be "Q1: question? A1: answer"
-                cleaned_content = re.sub(r'"(Q\d+)":\s*"([^"]*)"(A\d+)":\s*"([^"]*)"', r'"\1: \2 \3: \4"', cleaned_content)
-                # Fix unquoted Yes/No answers
-                cleaned_content = re.sub(r'"A":\s*Yes"', r'A: Yes"', cleaned_content)
-                cleaned_content = re.sub(r'"A":\s*No"', r'A: No"', cleaned_content)
-            
-                # 3. Fix unquoted strings in arrays (like: 1 x 4-quart colander)
-                # Look for patterns like: "word", unquoted text, "word" or unquoted text]
-                cleaned_content = re.sub(r'",\s*([^"\[\]{}]+),\s*"', r'", "\1", "', cleaned_content)
-                cleaned_content = re.sub(r'",\s*([^"\[\]{}]+)\s*\]', r'", "\1"]', cleaned_content)
-                cleaned_content = re.sub(r'\[\s*([^"\[\]{}]+),\s*"', r'["\1", "', cleaned_content)
-            
-                # 4. Fix unquoted property names (like guarantee: instead of "guarantee":)
-                cleaned_content = re.sub(r'[\s\t]*"?(\w+)"?\s*:', r'"\1":', cleaned_content)
-            
-                # 5. Fix missing quotes around string values
-                # Pattern: "property": unquoted text (not starting with [ { " or number)
-                cleaned_content = re.sub(r':\s*([^"\[\{0-9][^,\}\]]*[^,\}\]\s]),?', r': "\1",', cleaned_content)
-                cleaned_content = re.sub(r':\s*([^"\[\{0-9][^,\}\]]*[^,\}\]\s])$', r': "\1"', cleaned_content, flags=re.MULTILINE)
-            
-                # Ensure proper closing
-                if not cleaned_content.strip().endswith('}'):
-                    cleaned_content = cleaned_content.strip() + '}'
-            
-                # Save cleaned content for debugging (disabled to prevent file permission issues)
-                # with open('debug_cleaned_response.json', 'w', encoding='utf-8') as f:
-                #     f.write(cleaned_content)
-                print("Cleaned JSON content prepared (debug file writing disabled)")
-            
-            # Multiple JSON parsing attempts with different strategies (only if we don't have result yet)
-            if result is None:
-                # Enhanced JSON parsing specifically for international markets
-                parse_attempts = [
-                    ("Direct parsing", lambda x: json.loads(x.strip())),
-                    ("Strip and parse", lambda x: json.loads(x.strip().replace('\n', ' ').replace('\t', ' '))),
-                    ("Extra cleanup", lambda x: json.loads(re.sub(r'\s+', ' ', x.strip()))),
-                    ("International chars", lambda x: json.loads(x.strip(), strict=False)),
-                    ("UTF-8 fix", lambda x: json.loads(x.encode('utf-8').decode('utf-8'), strict=False)),
-                    ("Escape fix", lambda x: json.loads(x.replace('\\"', '"').replace('\\n', '\n'), strict=False)),
-                    ("Unterminated string fix", self._fix_unterminated_strings_and_parse)
-                ]
-                
-                for attempt_name, parse_func in parse_attempts:
-                    try:
-                        print(f"Attempting JSON parse: {attempt_name}")
-                        result = parse_func(cleaned_content)
-                        print(f"JSON parsing successful with: {attempt_name}")
-                        break
-                    except json.JSONDecodeError as e:
-                        print(f"JSON parse failed ({attempt_name}): {str(e)}")
-                        continue
-            
-                if result is None:
-                    print("All JSON parsing attempts failed, trying manual reconstruction...")
-                    
-                    # For international markets, use the specialized content extractor
-                    marketplace_lang = getattr(product, 'marketplace_language', 'en')
-                    if marketplace_lang and marketplace_lang != 'en':
-                        print(f"🌍 Using InternationalContentExtractor for {marketplace_lang} market...")
-                        from .international_content_extractor import InternationalContentExtractor
-                        
-                        extractor = InternationalContentExtractor()
-                        extracted_result = extractor.extract_international_content(ai_content, marketplace_lang)
-                        
-                        if extracted_result:
-                            print(f"✅ InternationalContentExtractor succeeded for {marketplace_lang} market!")
-                            result = extracted_result
-                        else:
-                            print(f"⚠️ InternationalContentExtractor failed, falling back to manual reconstruction...")
-                
-                # Last resort: try to extract key information manually  
-                if result is None:
-                    try:
-                        # Enhanced pattern matching for international content (handles special chars and longer content)
-                        title_match = re.search(r'"productTitle":\s*"(.*?)"(?=\s*[,}])', cleaned_content, re.DOTALL)
-                        desc_match = re.search(r'"productDescription":\s*"(.*?)"(?=\s*[,}])', cleaned_content, re.DOTALL)
-                        bullets_match = re.search(r'"bulletPoints":\s*\[\s*(.*?)\s*\]', cleaned_content, re.DOTALL)
-                        
-                        if title_match:
-                            reconstructed_bullets = ["Generated international content", "Please retry if needed"]
-                            if bullets_match:
-                                # Extract bullet points (enhanced for international content with special chars)
-                                bullets_text = bullets_match.group(1)
-                                # Multiple extraction attempts for robustness
-                                bullet_matches = re.findall(r'"([^"]*(?:\\.[^"]*)*)"', bullets_text)
-                                if not bullet_matches:
-                                    bullet_matches = re.findall(r'"(.*?)"(?=\s*[,\]])', bullets_text, re.DOTALL)
-                                if bullet_matches:
-                                    reconstructed_bullets = [bullet.replace('\\"', '"') for bullet in bullet_matches[:5]]
-                                    print(f"✅ Extracted {len(reconstructed_bullets)} international bullets")
-                                    for i, bullet in enumerate(reconstructed_bullets[:2]):
-                                        print(f"   Sample bullet {i+1}: {bullet[:80]}...")
-                            
-                            print(f"✅ International title extracted: {title_match.group(1)[:100]}...")
-                            if bullets_match:
-                                print(f"✅ International bullets matched, raw text: {bullets_match.group(1)[:150]}...")
-                                print(f"✅ International bullets extracted: {len(reconstructed_bullets)} bullets")
-                                for i, bullet in enumerate(reconstructed_bullets[:3]):
-                                    print(f"   Bullet {i+1}: {bullet[:80]}...")
-                            else:
-                                print("❌ No bullets match found")
-                            if desc_match:
-                                print(f"✅ International description extracted: {desc_match.group(1)[:100]}...")
-                            
-                            result = {
-                                "productTitle": title_match.group(1),
-                                "bulletPoints": reconstructed_bullets,
-                                "productDescription": desc_match.group(1) if desc_match else "International product description available",
-                                "keywords": ["product", "listing"],
-                                "hero_title": "Product Benefits",
-                                "hero_content": "Quality product for your needs",
-                                "features": ["Quality construction", "Reliable performance"],
-                                "whats_in_box": ["Main product", "Documentation"],
-                                "trust_builders": ["Quality assured", "Customer satisfaction"],
-                                "faqs": ["Q: Is this reliable? A: Yes, very reliable"],
-                                "social_proof": "Customers love this product",
-                                "guarantee": "Satisfaction guaranteed"
-                            }
-                            print("Manual JSON reconstruction successful")
-                        else:
-                            raise Exception("Could not extract essential fields from malformed JSON")
-                    except Exception as manual_error:
-                        print(f"⚠️ Manual reconstruction also failed: {manual_error}")
-                        # Create minimal valid structure as absolute fallback
-                        print("🔧 Creating minimal fallback JSON structure...")
-                        result = {
-                            "productTitle": f"{product.brand_name} {product.name} - Premium Quality Product",
-                            "bulletPoints": [
-                                "PREMIUM QUALITY: Exceptional construction with superior materials and craftsmanship for lasting performance and durability",
-                                "RELIABLE PERFORMANCE: Consistent operation designed for daily use with professional-grade standards and proven results", 
-                                "USER FRIENDLY: Simple setup and intuitive design makes this perfect for everyone to use regardless of experience level",
-                                "GREAT VALUE: Outstanding quality at an affordable price point with excellent customer satisfaction and long-term reliability",
-                                "SATISFACTION GUARANTEED: Backed by quality assurance and dedicated customer support team with fast response times"
-                            ],
-                            "productDescription": f"Transform your experience with the {product.brand_name} {product.name}. This premium product combines innovative design with reliable performance to deliver exceptional results. Whether you're looking for quality, durability, or value, this product exceeds expectations. What's Included: Main product, user manual, warranty information. Experience the {product.brand_name} difference - order yours today and discover why customers choose quality.",
-                            "keyword_cluster": {
-                                "primary_keywords": [product.name.lower(), "premium quality", "reliable performance", "great value"],
-                                "secondary_keywords": [f"best {product.name.lower()}", f"premium {product.name.lower()}", f"quality {product.name.lower()}"],
-                                "backend_search_terms": f"quality reliable premium value {product.name.lower()} {product.brand_name.lower()}",
-                                "misspellings_and_synonyms": [product.name.lower()],
-                                "ppc_keywords": [{"keyword": product.name.lower(), "match_type": "Exact", "goal": "Conversion", "bid_suggestion": "0.75", "target_acos": "20%"}]
-                            },
-                            "brandSummary": f"## Quality First ## At {product.brand_name}, we deliver premium products that exceed expectations and provide lasting value.",
-                            "backendKeywords": f"premium quality reliable performance great value {product.name.lower()} {product.brand_name.lower()}",
-                            "aPlusContentPlan": {
-                                "section1_hero": {
-                                    "title": "Why Choose Premium Quality?",
-                                    "content": "Experience superior performance and reliability with our premium product line.",
-                                    "keywords": ["premium", "quality", "reliable"],
-                                    "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Professional lifestyle shot showing satisfied customer using product in real environment - specific setting, lighting, emotions, and product benefits clearly visible. Include demographics, activity context, and conversion elements that resonate with target market.",
-                                    "seoOptimization": "Focus on quality and premium positioning"
-                                },
-                                "overallStrategy": "Premium positioning with quality focus"
-                            },
-                            "ppcStrategy": {
-                                "campaignStructure": {
-                                    "exactMatchCampaign": {
-                                        "keywords": [product.name.lower()],
-                                        "bidStrategy": "Fixed bids starting at $0.75",
-                                        "dailyBudget": "$30",
-                                        "targetAcos": "20%"
-                                    }
-                                }
-                            }
-                        }
-                        print("✅ Fallback JSON structure created successfully")
-            
-            # Remove any emojis from all text fields FIRST before any processing
-            print("Before emoji removal - checking title...")
-            try:
-                # Check the correct field name - InternationalContentExtractor uses 'productTitle'
-                title_before = result.get('productTitle', '') or result.get('title', '')
-                print(f"Title before cleanup: {len(title_before)} chars, has Unicode: {any(ord(c) > 127 for c in title_before)}")
-            except Exception as e:
-                print(f"Error checking title before: {e}")
+                # Create minimal valid structure as absolute fallback
+                print("❌ AI response contained no JSON object - creating minimal fallback JSON structure...")
+                if raw_response is None:
+                    invalidate_completion(**request_params)  # Don't replay the unparseable completion
+                result = {
+                    "productTitle": f"{product.brand_name} {product.name} - Premium Quality Product",
+                    "bulletPoints": [
+                        "PREMIUM QUALITY: Exceptional construction with superior materials and craftsmanship for lasting performance and durability",
+                        "RELIABLE PERFORMANCE: Consistent operation designed for daily use with professional-grade standards and proven results", 
+                        "USER FRIENDLY: Simple setup and intuitive design makes this perfect for everyone to use regardless of experience level",
+                        "GREAT VALUE: Outstanding quality at an affordable price point with excellent customer satisfaction and long-term reliability",
+                        "SATISFACTION GUARANTEED: Backed by quality assurance and dedicated customer support team with fast response times"
+                    ],
+                    "productDescription": f"Transform your experience with the {product.brand_name} {product.name}. This premium product combines innovative design with reliable performance to deliver exceptional results. Whether you're looking for quality, durability, or value, this product exceeds expectations. What's Included: Main product, user manual, warranty information. Experience the {product.brand_name} difference - order yours today and discover why customers choose quality.",
+                    "brandSummary": f"## Quality First ## At {product.brand_name}, we deliver premium products that exceed expectations and provide lasting value.",
+                    "backendKeywords": f"premium quality reliable performance great value {product.name.lower()} {product.brand_name.lower()}",
+                    "aPlusContentPlan": {
+                        "section1_hero": {
+                            "title": "Why Choose Premium Quality?",
+                            "content": "Experience superior performance and reliability with our premium product line.",
+                            "keywords": ["premium", "quality", "reliable"],
+                            "imageDescription": "DETAILED ENGLISH IMAGE STRATEGY: Professional lifestyle shot showing satisfied customer using product in real environment - specific setting, lighting, emotions, and product benefits clearly visible. Include demographics, activity context, and conversion elements that resonate with target market.",
+                            "seoOptimization": "Focus on quality and premium positioning"
+                        },
+                        "overallStrategy": "Premium positioning with quality focus"
+                    }
+                }
+                print("✅ Fallback JSON structure created successfully")
             
-            result = self._comprehensive_emoji_removal(result)
+            # One normalization pass over every field (emoji, NFC, whitespace; ASCII folding for the US)
+            result, text_stats = normalize_result(
+                result, marketplace_lang or 'en', ascii_fold=getattr(product, 'marketplace', 'us') == 'us'
+            )
+            totals = sum(text_stats.values(), Counter())
+            print(f"🧹 Normalized {len(text_stats)} fields: {totals['chars']} chars, {totals['removed']} removed, "
+                  f"{totals['folded']} folded, {totals['non_ascii']} non-ASCII, {totals['market_chars']} market characters")
             
-            print("After emoji removal - checking title...")
-            try:
-                # Check the correct field name after emoji removal
-                title_after = result.get('productTitle', '') or result.get('title', '')
-                print(f"Title after cleanup: {len(title_after)} chars, has Unicode: {any(ord(c) > 127 for c in title_after)}")
-            except Exception as e:
-                print(f"Error checking title after: {e}")
+            # PPC campaigns and the keyword cluster are bookkeeping over the keywords - derived, not generated
+            apply_keyword_derivations(result, product, seller_keywords)
             
             # Validate result has required fields for new JSON structure
-            required_fields = ["productTitle", "bulletPoints", "productDescription", "keyword_cluster", "brandSummary", "backendKeywords", "aPlusContentPlan", "ppcStrategy"]
+            required_fields = ["productTitle", "bulletPoints", "productDescription", "brandSummary", "backendKeywords", "aPlusContentPlan"]
             missing_fields = [field for field in required_fields if field not in result]
             if missing_fields:
                 # Safe console output - avoid Unicode errors
@@ -3006,13 +2239,6 @@ Write each section in a completely different style and tone. Use unexpected but
                     "productTitle": f"{product.brand_name} {product.name} - Quality Product",
                     "bulletPoints": ["PREMIUM QUALITY: High quality construction with superior materials and craftsmanship for lasting durability and exceptional performance", "RELIABLE PERFORMANCE: Consistent and dependable operation designed for daily use with proven results and customer satisfaction", "EXCEPTIONAL VALUE: Great quality at an affordable price point offering the perfect balance of performance and cost-effectiveness", "CUSTOMER SATISFACTION: Backed by thousands of positive reviews and testimonials from happy customers who love this product", "EASY TO USE: Simple setup and user-friendly design makes this perfect for everyone regardless of technical experience"],
                     "productDescription": f"The {product.name} by {product.brand_name} offers exceptional quality and performance.",
-                    "keyword_cluster": {
-                        "primary_keywords": [product.name.lower(), "quality", "reliable", "performance", "value"],
-                        "secondary_keywords": [f"best {product.name.lower()}", f"premium {product.name.lower()}", f"high quality {product.name.lower()}"],
-                        "backend_search_terms": "problem solving solution fix buy best cheap home family professional",
-                        "misspellings_and_synonyms": [product.name.lower()],
-                        "ppc_keywords": [{"keyword": product.name.lower(), "match_type": "Exact", "goal": "Conversion", "bid_suggestion": "0.75", "target_acos": "20%"}]
-                    },
                     "brandSummary": f"## Quality First ## At {product.brand_name}, we believe in making quality products that enhance your life. Join thousands who trust {product.brand_name} for reliable performance.",
                     "backendKeywords": "quality reliable performance value home family professional problem solving solution",
                     "aPlusContentPlan": {
@@ -3080,20 +2306,6 @@ Write each section in a completely different style and tone. Use unexpected but
                             "seoOptimization": "Action-oriented keywords for conversion"
                         },
                         "overallStrategy": "Complete 8-section A+ content strategy for maximum conversion and customer engagement"
-                    },
-                    "ppcStrategy": {
-                        "campaignStructure": {
-                            "exactMatchCampaign": {
-                                "keywords": [product.name.lower()],
-                                "bidStrategy": "Fixed bids starting at $0.75",
-                                "dailyBudget": "$30",
-                                "targetAcos": "20%"
-                            }
-                        },
-                        "negativeKeywords": {
-                            "immediate": ["cheap", "free", "used"],
-                            "strategy": "Protect budget from low-intent traffic"
-                        }
                     }
                 }
                 for field in missing_fields:
@@ -3223,12 +2435,12 @@ Technical specifications include comprehensive compatibility, robust build quali
                 ]
                 print(f"⚠️ Generated {len(primary_keywords)} primary + {len(secondary_keywords)} secondary fallback keywords")
             
-            # OLD KEYWORD LOGIC - Only use if comprehensive SEO keywords weren't generated
-            if not hasattr(listing, 'keywords') or not listing.keywords:
-                all_keywords = primary_keywords + secondary_keywords
-                listing.keywords = ', '.join(all_keywords) if all_keywords else ''
-                # Copy keywords to amazon_keywords for frontend display
-                listing.amazon_keywords = listing.keywords
+            # Base keywords from the keyword cluster; the seoKeywords pass below refines them when present.
+            # Always overwritten, so re-processing an archived response re-derives them too.
+            all_keywords = primary_keywords + secondary_keywords
+            listing.keywords = ', '.join(all_keywords) if all_keywords else ''
+            # Copy keywords to amazon_keywords for frontend display
+            listing.amazon_keywords = listing.keywords
             
             # Backend keywords - ONLY optimize France market (keep USA and Germany untouched)
             backend_keywords = result.get('backendKeywords', '')
@@ -3325,17 +2537,9 @@ Technical specifications include comprehensive compatibility, robust build quali
             if faqs_list:
                 faqs_content = '\n\n'.join(faqs_list)
                 
-                # Fix FAQ format for Polish market
+                # Marketplace FAQ prefixes (Q:/A: -> P:/O: for Poland, S:/C: for Turkey, ...)
                 marketplace_code = getattr(product, 'marketplace', 'com')
-                if marketplace_code == 'pl':
-                    # Convert Q: → P: and A: → O: for Polish format
-                    faqs_content = faqs_content.replace('Q:', 'P:').replace('A:', 'O:')
-                elif marketplace_code == 'tr':
-                    # Convert Q: → S: and A: → C: for Turkish format
-                    faqs_content = faqs_content.replace('Q:', 'S:').replace('A:', 'C:')
-                elif marketplace_code == 'be':
-                    # Convert Q: → Q: and A: → R: for Belgian French format
-                    faqs_content = faqs_content.replace('A:', 'R:')
+                faqs_content, _ = localize_text(marketplace_code, 'faq_prefixes', faqs_content)
                 
                 listing.faqs = faqs_content
             else:
@@ -3467,1892 +2671,28 @@ Technical specifications include comprehensive compatibility, robust build quali
             print(f"   - A+ Content: Hero, Features, FAQs, Trust Builders")
             print(f"   - Brand Summary integrated into content")
             self.logger.info("Generating A+ content HTML...")
-            # Build comprehensive A+ content HTML from the plan
-            
-            # Define localized interface labels (needed for all markets) - MOVED HERE TO FIX SCOPE ISSUE
             marketplace_code = getattr(product, 'marketplace', 'com') or 'com'
-            
-            def get_localized_labels(market_code):
-                if market_code == 'tr':
-                    return {
-                        'keywords': 'Anahtar Kelimeler',
-                        'image_strategy': 'Görsel Strateji', 
-                        'seo_focus': 'SEO Odak',
-                        'features_title': 'Ana Özellikler ve Faydalar',
-                        'trust_title': 'Kalite & Güven',
-                        'faqs_title': 'Sıkça Sorulan Sorular'
-                    }
-                elif market_code == 'jp':
-                    return {
-                        'keywords': 'キーワード',
-                        'image_strategy': '画像戦略',
-                        'seo_focus': 'SEO焦点'
-                    }
-                elif market_code == 'de':
-                    return {
-                        'keywords': 'Schlüsselwörter',
-                        'image_strategy': 'Bildstrategie',
-                        'seo_focus': 'SEO-Fokus'
-                    }
-                elif market_code == 'fr':
-                    return {
-                        'keywords': 'Mots-clés',
-                        'image_strategy': 'Stratégie image',
-                        'seo_focus': 'Focus SEO'
-                    }
-                elif market_code == 'es':
-                    return {
-                        'keywords': 'Palabras clave',
-                        'image_strategy': 'Estrategia imagen',
-                        'seo_focus': 'Enfoque SEO'
-                    }
-                elif market_code == 'nl':
-                    return {
-                        'keywords': 'Trefwoorden',
-                        'image_strategy': 'Beeld Strategie',
-                        'seo_focus': 'SEO Focus',
-                        'features_title': 'Key Features & Benefits',
-                        'trust_title': 'Trust & Quality',
-                        'faqs_title': 'Frequently Asked Questions'
-                    }
-                elif market_code == 'eg':
-                    return {
-                        'keywords': 'الكلمات المفتاحية',
-                        'image_strategy': 'استراتيجية الصور',
-                        'seo_focus': 'تركيز تحسين محركات البحث',
-                        'features_title': 'الميزات والفوائد الرئيسية',
-                        'trust_title': 'الجودة والثقة',
-                        'faqs_title': 'الأسئلة الشائعة'
-                    }
-                elif market_code == 'mx':
-                    return {
-                        'keywords': 'Palabras Clave',
-                        'image_strategy': 'Estrategia de Imagen',
-                        'seo_focus': 'Enfoque SEO',
-                        'features_title': 'Características y Beneficios Clave',
-                        'trust_title': 'Calidad y Confianza',
-                        'faqs_title': 'Preguntas Frecuentes'
-                    }
-                elif market_code == 'sa':
-                    return {
-                        'keywords': 'الكلمات المفتاحية',
-                        'image_strategy': 'استراتيجية الصور',
-                        'seo_focus': 'تركيز تحسين محركات البحث',
-                        'features_title': 'الميزات والفوائد الرئيسية',
-                        'trust_title': 'الجودة والثقة',
-                        'faqs_title': 'الأسئلة الشائعة'
-                    }
-                elif market_code == 'in':
-                    return {
-                        'keywords': 'Keywords',
-                        'image_strategy': 'Image Strategy',
-                        'seo_focus': 'SEO Focus',
-                        'features_title': 'Key Features & Benefits',
-                        'trust_title': 'Trust & Quality',
-                        'faqs_title': 'Frequently Asked Questions'
-                    }
-                elif market_code == 'pl':
-                    return {
-                        'keywords': 'Słowa Kluczowe',
-                        'image_strategy': 'Strategia Obrazów',
-                        'seo_focus': 'Skupienie SEO',
-                        'features_title': 'Kluczowe Cechy i Korzyści',
-                        'trust_title': 'Jakość i Zaufanie',
-                        'faqs_title': 'Często Zadawane Pytania'
-                    }
-                elif market_code == 'be':
-                    return {
-                        'keywords': 'Mots-clés',
-                        'image_strategy': 'Stratégie d\'Image',
-                        'seo_focus': 'Focus SEO',
-                        'features_title': 'Caractéristiques et Avantages Clés',
-                        'trust_title': 'Qualité et Confiance',
-                        'faqs_title': 'Questions Fréquemment Posées'
-                    }
-                elif market_code == 'sg':
-                    return {
-                        'keywords': 'Keywords',
-                        'image_strategy': 'Image Strategy',
-                        'seo_focus': 'SEO Focus',
-                        'features_title': 'Key Features & Benefits',
-                        'trust_title': 'Quality & Trust',
-                        'faqs_title': 'Frequently Asked Questions'
-                    }
-                elif market_code == 'au':
-                    return {
-                        'keywords': 'Keywords',
-                        'image_strategy': 'Image Strategy',
-                        'seo_focus': 'SEO Focus',
-                        'features_title': 'Key Features & Benefits',
-                        'trust_title': 'Quality & Trust',
-                        'faqs_title': 'Frequently Asked Questions'
-                    }
-                else:
-                    return {
-                        'keywords': 'Keywords',
-                        'image_strategy': 'Image Strategy',
-                        'seo_focus': 'SEO Focus',
-                        'features_title': 'Key Features & Benefits',
-                        'trust_title': 'Trust & Quality',
-                        'faqs_title': 'Frequently Asked Questions'
-                    }
-            
-            localized_labels = get_localized_labels(marketplace_code)
-            sections_html = []
-            
-            # For international markets, ensure we use actual content even if structure is different
             marketplace_lang = getattr(product, 'marketplace_language', 'en')
-            
-            # Generate HTML for each A+ section with dynamic card types and colors
-            # Check for both 'section' prefix and 'section1_hero' style keys
-            for section_key, section_data in aplus_plan.items():
-                if (section_key.startswith('section') or '_' in section_key) and isinstance(section_data, dict):
-                    section_title = section_data.get('title', '')
-                    section_content = section_data.get('content', '')
-                    section_keywords = ', '.join(section_data.get('keywords', []))
-                    image_desc = section_data.get('imageDescription', '')
-                    seo_note = section_data.get('seoOptimization', '')
-                    
-                    # Enhance with culturally-specific keywords based on marketplace and section type
-                    marketplace_code = getattr(product, 'marketplace', 'com') or 'com'
-                    product_category = getattr(product, 'categories', '').lower() if hasattr(product, 'categories') else ''
-                    
-                    # Override keywords with cultural ones based on section type and market
-                    if 'hero' in section_key.lower() or 'section1' in section_key:
-                        # Hero section - trust and brand focused
-                        if marketplace_code == 'jp':
-                            section_keywords = "プレミアム品質, みんなの信頼, 安心保証, 日本基準"
-                        elif marketplace_code == 'es':
-                            section_keywords = "calidad premium, confianza familiar, garantía extendida"
-                        elif marketplace_code == 'de':
-                            section_keywords = "Premium-Qualität, deutsche Standards, TÜV-geprüft"
-                        elif marketplace_code == 'fr':
-                            section_keywords = "qualité premium, tradition française, savoir-faire"
-                        elif marketplace_code == 'it':
-                            section_keywords = "qualità premium, eccellenza italiana, fiducia del cliente"
-                        elif marketplace_code == 'tr':
-                            section_keywords = "premium kalite, güvenilir marka, müşteri memnuniyeti"
-                        elif marketplace_code == 'sa':
-                            section_keywords = "جودة فائقة، علامة موثوقة، رضا العملاء"
-                        elif marketplace_code == 'eg':
-                            section_keywords = "جودة ممتازة، علامة تجارية موثوقة، رضا العملاء"
-                        elif marketplace_code == 'pl':
-                            section_keywords = "jakość premium, zaufana marka, zadowolenie klienta"
-                        elif marketplace_code == 'be':
-                            section_keywords = "qualité premium, marque de confiance, satisfaction client"
-                        elif marketplace_code == 'sg':
-                            section_keywords = "premium quality Singapore, trusted brand excellence, customer satisfaction guarantee, multicultural harmony"
-                        elif marketplace_code == 'uk':
-                            section_keywords = "premium quality Britain, trusted British brand excellence, customer satisfaction guarantee, refined British lifestyle"
-                        elif marketplace_code == 'au':
-                            section_keywords = "premium quality Australia, trusted brand excellence, customer satisfaction guarantee, Aussie lifestyle"
-                        elif marketplace_code == 'in':
-                            section_keywords = "premium quality, trusted brand, customer satisfaction"
-                        else:
-                            section_keywords = "premium quality, trusted brand, customer satisfaction"
-                    elif 'feature' in section_key.lower() or 'section2' in section_key:
-                        # Features section - functionality focused
-                        if marketplace_code == 'jp':
-                            if 'audio' in product_category or 'headphone' in product_category:
-                                section_keywords = "高音質, ノイズキャンセリング, 長時間再生, 快適装着"
-                            elif 'kitchen' in product_category:
-                                section_keywords = "衛生的, 食洗機対応, 安全設計, 長持ち"
-                            else:
-                                section_keywords = "高品質, 安全性, 使いやすさ, 長期保証"
-                        elif marketplace_code == 'es':
-                            section_keywords = "funcionalidad superior, diseño elegante, uso familiar"
-                        elif marketplace_code == 'de':
-                            section_keywords = "Ingenieursqualität, Präzision, Zuverlässigkeit, Effizienz"
-                        elif marketplace_code == 'fr':
-                            section_keywords = "sophistication, élégance française, art de vivre"
-                        elif marketplace_code == 'it':
-                            section_keywords = "design innovativo, prestazioni superiori, stile italiano"
-                        elif marketplace_code == 'tr':
-                            section_keywords = "yenilikçi tasarım, yüksek performans, kullanıcı dostu"
-                        elif marketplace_code == 'sa':
-                            section_keywords = "تصميم مبتكر، أداء عالي، سهل الاستخدام"
-                        elif marketplace_code == 'eg':
-                            section_keywords = "تصميم مبدع، أداء عالي الجودة، سهل الاستعمال"
-                        elif marketplace_code == 'pl':
-                            section_keywords = "innowacyjny design, wysoka wydajność, przyjazny użytkownikowi"
-                        elif marketplace_code == 'be':
-                            section_keywords = "design innovant, haute performance, convivial"
-                        elif marketplace_code == 'sg':
-                            section_keywords = "innovative design excellence, high performance technology, user-friendly interface, Singapore lifestyle integration"
-                        elif marketplace_code == 'uk':
-                            section_keywords = "innovative British design excellence, high performance engineering, user-friendly interface, sophisticated British lifestyle integration"
-                        elif marketplace_code == 'au':
-                            section_keywords = "innovative design excellence, high performance technology, user-friendly interface, Australian lifestyle integration"
-                        elif marketplace_code == 'in':
-                            section_keywords = "innovative design, high performance, user-friendly"
-                        else:
-                            section_keywords = "innovative design, high performance, user-friendly"
-                    elif 'trust' in section_key.lower() or 'quality' in section_key.lower() or 'guarantee' in section_key.lower():
-                        # Trust/Quality section - reliability focused
-                        if marketplace_code == 'jp':
-                            section_keywords = "みんなが選ぶ安心, 長期保証, 日本品質基準, アフターサポート"
-                        elif marketplace_code == 'es':
-                            section_keywords = "recomendado por familias, garantía extendida, servicio al cliente"
-                        elif marketplace_code == 'de':
-                            section_keywords = "TÜV-geprüft, deutsche Qualitätsnormen, Zertifizierung, Compliance"
-                        elif marketplace_code == 'fr':
-                            section_keywords = "tradition française, savoir-faire, qualité artisanale, héritage"
-                        elif marketplace_code == 'it':
-                            section_keywords = "tradizione italiana, artigianato, qualità superiore, heritage"
-                        elif marketplace_code == 'tr':
-                            section_keywords = "5 yıldızlı değerlendirmeler, para iade garantisi, müşteri memnuniyeti"
-                        elif marketplace_code == 'sa':
-                            section_keywords = "تقييمات 5 نجوم، ضمان استرداد المال، رضا العملاء"
-                        elif marketplace_code == 'eg':
-                            section_keywords = "تقييمات خمس نجوم، ضمان إرجاع الأموال، رضا العملاء"
-                        elif marketplace_code == 'pl':
-                            section_keywords = "5-gwiazdkowe recenzje, gwarancja zwrotu pieniędzy, zadowolenie klientów"
-                        elif marketplace_code == 'be':
-                            section_keywords = "avis 5 étoiles, garantie de remboursement, satisfaction client"
-                        elif marketplace_code == 'sg':
-                            section_keywords = "5-star Singapore reviews, money-back guarantee, customer satisfaction excellence, trusted by families"
-                        elif marketplace_code == 'uk':
-                            section_keywords = "5-star British reviews, money-back guarantee, customer satisfaction excellence, trusted by UK families nationwide"
-                        elif marketplace_code == 'au':
-                            section_keywords = "5-star Australian reviews, money-back guarantee, customer satisfaction excellence, trusted by Aussie families"
-                        elif marketplace_code == 'in':
-                            section_keywords = "5-star reviews, money-back guarantee, customer satisfaction"
-                        else:
-                            section_keywords = "5-star reviews, money-back guarantee, customer satisfaction"
-                    elif 'usage' in section_key.lower() or 'section3' in section_key:
-                        # Usage section - application focused
-                        if marketplace_code == 'jp':
-                            section_keywords = "日常使い, 様々な場面, 便利性, 効率アップ"
-                        elif marketplace_code == 'es':
-                            section_keywords = "uso cotidiano, vida familiar, versatilidad, comodidad"
-                        elif marketplace_code == 'de':
-                            section_keywords = "vielseitige Anwendung, Alltagstauglichkeit, praktisch, effizient"
-                        elif marketplace_code == 'fr':
-                            section_keywords = "usage quotidien, polyvalence, praticité, élégance d'usage"
-                        elif marketplace_code == 'it':
-                            section_keywords = "uso quotidiano, versatilità italiana, praticità, stile di vita"
-                        elif marketplace_code == 'tr':
-                            section_keywords = "günlük kullanım, çok amaçlı, pratik, kullanışlı"
-                        elif marketplace_code == 'sa':
-                            section_keywords = "استخدام يومي، تطبيقات متنوعة، عملي، مريح"
-                        elif marketplace_code == 'eg':
-                            section_keywords = "استعمال يومي، تطبيقات متعددة، عملي، مريح"
-                        elif marketplace_code == 'pl':
-                            section_keywords = "codzienne użycie, wszechstronne zastosowania, praktyczny, wygodny"
-                        elif marketplace_code == 'be':
-                            section_keywords = "usage quotidien, applications polyvalentes, pratique, pratique"
-                        elif marketplace_code == 'sg':
-                            section_keywords = "everyday Singapore lifestyle, versatile HDB applications, practical urban living, convenient MRT-friendly"
-                        elif marketplace_code == 'uk':
-                            section_keywords = "everyday British lifestyle, versatile home applications, practical weather durability, convenient commuter-friendly"
-                        elif marketplace_code == 'au':
-                            section_keywords = "everyday Australian lifestyle, versatile home applications, practical outback durability, convenient city-friendly"
-                        elif marketplace_code == 'in':
-                            section_keywords = "everyday use, versatile applications, practical, convenient"
-                        else:
-                            section_keywords = "everyday use, versatile applications, practical, convenient"
-                    elif 'quality' in section_key.lower() or 'section4' in section_key:
-                        # Quality section - standards focused
-                        if marketplace_code == 'jp':
-                            section_keywords = "品質管理, 検査基準, 製造工程, 信頼性テスト"
-                        elif marketplace_code == 'es':
-                            section_keywords = "control de calidad, estándares europeos, fabricación cuidadosa"
-                        elif marketplace_code == 'de':
-                            section_keywords = "Qualitätskontrolle, ISO-Standards, deutsche Fertigung, Prüfsiegel"
-                        elif marketplace_code == 'fr':
-                            section_keywords = "contrôle qualité, normes françaises, fabrication soignée"
-                        elif marketplace_code == 'it':
-                            section_keywords = "controllo qualità, standard italiani, manifattura eccellente"
-                        elif marketplace_code == 'tr':
-                            section_keywords = "kalite kontrol, TSE belgesi, CE sertifikası, 2 yıl garanti"
-                        elif marketplace_code == 'sa':
-                            section_keywords = "مراقبة الجودة، معايير سعودية، تصنيع معتمد، ضمان سنتين"
-                        elif marketplace_code == 'eg':
-                            section_keywords = "مراقبة الجودة، معايير مصرية، تصنيع معتمد، ضمان سنتان"
-                        elif marketplace_code == 'pl':
-                            section_keywords = "kontrola jakości, polskie standardy, certyfikowana doskonałość"
-                        elif marketplace_code == 'be':
-                            section_keywords = "contrôle qualité, normes belges, excellence certifiée"
-                        elif marketplace_code == 'sg':
-                            section_keywords = "quality control Singapore, SPRING standards, certified excellence, tropical climate tested"
-                        elif marketplace_code == 'uk':
-                            section_keywords = "quality control Britain, British Standards Institution, certified excellence, UK weather tested"
-                        elif marketplace_code == 'au':
-                            section_keywords = "quality control Australia, ACMA standards, certified excellence, extreme climate tested"
-                        elif marketplace_code == 'in':
-                            section_keywords = "quality control, manufacturing standards, certified excellence"
-                        else:
-                            section_keywords = "quality control, manufacturing standards, certified excellence"
-                    elif 'social' in section_key.lower() or 'proof' in section_key.lower() or 'section6' in section_key:
-                        # Social proof section - testimonials focused
-                        if marketplace_code == 'jp':
-                            section_keywords = "お客様満足度, 高評価レビュー, リピーター多数, 口コミ人気"
-                        elif marketplace_code == 'es':
-                            section_keywords = "testimonios reales, familias satisfechas, recomendaciones"
-                        elif marketplace_code == 'de':
-                            section_keywords = "Kundenbewertungen, Zufriedenheitsgarantie, Weiterempfehlung"
-                        elif marketplace_code == 'fr':
-                            section_keywords = "témoignages clients, satisfaction garantie, reconnaissance"
-                        elif marketplace_code == 'it':
-                            section_keywords = "testimonianze, soddisfazione clienti, raccomandazioni"
-                        elif marketplace_code == 'tr':
-                            section_keywords = "müşteri yorumları, doğrulanmış incelemeler, memnuniyet garantili"
-                        elif marketplace_code == 'sa':
-                            section_keywords = "شهادات العملاء، مراجعات موثقة، رضا مضمون"
-                        elif marketplace_code == 'eg':
-                            section_keywords = "شهادات العملاء، مراجعات موثقة، رضا مضمون"
-                        elif marketplace_code == 'pl':
-                            section_keywords = "opinie klientów, zweryfikowane recenzje, zadowolenie gwarantowane"
-                        elif marketplace_code == 'be':
-                            section_keywords = "témoignages clients, avis vérifiés, satisfaction garantie"
-                        elif marketplace_code == 'sg':
-                            section_keywords = "Singapore customer testimonials, verified family reviews, satisfaction guaranteed, multicultural trust"
-                        elif marketplace_code == 'uk':
-                            section_keywords = "British customer testimonials, verified family reviews, satisfaction guaranteed, authentic British trust"
-                        elif marketplace_code == 'au':
-                            section_keywords = "Australian customer testimonials, verified family reviews, satisfaction guaranteed, fair dinkum trust"
-                        elif marketplace_code == 'in':
-                            section_keywords = "customer testimonials, verified reviews, satisfaction guaranteed"
-                        else:
-                            section_keywords = "customer testimonials, verified reviews, satisfaction guaranteed"
-                    elif 'comparison' in section_key.lower() or 'section7' in section_key:
-                        # Comparison section - competitive advantage focused
-                        if marketplace_code == 'jp':
-                            section_keywords = "他社比較, 優位性, 選ばれる理由, 差別化ポイント"
-                        elif marketplace_code == 'es':
-                            section_keywords = "ventajas competitivas, mejor elección, diferencias clave"
-                        elif marketplace_code == 'de':
-                            section_keywords = "Wettbewerbsvorteil, Alleinstellungsmerkmal, Überlegenheit"
-                        elif marketplace_code == 'fr':
-                            section_keywords = "avantages concurrentiels, supériorité, choix optimal"
-                        elif marketplace_code == 'it':
-                            section_keywords = "vantaggi competitivi, superiorità, scelta migliore"
-                        elif marketplace_code == 'tr':
-                            section_keywords = "rekabet avantajı, üstün seçim, temel farklılıklar"
-                        elif marketplace_code == 'sa':
-                            section_keywords = "ميزة تنافسية، خيار متفوق، مميزات رئيسية"
-                        elif marketplace_code == 'eg':
-                            section_keywords = "ميزة تنافسية، الخيار الأفضل، مزايا أساسية"
-                        elif marketplace_code == 'pl':
-                            section_keywords = "przewaga konkurencyjna, najlepszy wybór, kluczowe różnice"
-                        elif marketplace_code == 'be':
-                            section_keywords = "avantage concurrentiel, choix supérieur, différenciateurs clés"
-                        elif marketplace_code == 'sg':
-                            section_keywords = "competitive advantage Singapore, superior choice excellence, key differentiators, Lion City quality"
-                        elif marketplace_code == 'uk':
-                            section_keywords = "competitive advantage Britain, superior choice excellence, key differentiators, British innovation heritage"
-                        elif marketplace_code == 'au':
-                            section_keywords = "competitive advantage Australia, superior choice excellence, key differentiators, Aussie innovation"
-                        elif marketplace_code == 'in':
-                            section_keywords = "competitive advantage, superior choice, key differentiators"
-                        else:
-                            section_keywords = "competitive advantage, superior choice, key differentiators"
-                    elif 'package' in section_key.lower() or 'section8' in section_key:
-                        # Package section - contents focused
-                        if marketplace_code == 'jp':
-                            section_keywords = "同梱内容, パッケージング, 付属品, 開封体験"
-                        elif marketplace_code == 'es':
-                            section_keywords = "contenido completo, empaque premium, accesorios incluidos"
-                        elif marketplace_code == 'de':
-                            section_keywords = "Lieferumfang, Verpackungsqualität, Zubehör, Vollständigkeit"
-                        elif marketplace_code == 'fr':
-                            section_keywords = "contenu livré, emballage soigné, accessoires inclus"
-                        elif marketplace_code == 'it':
-                            section_keywords = "contenuto confezione, imballaggio curato, accessori inclusi"
-                        elif marketplace_code == 'tr':
-                            section_keywords = "paket içeriği, premium ambalaj, dahil aksesuarlar"
-                        elif marketplace_code == 'sa':
-                            section_keywords = "محتويات العبوة، تغليف فاخر، إكسسوارات مدرجة"
-                        elif marketplace_code == 'eg':
-                            section_keywords = "محتويات الحزمة، تعبئة فاخرة، اكسسوارات مشمولة"
-                        elif marketplace_code == 'pl':
-                            section_keywords = "zawartość opakowania, premium pakowanie, dołączone akcesoria"
-                        elif marketplace_code == 'be':
-                            section_keywords = "contenu emballage, emballage premium, accessoires inclus"
-                        elif marketplace_code == 'sg':
-                            section_keywords = "complete package contents, premium Singapore packaging, included accessories, tropical-ready materials"
-                        elif marketplace_code == 'uk':
-                            section_keywords = "complete package contents, premium British packaging, included accessories, weather-resistant materials"
-                        elif marketplace_code == 'au':
-                            section_keywords = "complete package contents, premium Australian packaging, included accessories, extreme-weather materials"
-                        elif marketplace_code == 'in':
-                            section_keywords = "package contents, premium packaging, included accessories"
-                        else:
-                            section_keywords = "package contents, premium packaging, included accessories"
-                    elif 'faq' in section_key.lower() or 'support' in section_key.lower():
-                        # FAQ/Support section - help focused
-                        if marketplace_code == 'jp':
-                            section_keywords = "詳しい説明, 心配解消, 使い方ガイド, トラブル対応"
-                        elif marketplace_code == 'es':
-                            section_keywords = "ayuda familiar, dudas comunes, consejos prácticos"
-                        elif marketplace_code == 'de':
-                            section_keywords = "technische Details, Bedienungsanleitung, Problemlösung"
-                        elif marketplace_code == 'fr':
-                            section_keywords = "conseils d'expert, solutions élégantes, guide sophistiqué"
-                        elif marketplace_code == 'it':
-                            section_keywords = "supporto tecnico, guide dettagliate, assistenza italiana"
-                        elif marketplace_code == 'tr':
-                            section_keywords = "sık sorulan sorular, Türkçe destek, kullanım kılavuzu, problem çözümü"
-                        elif marketplace_code == 'sa':
-                            section_keywords = "أسئلة شائعة، دعم باللغة العربية، دليل الاستخدام، حل المشاكل"
-                        elif marketplace_code == 'eg':
-                            section_keywords = "أسئلة شائعة، دعم باللغة العربية، دليل الاستعمال، حل المشاكل"
-                        elif marketplace_code == 'pl':
-                            section_keywords = "szybkie odpowiedzi, rozwiązywanie problemów, przewodnik użytkownika"
-                        elif marketplace_code == 'in':
-                            section_keywords = "quick answers, troubleshooting, user guide"
-                        else:
-                            section_keywords = "quick answers, troubleshooting, user guide"
-                    
-                    # Also enhance image descriptions culturally
-                    if not image_desc or len(image_desc) < 50:
-                        if 'hero' in section_key.lower() or 'section1' in section_key:
-                            if marketplace_code == 'jp':
-                                image_desc = "日本の家庭で安心して使用、清潔感と品質を重視 (970x600px)"
-                            elif marketplace_code == 'es':
-                                image_desc = "Familia española disfrutando del producto, ambiente cálido (970x600px)"
-                            elif marketplace_code == 'de':
-                                image_desc = "Deutsche Qualität und Präzision im modernen Zuhause (970x600px)"
-                            elif marketplace_code == 'fr':
-                                image_desc = "Élégance française, sophistication au quotidien (970x600px)"
-                            else:
-                                image_desc = "Modern lifestyle, premium quality experience (970x600px)"
-                    card_type = section_data.get('cardType', 'default')
-                    card_color = section_data.get('cardColor', 'gray')
-                    visual_template = section_data.get('visualTemplate', {})
-                    
-                    # Define color schemes for different card types with dynamic assignment
-                    color_schemes = {
-                        'blue': {'bg': 'bg-blue-50', 'border': 'border-blue-200', 'title': 'text-blue-900', 'badge': 'bg-blue-100 text-blue-800'},
-                        'green': {'bg': 'bg-green-50', 'border': 'border-green-200', 'title': 'text-green-900', 'badge': 'bg-green-100 text-green-800'},
-                        'purple': {'bg': 'bg-purple-50', 'border': 'border-purple-200', 'title': 'text-purple-900', 'badge': 'bg-purple-100 text-purple-800'},
-                        'orange': {'bg': 'bg-orange-50', 'border': 'border-orange-200', 'title': 'text-orange-900', 'badge': 'bg-orange-100 text-orange-800'},
-                        'teal': {'bg': 'bg-teal-50', 'border': 'border-teal-200', 'title': 'text-teal-900', 'badge': 'bg-teal-100 text-teal-800'},
-                        'indigo': {'bg': 'bg-indigo-50', 'border': 'border-indigo-200', 'title': 'text-indigo-900', 'badge': 'bg-indigo-100 text-indigo-800'},
-                        'pink': {'bg': 'bg-pink-50', 'border': 'border-pink-200', 'title': 'text-pink-900', 'badge': 'bg-pink-100 text-pink-800'},
-                        'yellow': {'bg': 'bg-yellow-50', 'border': 'border-yellow-200', 'title': 'text-yellow-900', 'badge': 'bg-yellow-100 text-yellow-800'}
-                    }
-                    
-                    # Dynamic color assignment based on section
-                    section_colors = {
-                        'section1_hero': 'blue',
-                        'section2_features': 'green',
-                        'section3_usage': 'purple',
-                        'section4_quality': 'orange',
-                        'section5_guarantee': 'teal',
-                        'section6_social_proof': 'indigo',
-                        'section7_comparison': 'pink',
-                        'section8_package': 'yellow'
-                    }
-                    
-                    assigned_color = section_colors.get(section_key, card_color if card_color != 'default' else 'blue')
-                    colors = color_schemes.get(assigned_color, color_schemes['blue'])
-                    
-                    # Enhanced dynamic icons based on section key for better visual hierarchy
-                    section_icons = {
-                        'section1_hero': '🚀',
-                        'section2_features': '✨', 
-                        'section3_usage': '🎯',
-                        'section4_quality': '🏆',
-                        'section5_guarantee': '🛡️',
-                        'section6_social_proof': '💬',
-                        'section7_comparison': '📊',
-                        'section8_package': '📦',
-                        'hero': '🌟',
-                        'features': '⚡',
-                        'usage': '🔥',
-                        'quality': '💎',
-                        'guarantee': '🛡️',
-                        'social': '🤝',
-                        'comparison': '📈',
-                        'package': '🎁',
-                        'default': '💫'
-                    }
-                    
-                    # Try to match icon based on section key
-                    icon = section_icons.get(section_key, section_icons.get(card_type, section_icons['default']))
-                    
-                    # Generate visual template HTML if available
-                    visual_template_html = ""
-                    if visual_template:
-                        template_type = visual_template.get('templateType', 'standard')
-                        image_title = visual_template.get('imageTitle', '')
-                        suggested_scene = visual_template.get('suggestedScene', '')
-                        overlay_text = visual_template.get('overlayText', '')
-                        style_guide = visual_template.get('styleGuide', '')
-                        layout_structure = visual_template.get('layoutStructure', '')
-                        color_scheme = visual_template.get('colorScheme', '')
-                        design_elements = visual_template.get('designElements', [])
-                        
-                        visual_template_html = f"""
-        <div class="visual-template-generator bg-gradient-to-r from-indigo-50 to-purple-50 border border-indigo-200 rounded-lg p-4 mt-4">
-            <div class="flex items-center mb-3">
-                <span class="text-2xl mr-2">🎨</span>
-                <h4 class="text-indigo-900 font-semibold text-lg">A+ Visual Template Generator</h4>
-            </div>
-            
-            <div class="grid grid-cols-1 md:grid-cols-2 gap-4 mb-4">
-                <div class="template-brief bg-white p-3 rounded border">
-                    <h5 class="font-semibold text-gray-900 mb-2">📸 {template_type.title()} Image Brief</h5>
-                    <div class="text-sm space-y-2">
-                        <div><strong>Title:</strong> {image_title}</div>
-                        <div><strong>Scene:</strong> {suggested_scene}</div>
-                        <div><strong>Overlay Text:</strong> "{overlay_text}"</div>
-                    </div>
-                </div>
-                
-                <div class="style-guide bg-white p-3 rounded border">
-                    <h5 class="font-semibold text-gray-900 mb-2">🎯 Design Guidelines</h5>
-                    <div class="text-sm space-y-2">
-                        <div><strong>Style:</strong> {style_guide}</div>
-                        <div><strong>Layout:</strong> {layout_structure}</div>
-                        <div><strong>Colors:</strong> {color_scheme}</div>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="design-elements bg-white p-3 rounded border">
-                <h5 class="font-semibold text-gray-900 mb-2">🔧 Required Elements</h5>
-                <div class="flex flex-wrap gap-2">
-                    {' '.join([f'<span class="bg-indigo-100 text-indigo-800 px-2 py-1 rounded text-xs">{element}</span>' for element in design_elements])}
-                </div>
-            </div>
-            
-            <div class="template-download mt-4 text-center">
-                <p class="text-xs text-gray-600 mb-2">💡 Copy this brief to Canva, Figma, or share with your designer</p>
-                <button class="bg-indigo-600 text-white px-4 py-2 rounded text-sm font-medium hover:bg-indigo-700 transition-colors">
-                    📄 Download PDF Brief
-                </button>
-            </div>
-        </div>"""
-
-                    section_html = f"""
-    <div class="aplus-section-card {colors['bg']} {colors['border']} border-2 rounded-lg p-4 sm:p-6 mb-6 mx-2 sm:mx-0 shadow-sm hover:shadow-md transition-shadow">
-        <div class="flex items-center mb-4">
-            <span class="text-2xl sm:text-3xl mr-3">{icon}</span>
-            <div class="flex-1">
-                <h3 class="{colors['title']} text-xl sm:text-2xl font-bold">{section_title}</h3>
-                <p class="text-gray-600 text-sm mt-1">{card_type.title()} section with detailed content and optimization</p>
-            </div>
-        </div>
-        <div class="content-section bg-white rounded-lg p-4 mb-4 border">
-            <p class="text-gray-700 leading-relaxed text-sm sm:text-base">{section_content}</p>
-        </div>
-        {visual_template_html}
-        <div class="seo-details mt-4">
-            <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🔍</span>
-                        <strong class="text-gray-900">{localized_labels['keywords']}</strong>
-                    </div>
-                    <p class="text-gray-600">{section_keywords}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">📸</span>
-                        <strong class="text-gray-900">{localized_labels['image_strategy']}</strong>
-                    </div>
-                    <p class="text-gray-600">{image_desc}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🎯</span>
-                        <strong class="text-gray-900">{localized_labels['seo_focus']}</strong>
-                    </div>
-                    <p class="text-gray-600">{seo_note}</p>
-                </div>
-            </div>
-        </div>
-    </div>"""
-                    sections_html.append(section_html)
-            
+            product_category = getattr(product, 'categories', '').lower() if hasattr(product, 'categories') else ''
+            sections_html = render_sections(aplus_plan, marketplace_code, product_category)
+            fallback = None
             
             # If no sections were generated (common for international markets), create them from actual content
             # Include Turkey (tr) to ensure it gets comprehensive sections like Mexico
             # FORCE Turkey to use comprehensive sections like Mexico regardless of initial sections
             if (not sections_html and (listing.hero_title or listing.features or listing.trust_builders)) or marketplace_code == 'tr':
-                # Clear existing sections for Turkey to ensure it gets comprehensive generation
                 if marketplace_code == 'tr':
-                    sections_html = []
                     self.logger.info("🇹🇷 FORCING Turkey comprehensive section generation like Mexico")
                 else:
                     self.logger.info("Creating A+ sections from extracted content for international market")
-                
-                # Create hero section from actual hero content with new box design
-                if listing.hero_title and listing.hero_content:
-                    if marketplace_code == 'jp':
-                        keywords_text = "プレミアム, 品質, 信頼性"
-                        image_text = "ライフスタイル写真 (970x600px)"
-                        seo_text = "品質重視のSEO戦略"
-                        premium_label = "プレミアム体験"
-                        premium_desc = "日本の品質基準に準拠した優れた設計"
-                    elif marketplace_code == 'es':
-                        keywords_text = "premium, calidad, confianza"
-                        image_text = "Imagen de estilo de vida (970x600px)"
-                        seo_text = "Estrategia SEO de calidad"
-                        premium_label = "Experiencia Premium"
-                        premium_desc = "Diseño superior con estándares europeos"
-                    elif marketplace_code == 'de':
-                        keywords_text = "Premium, Qualität, Vertrauen"
-                        image_text = "Lifestyle-Bild (970x600px)"
-                        seo_text = "Qualitätsfokussierte SEO-Strategie"
-                        premium_label = "Premium-Erlebnis"
-                        premium_desc = "Überlegenes Design nach deutschen Standards"
-                    elif marketplace_code == 'fr':
-                        keywords_text = "premium, qualité, confiance"
-                        image_text = "Image lifestyle (970x600px)"
-                        seo_text = "Stratégie SEO axée qualité"
-                        premium_label = "Expérience Premium"
-                        premium_desc = "Conception supérieure aux normes françaises"
-                    elif marketplace_code == 'tr':
-                        keywords_text = "premium kalite, güvenilir marka, müşteri memnuniyeti"
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            image_text = "ENGLISH: Turkish family in modern home during New Year celebration, father gaming with premium headset while children watch excitedly, warm festive lighting with traditional decorations in background, RGB headset glowing, quality time together, Turkish hospitality atmosphere visible (970x600px)"
-                        elif 'kitchen' in product_category:
-                            image_text = "ENGLISH: Traditional Turkish kitchen during family gathering, grandmother using premium knife sharpener while family prepares feast together, warm lighting, fresh ingredients and traditional Turkish dishes, multi-generational cooking moment, hospitality elements visible (970x600px)"
-                        elif 'water' in product_category or 'bottle' in product_category:
-                            image_text = "ENGLISH: Active Turkish family at Bosphorus park during weekend, father drinking from large water bottle after outdoor activity, children playing nearby, golden sunset lighting, healthy lifestyle focus, Istanbul skyline in background, family values combined (970x600px)"
-                        else:
-                            image_text = "ENGLISH: Turkish family in modern home showcasing premium product, quality lifestyle focus, warm lighting, traditional hospitality values with modern functionality (970x600px)"
-                        seo_text = "Kalite odaklı SEO stratejisi"
-                        premium_label = "Premium Deneyim"
-                        premium_desc = "Türk standartlarına göre üstün tasarım ve kalite"
-                    elif marketplace_code == 'sa':
-                        keywords_text = "جودة فائقة، علامة موثوقة، رضا العملاء"
-                        image_text = "عائلة سعودية في منزل عصري أثناء عيد الفطر، الأب يلعب الألعاب بينما يشاهد الأطفال، إضاءة دافئة، السماعة ظاهرة مع إضاءة RGB، أجواء احتفالية (970x600px)"
-                        seo_text = "استراتيجية تحسين محركات البحث المركزة على الجودة"
-                        premium_label = "تجربة فاخرة"
-                        premium_desc = "تصميم متفوق وفقاً للمعايير السعودية العالية"
-                    elif marketplace_code == 'in':
-                        keywords_text = "premium quality, trusted brand, customer satisfaction"
-                        image_text = "Indian family in modern kitchen during festival preparation, mother using premium knife set to prepare dal sabzi while family gathers around, traditional spices and fresh vegetables visible, warm festive lighting with rangoli in background, perfect gifting moment (970x600px)"
-                        seo_text = "Indian cooking and festival gifting focused SEO strategy"
-                        premium_label = "Premium Experience"
-                        premium_desc = "Superior design perfect for Indian cooking and festival gifting"
-                    elif marketplace_code == 'nl':
-                        keywords_text = "premium kwaliteit, betrouwbaar merk, klanttevredenheid"
-                        image_text = "ENGLISH: Dutch lifestyle hero image with product (970x600px)"
-                        seo_text = "Kwaliteit gerichte SEO strategie"
-                        premium_label = "Premium Ervaring"
-                        premium_desc = "Superieur ontwerp volgens Nederlandse normen"
-                    elif marketplace_code == 'pl':
-                        keywords_text = "premium jakość, zaufana marka, zadowolenie klientów"
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            image_text = "ENGLISH: Polish family in cozy living room during Christmas preparations, father gaming with premium headset while children watch excitedly, warm festive lighting with Christmas tree in background, RGB headset glowing, quality time together, traditional Polish decorations visible (970x600px)"
-                        elif 'kitchen' in product_category:
-                            image_text = "ENGLISH: Traditional Polish kitchen during Christmas Eve preparation, grandmother using premium knife sharpener while family gathers around traditional wigilia table, warm lighting, fresh bread and traditional Polish dishes, multi-generational cooking moment, heritage elements visible (970x600px)"
-                        elif 'water' in product_category or 'bottle' in product_category:
-                            image_text = "ENGLISH: Active Polish family at outdoor park during weekend, father drinking from large water bottle after cycling, children playing nearby, morning sunlight, healthy lifestyle focus, Polish nature in background, fitness and family values combined (970x600px)"
-                        else:
-                            image_text = "ENGLISH: Polish family in modern home showcasing premium product, quality lifestyle focus, warm lighting, traditional values with modern functionality (970x600px)"
-                        seo_text = "Strategia SEO skoncentrowana na jakości polskiej"
-                        premium_label = "Premium Doświadczenie"
-                        premium_desc = "Najwyższa jakość zgodna z polskimi standardami i tradycjami rodzinnymi"
-                    elif marketplace_code == 'be':
-                        keywords_text = "qualité premium, marque de confiance, satisfaction client"
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            image_text = "ENGLISH: Belgian family in elegant home during holiday celebration, father enjoying premium headset while family gathers around, warm festive lighting with European decorations, RGB headset glowing, quality time together, Belgian hospitality and sophistication visible (970x600px)"
-                        elif 'kitchen' in product_category:
-                            image_text = "ENGLISH: Traditional Belgian kitchen during family meal preparation, grandmother using premium knife sharpener while family prepares European feast, warm lighting, fresh ingredients and traditional Belgian specialties, multi-generational cooking moment, European heritage elements visible (970x600px)"
-                        elif 'water' in product_category or 'bottle' in product_category:
-                            image_text = "ENGLISH: Active Belgian family at European countryside during weekend, father drinking from large water bottle after cycling, children playing nearby, golden sunlight, healthy lifestyle focus, Belgian landscapes in background, family values combined (970x600px)"
-                        else:
-                            image_text = "ENGLISH: Belgian family in modern European home showcasing premium product, quality lifestyle focus, warm lighting, traditional European values with modern functionality (970x600px)"
-                        seo_text = "Stratégie SEO axée sur la qualité belge"
-                        premium_label = "Expérience Premium"
-                        premium_desc = "Qualité supérieure conforme aux standards belges et traditions européennes"
-                    elif marketplace_code == 'sg':
-                        keywords_text = "premium quality Singapore excellence, trusted brand multicultural, customer satisfaction guaranteed Singapore"
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            image_text = "ENGLISH: Elegant Singaporean family in premium HDB apartment during Chinese New Year reunion celebration, father experiencing luxury gaming headset while multi-generational family shares prosperity feast, authentic red lanterns with Singapore skyline view, warm festive lighting, RGB headset illuminating modern Asian décor, harmony between traditional values and cutting-edge technology, Merlion visible through window, Singapore multicultural unity and hospitality essence captured (970x600px)"
-                        elif 'kitchen' in product_category:
-                            image_text = "ENGLISH: Contemporary Singapore HDB kitchen during festive meal preparation, experienced grandmother demonstrating premium knife sharpener while family prepares traditional laksa and bak kwa, efficient modern kitchen with Marina Bay view, fresh tropical ingredients and local hawker-inspired specialties, multi-generational cooking wisdom, Singapore's rich food heritage and innovation visible, authentic Lion City atmosphere (970x600px)"
-                        elif 'water' in product_category or 'bottle' in product_category:
-                            image_text = "ENGLISH: Active Singaporean family exercising at Marina Bay Sands area during golden hour weekend, father hydrating from premium water bottle after MRT commute and jogging, children playing with Gardens by the Bay backdrop, golden tropical sunlight filtering through urban canopy, healthy Singapore lifestyle focus, iconic landmarks including Singapore Flyer visible, modern tropical city living excellence (970x600px)"
-                        else:
-                            image_text = "ENGLISH: Sophisticated Singaporean family in modern executive HDB showcasing premium product, quality lifestyle excellence focus, contemporary lighting with tropical ambiance, perfect blend of traditional Asian family values with Singapore's technological innovation and efficiency, multicultural harmony and Lion City prosperity visible, authentic Singapore living standard (970x600px)"
-                        seo_text = "Advanced SEO strategy optimized for Singapore market excellence and multicultural search patterns"
-                        premium_label = "Singapore Premium Excellence"
-                        premium_desc = "Superior quality engineered for Singapore standards, tropical climate durability, and multicultural family traditions"
-                    elif marketplace_code == 'uk':
-                        keywords_text = "premium quality British excellence, trusted brand heritage, customer satisfaction guaranteed Britain"
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            image_text = "ENGLISH: Distinguished British family in elegant Georgian home during Boxing Day celebration, father enjoying premium gaming headset while multi-generational family gathers around traditional fireplace, festive Christmas decorations visible, warm ambient lighting, RGB headset complementing sophisticated British interior, harmony between British heritage and modern technology, Big Ben visible through window, authentic British refinement and tradition captured (970x600px)"
-                        elif 'kitchen' in product_category:
-                            image_text = "ENGLISH: Elegant British kitchen during Sunday roast preparation, experienced cook demonstrating premium knife sharpener while family prepares traditional Yorkshire pudding and beef roast, classic Shaker-style kitchen with countryside view, fresh British ingredients and seasonal vegetables, multi-generational cooking traditions, Britain's rich culinary heritage and innovation visible, authentic British home cooking excellence (970x600px)"
-                        elif 'water' in product_category or 'bottle' in product_category:
-                            image_text = "ENGLISH: Active British family exercising in Hyde Park during crisp autumn morning, father hydrating from premium water bottle after morning jog and cycling, children playing with London Eye backdrop, golden British sunlight filtering through changing leaves, healthy British outdoor lifestyle focus, iconic landmarks including Tower Bridge visible, modern British urban living excellence (970x600px)"
-                        else:
-                            image_text = "ENGLISH: Sophisticated British family in refined home showcasing premium product, quality lifestyle excellence focus, natural lighting with British countryside ambiance, perfect blend of traditional British values with Britain's technological innovation and reliability, authentic British heritage and modern prosperity visible, distinguished British living standard (970x600px)"
-                        seo_text = "Advanced SEO strategy optimized for British market excellence and sophisticated search patterns"
-                        premium_label = "British Premium Excellence"
-                        premium_desc = "Superior quality engineered for British standards, weather durability, and traditional British family values"
-                    elif marketplace_code == 'au':
-                        keywords_text = "premium quality Australian excellence, trusted brand fair dinkum, customer satisfaction guaranteed Australia"
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            image_text = "ENGLISH: Authentic Australian family in modern Queensland home during Australia Day celebration, father experiencing premium gaming headset while multi-generational family enjoys backyard BBQ, Southern Cross visible in twilight sky, warm golden hour lighting, RGB headset illuminating contemporary Australian décor, harmony between laid-back Aussie culture and cutting-edge technology, Sydney Harbour Bridge visible in distance, Australian mateship and hospitality essence captured (970x600px)"
-                        elif 'kitchen' in product_category:
-                            image_text = "ENGLISH: Contemporary Australian kitchen during weekend family cooking, experienced grandmother demonstrating premium knife sharpener while family prepares traditional meat pies and pavlova, modern open-plan kitchen with bushland view, fresh local ingredients and Australian specialties, multi-generational cooking wisdom, Australia's rich culinary heritage and innovation visible, authentic Aussie fair dinkum atmosphere (970x600px)"
-                        elif 'water' in product_category or 'bottle' in product_category:
-                            image_text = "ENGLISH: Active Australian family exercising at Bondi Beach area during golden hour weekend, father hydrating from premium water bottle after surfing and beach run, children playing with Sydney Opera House backdrop, warm Australian sunlight filtering through coastal environment, healthy Aussie outdoor lifestyle focus, iconic landmarks including Harbour Bridge visible, modern Australian coastal living excellence (970x600px)"
-                        else:
-                            image_text = "ENGLISH: Relaxed Australian family in modern home showcasing premium product, quality lifestyle excellence focus, natural lighting with outback ambiance, perfect blend of traditional Aussie values with Australia's technological innovation and efficiency, fair dinkum mateship and Australian prosperity visible, authentic Australian living standard (970x600px)"
-                        seo_text = "Advanced SEO strategy optimized for Australian market excellence and fair dinkum search patterns"
-                        premium_label = "Australian Premium Excellence"
-                        premium_desc = "Superior quality engineered for Australian standards, extreme climate durability, and fair dinkum family traditions"
-                    else:
-                        keywords_text = "premium, quality, trust"
-                        image_text = "Hero lifestyle image (970x600px)"
-                        seo_text = "Quality-focused SEO strategy"
-                        premium_label = "Premium Experience"
-                        premium_desc = "Superior design and quality standards"
-                    
-                    hero_html = f"""
-    <div class="aplus-section-card bg-blue-50 border-blue-200 border-2 rounded-lg p-4 sm:p-6 mb-6 mx-2 sm:mx-0 shadow-sm hover:shadow-md transition-shadow">
-        <div class="flex items-center mb-4">
-            <span class="text-2xl sm:text-3xl mr-3">🚀</span>
-            <div class="flex-1">
-                <h3 class="text-blue-900 text-xl sm:text-2xl font-bold">{listing.hero_title}</h3>
-                <p class="text-gray-600 text-sm mt-1">Hero section with brand story and value proposition</p>
-            </div>
-        </div>
-        <div class="content-section bg-white rounded-lg p-4 mb-4 border">
-            <p class="text-gray-700 leading-relaxed text-sm sm:text-base">{listing.hero_content}</p>
-        </div>
-        <div class="seo-details mt-4">
-            <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🔍</span>
-                        <strong class="text-gray-900">{localized_labels['keywords']}</strong>
-                    </div>
-                    <p class="text-gray-600">{keywords_text}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">📸</span>
-                        <strong class="text-gray-900">{localized_labels['image_strategy']}</strong>
-                    </div>
-                    <p class="text-gray-600">{image_text}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🎯</span>
-                        <strong class="text-gray-900">{localized_labels['seo_focus']}</strong>
-                    </div>
-                    <p class="text-gray-600">{seo_text}</p>
-                </div>
-            </div>
-        </div>
-    </div>"""
-                    sections_html.append(hero_html)
-                
-                # Create features section from actual bullet points with new box design
-                if listing.bullet_points or listing.features:
-                    # Use bullet points if available, otherwise fall back to features
-                    if listing.bullet_points:
-                        bullet_list = listing.bullet_points.split('\n') if isinstance(listing.bullet_points, str) else listing.bullet_points
-                        # Clean bullet points (remove emojis and bullet formatting for features section)
-                        clean_bullets = []
-                        for bullet in bullet_list[:6]:
-                            # Remove emojis and common bullet prefixes
-                            clean_bullet = bullet.strip()
-                            if clean_bullet.startswith('🔋') or clean_bullet.startswith('🎧') or clean_bullet.startswith('⭐'):
-                                # Extract main content after emoji and colon
-                                parts = clean_bullet.split(':', 1)
-                                if len(parts) > 1:
-                                    clean_bullet = parts[1].strip()
-                            clean_bullets.append(clean_bullet)
-                        features_items = '\n'.join([f"<li class='mb-2'>{feature}</li>" for feature in clean_bullets if feature])
-                    else:
-                        features_list = listing.features.split('\n') if isinstance(listing.features, str) else listing.features
-                        features_items = '\n'.join([f"<li class='mb-2'>{feature}</li>" for feature in features_list[:6]])
-                    
-                    # Get marketplace and culture-specific keywords for features
-                    product_category = getattr(product, 'categories', '').lower() if hasattr(product, 'categories') else ''
-                    
-                    if marketplace_code == 'jp':
-                        # Japanese culture: emphasizes quality, safety, and group harmony
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "高音質, ノイズキャンセリング, 長時間再生, 快適装着"
-                        elif 'kitchen' in product_category or 'cutting' in product_category:
-                            features_keywords = "衛生的, 食洗機対応, 安全設計, 長持ち"
-                        elif 'electronics' in product_category:
-                            features_keywords = "省エネ, 高性能, 操作簡単, 日本製品質"
-                        else:
-                            features_keywords = "高品質, 安全性, 使いやすさ, 長期保証"
-                        # Japanese image: clean, minimalist, technical precision
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "清潔な白背景で機能を精密に表示、日本語説明付き (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "日本の台所で使用シーン、清潔感と機能性を強調 (1500x1500px)"
-                        else:
-                            features_image = "機能詳細図解、日本語ラベル付き (1500x1500px)"
-                        features_seo = "機能キーワード最適化戦略"
-                    elif marketplace_code == 'br':
-                        # Brazil culture: vibrant, family-oriented, celebration
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "som cristalino, cancelamento ruído, bateria longa, confortável"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "cozinha prática, família brasileira, durável, fácil limpeza"
-                        else:
-                            features_keywords = "qualidade premium, garantia estendida, suporte brasileiro"
-                        # Brazil image descriptions in Portuguese
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "Pessoa usando fones em ambiente tropical, destaque para recursos técnicos com ícones coloridos (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "Cozinha brasileira moderna mostrando produto em uso, família preparando refeição (1500x1500px)"
-                        else:
-                            features_image = "Infográfico com recursos detalhados, cores vibrantes do Brasil (1500x1500px)"
-                        features_seo = "Otimização para palavras-chave de recursos técnicos"
-                    elif marketplace_code == 'mx':
-                        # Mexico culture: family values, warmth, tradition
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "sonido superior, cancelación ruido, batería duradera, comodidad total"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "cocina mexicana, tradición familiar, resistente, práctico"
-                        else:
-                            features_keywords = "calidad certificada, garantía mexicana, servicio local"
-                        # Mexico image descriptions in Spanish
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "Usuario disfrutando música en sala familiar mexicana, características destacadas con iconos (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "Cocina tradicional mexicana con producto destacado, familia reunida (1500x1500px)"
-                        else:
-                            features_image = "Gráfico de características con diseño mexicano colorido (1500x1500px)"
-                        features_seo = "SEO optimizado para características técnicas en México"
-                    elif marketplace_code == 'in':
-                        # India culture: daily cooking, gifting, family traditions
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "superior sound, festival music, family entertainment, diwali gift perfect"
-                        elif 'kitchen' in product_category or 'knife' in product_category:
-                            features_keywords = "daily indian cooking, dal sabzi preparation, ginger garlic chopping, festival gifting ideal"
-                        else:
-                            features_keywords = "certified quality, indian warranty, festival gift ready, local service"
-                        # India image descriptions focused on Indian cooking lifestyle
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "Indian family enjoying festival music at home, features highlighted with rangoli decorations (1500x1500px)"
-                        elif 'kitchen' in product_category or 'knife' in product_category:
-                            features_image = "Indian mother preparing dal sabzi in traditional kitchen, knife set prominently displayed with fresh vegetables like onions ginger garlic, warm lighting (1500x1500px)"
-                        else:
-                            features_image = "Feature infographic with Indian festival motifs and family cooking focus (1500x1500px)"
-                        features_seo = "SEO optimised for Indian cooking and gifting keywords"
-                    elif marketplace_code == 'eg':
-                        # Egypt culture: family values, Nile heritage, tradition
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "صوت فائق، إلغاء الضوضاء، بطارية طويلة، راحة العائلة المصرية"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "مطبخ مصري، تقاليد عائلية، تراث النيل، مقاوم، عملي"
-                        else:
-                            features_keywords = "جودة معتمدة، ضمان مصري، خدمة محلية، تراث فرعوني"
-                        # Egypt image descriptions in Arabic
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "مستخدم مصري يستمتع بالموسيقى في صالة عائلية مصرية، ميزات بارزة مع أيقونات مصرية (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "مطبخ مصري تقليدي مع المنتج البارز، عائلة مصرية مجتمعة، تراث النيل (1500x1500px)"
-                        else:
-                            features_image = "رسوم بيانية للميزات بتصميم مصري ملون، رموز فرعونية (1500x1500px)"
-                        features_seo = "تحسين محركات البحث للميزات التقنية في مصر"
-                    elif marketplace_code == 'sa':
-                        # Saudi culture: family values, luxury, tradition
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "صوت فائق، إلغاء الضوضاء، بطارية طويلة، راحة كاملة"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "مطبخ سعودي، تقاليد عائلية، مقاوم، عملي"
-                        else:
-                            features_keywords = "جودة معتمدة، ضمان سعودي، خدمة محلية"
-                        # Saudi image descriptions in Arabic
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "مستخدم يستمتع بالموسيقى في صالة عائلية سعودية، ميزات بارزة مع أيقونات (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "مطبخ سعودي تقليدي مع المنتج البارز، عائلة مجتمعة (1500x1500px)"
-                        else:
-                            features_image = "رسوم بيانية للميزات بتصميم سعودي ملون (1500x1500px)"
-                        features_seo = "تحسين محركات البحث للميزات التقنية في السعودية"
-                    elif marketplace_code == 'pl':
-                        # Poland culture: family values, Catholic traditions, quality focus
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "dźwięk doskonały, redukcja hałasu, bateria długotrwała, komfort rodzinny polski"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "kuchnia polska, tradycja rodzinna, wytrzymały, praktyczny"
-                        else:
-                            features_keywords = "jakość certyfikowana, gwarancja polska, serwis lokalny, tradycja katolicka"
-                        # Poland image descriptions in English (like Mexico)
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "ENGLISH: Grid of 6 feature images: 1) Close-up on noise-canceling switch, 2) 50mm driver cross-section with sound waves, 3) battery indicator showing 30h, 4) RGB lights glowing, 5) bluetooth connected to phone and console, 6) Polish user wearing comfortably during gaming session"
-                        elif 'kitchen' in product_category:
-                            features_image = "ENGLISH: Traditional Polish kitchen with product prominently displayed, Polish family gathered, heritage elements (1500x1500px)"
-                        else:
-                            features_image = "ENGLISH: Feature infographic with Polish colorful design elements (1500x1500px)"
-                        features_seo = "SEO zoptymalizowane dla cech technicznych w Polsce"
-                    elif marketplace_code == 'nl':
-                        # Netherlands culture: practical, quality-conscious, direct
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "uitstekend geluid, ruisonderdrukking, lange batterij, comfortabel"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "praktisch keukengereedschap, duurzaam, makkelijk schoon"
-                        else:
-                            features_keywords = "Nederlandse kwaliteit, garantie, betrouwbaar"
-                        # Netherlands image descriptions in Dutch
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "Nederlandse professional met koptelefoon in modern kantoor, technische details zichtbaar (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "Moderne Nederlandse keuken met product in gebruik, praktische toepassingen (1500x1500px)"
-                        else:
-                            features_image = "Technische specificaties overzicht, Nederlandse stijl design (1500x1500px)"
-                        features_seo = "SEO voor technische kenmerken in Nederland"
-                    elif marketplace_code == 'tr':
-                        # Turkey culture: hospitality, family, quality focus
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "kristal ses, gürültü engelleme, uzun pil, rahat kullanım"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "Türk mutfağı, aile boyu, dayanıklı, kolay temizlik"
-                        else:
-                            features_keywords = "kalite belgeli, Türkiye garantisi, yerli destek"
-                        # Turkey detailed ENGLISH image descriptions like Poland
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "ENGLISH: Grid of 6 feature images: 1) Close-up on noise-canceling switch, 2) 50mm driver cross-section with sound waves, 3) battery indicator showing 30h, 4) RGB lights glowing, 5) bluetooth connected to phone and console, 6) Turkish user wearing comfortably during gaming session"
-                        elif 'kitchen' in product_category:
-                            features_image = "ENGLISH: Traditional Turkish kitchen with product prominently displayed, Turkish family gathered around dining table, heritage elements and warm hospitality atmosphere (1500x1500px)"
-                        else:
-                            features_image = "ENGLISH: Turkish family using product in daily situations, home lifestyle applications with traditional hospitality elements (1500x1500px)"
-                        features_seo = "Teknik özellikler için SEO optimizasyonu Türkiye'de"
-                    elif marketplace_code == 'es':
-                        # Spanish culture: emphasizes family, passion, and value
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "sonido cristalino, comodidad familiar, música perfecta"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "cocina familiar, ingredientes frescos, tradición culinaria"
-                        else:
-                            features_keywords = "calidad superior, diseño elegante, valor familiar"
-                        # Spanish image: warm, family-oriented, lifestyle context
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "Familia española disfrutando música juntos, ambiente cálido (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "Cocina familiar española, preparando comida tradicional (1500x1500px)"
-                        else:
-                            features_image = "Infografía con estilo mediterráneo, colores cálidos (1500x1500px)"
-                        features_seo = "Estrategia SEO de características"
-                    elif marketplace_code == 'de':
-                        # German culture: emphasizes precision, engineering, and efficiency
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "Präzisionssound, deutsche Ingenieurskunst, Effizienz"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "Präzisionsschnitt, deutsche Qualität, Langlebigkeit"
-                        else:
-                            features_keywords = "Ingenieursqualität, Präzision, Zuverlässigkeit, Effizienz"
-                        # German image: precise, technical, engineering-focused
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "Technische Präzision, Ingenieursqualität, deutsche Standards (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "Deutsche Küche, Präzision und Qualität im Detail (1500x1500px)"
-                        else:
-                            features_image = "Präzise Feature-Infografik, deutsche Ingenieurskunst (1500x1500px)"
-                        features_seo = "Feature-SEO-Strategie"
-                    elif marketplace_code == 'fr':
-                        # French culture: emphasizes elegance, style, and sophistication
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "élégance sonore, raffinement français, art de vivre"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "art culinaire, raffinement, élégance française"
-                        else:
-                            features_keywords = "sophistication, élégance française, art de vivre, raffinement"
-                        # French image: elegant, sophisticated, artistic
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "Ambiance parisienne élégante, sophistication musicale (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "Art culinaire français, raffinement et élégance (1500x1500px)"
-                        else:
-                            features_image = "Infographie sophistiquée, style français raffiné (1500x1500px)"
-                        features_seo = "Stratégie SEO des fonctionnalités"
-                    elif marketplace_code == 'sg':
-                        # Singapore culture: emphasizes efficiency, multiculturalism, technology integration, tropical lifestyle
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "premium Singapore sound excellence, wireless MRT-friendly, all-day tropical comfort, multicultural audio experience"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "professional hawker-grade quality, easy tropical cleanup, modern HDB kitchen design, Singapore culinary innovation"
-                        else:
-                            features_keywords = "innovative Singapore design, high-performance tropical durability, user-friendly Lion City technology, premium multicultural quality"
-                        # Singapore image: efficient urban lifestyle, tropical innovation, multicultural harmony
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "ENGLISH: Grid of 6 premium feature images: 1) Close-up noise-canceling switch with Singapore skyline reflection, 2) 50mm driver cross-section with sound waves over Marina Bay, 3) Battery indicator showing 30h with tropical humidity resistance, 4) RGB lights glowing against HDB apartment evening, 5) Bluetooth connected to phone and gaming console in modern Singapore home, 6) Multicultural Singaporean family wearing comfortably during gaming session with Gardens by the Bay backdrop (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "ENGLISH: Contemporary Singapore kitchen features grid: 1) Diamond disc precision with tropical durability coating, 2) Ceramic disc with anti-humidity protection, 3) Premium walnut handle with Singapore climate resistance, 4) 15/20 degree angle guides for Asian and Western cuisine, 5) Hawker-chef demonstrating professional technique, 6) Modern HDB kitchen with Marina Bay view showcasing efficiency (1500x1500px)"
-                        else:
-                            features_image = "ENGLISH: Dynamic Singapore features showcase: innovative design meeting tropical climate demands, efficiency-focused urban lifestyle, multicultural family harmony, Lion City quality standards, modern technology integration with traditional Asian values, Singapore excellence visible (1500x1500px)"
-                        features_seo = "Advanced feature SEO strategy optimized for Singapore market and tropical lifestyle"
-                    elif marketplace_code == 'uk':
-                        # British culture: emphasizes heritage, sophistication, weather resilience, refined quality
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "premium British sound excellence, wireless commuter-friendly, all-day refined comfort, sophisticated audio experience"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "professional Sunday-roast quality, easy sophisticated cleanup, modern British kitchen design, refined culinary innovation"
-                        else:
-                            features_keywords = "innovative British design, high-performance weather durability, user-friendly sophisticated technology, premium refined quality"
-                        # British image: heritage lifestyle, weather innovation, family sophistication
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "ENGLISH: Grid of 6 premium British feature images: 1) Close-up noise-canceling switch with London Thames reflection, 2) 50mm driver cross-section with sound waves over Stonehenge, 3) Battery indicator showing 30h with UK weather resistance, 4) RGB lights glowing against Scottish Highlands sunset, 5) Bluetooth connected to phone and gaming console in refined British home, 6) Distinguished British family wearing comfortably during gaming session with Buckingham Palace backdrop (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "ENGLISH: Classic British kitchen features grid: 1) Diamond disc precision with weather durability coating, 2) Ceramic disc with humidity and rain protection, 3) Premium oak handle with British climate resistance, 4) 15/20 degree angle guides for roast and traditional cuisine, 5) British chef demonstrating professional technique, 6) Traditional country kitchen with countryside view showcasing efficiency (1500x1500px)"
-                        else:
-                            features_image = "ENGLISH: Dynamic British features showcase: innovative design meeting changeable weather demands, heritage-focused lifestyle, sophisticated family harmony, British quality standards, modern technology integration with traditional British values, refined British excellence visible (1500x1500px)"
-                        features_seo = "Advanced feature SEO strategy optimized for British market and sophisticated lifestyle"
-                    elif marketplace_code == 'au':
-                        # Australian culture: emphasizes mateship, outdoor lifestyle, extreme climate durability, fair dinkum quality
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "premium Australian sound excellence, wireless outback-friendly, all-day extreme comfort, fair dinkum audio experience"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "professional BBQ-grade quality, easy extreme cleanup, modern Australian kitchen design, fair dinkum culinary innovation"
-                        else:
-                            features_keywords = "innovative Australian design, high-performance extreme durability, user-friendly Aussie technology, premium fair dinkum quality"
-                        # Australian image: rugged outdoor lifestyle, extreme climate innovation, mateship harmony
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "ENGLISH: Grid of 6 premium Australian feature images: 1) Close-up noise-canceling switch with Sydney Harbour reflection, 2) 50mm driver cross-section with sound waves over Uluru, 3) Battery indicator showing 30h with extreme climate resistance, 4) RGB lights glowing against Queensland sunset, 5) Bluetooth connected to phone and gaming console in modern Australian home, 6) Fair dinkum Australian family wearing comfortably during gaming session with Great Barrier Reef backdrop (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "ENGLISH: Contemporary Australian kitchen features grid: 1) Diamond disc precision with extreme climate coating, 2) Ceramic disc with dust and humidity protection, 3) Premium eucalyptus handle with Australian climate resistance, 4) 15/20 degree angle guides for BBQ and traditional cuisine, 5) Aussie chef demonstrating professional technique, 6) Modern open-plan kitchen with bushland view showcasing efficiency (1500x1500px)"
-                        else:
-                            features_image = "ENGLISH: Dynamic Australian features showcase: innovative design meeting extreme climate demands, outdoor-focused lifestyle, mateship family harmony, fair dinkum quality standards, modern technology integration with traditional Aussie values, Australian excellence visible (1500x1500px)"
-                        features_seo = "Advanced feature SEO strategy optimized for Australian market and extreme climate lifestyle"
-                    else:
-                        # USA/International: emphasizes innovation, performance, convenience
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_keywords = "premium sound, wireless freedom, all-day comfort"
-                        elif 'kitchen' in product_category:
-                            features_keywords = "professional grade, easy cleanup, modern design"
-                        else:
-                            features_keywords = "innovative design, high performance, user-friendly, premium quality"
-                        # USA/International image: dynamic, innovative, lifestyle-focused
-                        if 'audio' in product_category or 'headphone' in product_category:
-                            features_image = "Modern lifestyle, wireless freedom, urban setting (1500x1500px)"
-                        elif 'kitchen' in product_category:
-                            features_image = "Modern American kitchen, innovative cooking (1500x1500px)"
-                        else:
-                            features_image = "Dynamic features showcase, innovation-focused (1500x1500px)"
-                        features_seo = "Feature-focused SEO strategy"
-                    
-                    features_html = f"""
-    <div class="aplus-section-card bg-green-50 border-green-200 border-2 rounded-lg p-4 sm:p-6 mb-6 mx-2 sm:mx-0 shadow-sm hover:shadow-md transition-shadow">
-        <div class="flex items-center mb-4">
-            <span class="text-2xl sm:text-3xl mr-3">⭐</span>
-            <div class="flex-1">
-                <h3 class="text-green-900 text-xl sm:text-2xl font-bold">{localized_labels.get('features_title', 'Key Features & Benefits')}</h3>
-                <p class="text-gray-600 text-sm mt-1">{'Ürün özellikleri ve faydaları bölümü' if marketplace_code == 'tr' else 'Features section with product advantages and benefits'}</p>
-            </div>
-        </div>
-        <div class="content-section bg-white rounded-lg p-4 mb-4 border">
-            <ul class="text-gray-700 text-sm sm:text-base list-disc pl-5">
-                {features_items}
-            </ul>
-        </div>
-        <div class="seo-details mt-4">
-            <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🔍</span>
-                        <strong class="text-gray-900">{localized_labels['keywords']}</strong>
-                    </div>
-                    <p class="text-gray-600">{features_keywords}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">📸</span>
-                        <strong class="text-gray-900">{localized_labels['image_strategy']}</strong>
-                    </div>
-                    <p class="text-gray-600">{features_image}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🎯</span>
-                        <strong class="text-gray-900">{localized_labels['seo_focus']}</strong>
-                    </div>
-                    <p class="text-gray-600">{features_seo}</p>
-                </div>
-            </div>
-        </div>
-    </div>"""
-                    sections_html.append(features_html)
-                
-                # Create trust section from actual trust builders with new box design
-                if listing.trust_builders:
-                    trust_list = listing.trust_builders.split('\n') if isinstance(listing.trust_builders, str) else listing.trust_builders
-                    trust_items = '\n'.join([f"<li class='mb-2'>{trust}</li>" for trust in trust_list[:5]])
-                    
-                    # Get marketplace and culture-specific trust keywords
-                    if marketplace_code == 'jp':
-                        # Japanese culture: trust through group consensus and long-term reliability
-                        trust_keywords = "みんなが選ぶ安心, 長期保証, 日本品質基準, アフターサポート"
-                        # Japanese trust image: group consensus, long-term thinking
-                        trust_image = "日本の家族が安心して使用、信頼の証、認証マーク (1200x800px)"
-                        trust_seo = "信頼性重視のSEO戦略"
-                    elif marketplace_code == 'br':
-                        # Brazil culture: trust through social proof and guarantees
-                        trust_keywords = "garantia estendida, certificado INMETRO, qualidade brasileira, nota fiscal"
-                        # Brazil trust image descriptions in Portuguese
-                        trust_image = "Selos de certificação brasileiros, depoimentos de clientes satisfeitos, garantia destacada (1200x800px)"
-                        trust_seo = "SEO focado em confiança e garantias"
-                    elif marketplace_code == 'mx':
-                        # Mexico culture: trust through family recommendations
-                        trust_keywords = "garantía mexicana, certificado calidad, recomendado familias, servicio local"
-                        # Mexico trust image descriptions in Spanish
-                        trust_image = "Certificaciones mexicanas visibles, testimonios familias mexicanas, sellos de garantía (1200x800px)"
-                        trust_seo = "Estrategia SEO de confianza y calidad"
-                    elif marketplace_code == 'in':
-                        # India culture: trust through family recommendations and gifting confidence
-                        trust_keywords = "indian warranty ISI certified, quality certificate genuine, recommended by families, perfect gifting confidence, local service support"
-                        # India trust image descriptions focused on Indian quality and gifting
-                        trust_image = "Indian quality certifications ISI BIS visible, happy Indian families using product during festival cooking, warranty certificate with GST invoice (1200x800px)"
-                        trust_seo = "SEO strategy for Indian trust and gifting confidence"
-                    elif marketplace_code == 'eg':
-                        # Egypt culture: trust through family recommendations and cultural heritage
-                        trust_keywords = "ضمان مصري، شهادة جودة، موصى به من العائلات المصرية، خدمة محلية، تراث فرعوني"
-                        # Egypt trust image descriptions in Arabic with cultural elements
-                        trust_image = "شهادات مصرية مرئية، شهادات من العائلات المصرية، أختام الضمان المصري، رموز تراثية (1200x800px)"
-                        trust_seo = "استراتيجية تحسين محركات البحث للثقة والجودة المصرية"
-                    elif marketplace_code == 'sa':
-                        # Saudi culture: trust through family recommendations
-                        trust_keywords = "ضمان سعودي، شهادة جودة، موصى به من العائلات، خدمة محلية"
-                        # Saudi trust image descriptions in Arabic
-                        trust_image = "شهادات سعودية مرئية، شهادات من العائلات السعودية، أختام الضمان (1200x800px)"
-                        trust_seo = "استراتيجية تحسين محركات البحث للثقة والجودة"
-                    elif marketplace_code == 'pl':
-                        # Poland culture: trust through family recommendations and Catholic values
-                        trust_keywords = "gwarancja polska, certyfikat jakości, polecane rodzinom polskim, serwis lokalny, tradycja katolicka"
-                        # Poland trust image descriptions in English (like Mexico)
-                        trust_image = "ENGLISH: Display of Polish certification badge, Poland flag icon, 2-year warranty card, customer review average 4.8 stars, presented in premium style with Catholic heritage elements"
-                        trust_seo = "Strategia SEO dla zaufania i jakości polskiej"
-                    elif marketplace_code == 'nl':
-                        # Netherlands culture: trust through quality and reliability
-                        trust_keywords = "CE keurmerk, Nederlandse garantie, betrouwbare kwaliteit, klantenservice"
-                        # Netherlands trust image descriptions in Dutch
-                        trust_image = "CE certificering zichtbaar, Nederlandse kwaliteitskeurmerken, garantiebewijzen (1200x800px)"
-                        trust_seo = "SEO strategie voor vertrouwen"
-                    elif marketplace_code == 'tr':
-                        # Turkey culture: trust through certifications and local support
-                        trust_keywords = "TSE belgesi, CE sertifikası, 2 yıl garanti, Türkiye destek"
-                        # Turkey trust image descriptions with detailed ENGLISH descriptions like Poland
-                        trust_image = "ENGLISH: Display of Turkish certification badge, Turkey flag icon, 2-year warranty card, customer review average 4.8 stars, presented in premium style with Turkish hospitality elements"
-                        trust_seo = "Güven ve kalite için SEO stratejisi Türkiye'de"
-                    elif marketplace_code == 'es':
-                        # Spanish culture: trust through family recommendations and community
-                        trust_keywords = "recomendado por familias, garantía extendida, servicio al cliente"
-                        # Spanish trust image: family recommendations, community
-                        trust_image = "Familia española recomendando producto, comunidad de confianza (1200x800px)"
-                        trust_seo = "Estrategia SEO de confianza"
-                    elif marketplace_code == 'de':
-                        # German culture: trust through certifications and technical standards
-                        trust_keywords = "TÜV-geprüft, deutsche Qualitätsnormen, Zertifizierung, Compliance"
-                        # German trust image: certifications, technical standards
-                        trust_image = "TÜV-Zertifikate, deutsche Qualitätsnormen, technische Prüfung (1200x800px)"
-                        trust_seo = "Vertrauens-SEO-Strategie"
-                    elif marketplace_code == 'fr':
-                        # French culture: trust through heritage and artisanal quality
-                        trust_keywords = "tradition française, savoir-faire, qualité artisanale, héritage"
-                        # French trust image: heritage, artisanal quality
-                        trust_image = "Tradition française, savoir-faire artisanal, héritage qualité (1200x800px)"
-                        trust_seo = "Stratégie SEO de confiance"
-                    else:
-                        # USA/International: trust through reviews and money-back guarantees
-                        trust_keywords = "5-star reviews, money-back guarantee, customer satisfaction, verified quality"
-                        # USA trust image: reviews, satisfaction guarantees
-                        trust_image = "Customer reviews, 5-star ratings, satisfaction guarantee (1200x800px)"
-                        trust_seo = "Trust-focused SEO strategy"
-                    
-                    trust_html = f"""
-    <div class="aplus-section-card bg-purple-50 border-purple-200 border-2 rounded-lg p-4 sm:p-6 mb-6 mx-2 sm:mx-0 shadow-sm hover:shadow-md transition-shadow">
-        <div class="flex items-center mb-4">
-            <span class="text-2xl sm:text-3xl mr-3">🛡️</span>
-            <div class="flex-1">
-                <h3 class="text-purple-900 text-xl sm:text-2xl font-bold">{localized_labels.get('trust_title', 'Why Trust This Product')}</h3>
-                <p class="text-gray-600 text-sm mt-1">{'Kalite güvencesi ve garantiler bölümü' if marketplace_code == 'tr' else 'Trust section with quality assurance and guarantees'}</p>
-            </div>
-        </div>
-        <div class="content-section bg-white rounded-lg p-4 mb-4 border">
-            <ul class="text-gray-700 text-sm sm:text-base list-disc pl-5">
-                {trust_items}
-            </ul>
-        </div>
-        <div class="seo-details mt-4">
-            <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🔍</span>
-                        <strong class="text-gray-900">{localized_labels['keywords']}</strong>
-                    </div>
-                    <p class="text-gray-600">{trust_keywords}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">📸</span>
-                        <strong class="text-gray-900">{localized_labels['image_strategy']}</strong>
-                    </div>
-                    <p class="text-gray-600">{trust_image}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🎯</span>
-                        <strong class="text-gray-900">{localized_labels['seo_focus']}</strong>
-                    </div>
-                    <p class="text-gray-600">{trust_seo}</p>
-                </div>
-            </div>
-        </div>
-    </div>"""
-                    sections_html.append(trust_html)
-                
-                # Create Usage/Applications section (Section 4)
-                if listing.features or listing.hero_content:
-                    if marketplace_code == 'tr':
-                        usage_content = "Günlük kullanım, çok amaçlı uygulamalar, pratik ve kullanışlı çözümler sunar."
-                        usage_keywords = "günlük kullanım, çok amaçlı, praktik, kullanışlı"
-                        usage_image = "ENGLISH: Turkish family using product in various daily situations, home lifestyle applications with traditional hospitality elements (1500x1500px)"
-                        usage_seo = "Kullanım senaryoları için SEO optimizasyonu"
-                        usage_title = "Kullanım Alanları"
-                    elif marketplace_code == 'pl':
-                        usage_content = "Codzienne użytkowanie, wszechstronne zastosowania, praktyczne i wygodne rozwiązania dla polskiej rodziny."
-                        usage_keywords = "codzienne użycie, wszechstronne zastosowania, praktyczny, wygodny"
-                        usage_image = "ENGLISH: Polish family using product in various daily situations, home lifestyle applications (1500x1500px)"
-                        usage_seo = "Strategia SEO dla zastosowań codziennych"
-                        usage_title = "Zastosowania"
-                    else:
-                        usage_content = "Everyday use, versatile applications, practical and convenient solutions."
-                        usage_keywords = "everyday use, versatile applications, practical, convenient"
-                        usage_image = "Product in various use cases, lifestyle applications (1500x1500px)"
-                        usage_seo = "Usage-focused SEO strategy"
-                        usage_title = "Applications"
-                    
-                    usage_html = f"""
-    <div class="aplus-section-card bg-orange-50 border-orange-200 border-2 rounded-lg p-4 sm:p-6 mb-6 mx-2 sm:mx-0 shadow-sm hover:shadow-md transition-shadow">
-        <div class="flex items-center mb-4">
-            <span class="text-2xl sm:text-3xl mr-3">🎯</span>
-            <div class="flex-1">
-                <h3 class="text-orange-900 text-xl sm:text-2xl font-bold">{usage_title}</h3>
-                <p class="text-gray-600 text-sm mt-1">{'Kullanım alanları ve uygulama senaryoları' if marketplace_code == 'tr' else 'Usage and application scenarios'}</p>
-            </div>
-        </div>
-        <div class="content-section bg-white rounded-lg p-4 mb-4 border">
-            <p class="text-gray-700 leading-relaxed text-sm sm:text-base">{usage_content}</p>
-        </div>
-        <div class="seo-details mt-4">
-            <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🔍</span>
-                        <strong class="text-gray-900">{localized_labels['keywords']}</strong>
-                    </div>
-                    <p class="text-gray-600">{usage_keywords}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">📸</span>
-                        <strong class="text-gray-900">{localized_labels['image_strategy']}</strong>
-                    </div>
-                    <p class="text-gray-600">{usage_image}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🎯</span>
-                        <strong class="text-gray-900">{localized_labels['seo_focus']}</strong>
-                    </div>
-                    <p class="text-gray-600">{usage_seo}</p>
-                </div>
-            </div>
-        </div>
-    </div>"""
-                    sections_html.append(usage_html)
-                
-                # Create Comparison section (Section 5)
-                if listing.features or listing.hero_content:
-                    if marketplace_code == 'tr':
-                        comparison_content = "Rakiplerinden üstün özellikler, daha iyi performans ve değer sunar."
-                        comparison_keywords = "rekabet avantajı, üstün seçim, temel farklılıklar"
-                        comparison_image = "ENGLISH: Comparison table highlighting product advantages, Turkish quality standards (1200x800px)"
-                        comparison_seo = "Karşılaştırma odaklı SEO"
-                        comparison_title = "Neden Bu Ürünü Seçmelisiniz"
-                    elif marketplace_code == 'pl':
-                        comparison_content = "Przewaga nad konkurencją dzięki lepszym funkcjom, wydajności i wartości dla polskich rodzin."
-                        comparison_keywords = "przewaga konkurencyjna, najlepszy wybór, kluczowe różnice"
-                        comparison_image = "ENGLISH: Comparison table highlighting product advantages, Polish quality standards (1200x800px)"
-                        comparison_seo = "SEO dla przewagi konkurencyjnej"
-                        comparison_title = "Dlaczego Wybrać Ten Produkt"
-                    else:
-                        comparison_content = "Superior features, better performance and value compared to competitors."
-                        comparison_keywords = "competitive advantage, superior choice, key differentiators"
-                        comparison_image = "Comparison table highlighting advantages (1200x800px)"
-                        comparison_seo = "Comparison-focused SEO"
-                        comparison_title = "Why Choose This Product"
-                    
-                    comparison_html = f"""
-    <div class="aplus-section-card bg-teal-50 border-teal-200 border-2 rounded-lg p-4 sm:p-6 mb-6 mx-2 sm:mx-0 shadow-sm hover:shadow-md transition-shadow">
-        <div class="flex items-center mb-4">
-            <span class="text-2xl sm:text-3xl mr-3">🏆</span>
-            <div class="flex-1">
-                <h3 class="text-teal-900 text-xl sm:text-2xl font-bold">{comparison_title}</h3>
-                <p class="text-gray-600 text-sm mt-1">{'Rekabet avantajları ve temel farklılıklar' if marketplace_code == 'tr' else 'Competitive advantages and key differentiators'}</p>
-            </div>
-        </div>
-        <div class="content-section bg-white rounded-lg p-4 mb-4 border">
-            <p class="text-gray-700 leading-relaxed text-sm sm:text-base">{comparison_content}</p>
-        </div>
-        <div class="seo-details mt-4">
-            <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🔍</span>
-                        <strong class="text-gray-900">{localized_labels['keywords']}</strong>
-                    </div>
-                    <p class="text-gray-600">{comparison_keywords}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">📸</span>
-                        <strong class="text-gray-900">{localized_labels['image_strategy']}</strong>
-                    </div>
-                    <p class="text-gray-600">{comparison_image}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🎯</span>
-                        <strong class="text-gray-900">{localized_labels['seo_focus']}</strong>
-                    </div>
-                    <p class="text-gray-600">{comparison_seo}</p>
-                </div>
-            </div>
-        </div>
-    </div>"""
-                    sections_html.append(comparison_html)
-                
-                # Create Customer testimonials section (Section 6)
-                if listing.hero_content:
-                    if marketplace_code == 'tr':
-                        testimonials_content = "Müşteri memnuniyeti garantili, doğrulanmış yorumlar ve 5 yıldızlı deneyimler."
-                        testimonials_keywords = "müşteri yorumları, doğrulanmış incelemeler, memnuniyet garantili"
-                        testimonials_image = "ENGLISH: Happy Turkish customers with 5-star ratings, family testimonials with hospitality elements (1200x800px)"
-                        testimonials_seo = "Sosyal kanıt SEO stratejisi"
-                        testimonials_title = "Müşteri Deneyimleri"
-                    elif marketplace_code == 'pl':
-                        testimonials_content = "Zadowolenie klientów gwarantowane, zweryfikowane opinie i 5-gwiazdkowe doświadczenia polskich rodzin."
-                        testimonials_keywords = "opinie klientów, zweryfikowane recenzje, zadowolenie gwarantowane"
-                        testimonials_image = "ENGLISH: Happy Polish customers with 5-star ratings, family testimonials (1200x800px)"
-                        testimonials_seo = "Strategia SEO dowodów społecznych"
-                        testimonials_title = "Zadowolenie Klientów"
-                    else:
-                        testimonials_content = "Customer satisfaction guaranteed, verified reviews and 5-star experiences."
-                        testimonials_keywords = "customer testimonials, verified reviews, satisfaction guaranteed"
-                        testimonials_image = "Happy customers with 5-star ratings (1200x800px)"
-                        testimonials_seo = "Social proof SEO strategy"
-                        testimonials_title = "Customer Satisfaction"
-                    
-                    testimonials_html = f"""
-    <div class="aplus-section-card bg-pink-50 border-pink-200 border-2 rounded-lg p-4 sm:p-6 mb-6 mx-2 sm:mx-0 shadow-sm hover:shadow-md transition-shadow">
-        <div class="flex items-center mb-4">
-            <span class="text-2xl sm:text-3xl mr-3">💬</span>
-            <div class="flex-1">
-                <h3 class="text-pink-900 text-xl sm:text-2xl font-bold">{testimonials_title}</h3>
-                <p class="text-gray-600 text-sm mt-1">{'Müşteri yorumları ve memnuniyet' if marketplace_code == 'tr' else 'Customer testimonials and satisfaction'}</p>
-            </div>
-        </div>
-        <div class="content-section bg-white rounded-lg p-4 mb-4 border">
-            <p class="text-gray-700 leading-relaxed text-sm sm:text-base">{testimonials_content}</p>
-        </div>
-        <div class="seo-details mt-4">
-            <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🔍</span>
-                        <strong class="text-gray-900">{localized_labels['keywords']}</strong>
-                    </div>
-                    <p class="text-gray-600">{testimonials_keywords}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">📸</span>
-                        <strong class="text-gray-900">{localized_labels['image_strategy']}</strong>
-                    </div>
-                    <p class="text-gray-600">{testimonials_image}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🎯</span>
-                        <strong class="text-gray-900">{localized_labels['seo_focus']}</strong>
-                    </div>
-                    <p class="text-gray-600">{testimonials_seo}</p>
-                </div>
-            </div>
-        </div>
-    </div>"""
-                    sections_html.append(testimonials_html)
-                
-                # Create Package contents section (Section 7)
-                if listing.features:
-                    if marketplace_code == 'tr':
-                        package_content = "Paket içeriği eksiksiz, premium ambalaj ve dahil edilen aksesuarlar."
-                        package_keywords = "paket içeriği, premium ambalaj, dahil aksesuarlar"
-                        package_image = "ENGLISH: Unboxing view with contents neatly displayed, Turkish quality packaging (1200x800px)"
-                        package_seo = "Paket içeriği SEO optimizasyonu"
-                        package_title = "Paket İçeriği"
-                    elif marketplace_code == 'pl':
-                        package_content = "Kompletna zawartość opakowania, premium pakowanie i dołączone akcesoria dla polskich klientów."
-                        package_keywords = "zawartość opakowania, premium pakowanie, dołączone akcesoria"
-                        package_image = "ENGLISH: Unboxing view with contents neatly displayed, Polish quality packaging (1200x800px)"
-                        package_seo = "SEO dla zawartości opakowania"
-                        package_title = "Zawartość Zestawu"
-                    else:
-                        package_content = "Complete package contents, premium packaging and included accessories."
-                        package_keywords = "package contents, premium packaging, included accessories"
-                        package_image = "Unboxing view with contents displayed (1200x800px)"
-                        package_seo = "Package contents SEO"
-                        package_title = "What's Included"
-                    
-                    package_html = f"""
-    <div class="aplus-section-card bg-indigo-50 border-indigo-200 border-2 rounded-lg p-4 sm:p-6 mb-6 mx-2 sm:mx-0 shadow-sm hover:shadow-md transition-shadow">
-        <div class="flex items-center mb-4">
-            <span class="text-2xl sm:text-3xl mr-3">📦</span>
-            <div class="flex-1">
-                <h3 class="text-indigo-900 text-xl sm:text-2xl font-bold">{package_title}</h3>
-                <p class="text-gray-600 text-sm mt-1">Package contents and included items</p>
-            </div>
-        </div>
-        <div class="content-section bg-white rounded-lg p-4 mb-4 border">
-            <p class="text-gray-700 leading-relaxed text-sm sm:text-base">{package_content}</p>
-        </div>
-        <div class="seo-details mt-4">
-            <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🔍</span>
-                        <strong class="text-gray-900">{localized_labels['keywords']}</strong>
-                    </div>
-                    <p class="text-gray-600">{package_keywords}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">📸</span>
-                        <strong class="text-gray-900">{localized_labels['image_strategy']}</strong>
-                    </div>
-                    <p class="text-gray-600">{package_image}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🎯</span>
-                        <strong class="text-gray-900">{localized_labels['seo_focus']}</strong>
-                    </div>
-                    <p class="text-gray-600">{package_seo}</p>
-                </div>
-            </div>
-        </div>
-    </div>"""
-                    sections_html.append(package_html)
-                
-                # Create FAQ section from actual FAQs with new box design
-                if listing.faqs:
-                    faq_list = listing.faqs.split('\n') if isinstance(listing.faqs, str) else listing.faqs
-                    faq_items = '\n'.join([f"<div class='mb-3'><p class='font-semibold'>{faq}</p></div>" for faq in faq_list[:5]])
-                    
-                    # Get marketplace and culture-specific FAQ keywords
-                    if marketplace_code == 'jp':
-                        # Japanese culture: detailed explanations and anticipating concerns
-                        faq_keywords = "詳しい説明, 心配解消, 使い方ガイド, トラブル対応"
-                        # Japanese FAQ image: detailed, helpful, respectful
-                        faq_image = "丁寧なサポートスタッフ、詳しい説明書、日本語対応 (800x600px)"
-                        faq_seo = "問題解決SEO戦略"
-                    elif marketplace_code == 'br':
-                        # Brazil culture: friendly guidance and community support
-                        faq_keywords = "dúvidas frequentes, suporte brasileiro, como usar, passo a passo"
-                        # Brazil FAQ image descriptions in Portuguese
-                        faq_image = "Atendimento brasileiro amigável, tutorial visual passo a passo, ícones explicativos (800x600px)"
-                        faq_seo = "Otimização SEO para perguntas frequentes"
-                    elif marketplace_code == 'mx':
-                        # Mexico culture: family-friendly help and warm support
-                        faq_keywords = "preguntas comunes, ayuda familiar, guía fácil, soporte mexicano"
-                        # Mexico FAQ image descriptions in Spanish
-                        faq_image = "Servicio al cliente mexicano sonriente, guía visual paso a paso, iconos amigables (800x600px)"
-                        faq_seo = "SEO para preguntas frecuentes México"
-                    elif marketplace_code == 'in':
-                        # India culture: cooking help, safety for beginners, gifting guidance
-                        faq_keywords = "indian cooking questions, beginner safety tips, stainless steel care, gifting guide help, family kitchen support"
-                        # India FAQ image descriptions focused on cooking and safety
-                        faq_image = "Indian customer service team explaining knife safety to beginner cook, step-by-step Indian cooking guide, kitchen safety icons (800x600px)"
-                        faq_seo = "SEO for Indian cooking questions and gifting guidance"
-                    elif marketplace_code == 'eg':
-                        # Egypt culture: family-friendly help and warm support with cultural heritage
-                        faq_keywords = "أسئلة شائعة، مساعدة عائلية مصرية، دليل سهل، دعم مصري، تراث عائلي"
-                        # Egypt FAQ image descriptions in Arabic with cultural elements
-                        faq_image = "خدمة عملاء مصرية مبتسمة، دليل مرئي خطوة بخطوة، أيقونات ودية مصرية، رموز تراثية (800x600px)"
-                        faq_seo = "تحسين محركات البحث للأسئلة الشائعة المصرية"
-                    elif marketplace_code == 'sa':
-                        # Saudi culture: family-friendly help and warm support
-                        faq_keywords = "أسئلة شائعة، مساعدة عائلية، دليل سهل، دعم سعودي"
-                        # Saudi FAQ image descriptions in Arabic
-                        faq_image = "خدمة عملاء سعودية مبتسمة، دليل مرئي خطوة بخطوة، أيقونات ودية (800x600px)"
-                        faq_seo = "تحسين محركات البحث للأسئلة الشائعة السعودية"
-                    elif marketplace_code == 'pl':
-                        # Poland culture: family-friendly help and warm support with Catholic traditions
-                        faq_keywords = "często zadawane pytania, pomoc rodzinna polska, przewodnik łatwy, wsparcie polskie, tradycja katolicka"
-                        # Poland FAQ image descriptions in English (like Mexico)
-                        faq_image = "ENGLISH: Smiling Polish customer service team explaining product features to Polish family, step-by-step visual guide, friendly Polish icons with Catholic heritage symbols (800x600px)"
-                        faq_seo = "SEO dla często zadawanych pytań polskich"
-                    elif marketplace_code == 'nl':
-                        # Netherlands culture: direct and practical information
-                        faq_keywords = "veelgestelde vragen, praktische hulp, gebruiksaanwijzing, probleemoplossing"
-                        # Netherlands FAQ image descriptions in Dutch
-                        faq_image = "Duidelijke instructies met pictogrammen, stap-voor-stap handleiding, praktische tips (800x600px)"
-                        faq_seo = "SEO voor veelgestelde vragen"
-                    elif marketplace_code == 'tr':
-                        # Turkey culture: detailed support with hospitality
-                        faq_keywords = "sık sorulan sorular, Türkçe destek, kullanım kılavuzu, problem çözümü"
-                        # Turkey FAQ image descriptions with detailed ENGLISH descriptions like Poland
-                        faq_image = "ENGLISH: Smiling Turkish customer service team explaining product features to Turkish family, step-by-step visual guide, friendly Turkish icons with hospitality elements (800x600px)"
-                        faq_seo = "Sık sorulan sorular için SEO optimizasyonu Türkiye'de"
-                    elif marketplace_code == 'es':
-                        # Spanish culture: community help and family-friendly guidance
-                        faq_keywords = "ayuda familiar, dudas comunes, consejos prácticos, guía fácil"
-                        # Spanish FAQ image: helpful, family-friendly
-                        faq_image = "Ayuda familiar amigable, guía fácil de entender (800x600px)"
-                        faq_seo = "Estrategia SEO de preguntas"
-                    elif marketplace_code == 'de':
-                        # German culture: technical precision and thorough documentation
-                        faq_keywords = "technische Details, Bedienungsanleitung, Problemlösung, Handbuch"
-                        # German FAQ image: thorough, technical documentation
-                        faq_image = "Ausführliche Dokumentation, technische Anleitung, Präzision (800x600px)"
-                        faq_seo = "FAQ-SEO-Strategie"
-                    elif marketplace_code == 'fr':
-                        # French culture: elegant solutions and sophisticated guidance
-                        faq_keywords = "conseils d'expert, solutions élégantes, guide sophistiqué, assistance"
-                        # French FAQ image: elegant, sophisticated guidance
-                        faq_image = "Guide élégant, assistance sophistiquée, style raffiné (800x600px)"
-                        faq_seo = "Stratégie SEO des questions"
-                    else:
-                        # USA/International: quick answers and practical solutions
-                        faq_keywords = "quick answers, troubleshooting, user guide, instant help"
-                        # USA FAQ image: quick, efficient, modern
-                        faq_image = "Modern help center, instant answers, user-friendly design (800x600px)"
-                        faq_seo = "FAQ-focused SEO strategy"
-                    
-                    faq_html = f"""
-    <div class="aplus-section-card bg-yellow-50 border-yellow-200 border-2 rounded-lg p-4 sm:p-6 mb-6 mx-2 sm:mx-0 shadow-sm hover:shadow-md transition-shadow">
-        <div class="flex items-center mb-4">
-            <span class="text-2xl sm:text-3xl mr-3">❓</span>
-            <div class="flex-1">
-                <h3 class="text-yellow-900 text-xl sm:text-2xl font-bold">{localized_labels.get('faqs_title', 'Frequently Asked Questions')}</h3>
-                <p class="text-gray-600 text-sm mt-1">FAQ section with common customer questions and answers</p>
-            </div>
-        </div>
-        <div class="content-section bg-white rounded-lg p-4 mb-4 border">
-            <div class="text-gray-700 text-sm sm:text-base">
-                {faq_items}
-            </div>
-        </div>
-        <div class="seo-details mt-4">
-            <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🔍</span>
-                        <strong class="text-gray-900">{localized_labels['keywords']}</strong>
-                    </div>
-                    <p class="text-gray-600">{faq_keywords}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">📸</span>
-                        <strong class="text-gray-900">{localized_labels['image_strategy']}</strong>
-                    </div>
-                    <p class="text-gray-600">{faq_image}</p>
-                </div>
-                <div class="bg-white p-3 rounded border">
-                    <div class="flex items-center mb-2">
-                        <span class="mr-2">🎯</span>
-                        <strong class="text-gray-900">{localized_labels['seo_focus']}</strong>
-                    </div>
-                    <p class="text-gray-600">{faq_seo}</p>
-                </div>
-            </div>
-        </div>
-    </div>"""
-                    sections_html.append(faq_html)
-            
-            # Generate HTML from saved listing data
-            features_html = '\n'.join([f"        <li>{feature}</li>" for feature in features_list])
-            whats_in_box_items = result.get('whatsInBox', [f'{product.name}', 'User manual', 'Warranty information'])
-            whats_in_box_html = '\n'.join([f"        <li>{item}</li>" for item in whats_in_box_items])
-            trust_items = result.get('trustBuilders', ['Quality guaranteed', '30-day satisfaction', 'Customer support'])
-            trust_html = '\n'.join([f"        <li>{trust}</li>" for trust in trust_items])
-            faq_items = result.get('faqs', [])
-            faqs_html = '\n'.join([f"    <p><strong>{faq}</strong></p>" for faq in faq_items])
-            
-            # Generate PPC strategy HTML
-            ppc_strategy = result.get('ppcStrategy', {})
-            campaign_structure = ppc_strategy.get('campaignStructure', {})
-            ppc_html = ""
-            
-            if isinstance(campaign_structure, dict) and campaign_structure:
-                ppc_sections = []
-                for campaign_type, campaign_data in campaign_structure.items():
-                    if isinstance(campaign_data, dict):
-                        keywords = ', '.join(campaign_data.get('keywords', []))
-                        bid_strategy = campaign_data.get('bidStrategy', '')
-                        budget = campaign_data.get('dailyBudget', '')
-                        acos = campaign_data.get('targetAcos', '')
-                        
-                        ppc_sections.append(f"""
-        <div class="ppc-campaign">
-            <h4>{campaign_type.replace('Campaign', ' Campaign').title()}</h4>
-            <p><strong>Keywords:</strong> {keywords}</p>
-            <p><strong>Bid Strategy:</strong> {bid_strategy}</p>
-            <p><strong>Daily Budget:</strong> {budget}</p>
-            <p><strong>Target ACoS:</strong> {acos}</p>
-        </div>""")
-                
-                ppc_html = f"""
-<div class="ppc-strategy">
-    <h3>PPC Campaign Strategy</h3>
-    {''.join(ppc_sections)}
-    <div class="ppc-negatives">
-        <h4>Negative Keywords Strategy</h4>
-        <p><strong>Immediate Negatives:</strong> {', '.join(ppc_strategy.get('negativeKeywords', {}).get('immediate', []))}</p>
-        <p><strong>Strategy:</strong> {ppc_strategy.get('negativeKeywords', {}).get('strategy', '')}</p>
-    </div>
-</div>"""
-
-            # Generate comprehensive A+ content plan with mobile-responsive structure
-            aplus_html = f"""<div class="aplus-introduction bg-gradient-to-r from-purple-50 to-pink-50 border border-purple-200 p-4 sm:p-6 rounded-lg mb-6">
-    <div class="flex items-center mb-4">
-        <span class="text-3xl mr-3">🚀</span>
-        <div>
-            <h2 class="text-xl sm:text-2xl font-bold text-gray-900">Complete A+ Content Strategy</h2>
-            <p class="text-purple-700 text-sm">Professional Amazon A+ content for enhanced product presentation.</p>
-        </div>
-    </div>
-    <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
-        <div class="bg-white p-3 rounded border">
-            <div class="flex items-center mb-2">
-                <span class="mr-2">🧠</span>
-                <strong class="text-gray-900">AI-Generated Briefs</strong>
-            </div>
-            <p class="text-gray-600">Complete image concepts with titles, scenes, and overlay text</p>
-        </div>
-        <div class="bg-white p-3 rounded border">
-            <div class="flex items-center mb-2">
-                <span class="mr-2">🎯</span>
-                <strong class="text-gray-900">Design Guidelines</strong>
-            </div>
-            <p class="text-gray-600">Style guides, color schemes, and layout specifications</p>
-        </div>
-        <div class="bg-white p-3 rounded border">
-            <div class="flex items-center mb-2">
-                <span class="mr-2">📤</span>
-                <strong class="text-gray-900">Ready for Production</strong>
-            </div>
-            <p class="text-gray-600">Copy briefs to Canva, Figma, or share with designers</p>
-        </div>
-    </div>
-</div>
-
-<div class="aplus-hero bg-gradient-to-r from-blue-50 to-indigo-50 p-4 sm:p-6 rounded-lg mb-6">
-    <h3 class="text-xl sm:text-2xl font-bold text-gray-900 mb-3">{listing.hero_title}</h3>
-    <p class="text-gray-700 text-sm sm:text-base leading-relaxed">{listing.hero_content}</p>
-</div>
-
-<div class="aplus-comprehensive-plan">
-    <h2 class="text-xl sm:text-2xl font-bold text-gray-900 mb-4 px-2 sm:px-0">Complete A+ Content Strategy</h2>
-    <div class="space-y-4 sm:space-y-6">
-        {''.join(sections_html)}
-    </div>
-</div>
-
-<div class="aplus-strategy-summary bg-gray-50 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
-    <h3 class="text-lg sm:text-xl font-semibold text-gray-900 mb-3">Overall A+ Strategy</h3>
-    <p class="text-gray-700 text-sm sm:text-base leading-relaxed">{aplus_plan.get('overallStrategy', 'Complete A+ content plan designed to guide customers from awareness to purchase')}</p>
-</div>
-
-<div class="mobile-responsive-content">
-    {ppc_html}
-</div>
-
-<div class="keyword-strategy bg-white border border-gray-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
-    <h3 class="text-lg sm:text-xl font-semibold text-gray-900 mb-3">Keyword Strategy</h3>
-    <p class="text-gray-700 text-sm sm:text-base mb-4">{result.get('keywordStrategy', 'Strategic keyword placement for maximum SEO impact')}</p>
-    <h4 class="text-md sm:text-lg font-medium text-gray-800 mb-2">Competitor Keywords</h4>
-    <p class="text-gray-600 text-sm sm:text-base">{result.get('topCompetitorKeywords', 'Analysis of competitive landscape for positioning')}</p>
-</div>
-
-<div class="aplus-features bg-green-50 border border-green-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
-    <h3 class="text-lg sm:text-xl font-semibold text-green-900 mb-3">Key Features & Benefits</h3>
-    <ul class="space-y-1 sm:space-y-2 text-sm sm:text-base">
-{features_html}
-    </ul>
-</div>
-
-<div class="aplus-whats-in-box bg-purple-50 border border-purple-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
-    <h3 class="text-lg sm:text-xl font-semibold text-purple-900 mb-3">What's in the Box</h3>
-    <ul class="space-y-1 sm:space-y-2 text-sm sm:text-base text-gray-700">
-{whats_in_box_html}
-    </ul>
-</div>
-
-<div class="aplus-trust bg-orange-50 border border-orange-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
-    <h3 class="text-lg sm:text-xl font-semibold text-orange-900 mb-3">Trust & Quality Assurance</h3>
-    <ul class="space-y-1 sm:space-y-2 text-sm sm:text-base text-gray-700">
-{trust_html}
-    </ul>
-</div>
-
-<div class="aplus-testimonials bg-teal-50 border border-teal-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
-    <h3 class="text-lg sm:text-xl font-semibold text-teal-900 mb-3">Customer Satisfaction</h3>
-    <p class="text-gray-700 text-sm sm:text-base mb-3">{result.get('social_proof', '')}</p>
-    <p class="text-gray-800 text-sm sm:text-base font-medium"><strong>Our Guarantee:</strong> {result.get('guarantee', '')}</p>
-</div>
-
-<div class="aplus-faqs bg-indigo-50 border border-indigo-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
-    <h3 class="text-lg sm:text-xl font-semibold text-indigo-900 mb-4">Frequently Asked Questions</h3>
-    <div class="space-y-3 text-sm sm:text-base">
-{faqs_html}
-    </div>
-</div>"""
-            # FIXED: Always use comprehensive A+ HTML structure for ALL markets (US and International)
-            # This ensures 25,000+ character comprehensive A+ content for 10/10 quality
-            marketplace_code = getattr(product, 'marketplace', 'com') or 'com'
+                fallback = fallback_cards(listing, marketplace_code, product_category)
+                sections_html = render_fallback_cards(fallback, marketplace_code)
             
-            # FIXED: Only use simple localized content for specific markets that don't have comprehensive sections
-            # Turkey (tr) and Mexico (mx) should use comprehensive sections, not simple localized content
-            if marketplace_code in ['es', 'jp', 'br', 'nl', 'se']:
-                # Create localized A+ content using hero/features fields that are always populated
-                localized_sections = []
-                
-                # Hero section with localized content
-                if listing.hero_title and listing.hero_content:
-                    localized_sections.append(f"""
-<div class="aplus-section hero-section-localized">
-    <h2 class="section-title">{listing.hero_title}</h2>
-    <div class="section-content">
-        <p>{listing.hero_content}</p>
-    </div>
-</div>""")
-                
-                # Features section with localized content
-                if listing.features:
-                    features_list = listing.features.split('\n')
-                    features_html = '<ul>' + ''.join(f'<li>{feature.strip()}</li>' for feature in features_list if feature.strip()) + '</ul>'
-                    localized_sections.append(f"""
-<div class="aplus-section features-section-localized">
-    <h2 class="section-title">{'Özellikler' if marketplace_code == 'tr' else 'Características' if marketplace_code == 'mx' else 'الميزات' if marketplace_code == 'sa' else 'Features' if marketplace_code == 'in' else 'Features'}</h2>
-    <div class="section-content">
-        {features_html}
-    </div>
-</div>""")
-                
-                # Trust builders section - FIXED: Prevent character splitting
-                if listing.trust_builders:
-                    # Handle both single text and multi-line trust content
-                    if '\n' in listing.trust_builders:
-                        trust_list = listing.trust_builders.split('\n')
-                        trust_html = '<ul>' + ''.join(f'<li>{trust.strip()}</li>' for trust in trust_list if trust.strip()) + '</ul>'
-                    else:
-                        # Single text without newlines - treat as single paragraph
-                        trust_html = f'<p>{listing.trust_builders.strip()}</p>'
-                    
-                    localized_sections.append(f"""
-<div class="aplus-section trust-section-localized">
-    <h2 class="section-title">{'Güven' if marketplace_code == 'tr' else 'Confianza' if marketplace_code == 'mx' else 'الثقة' if marketplace_code == 'sa' else 'Zaufanie' if marketplace_code == 'pl' else 'Trust' if marketplace_code == 'in' else 'Trust'}</h2>
-    <div class="section-content">
-        {trust_html}
-    </div>
-</div>""")
-                
-                # FAQs section  
-                if listing.faqs:
-                    faqs_content = listing.faqs.replace('\n\n', '</p><p>').replace('\n', '<br>')
-                    localized_sections.append(f"""
-<div class="aplus-section faqs-section-localized">
-    <h2 class="section-title">{'Sık Sorulan Sorular' if marketplace_code == 'tr' else 'Preguntas Frecuentes' if marketplace_code == 'mx' else 'الأسئلة الشائعة' if marketplace_code == 'sa' else 'Często Zadawane Pytania' if marketplace_code == 'pl' else 'FAQs' if marketplace_code == 'in' else 'FAQs'}</h2>
-    <div class="section-content">
-        <p>{faqs_content}</p>
-    </div>
-</div>""")
-                
-                # Combine localized sections with template
-                if localized_sections:
-                    localized_aplus_content = f"""
-<div class="aplus-localized-content">
-    {''.join(localized_sections)}
-</div>
-{aplus_html}"""
-                    listing.amazon_aplus_content = localized_aplus_content
-                    self.logger.info(f"✅ Using GUARANTEED localized A+ content for {marketplace_code}: {len(localized_aplus_content)} characters")
-                else:
-                    listing.amazon_aplus_content = aplus_html
-                    self.logger.info(f"⚠️ No localized content available for {marketplace_code}, using template: {len(aplus_html)} characters")
-            else:
-                # For Turkey and Mexico: use comprehensive template WITHOUT simple sections
-                # For US market: use full template WITH simple sections
-                if marketplace_code in ['tr', 'mx', 'sa', 'eg', 'in', 'pl', 'be', 'sg', 'au']:
-                    # Turkey and Mexico get comprehensive sections only, no simple sections
-                    comprehensive_only_html = f"""<div class="aplus-introduction bg-gradient-to-r from-purple-50 to-pink-50 border border-purple-200 p-4 sm:p-6 rounded-lg mb-6">
-    <div class="flex items-center mb-4">
-        <span class="text-3xl mr-3">🚀</span>
-        <div>
-            <h2 class="text-xl sm:text-2xl font-bold text-gray-900">Complete A+ Content Strategy</h2>
-            <p class="text-purple-700 text-sm">Professional Amazon A+ content for enhanced product presentation.</p>
-        </div>
-    </div>
-    <div class="grid grid-cols-1 md:grid-cols-3 gap-4 text-sm">
-        <div class="bg-white p-3 rounded border">
-            <div class="flex items-center mb-2">
-                <span class="mr-2">🧠</span>
-                <strong class="text-gray-900">AI-Generated Briefs</strong>
-            </div>
-            <p class="text-gray-600">Complete image concepts with titles, scenes, and overlay text</p>
-        </div>
-        <div class="bg-white p-3 rounded border">
-            <div class="flex items-center mb-2">
-                <span class="mr-2">🎯</span>
-                <strong class="text-gray-900">Design Guidelines</strong>
-            </div>
-            <p class="text-gray-600">Style guides, color schemes, and layout specifications</p>
-        </div>
-        <div class="bg-white p-3 rounded border">
-            <div class="flex items-center mb-2">
-                <span class="mr-2">📤</span>
-                <strong class="text-gray-900">Ready for Production</strong>
-            </div>
-            <p class="text-gray-600">Copy briefs to Canva, Figma, or share with designers</p>
-        </div>
-    </div>
-</div>
-
-<div class="aplus-hero bg-gradient-to-r from-blue-50 to-indigo-50 p-4 sm:p-6 rounded-lg mb-6">
-    <h3 class="text-xl sm:text-2xl font-bold text-gray-900 mb-3">{listing.hero_title}</h3>
-    <p class="text-gray-700 text-sm sm:text-base leading-relaxed">{listing.hero_content}</p>
-</div>
-
-<div class="aplus-comprehensive-plan">
-    <h2 class="text-xl sm:text-2xl font-bold text-gray-900 mb-4 px-2 sm:px-0">Complete A+ Content Strategy</h2>
-    <div class="space-y-4 sm:space-y-6">
-        {''.join(sections_html)}
-    </div>
-</div>
-
-<div class="aplus-strategy-summary bg-gray-50 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
-    <h3 class="text-lg sm:text-xl font-semibold text-gray-900 mb-3">Overall A+ Strategy</h3>
-    <p class="text-gray-700 text-sm sm:text-base leading-relaxed">{aplus_plan.get('overallStrategy', 'Complete A+ content plan designed to guide customers from awareness to purchase')}</p>
-</div>
-
-<div class="mobile-responsive-content">
-    {ppc_html}
-</div>
-
-<div class="keyword-strategy bg-white border border-gray-200 p-4 sm:p-6 rounded-lg mt-6 mx-2 sm:mx-0">
-    <h3 class="text-lg sm:text-xl font-semibold text-gray-900 mb-3">Keyword Strategy</h3>
-    <p class="text-gray-700 text-sm sm:text-base mb-4">{result.get('keywordStrategy', 'Strategic keyword placement for maximum SEO impact')}</p>
-    <h4 class="text-md sm:text-lg font-medium text-gray-800 mb-2">Competitor Keywords</h4>
-    <p class="text-gray-600 text-sm sm:text-base">{result.get('topCompetitorKeywords', 'Analysis of competitive landscape for positioning')}</p>
-</div>"""
-                    listing.amazon_aplus_content = comprehensive_only_html
-                    self.logger.info(f"✅ Using comprehensive-only template for {marketplace_code}: {len(comprehensive_only_html)} characters")
-                else:
-                    # US market gets full template with simple sections
-                    listing.amazon_aplus_content = aplus_html
-                    self.logger.info(f"Using standard A+ content template for {marketplace_code}: {len(aplus_html)} characters")
+            # The plan is kept so a styling change can re-render without the model (rerender_aplus)
+            page_data = aplus_page(product, listing, result)
+            listing.amazon_aplus_plan = stored_plan(aplus_plan, page_data, product_category, cards=fallback)
+            listing.amazon_aplus_content = render_aplus(aplus_plan, page_data, marketplace_code, sections=sections_html)
+            self.logger.info(f"A+ content rendered for {marketplace_code}: {len(listing.amazon_aplus_content)} characters")
             
             # CRITICAL: Now the localized content from aPlusContentPlan is properly embedded
             # The sections_html contains AI-generated content in the target language
@@ -5585,70 +2925,6 @@ Technical specifications include comprehensive compatibility, robust build quali
                 # Don't fail listing generation if validation fails
                 pass
             
-        except json.JSONDecodeError as e:
-            print(f"JSON parsing error: {e}")
-            print(f"Error position: line {e.lineno} column {e.colno}")
-            safe_first = ai_content[:1000].encode('ascii', errors='ignore').decode('ascii')
-            safe_last = ai_content[-500:].encode('ascii', errors='ignore').decode('ascii')
-            print(f"Raw AI response (first 1000 chars): {safe_first}")
-            print(f"Raw AI response (last 500 chars): ...{safe_last}")
-            
-            # Save the full response to debug file for analysis (disabled to prevent file permission issues)
-            # with open('debug_ai_response.json', 'w', encoding='utf-8') as f:
-            #     f.write(ai_content)
-            print("Full AI response content prepared (debug file writing disabled)")
-            
-            # Try to clean and re-parse the JSON
-            try:
-                import re
-                cleaned_content = ai_content.strip()
-                
-                # Remove markdown code blocks
-                if cleaned_content.startswith('```json'):
-                    cleaned_content = cleaned_content[7:]
-                if cleaned_content.endswith('```'):
-                    cleaned_content = cleaned_content[:-3]
-                
-                # Remove trailing commas before closing brackets/braces
-                cleaned_content = re.sub(r',\s*}', '}', cleaned_content)
-                cleaned_content = re.sub(r',\s*]', ']', cleaned_content)
-                
-                result = json.loads(cleaned_content.strip())
-                print("Successfully parsed cleaned JSON - proceeding with AI content")
-                    
-                    # Continue with normal parsing
-                listing.title = result.get('title', '')[:200]
-                
-                # Add A+ content parsing in the cleanup section
-                listing.hero_title = result.get('hero_title', '')
-                listing.hero_content = result.get('hero_content', '')
-                listing.features = '\n'.join(result.get('features', []))
-                listing.whats_in_box = '\n'.join(result.get('whats_in_box', []))
-                listing.trust_builders = '\n'.join(result.get('trust_builders', []))
-                
-                # Handle FAQs
-                faqs = result.get('faqs', [])
-                faq_strings = []
-                for faq in faqs:
-                    if isinstance(faq, dict):
-                        q = faq.get('question', faq.get('q', ''))
-                        a = faq.get('answer', faq.get('a', ''))
-                        faq_strings.append(f"Q: {q} A: {a}")
-                    else:
-                        faq_strings.append(str(faq))
-                listing.faqs = '\n'.join(faq_strings)
-                listing.social_proof = result.get('social_proof', '')
-                listing.guarantee = result.get('guarantee', '')
-                
-                print("AI content successfully parsed and saved to all A+ fields!")
-                
-                # Process bullet points and other content normally...
-                
-            except Exception as cleanup_error:
-                print(f"[ERROR] JSON cleanup also failed: {cleanup_error}")
-                safe_cleaned = cleaned_content[-300:].encode('ascii', errors='ignore').decode('ascii')
-                print(f"[ERROR] Cleaned content (last 300 chars): ...{safe_cleaned}")
-                raise Exception(f"AI generated invalid JSON that could not be parsed: {str(cleanup_error)}. Please try again.")
         except Exception as e:
             print(f"[ERROR] OpenAI API error: {e}")
             import traceback
@@ -6045,8 +3321,25 @@ LUJO MEXICANO:
         
         return cultural_context + occasion_context + tone_context
     
+    def _shared(self, key, compute):
+        """Compute a marketplace-independent value, or reuse it from the attached fan-out context"""
+        if self.shared_context is None:
+            return compute()
+        return self.shared_context.get(key, compute)
+
     def _analyze_product_context(self, product):
         """Analyze product and return comprehensive context for generation"""
+        return {
+            **self._product_profile(product),
+            'occasion_context': self._get_occasion_context(product),
+            'brand_tone_descriptor': self._get_brand_tone_descriptor(product),
+        }
+
+    def _product_profile(self, product):
+        """Marketplace-independent part of the product context"""
+        return dict(self._shared('product_profile', lambda: self._build_product_profile(product)))
+
+    def _build_product_profile(self, product):
         # Extract main product category
         categories = getattr(product, 'categories', '') or ''
         main_category = categories.split('>')[0].strip() if '>' in categories else categories.strip()
@@ -6072,56 +3365,23 @@ LUJO MEXICANO:
             'feature_count': len(feature_list),
             'complexity': complexity,
             'key_features': feature_list[:5],  # Top 5 features
-            'occasion_context': self._get_occasion_context(product),
-            'brand_tone_descriptor': self._get_brand_tone_descriptor(product),
             'price_tier': 'budget' if product.price < 50 else 'mid-range' if product.price < 200 else 'premium'
         }
     
-    def _comprehensive_emoji_removal(self, result):
-        """Remove emojis and special characters from listing content"""
-        import re
-        
-        # Define emoji pattern
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            "\U00002702-\U000027B0"  # dingbats
-            "\U000024C2-\U0001F251"
-            "]+", flags=re.UNICODE)
-        
-        # Clean all string fields in the result
-        if isinstance(result, dict):
-            cleaned_result = {}
-            for key, value in result.items():
-                if isinstance(value, str):
-                    # Remove emojis
-                    cleaned_value = emoji_pattern.sub('', value)
-                    # Clean up any double spaces
-                    cleaned_value = ' '.join(cleaned_value.split())
-                    cleaned_result[key] = cleaned_value
-                elif isinstance(value, list):
-                    # Clean list items
-                    cleaned_list = []
-                    for item in value:
-                        if isinstance(item, str):
-                            clean_item = emoji_pattern.sub('', item)
-                            clean_item = ' '.join(clean_item.split())
-                            cleaned_list.append(clean_item)
-                        else:
-                            cleaned_list.append(item)
-                    cleaned_result[key] = cleaned_list
-                else:
-                    cleaned_result[key] = value
-            return cleaned_result
-        elif isinstance(result, str):
-            clean_result = emoji_pattern.sub('', result)
-            return ' '.join(clean_result.split())
-        else:
-            return result
-    
+    def _cleaned_product_data(self, product):
+        """Cleaned name/brand/features/description, computed once per fan-out"""
+        return dict(self._shared('cleaned_product', lambda: {
+            'name': self._clean_product_name(product.name),
+            'brand': self._clean_brand_name(product.brand_name),
+            'features': self._clean_product_features(product.features),
+            'description': self._clean_product_description(product.description),
+        }))
+
+    def _base_keyword_cluster(self, product):
+        """Seller-supplied keywords deduplicated into a base cluster, computed once per fan-out"""
+        from .fanout import base_keyword_cluster
+        return self._shared('keyword_cluster', lambda: base_keyword_cluster(product))
+
     def _clean_product_name(self, name):
         """Clean messy product names to prevent AI generation failures"""
         if not name:
@@ -6227,95 +3487,14 @@ LUJO MEXICANO:
         
         return cleaned
     
-    def _fix_unterminated_strings_and_parse(self, json_text):
-        """Fix unterminated strings in JSON and attempt parsing"""
-        import json
-        import re
-        
-        # Clean the JSON text
-        fixed = json_text.strip()
-        
-        # Find unterminated string patterns and fix them
-        # Look for quotes that aren't properly closed
-        
-        # Method 1: Try to find and close unclosed quotes
-        quote_count = 0
-        in_string = False
-        escaped = False
-        last_quote_pos = -1
-        
-        for i, char in enumerate(fixed):
-            if char == '\\' and not escaped:
-                escaped = True
-                continue
-            
-            if char == '"' and not escaped:
-                in_string = not in_string
-                if in_string:
-                    last_quote_pos = i
-                quote_count += 1
-            
-            escaped = False
-        
-        # If we're still in a string, try to close it
-        if in_string and quote_count % 2 == 1:
-            # Find the last meaningful content before closing
-            # Look for common JSON closing patterns
-            closing_patterns = ['}', ']', '"}', '"]']
-            insert_pos = len(fixed)
-            
-            # Find the best place to insert a closing quote
-            for pattern in closing_patterns:
-                pos = fixed.rfind(pattern)
-                if pos > last_quote_pos:
-                    insert_pos = pos
-                    break
-            
-            # Insert closing quote before the closing pattern
-            if insert_pos < len(fixed):
-                fixed = fixed[:insert_pos] + '"' + fixed[insert_pos:]
-            else:
-                fixed = fixed + '"}'
-        
-        # Method 2: Try to truncate at last complete object
-        if not fixed.endswith('}') and not fixed.endswith(']'):
-            # Find last complete closing brace
-            brace_pos = fixed.rfind('}')
-            if brace_pos > 0:
-                fixed = fixed[:brace_pos + 1]
-        
-        try:
-            return json.loads(fixed)
-        except json.JSONDecodeError:
-            # If still failing, try more aggressive fixes
-            
-            # Remove trailing incomplete content
-            lines = fixed.split('\n')
-            clean_lines = []
-            for line in lines:
-                if line.strip().endswith(',') or line.strip().endswith('{') or line.strip().endswith('['):
-                    clean_lines.append(line)
-                elif '"' in line and ':' in line:
-                    clean_lines.append(line)
-                elif line.strip() in ['}', ']', '},', '],']:
-                    clean_lines.append(line)
-                    break
-            
-            attempt2 = '\n'.join(clean_lines)
-            if not attempt2.endswith('}'):
-                attempt2 += '}'
-            
-            return json.loads(attempt2)
-    
     def _generate_fallback_walmart_content(self, listing, product):
         """Generate fallback content when AI generation fails to prevent blank listings"""
         print(f"🔧 Generating fallback content for {product.name}...")
         
         # Clean product data
-        cleaned_name = self._clean_product_name(product.name)
-        cleaned_brand = self._clean_brand_name(product.brand_name)
-        cleaned_features = self._clean_product_features(product.features)
-        cleaned_description = self._clean_product_description(product.description)
+        cleaned = self._cleaned_product_data(product)
+        cleaned_name, cleaned_brand = cleaned['name'], cleaned['brand']
+        cleaned_features, cleaned_description = cleaned['features'], cleaned['description']
         
         # Generate basic Walmart fields
         listing.walmart_product_title = f"{cleaned_brand} {cleaned_name} - Professional Quality"
@@ -6331,8 +3510,9 @@ LUJO MEXICANO:
         ]
         listing.walmart_key_features = '\n'.join(features_list)
         
-        # Generate basic keywords
-        listing.keywords = f"{cleaned_brand.lower()}, {cleaned_name.lower()}, professional, quality, durable, reliable"
+        # Generate basic keywords, seller keywords first
+        seller_keywords = self._base_keyword_cluster(product)['all_keywords']
+        listing.keywords = ', '.join(seller_keywords + [cleaned_brand.lower(), cleaned_name.lower(), 'professional', 'quality', 'durable', 'reliable'])
         
         # Generate basic specifications
         listing.walmart_specifications = f'{{"brand": "{cleaned_brand}", "product_type": "{cleaned_name}", "quality": "Professional grade"}}'
@@ -6346,30 +3526,23 @@ LUJO MEXICANO:
         print(f"✅ Fallback content generated for {cleaned_name}")
 
     def _generate_walmart_listing(self, product, listing):
-        from .services_occasion_enhanced import OccasionOptimizer
+        # A completed listing on another platform is adapted locally; ?nocache forces a fresh generation
+        if cross_platform_enabled() and not self.bypass_cache:
+            source = find_source(product, 'walmart')
+            if source is not None:
+                derive_listing(self, source, listing, 'walmart')
+                listing.status = 'completed'
+                listing.save()
+                return listing
         
         if not self.client:
             raise Exception("OpenAI API key not configured. Please set a valid OpenAI API key to generate Walmart listings.")
-            
-        # Initialize occasion optimizer for Walmart too
-        occasion_optimizer = OccasionOptimizer()
         
         # OPTIMIZED HYBRID APPROACH: 2 parallel API calls for maximum speed + quality
         try:
-            import concurrent.futures
-            
-            # Execute both API calls in parallel for maximum speed
-            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-                # Submit both calls simultaneously
-                core_future = executor.submit(self._generate_walmart_core_content, product)
-                advanced_future = executor.submit(self._generate_walmart_advanced_content, product)
-                
-                # Get results (will wait for both to complete)
-                core_content = core_future.result()
-                advanced_content = advanced_future.result()
-            
-            # Merge both results into listing
-            self._merge_walmart_hybrid_content(listing, core_content, advanced_content, product)
+            # Core and advanced content run in parallel, then merge into the listing
+            result = self._walmart_pipeline().run(product=product, listing=listing)
+            result.raise_for_failure()
             
             listing.status = 'completed'
             listing.save()
@@ -6400,10 +3573,9 @@ LUJO MEXICANO:
         """HYBRID APPROACH - Call 1: Generate core content with dynamic category-aware prompts"""
         
         # 🔧 CRITICAL FIX: Clean messy product data before AI generation
-        cleaned_name = self._clean_product_name(product.name)
-        cleaned_brand = self._clean_brand_name(product.brand_name)
-        cleaned_features = self._clean_product_features(product.features)
-        cleaned_description = self._clean_product_description(product.description)
+        cleaned = self._cleaned_product_data(product)
+        cleaned_name, cleaned_brand = cleaned['name'], cleaned['brand']
+        cleaned_features, cleaned_description = cleaned['features'], cleaned['description']
         
         # Dynamic category-aware prompt generation
         category_context = self._get_dynamic_category_context(product)
@@ -6448,6 +3620,7 @@ OBLIGATORIO incluir:
         
         # Get occasion context
         occasion_context = self._get_occasion_context(product)
+        seller_keywords = ', '.join(self._base_keyword_cluster(product)['all_keywords'][:30]) or 'None provided'
         
         prompt = f"""Generate Walmart listing core content for {cleaned_brand} {cleaned_name}.
 
@@ -6458,6 +3631,7 @@ Product Info:
 - Categories: {product.categories}
 - Brand Tone: {product.brand_tone}
 - Occasion: {occasion_context}
+- Seller Keywords: {seller_keywords}
 - Marketplace: {getattr(product, 'marketplace', 'walmart_usa')}
 
 {category_context}
@@ -6481,12 +3655,17 @@ Generate core sections with NO missing words. Return valid JSON:
 
 Write complete sentences. No generic templates. Product-specific content only."""
 
-        response = self.client.chat.completions.create(
+        messages = [{'role': 'user', 'content': prompt}]
+        structured = structured_output_enabled('walmart')
+        extra_params = {'response_format': get_listing_schema('walmart').response_format()} if structured else {}
+        request_params = dict(
             model='gpt-4o-mini',
-            messages=[{'role': 'user', 'content': prompt}],
+            messages=messages,
             temperature=0.3,
-            max_tokens=800
+            max_tokens=800,
+            **extra_params
         )
+        response = self._chat_completion(**request_params)
         
         import json
         content = response.choices[0].message.content.strip()
@@ -6495,39 +3674,28 @@ Write complete sentences. No generic templates. Product-specific content only.""
         print(f"🤖 Raw AI Response Length: {len(content)} chars")
         print(f"🤖 Raw AI Response Preview: {content[:200]}...")
         
-        # Clean JSON if wrapped in markdown
-        if content.startswith('```'):
-            if content.startswith('```json'):
-                content = content[7:]
-            else:
-                content = content[3:]
-            if content.endswith('```'):
-                content = content[:-3]
-            content = content.strip()
-        
-        print(f"🔧 Cleaned Content Length: {len(content)} chars")
-        print(f"🔧 Cleaned Content Preview: {content[:200]}...")
+        result, repairs = parse_llm_json(content)
+        if repairs:
+            print(f"🔧 JSON repairs: {', '.join(repairs)}")
+        if isinstance(result, dict):
+            if structured:
+                result, rerequested = complete_missing_sections(
+                    self._chat_completion, 'walmart', result, messages, previous=content,
+                    model='gpt-4o-mini', temperature=0.3
+                )
+                if rerequested:
+                    print(f"🧩 Re-requested {len(rerequested)} section(s): {', '.join(rerequested)}")
+            return result
         
-        # Try multiple JSON parsing strategies
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError as e:
-            print(f"🚨 JSON Parse Error: {e}")
-            print(f"🔧 Attempting unterminated string fix...")
-            
-            try:
-                return self._fix_unterminated_strings_and_parse(content)
-            except Exception as e2:
-                print(f"🚨 Unterminated string fix also failed: {e2}")
-                
-                # Return fallback content to prevent blank listings
-                print(f"🔧 Returning fallback content to prevent blank listing...")
-                return {
-                    "title": f"{cleaned_brand} {cleaned_name} - Professional Quality",
-                    "description": f"High-quality {cleaned_name} from {cleaned_brand}. " + cleaned_description[:150],
-                    "key_features": cleaned_features.split('\n')[:5] if cleaned_features else ["Professional grade", "Durable construction", "Easy to use", "High quality materials", "Excellent design"],
-                    "keywords": f"{cleaned_brand.lower()}, {cleaned_name.lower()}, professional, quality, durable"
-                }
+        # Return fallback content to prevent blank listings
+        print(f"🚨 No JSON object in AI response - returning fallback content to prevent blank listing...")
+        invalidate_completion(**request_params)  # Don't replay the unparseable completion
+        return {
+            "title": f"{cleaned_brand} {cleaned_name} - Professional Quality",
+            "description": f"High-quality {cleaned_name} from {cleaned_brand}. " + cleaned_description[:150],
+            "key_features": cleaned_features.split('\n')[:5] if cleaned_features else ["Professional grade", "Durable construction", "Easy to use", "High quality materials", "Excellent design"],
+            "keywords": f"{cleaned_brand.lower()}, {cleaned_name.lower()}, professional, quality, durable"
+        }
 
     def _get_dynamic_category_context(self, product):
         """Generate dynamic category-specific context for better AI prompts"""
@@ -6650,30 +3818,28 @@ Return valid JSON with ALL sections:
 
 IMPORTANT: Do not include any URLs, links, or example.com references. Only provide descriptions and concepts for media content."""
 
-        response = self.client.chat.completions.create(
+        request_params = dict(
             model='gpt-4o-mini',
             messages=[{'role': 'user', 'content': prompt}],
             temperature=0.3,
             max_tokens=1000
         )
+        response = self._chat_completion(**request_params)
         
         import json
         content = response.choices[0].message.content.strip()
         
-        # Clean JSON if wrapped in markdown
-        if content.startswith('```'):
-            if content.startswith('```json'):
-                content = content[7:]
-            else:
-                content = content[3:]
-            if content.endswith('```'):
-                content = content[:-3]
-            content = content.strip()
-        
-        return json.loads(content)
+        result, repairs = parse_llm_json(content)
+        if not isinstance(result, dict):
+            invalidate_completion(**request_params)  # Don't replay the unparseable completion
+            raise ValueError(f"No JSON object in AI response ({', '.join(repairs)})")
+        return result
 
-    def _merge_walmart_hybrid_content(self, listing, core_content, advanced_content, product):
-        """Merge hybrid approach results with ALL fields"""
+    def _merge_walmart_hybrid_content(self, listing, core_content, advanced_content, product, placeholders=True):
+        """
+        Merge hybrid approach results with ALL fields. placeholders=False leaves advanced fields the
+        content doesn't have blank instead of filling in generic values (cross-platform derivation).
+        """
         # 🔧 CRITICAL FIX: Validate content before merge to prevent blank listings
         if not core_content or not isinstance(core_content, dict):
             print(f"❌ INVALID CORE CONTENT: {repr(core_content)}")
@@ -6697,21 +3863,29 @@ IMPORTANT: Do not include any URLs, links, or example.com references. Only provi
         if not advanced_content or not isinstance(advanced_content, dict):
             print(f"⚠️ INVALID ADVANCED CONTENT: {repr(advanced_content)[:100]}... - Using fallbacks")
             advanced_content = {}
+        
+        def placeholder(value):
+            return value if placeholders else ''
+        
+        def advanced_json(key, default):
+            if key in advanced_content:
+                return json.dumps(advanced_content[key])
+            return json.dumps(default) if placeholders else ''
             
-        listing.walmart_specifications = json.dumps(advanced_content.get('specifications', {
+        listing.walmart_specifications = advanced_json('specifications', {
             "material": "Premium Quality",
             "color": "As Shown", 
             "weight": "Varies",
             "dimensions": "See Description"
-        }))
-        listing.walmart_compliance_certifications = json.dumps(advanced_content.get('compliance', {
+        })
+        listing.walmart_compliance_certifications = advanced_json('compliance', {
             "certification_guidance": "This product meets standard safety requirements.",
             "required_certifications": "Standard compliance certifications apply."
-        }))
-        listing.walmart_profit_maximizer = json.dumps(advanced_content.get('profit_maximizer', {
+        })
+        listing.walmart_profit_maximizer = advanced_json('profit_maximizer', {
             "q1_action_plan": ["List product competitively", "Optimize for search visibility"],
             "revenue_projections": "Competitive market positioning"
-        }))
+        })
         
         # NEW: Product identifiers (CRITICAL MISSING FIELDS)
         identifiers = advanced_content.get('identifiers', {})
@@ -6721,30 +3895,30 @@ IMPORTANT: Do not include any URLs, links, or example.com references. Only provi
         
         # NEW: Shipping information (CRITICAL MISSING FIELDS)  
         shipping = advanced_content.get('shipping', {})
-        listing.walmart_shipping_weight = shipping.get('shipping_weight', '1 lb')
+        listing.walmart_shipping_weight = shipping.get('shipping_weight', placeholder('1 lb'))
         listing.walmart_shipping_dimensions = json.dumps({
-            "length": shipping.get('package_length', '12 in'),
-            "width": shipping.get('package_width', '8 in'), 
-            "height": shipping.get('package_height', '6 in')
-        })
+            "length": shipping.get('package_length', placeholder('12 in')),
+            "width": shipping.get('package_width', placeholder('8 in')), 
+            "height": shipping.get('package_height', placeholder('6 in'))
+        }) if shipping or placeholders else ''
         
         # NEW: Rich media recommendations (MISSING FIELD)
-        listing.walmart_rich_media = json.dumps(advanced_content.get('rich_media', {
+        listing.walmart_rich_media = advanced_json('rich_media', {
             "main_images": 3,
             "lifestyle_images": 2,
             "detail_shots": 2
-        }))
+        })
         
         # Enhanced attributes with more details
         specs = advanced_content.get('specifications', {})
         listing.walmart_attributes = json.dumps({
             "price": str(product.price) if product.price else "0.00",
             "brand": product.brand_name or "Quality Brand",
-            "material": specs.get('material', 'Premium'),
-            "color": specs.get('color', 'Natural'),
-            "size": specs.get('dimensions', 'Standard'),
-            "model": specs.get('model', f"{product.brand_name or 'QB'}-001"),
-            "warranty": specs.get('warranty', '1 Year')
+            "material": specs.get('material', placeholder('Premium')),
+            "color": specs.get('color', placeholder('Natural')),
+            "size": specs.get('dimensions', placeholder('Standard')),
+            "model": specs.get('model', placeholder(f"{product.brand_name or 'QB'}-001")),
+            "warranty": specs.get('warranty', placeholder('1 Year'))
         })
         
         # Basic fields
@@ -6765,7 +3939,7 @@ Example: "HORL 2 Oak Sharpener - 15°/20° German Precision"
 
 Return only the title, nothing else."""
 
-        response = self.client.chat.completions.create(
+        response = self._chat_completion(
             model='gpt-4o-mini',
             messages=[{'role': 'user', 'content': prompt}],
             temperature=0.3,
@@ -6789,7 +3963,7 @@ Then explain how this titanium cutting board solves these problems. Include all
 
 Write complete sentences with no missing words."""
 
-        response = self.client.chat.completions.create(
+        response = self._chat_completion(
             model='gpt-4o-mini',
             messages=[{'role': 'user', 'content': prompt}],
             temperature=0.4,
@@ -6813,7 +3987,7 @@ Examples:
 
 Return as a simple list, one per line."""
 
-        response = self.client.chat.completions.create(
+        response = self._chat_completion(
             model='gpt-4o-mini',
             messages=[{'role': 'user', 'content': prompt}],
             temperature=0.3,
@@ -6838,7 +4012,7 @@ Focus on cutting board keywords:
 
 Return as comma-separated list."""
 
-        response = self.client.chat.completions.create(
+        response = self._chat_completion(
             model='gpt-4o-mini',
             messages=[{'role': 'user', 'content': prompt}],
             temperature=0.3,
@@ -6902,7 +4076,7 @@ Create JSON with these specifications:
 
 Return only valid JSON."""
 
-        response = self.client.chat.completions.create(
+        response = self._chat_completion(
             model='gpt-4o-mini',
             messages=[{'role': 'user', 'content': prompt}],
             temperature=0.2,
@@ -6927,7 +4101,7 @@ Create JSON with:
 
 Return only valid JSON."""
 
-        response = self.client.chat.completions.create(
+        response = self._chat_completion(
             model='gpt-4o-mini',
             messages=[{'role': 'user', 'content': prompt}],
             temperature=0.3,
@@ -6953,7 +4127,7 @@ Focus on cutting board category. Be specific with numbers and timeframes.
 
 Return only valid JSON."""
 
-        response = self.client.chat.completions.create(
+        response = self._chat_completion(
             model='gpt-4o-mini',
             messages=[{'role': 'user', 'content': prompt}],
             temperature=0.4,
@@ -6965,6 +4139,21 @@ Return only valid JSON."""
     # ETSY LISTING GENERATION - WORLD-CLASS EMOTIONAL & CONVERSION-FOCUSED SYSTEM
     # ========================================================================================
 
+    def _generate_shopify_listing(self, product, listing):
+        """Shopify content is derived from the product's listing on another platform (cross_platform.py)"""
+        self._derive_platform_listing(product, listing, 'shopify')
+
+    def _generate_tiktok_listing(self, product, listing):
+        """TikTok hooks, script and hashtags are derived from the product's listing on another platform"""
+        self._derive_platform_listing(product, listing, 'tiktok')
+
+    def _derive_platform_listing(self, product, listing, platform):
+        source = find_source(product, platform)
+        if source is None:
+            raise Exception(f"{platform.title()} listings are built from an existing listing - "
+                            "generate an Amazon, Etsy or Walmart listing for this product first.")
+        derive_listing(self, source, listing, platform)
+
     def _generate_etsy_listing(self, product, listing):
         """
         🎨 WORLD-CLASS ETSY GENERATION SYSTEM
@@ -6978,20 +4167,10 @@ Return only valid JSON."""
         try:
             print(f"🎨 GENERATING PREMIUM ETSY LISTING: {product.name}")
             
-            # Generate core emotional content
-            core_result = self._generate_etsy_emotional_core(product)
-            
-            # Generate advanced conversion elements
-            conversion_result = self._generate_etsy_conversion_elements(product)
-            
-            # Generate WOW features (premium business tools)
-            wow_result = self._generate_etsy_wow_features(product)
-            
-            # Populate all listing fields
-            self._populate_etsy_listing_fields(listing, core_result, conversion_result, wow_result, product)
-            
-            # Calculate quality scores
-            self._calculate_etsy_quality_scores(listing)
+            # Emotional core and conversion elements run concurrently;
+            # a branch that errors or times out falls back on its own
+            result = self._etsy_pipeline().run(product=product, listing=listing)
+            result.raise_for_failure()
             
             listing.status = 'completed'
             listing.save()
@@ -7059,26 +4238,22 @@ Write with PASSION and AUTHENTICITY. Make buyers feel they NEED this piece in th
 Return ONLY valid JSON."""
 
         try:
-            response = self.client.chat.completions.create(
+            request_params = dict(
                 model='gpt-4o-mini',
                 messages=[{'role': 'user', 'content': prompt}],
                 temperature=0.7,  # Higher creativity for emotional content
                 max_tokens=1800
             )
+            response = self._chat_completion(**request_params)
             
             import json
             content = response.choices[0].message.content.strip()
             
-            # Clean up code block markers
-            if content.startswith('```'):
-                content = content[7:-3] if content.startswith('```json') else content[3:-3]
-                content = content.strip()
-            
-            # Try to parse JSON
-            if content:
-                return json.loads(content)
-            else:
-                raise ValueError("Empty response from AI")
+            result, repairs = parse_llm_json(content)
+            if isinstance(result, dict):
+                return result
+            invalidate_completion(**request_params)  # Don't replay the unparseable completion
+            raise ValueError(f"No JSON object in AI response ({', '.join(repairs)})")
                 
         except (json.JSONDecodeError, ValueError, KeyError) as e:
             print(f"Emotional Core JSON error: {e}")
@@ -7153,26 +4328,22 @@ Generate JSON with psychological triggers that drive Etsy purchases:
 Return ONLY valid JSON. Make content authentic and specific to handmade {product.categories}."""
 
         try:
-            response = self.client.chat.completions.create(
+            request_params = dict(
                 model='gpt-4o-mini',
                 messages=[{'role': 'user', 'content': prompt}],
                 temperature=0.6,
                 max_tokens=1000
             )
+            response = self._chat_completion(**request_params)
             
             import json
             content = response.choices[0].message.content.strip()
             
-            # Clean up code block markers
-            if content.startswith('```'):
-                content = content[7:-3] if content.startswith('```json') else content[3:-3]
-                content = content.strip()
-            
-            # Try to parse JSON
-            if content:
-                return json.loads(content)
-            else:
-                raise ValueError("Empty response from AI")
+            result, repairs = parse_llm_json(content)
+            if isinstance(result, dict):
+                return result
+            invalidate_completion(**request_params)  # Don't replay the unparseable completion
+            raise ValueError(f"No JSON object in AI response ({', '.join(repairs)})")
                 
         except (json.JSONDecodeError, ValueError, KeyError) as e:
             print(f"Conversion Elements JSON error: {e}")
@@ -7214,61 +4385,8 @@ Return ONLY valid JSON. Make content authentic and specific to handmade {product
             "bonus_value": f"Every {name} includes: beautiful gift packaging perfect for special occasions, detailed care instructions to keep your {category.lower()} looking perfect, and personal note from the artisan. Plus, you're supporting small business and traditional craftsmanship with every purchase."
         }
 
-    def _generate_etsy_wow_features(self, product):
-        """Generate premium business tools that provide massive value"""
-        
-        prompt = f"""💼 ETSY BUSINESS CONSULTANT: Generate premium business tools worth $497+ value.
-
-PRODUCT: {product.name}
-CATEGORY: {product.categories}
-BRAND: {product.brand_name}
-
-Create comprehensive business package in JSON format:
-
-{{
-  "shop_setup_guide": "Complete Etsy shop optimization guide specific to {product.categories}. Include: shop banner design tips, about section writing, shop policies setup, and branding consistency strategies. Min 300 words.",
-  "social_media_package": "30-day content calendar for {product.name} with daily post ideas for Instagram/Pinterest/TikTok. Include hashtag strategies and engagement tactics. Min 300 words.",
-  "photography_guide": "Professional product photography tutorial for {product.categories} items. Cover lighting, angles, styling, and editing tips specific to this product type. Min 300 words.",
-  "pricing_analysis": "Competitive pricing strategy for {product.name} at ${product.price}. Include profit calculations, competitor analysis, and pricing psychology. Min 250 words.", 
-  "seo_report": "Advanced Etsy SEO strategy for '{product.name}' to rank higher in search. Include keyword research, tag optimization, and listing optimization tactics. Min 300 words.",
-  "customer_service_templates": "Professional email templates for {product.categories} customer inquiries. Include order confirmations, shipping updates, and problem resolution scripts. Min 250 words.",
-  "policies_templates": "Complete shop policies for {product.categories} sellers. Include shipping, returns, custom orders, and FAQ templates. Min 250 words.",
-  "variations_guide": "Create product variations and bundles for {product.name} to increase average order value. Include pricing strategies and presentation tips. Min 250 words.",
-  "competitor_insights": "Analysis of top competitors in {product.categories} and differentiation strategies for {product.brand_name}. Include positioning and unique selling propositions. Min 300 words.",
-  "seasonal_calendar": "12-month marketing calendar for {product.categories} with seasonal opportunities, holidays, and promotional strategies. Min 300 words."
-}}
-
-Return ONLY valid JSON with complete, actionable content for each field."""
-
-        try:
-            response = self.client.chat.completions.create(
-                model='gpt-4o-mini',
-                messages=[{'role': 'user', 'content': prompt}],
-                temperature=0.6,
-                max_tokens=3000
-            )
-            
-            import json
-            content = response.choices[0].message.content.strip()
-            
-            # Clean up code block markers
-            if content.startswith('```'):
-                content = content[7:-3] if content.startswith('```json') else content[3:-3]
-                content = content.strip()
-            
-            # Try to parse JSON
-            if content:
-                return json.loads(content)
-            else:
-                raise ValueError("Empty response from AI")
-                
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
-            print(f"WOW Features JSON error: {e}")
-            # Return fallback premium business tools
-            return self._generate_fallback_wow_features(product)
-
     def _generate_fallback_wow_features(self, product):
-        """Generate fallback premium business tools when AI fails"""
+        """Fallback business guides (used by etsy_guides when a guide can't be generated)"""
         
         category = product.categories or "handmade items"
         name = product.name
@@ -7569,7 +4687,7 @@ CONTENT THEMES:
 Each month features seasonal lifestyle photography showing {name} in relevant settings, driving emotional connection and purchase motivation."""
         }
 
-    def _populate_etsy_listing_fields(self, listing, core_result, conversion_result, wow_result, product):
+    def _populate_etsy_listing_fields(self, listing, core_result, conversion_result, product):
         """Populate all Etsy listing fields with premium content"""
         import json
         
@@ -7591,18 +4709,6 @@ Each month features seasonal lifestyle photography showing {name} in relevant se
         listing.etsy_gift_suggestions = core_result.get('gift_messaging', '')
         listing.etsy_value_proposition = conversion_result.get('value_proposition', '')
         
-        # WOW features (premium business tools)
-        listing.etsy_shop_setup_guide = wow_result.get('shop_setup_guide', '')
-        listing.etsy_social_media_package = wow_result.get('social_media_package', '')
-        listing.etsy_photography_guide = wow_result.get('photography_guide', '')
-        listing.etsy_pricing_analysis = wow_result.get('pricing_analysis', '')
-        listing.etsy_seo_report = wow_result.get('seo_report', '')
-        listing.etsy_customer_service_templates = wow_result.get('customer_service_templates', '')
-        listing.etsy_policies_templates = wow_result.get('policies_templates', '')
-        listing.etsy_variations_guide = wow_result.get('variations_guide', '')
-        listing.etsy_competitor_insights = wow_result.get('competitor_insights', '')
-        listing.etsy_seasonal_calendar = wow_result.get('seasonal_calendar', '')
-        
         # Compatibility fields
         listing.title = listing.etsy_title
         listing.long_description = listing.etsy_description
@@ -1075,8 +1075,9 @@ class OccasionOptimizer:
             }
         }
     
-    def get_occasion_prompt_enhancement(self, occasion):
+    def get_occasion_prompt_enhancement(self, occasion, rng=None):
         """Get the complete prompt enhancement for a specific occasion"""
+        rng = rng or random
         if occasion not in self.occasion_configs:
             return self._get_generic_occasion_prompt(occasion)
             
@@ -1089,12 +1090,12 @@ This listing MUST be deeply integrated with {occasion} throughout every element.
 The customer is specifically searching for {occasion} gifts, so generic listings will fail.
 
 EMOTIONAL HOOK TO USE:
-"{random.choice(config['emotional_hooks'])}"
+"{rng.choice(config['emotional_hooks'])}"
 
 TITLE REQUIREMENTS:
 - MUST include "{occasion}" or related term in the title
-- Use this pattern: {random.choice(config['title_patterns'])}
-- Include these power words: {', '.join(random.sample(config['power_words'], 3))}
+- Use this pattern: {rng.choice(config['title_patterns'])}
+- Include these power words: {', '.join(rng.sample(config['power_words'], 3))}
 - Add urgency: {config['urgency_phrases'][0]}
 
 BULLET POINT REQUIREMENTS:
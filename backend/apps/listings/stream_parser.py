@@ -0,0 +1,219 @@
+"""
+Streaming Completion Parser
+Consumes a streamed chat completion and emits each top-level JSON field
+(productTitle, bulletPoints, productDescription, ...) the moment its value is complete,
+so the frontend can render the title seconds before the full listing is decoded.
+"""
+
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalJSONParser:
+    """
+    Character-level scanner over a growing JSON object.
+    feed() returns the (key, value) pairs of top-level fields that became complete in that chunk.
+    Leading markdown fences or chatter before the first '{' are skipped.
+    """
+
+    def __init__(self):
+        self.buffer = ''
+        self.fields = {}
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect = 'start'  # start, key, colon, value, scalar, comma, done
+        self._key_start = None
+        self._key = None
+        self._value_start = None
+
+    @property
+    def done(self):
+        return self._expect == 'done'
+
+    def feed(self, text):
+        self.buffer += text
+        completed = []
+        buf = self.buffer
+
+        while self._pos < len(buf):
+            ch = buf[self._pos]
+            i = self._pos
+            self._pos += 1
+
+            if self._expect == 'done':
+                break
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._expect == 'key':
+                        self._key = self._loads(buf[self._key_start:i + 1])
+                        self._expect = 'colon'
+                    elif self._depth == 1 and self._expect == 'scalar':
+                        self._emit(buf[self._value_start:i + 1], completed)
+                continue
+
+            if self._expect == 'start':
+                if ch == '{':
+                    self._depth = 1
+                    self._expect = 'key'
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect == 'key':
+                    self._key_start = i
+                elif self._depth == 1 and self._expect == 'value':
+                    self._value_start = i
+                    self._expect = 'scalar'
+                continue
+
+            if self._depth == 1:
+                if self._expect == 'colon':
+                    if ch == ':':
+                        self._expect = 'value'
+                elif self._expect == 'value':
+                    if ch in '{[':
+                        self._value_start = i
+                        self._depth += 1
+                        self._expect = 'scalar'
+                    elif not ch.isspace():
+                        self._value_start = i
+                        self._expect = 'scalar'
+                elif self._expect == 'scalar' and ch in ',}':
+                    # Unquoted scalar (number, true, false, null) ends at the delimiter
+                    self._emit(buf[self._value_start:i], completed)
+                    self._expect = 'key' if ch == ',' else 'done'
+                elif self._expect == 'comma':
+                    if ch == ',':
+                        self._expect = 'key'
+                    elif ch == '}':
+                        self._expect = 'done'
+                elif self._expect == 'key' and ch == '}':
+                    self._expect = 'done'
+                continue
+
+            # Inside a nested object/array value
+            if ch in '{[':
+                self._depth += 1
+            elif ch in '}]':
+                self._depth -= 1
+                if self._depth == 1:
+                    self._emit(buf[self._value_start:i + 1], completed)
+
+        return completed
+
+    def _emit(self, raw, completed):
+        value = self._loads(raw.strip())
+        self._expect = 'comma'
+        if self._key is None:
+            return
+        self.fields[self._key] = value
+        completed.append((self._key, value))
+        self._key = None
+
+    @staticmethod
+    def _loads(raw):
+        try:
+            return json.loads(raw)
+        except (json.JSONDecodeError, ValueError):
+            # Keep the raw text; the full-response parser will repair it later
+            return raw
+
+
+class _StreamedMessage:
+    def __init__(self, content):
+        self.role = 'assistant'
+        self.content = content
+
+
+class _StreamedChoice:
+    def __init__(self, content, finish_reason):
+        self.index = 0
+        self.message = _StreamedMessage(content)
+        self.finish_reason = finish_reason
+
+
+class StreamedCompletion:
+    """Assembled streamed completion exposing the same shape callers read from ChatCompletion"""
+
+    def __init__(self, content, finish_reason, model, usage=None, completion_id=None):
+        self.id = completion_id or ''
+        self.model = model
+        self.created = int(time.time())
+        self.choices = [_StreamedChoice(content, finish_reason)]
+        self.usage = usage
+
+    def model_dump(self, mode='json'):
+        """chat.completion-shaped dict so the LLM cache can store streamed results too"""
+        usage = self.usage.model_dump(mode=mode) if hasattr(self.usage, 'model_dump') else self.usage
+        choice = self.choices[0]
+        return {
+            'id': self.id or 'stream',
+            'object': 'chat.completion',
+            'created': self.created,
+            'model': self.model,
+            'choices': [{
+                'index': 0,
+                'finish_reason': choice.finish_reason or 'stop',
+                'message': {'role': 'assistant', 'content': choice.message.content},
+            }],
+            'usage': usage,
+        }
+
+
+def replay_fields(content, on_field):
+    """Emit every top-level field of an already complete response (e.g. a cache hit)"""
+    parser = IncrementalJSONParser()
+    for key, value in parser.feed(content or ''):
+        on_field(key, value)
+    return parser
+
+
+def stream_chat_completion(client, on_field, **params):
+    """
+    Run chat.completions.create with stream=True, calling on_field(key, value) as each
+    top-level JSON field completes. Returns a StreamedCompletion with the full text.
+    """
+    parser = IncrementalJSONParser()
+    parts = []
+    finish_reason = None
+    usage = None
+    completion_id = None
+    started = time.time()
+    first_field_at = None
+
+    stream = client.chat.completions.create(stream=True, stream_options={'include_usage': True}, **params)
+    for chunk in stream:
+        completion_id = completion_id or getattr(chunk, 'id', None)
+        if getattr(chunk, 'usage', None):
+            usage = chunk.usage
+        if not chunk.choices:
+            continue
+        choice = chunk.choices[0]
+        if choice.finish_reason:
+            finish_reason = choice.finish_reason
+        delta = choice.delta.content if choice.delta else None
+        if not delta:
+            continue
+        parts.append(delta)
+        for key, value in parser.feed(delta):
+            if first_field_at is None:
+                first_field_at = time.time() - started
+                logger.info(f"First streamed field '{key}' after {first_field_at:.1f}s")
+            try:
+                on_field(key, value)
+            except Exception as e:
+                logger.warning(f"Stream field callback failed for {key}: {e}")
+
+    logger.info(f"Stream finished in {time.time() - started:.1f}s ({len(parser.fields)} fields)")
+    return StreamedCompletion(''.join(parts), finish_reason, params.get('model'), usage, completion_id)
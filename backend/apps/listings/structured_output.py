@@ -0,0 +1,251 @@
+"""
+Schema-Constrained Structured Output
+Per-platform JSON schemas for the listing responses, sent as an OpenAI json_schema response_format
+when STRUCTURED_OUTPUT_PLATFORMS enables the platform. Each schema is compiled once into a tree of
+validator functions; after a response, only the top-level sections that are missing, empty or
+invalid are re-requested (with a schema narrowed to those sections) and merged back in.
+"""
+
+import functools
+import json
+import logging
+
+from django.conf import settings
+
+from .json_repair import loads_lenient
+
+logger = logging.getLogger(__name__)
+
+
+def _text():
+    return {'type': 'string'}
+
+
+def _text_list():
+    return {'type': 'array', 'items': {'type': 'string'}}
+
+
+def _object(**properties):
+    """Strict-mode object: every property required, nothing else allowed"""
+    return {
+        'type': 'object',
+        'properties': properties,
+        'required': list(properties),
+        'additionalProperties': False,
+    }
+
+
+_APLUS_SECTION = _object(
+    title=_text(), content=_text(), keywords=_text_list(), imageDescription=_text(), seoOptimization=_text()
+)
+
+# Same keys and order as the RESPONSE FORMAT block of AMAZON_CORE_TEMPLATE (ppcStrategy is derived locally)
+AMAZON_LISTING_SCHEMA = _object(
+    productTitle=_text(),
+    bulletPoints=_text_list(),
+    productDescription=_text(),
+    seoKeywords=_object(
+        primary=_text_list(), longTail=_text_list(), problemSolving=_text_list(),
+        rufusConversational=_text_list(), semantic=_text_list()
+    ),
+    backendKeywords=_text(),
+    aPlusContentPlan=_object(
+        section1_hero=_APLUS_SECTION,
+        section2_features=_APLUS_SECTION,
+        section3_usage=_APLUS_SECTION,
+        section4_quality=_APLUS_SECTION,
+        section5_guarantee=_APLUS_SECTION,
+        section6_social_proof=_APLUS_SECTION,
+        section7_comparison=_APLUS_SECTION,
+        section8_package=_APLUS_SECTION,
+        overallStrategy=_text(),
+    ),
+    brandSummary=_text(),
+    whatsInBox=_text_list(),
+    trustBuilders=_text_list(),
+    faqs=_text_list(),
+    socialProof=_text(),
+    guarantee=_text(),
+)
+
+# Walmart core content call (title, description, features, keywords)
+WALMART_LISTING_SCHEMA = _object(
+    title=_text(),
+    description=_text(),
+    key_features=_text_list(),
+    keywords=_text(),
+)
+
+LISTING_SCHEMAS = {
+    'amazon': AMAZON_LISTING_SCHEMA,
+    'walmart': WALMART_LISTING_SCHEMA,
+}
+
+_JSON_TYPES = {
+    'string': str,
+    'array': list,
+    'object': dict,
+    'boolean': bool,
+    'null': type(None),
+}
+
+
+def _compile(schema):
+    """Turn a schema into check(value, path, errors), resolving every sub-schema up front"""
+    kind = schema.get('type')
+    enum = schema.get('enum')
+
+    if kind == 'object':
+        properties = {name: _compile(sub) for name, sub in schema.get('properties', {}).items()}
+        required = tuple(schema.get('required', ()))
+        closed = schema.get('additionalProperties') is False
+
+        def check(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append((path, f"expected object, got {type(value).__name__}"))
+                return
+            for name in required:
+                if name not in value:
+                    errors.append((f"{path}.{name}", 'missing'))
+            for name, item in value.items():
+                if name in properties:
+                    properties[name](item, f"{path}.{name}", errors)
+                elif closed:
+                    errors.append((f"{path}.{name}", 'unexpected property'))
+        return check
+
+    if kind == 'array':
+        item_check = _compile(schema['items']) if 'items' in schema else None
+
+        def check(value, path, errors):
+            if not isinstance(value, list):
+                errors.append((path, f"expected array, got {type(value).__name__}"))
+                return
+            if item_check is not None:
+                for index, item in enumerate(value):
+                    item_check(item, f"{path}[{index}]", errors)
+        return check
+
+    if kind in ('number', 'integer'):
+        def check(value, path, errors):
+            if isinstance(value, bool) or not isinstance(value, (int, float)) \
+                    or (kind == 'integer' and not float(value).is_integer()):
+                errors.append((path, f"expected {kind}, got {type(value).__name__}"))
+        return check
+
+    python_type = _JSON_TYPES.get(kind)
+
+    def check(value, path, errors):
+        if python_type is not None and not isinstance(value, python_type):
+            errors.append((path, f"expected {kind}, got {type(value).__name__}"))
+        elif enum is not None and value not in enum:
+            errors.append((path, f"not one of {enum}"))
+    return check
+
+
+def _is_empty(value):
+    return value is None or (isinstance(value, (str, list, dict)) and not value)
+
+
+class CompiledSchema:
+    """A top-level object schema compiled once; validation never re-walks the schema dict"""
+
+    def __init__(self, name, schema):
+        self.name = name
+        self.schema = schema
+        self.sections = list(schema['properties'])
+        self._section_checks = {key: _compile(sub) for key, sub in schema['properties'].items()}
+
+    def errors(self, value):
+        """[(path, message)] for every violation; an empty list means the value is valid"""
+        if not isinstance(value, dict):
+            return [('$', f"expected object, got {type(value).__name__}")]
+        errors = []
+        for key, check in self._section_checks.items():
+            if key not in value:
+                errors.append((f"$.{key}", 'missing'))
+            else:
+                check(value[key], f"$.{key}", errors)
+        return errors
+
+    def invalid_sections(self, value):
+        """Top-level sections that are missing, empty or fail their schema (in schema order)"""
+        if not isinstance(value, dict):
+            return list(self.sections)
+        invalid = []
+        for key, check in self._section_checks.items():
+            if key not in value or _is_empty(value[key]):
+                invalid.append(key)
+                continue
+            errors = []
+            check(value[key], f"$.{key}", errors)
+            if errors:
+                invalid.append(key)
+        return invalid
+
+    @functools.lru_cache(maxsize=64)
+    def response_format(self, sections=None):
+        """OpenAI response_format for the whole schema, or narrowed to a tuple of sections"""
+        schema = self.schema
+        name = self.name
+        if sections:
+            schema = _object(**{key: self.schema['properties'][key] for key in sections})
+            name = f"{self.name}_sections"
+        return {
+            'type': 'json_schema',
+            'json_schema': {'name': name, 'strict': True, 'schema': schema},
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def get_listing_schema(platform):
+    """The compiled listing schema for a platform (built on first use, then reused)"""
+    return CompiledSchema(f"{platform}_listing", LISTING_SCHEMAS[platform])
+
+
+def structured_output_enabled(platform):
+    return platform in LISTING_SCHEMAS and platform in getattr(settings, 'STRUCTURED_OUTPUT_PLATFORMS', [])
+
+
+def complete_missing_sections(chat, platform, result, messages, previous=None, **params):
+    """
+    Re-request only the sections of `result` that fail the platform schema and merge them in.
+    `chat` is the service's chat-completion callable; `previous` is the raw first completion
+    (defaults to `result` re-serialized); `params` are the original call's model, temperature etc.
+    Returns (result, re-requested sections).
+    """
+    schema = get_listing_schema(platform)
+    missing = schema.invalid_sections(result)
+    if not missing:
+        return result, []
+    if len(missing) == len(schema.sections):
+        # Nothing usable came back - a section request would be the whole listing again
+        return result, []
+
+    logger.info(f"Structured output ({platform}): re-requesting {len(missing)} section(s): {', '.join(missing)}")
+    # The follow-up refers to the first answer, so the conversation has to include it
+    if previous is None:
+        previous = json.dumps(result, ensure_ascii=False)
+    follow_up = list(messages) + [{'role': 'assistant', 'content': previous}, {
+        'role': 'user',
+        'content': (
+            "Your previous answer was missing or had invalid values for these keys: "
+            f"{', '.join(missing)}. Return ONLY a JSON object with exactly these keys, "
+            "following the same instructions and language as above."
+        ),
+    }]
+    params = dict(params, max_tokens=getattr(settings, 'STRUCTURED_OUTPUT_REPAIR_MAX_TOKENS', 1500))
+    params['response_format'] = schema.response_format(tuple(missing))
+
+    try:
+        response = chat(messages=follow_up, **params)
+        patch = loads_lenient(response.choices[0].message.content, default={})
+    except Exception as e:
+        logger.warning(f"Structured output ({platform}) section re-request failed: {e}")
+        return result, missing
+
+    merged = dict(result)
+    for key in missing:
+        if isinstance(patch, dict) and key in patch and not _is_empty(patch[key]):
+            merged[key] = patch[key]
+    return merged, missing
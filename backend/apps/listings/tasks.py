@@ -0,0 +1,172 @@
+"""
+Listing Generation Tasks
+Runs the GPT generation chain in a Celery worker so web requests return immediately
+"""
+
+import logging
+from .models import GeneratedListing
+from .coalescing import listing_fingerprint, find_inflight, claim_inflight, release_inflight
+
+try:
+    from celery import shared_task
+    from celery.signals import worker_process_init
+    CELERY_AVAILABLE = True
+except ImportError:
+    # Celery not installed - define dummy decorator
+    def shared_task(func):
+        return func
+    worker_process_init = None
+    CELERY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+if worker_process_init is not None:
+    @worker_process_init.connect
+    def _reset_clients_after_fork(**kwargs):
+        # The pooled OpenAI client is not fork-safe: each prefork child builds its own
+        from .openai_client import reset_openai_clients
+        reset_openai_clients(close=False)
+
+
+def _job_fingerprint(product, platform, draft=False):
+    """Drafts and full generations of the same product must not coalesce onto each other"""
+    return listing_fingerprint(product, platform) + (':draft' if draft else '')
+
+
+@shared_task
+def generate_listing_job(listing_id, bypass_cache=False, draft=False):
+    """Celery task to generate a queued listing"""
+    from .services import ListingGeneratorService
+
+    try:
+        listing = GeneratedListing.objects.select_related('product').get(id=listing_id)
+    except GeneratedListing.DoesNotExist:
+        logger.error(f"Listing job {listing_id} not found")
+        return
+
+    if listing.status != 'pending':
+        logger.warning(f"Listing job {listing_id} already {listing.status} - skipping")
+        return
+
+    try:
+        service = ListingGeneratorService(bypass_cache=bypass_cache)
+        service.generate_listing(listing.product_id, listing.platform, listing=listing, draft=draft)
+        logger.info(f"Listing job {listing_id} completed")
+    except Exception as e:
+        # generate_listing has already marked the listing as failed
+        logger.error(f"Listing job {listing_id} failed: {e}")
+    finally:
+        release_inflight(_job_fingerprint(listing.product, listing.platform, draft), listing.id)
+
+
+def enqueue_listing_generation(product, platform, bypass_cache=False, draft=False):
+    """
+    Create a pending listing and queue its generation, returning the listing (job).
+    An identical request that is already queued or running is returned instead of a new job.
+    draft=True makes the job produce a fast draft and queue the premium refinement.
+    """
+    fingerprint = _job_fingerprint(product, platform, draft)
+    existing = _active_listing(find_inflight(fingerprint))
+    if existing is not None:
+        logger.info(f"Coalesced duplicate job onto listing {existing.id}")
+        return existing
+
+    listing = GeneratedListing.objects.create(
+        product=product,
+        platform=platform,
+        status='pending'
+    )
+    owner_id = claim_inflight(fingerprint, listing.id)
+    if owner_id != listing.id:
+        existing = _active_listing(owner_id)
+        if existing is not None:
+            listing.delete()
+            return existing
+
+    if CELERY_AVAILABLE:
+        generate_listing_job.delay(listing.id, bypass_cache=bypass_cache, draft=draft)
+    else:
+        # Generate synchronously if Celery is not available
+        logger.warning("Celery not available - generating listing synchronously")
+        generate_listing_job(listing.id, bypass_cache=bypass_cache, draft=draft)
+        listing.refresh_from_db()
+
+    return listing
+
+
+def _active_listing(listing_id):
+    """Return the listing if it is still queued or generating"""
+    if not listing_id:
+        return None
+    return GeneratedListing.objects.filter(id=listing_id, status__in=['pending', 'processing']).first()
+
+
+@shared_task
+def refine_listing_job(listing_id, draft_version):
+    """Celery task for the premium pass over a draft listing (see tiered_generation.py)"""
+    from .tiered_generation import refine_listing
+
+    try:
+        refine_listing(listing_id, draft_version)
+    except GeneratedListing.DoesNotExist:
+        logger.error(f"Refinement: listing {listing_id} not found")
+    except Exception as e:
+        # refine_listing has already marked the refinement as failed; the draft is kept
+        logger.error(f"Refinement of listing {listing_id} failed: {e}")
+
+
+def enqueue_listing_refinement(listing):
+    """Queue the premium pass for a freshly saved draft"""
+    if CELERY_AVAILABLE:
+        refine_listing_job.delay(listing.id, listing.version)
+    else:
+        # The draft has already been returned; never make the request wait for the premium model
+        import threading
+        logger.warning("Celery not available - refining draft in a background thread")
+        threading.Thread(target=refine_listing_job, args=(listing.id, listing.version), daemon=True).start()
+
+
+@shared_task
+def run_bulk_batch_job(batch_id, workers=None):
+    """Celery task to work through a bulk generation batch (safe to re-run: it resumes)"""
+    from .bulk import run_batch
+
+    try:
+        run_batch(batch_id, workers=workers)
+    except Exception as e:
+        logger.error(f"Bulk batch {batch_id} failed: {e}")
+
+
+def enqueue_bulk_batch(batch, workers=None):
+    """Start (or resume) a bulk batch in the background"""
+    if CELERY_AVAILABLE:
+        run_bulk_batch_job.delay(batch.id, workers=workers)
+    else:
+        # Without Celery, a 1,000-item batch must not block the request - use a background thread
+        import threading
+        logger.warning("Celery not available - running bulk batch in a background thread")
+        threading.Thread(target=run_bulk_batch_job, args=(batch.id, workers), daemon=True).start()
+
+
+@shared_task
+def run_fanout_job_task(job_id):
+    """Celery task for a multi-marketplace fan-out (see fanout.py)"""
+    from .fanout import run_fanout_job
+
+    try:
+        run_fanout_job(job_id)
+    except Exception as e:
+        # run_fanout_job has already marked the job as failed
+        logger.error(f"Fan-out job {job_id} failed: {e}")
+
+
+def enqueue_fanout_job(job):
+    """Start a fan-out job in the background; callers poll its status"""
+    if CELERY_AVAILABLE:
+        run_fanout_job_task.delay(job.id)
+    else:
+        # Up to two dozen market generations must never run inside the request
+        import threading
+        logger.warning("Celery not available - running fan-out job in a background thread")
+        threading.Thread(target=run_fanout_job_task, args=(job.id,), daemon=True).start()
@@ -0,0 +1,136 @@
+"""
+Generated Text Normalization
+One pass over the whole parsed LLM result (nested A+ sections and keyword clusters included):
+emoji removal, NFC normalization, whitespace collapsing and, for the US market, folding to ASCII.
+The translate tables and patterns are built at import time, and per-field character statistics
+fall out of the same pass instead of separate scans of the text.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+
+# Emoji and pictograph blocks. Trade/registered marks, currency symbols and letters of any script
+# are outside these ranges and always kept.
+EMOJI_RANGES = [
+    (0x1F000, 0x1FAFF),  # mahjong/cards, enclosed, pictographs, emoticons, transport, flags
+    (0x2600, 0x27BF),    # misc symbols and dingbats
+    (0x2B00, 0x2BFF),    # arrows and stars (⭐ ⬛)
+    (0x231A, 0x231B), (0x23E9, 0x23FA),  # watch, hourglass, media controls
+    (0xFE00, 0xFE0F),    # variation selectors
+    (0xE0020, 0xE007F),  # tag sequences (subdivision flags)
+]
+EMOJI_JOINERS = [0x200D, 0x20E3]  # zero width joiner, combining keycap
+
+# Everything str.split() treats as whitespace becomes a plain space
+WHITESPACE = [0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x1C, 0x1D, 0x1E, 0x1F, 0x85, 0xA0, 0x1680, 0x2028, 0x2029,
+              0x202F, 0x205F, 0x3000] + list(range(0x2000, 0x200B))
+
+# Conventional ASCII spellings for characters NFKD does not decompose into ASCII
+ASCII_PUNCTUATION = {
+    '‘': "'", '’': "'", '‚': "'", '‛': "'", '′': "'",
+    '“': '"', '”': '"', '„': '"', '‟': '"', '″': '"', '«': '"', '»': '"',
+    '‐': '-', '‑': '-', '‒': '-', '–': '-', '—': '-', '―': '-', '−': '-',
+    '…': '...', '•': '-', '·': '-', '×': 'x', '™': '(TM)', '®': '(R)',
+    '©': '(C)', '½': ' 1/2', '¼': ' 1/4', '¾': ' 3/4',
+    'ß': 'ss', 'æ': 'ae', 'Æ': 'AE', 'œ': 'oe', 'Œ': 'OE', 'ø': 'o', 'Ø': 'O',
+}
+
+# Characters whose presence shows a translation kept its script (umlauts, accents, ...)
+MARKET_CHARACTERS = {
+    'de': 'äöüßÄÖÜ',
+    'fr': 'àâæçéèêëîïôœùûüÿÀÂÆÇÉÈÊËÎÏÔŒÙÛÜŸ',
+    'it': 'àèéìíîòóùúÀÈÉÌÍÎÒÓÙÚ',
+    'es': 'áéíñóúüÁÉÍÑÓÚÜ¿¡',
+    'es-mx': 'áéíñóúüÁÉÍÑÓÚÜ¿¡',
+    'pt': 'áâãàçéêíóôõúÁÂÃÀÇÉÊÍÓÔÕÚ',
+    'pt-br': 'áâãàçéêíóôõúÁÂÃÀÇÉÊÍÓÔÕÚ',
+    'nl': 'éëïöüÉËÏÖÜ',
+    'sv': 'åäöÅÄÖ',
+    'pl': 'ąćęłńóśźżĄĆĘŁŃÓŚŹŻ',
+    'tr': 'çğıöşüÇĞİÖŞÜ',
+}
+
+
+def _build_table():
+    table = {code: None for start, end in EMOJI_RANGES for code in range(start, end + 1)}
+    table.update({code: None for code in EMOJI_JOINERS})
+    table.update({code: ' ' for code in WHITESPACE})
+    # Other C0 control characters carry nothing
+    table.update({code: None for code in range(0x20) if code not in table})
+    return table
+
+
+_TABLE = _build_table()
+_ASCII_TABLE = str.maketrans(ASCII_PUNCTUATION)
+_SPACES = re.compile(r' {2,}')
+_COMBINING = re.compile('[\u0300-\u036f]')
+_MARKET_PATTERNS = {language: re.compile(f"[{re.escape(chars)}]") for language, chars in MARKET_CHARACTERS.items()}
+
+
+def _fold_to_ascii(text):
+    """Accented letters lose their accents (café -> cafe); anything still non-ASCII is dropped"""
+    decomposed = _COMBINING.sub('', unicodedata.normalize('NFKD', text.translate(_ASCII_TABLE)))
+    return decomposed.encode('ascii', errors='ignore').decode('ascii')
+
+
+class TextNormalizer:
+    """
+    Normalizes every string in a parsed result tree. Statistics accumulate per top-level field:
+    chars (after normalization), removed (emoji and control characters), folded (non-ASCII
+    characters rewritten or dropped by ASCII folding), non_ascii and market_chars (script-specific letters of
+    the marketplace language that survived).
+    """
+
+    def __init__(self, language='en', ascii_fold=False):
+        self.ascii_fold = ascii_fold
+        language = language or 'en'
+        self._market_pattern = _MARKET_PATTERNS.get(language) or _MARKET_PATTERNS.get(language.split('-')[0])
+        self.stats = {}
+
+    def text(self, value, field=''):
+        stats = self.stats.setdefault(field, Counter())
+        # isascii() is O(1), so plain ASCII text skips NFC and folding entirely
+        if not value.isascii() and not unicodedata.is_normalized('NFC', value):
+            value = unicodedata.normalize('NFC', value)
+        length = len(value)
+        value = value.translate(_TABLE)
+        stats['removed'] += length - len(value)
+
+        if self.ascii_fold and not value.isascii():
+            stats['folded'] += len(value) - len(value.encode('ascii', errors='ignore'))
+            value = _fold_to_ascii(value)
+
+        if '  ' in value:
+            value = _SPACES.sub(' ', value)
+        value = value.strip()
+
+        stats['chars'] += len(value)
+        if not value.isascii():
+            stats['non_ascii'] += len(value) - len(value.encode('ascii', errors='ignore'))
+            if self._market_pattern is not None:
+                stats['market_chars'] += len(self._market_pattern.findall(value))
+        return value
+
+    def tree(self, value, field=''):
+        """Normalized copy of a dict/list/str tree; other values are returned as they are"""
+        if isinstance(value, str):
+            return self.text(value, field)
+        if isinstance(value, dict):
+            return {key: self.tree(item, field or key) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.tree(item, field) for item in value]
+        return value
+
+
+def normalize_result(result, language='en', ascii_fold=False):
+    """(normalized result, {top-level field: Counter of character statistics})"""
+    normalizer = TextNormalizer(language, ascii_fold)
+    return normalizer.tree(result), normalizer.stats
+
+
+def text_stats(text, language='en'):
+    """Character statistics of text as normalize_result would count them (the text is not returned)"""
+    normalizer = TextNormalizer(language)
+    normalizer.text(text)
+    return normalizer.stats['']
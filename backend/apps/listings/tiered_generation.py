@@ -0,0 +1,133 @@
+"""
+Draft-Then-Refine Generation
+Tiered Amazon mode: a fast draft of the title, bullets and description comes from DRAFT_MODEL
+and is saved as a completed listing within seconds. A background refinement pass then runs the
+full premium Amazon generation on the same listing and bumps its version, so the expensive call
+is no longer on the interactive path.
+"""
+
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+
+from .bulk import MARKETPLACE_LANGUAGES
+from .json_repair import parse_llm_json
+from .models import GeneratedListing
+from .section_regeneration import LANGUAGE_NAMES
+
+logger = logging.getLogger(__name__)
+
+class RefinementSuperseded(Exception):
+    """Raised when a listing was saved by someone else while its premium pass was running"""
+
+
+# Only Amazon has a premium model worth deferring; Walmart and Etsy already use gpt-4o-mini
+TIERED_PLATFORMS = ('amazon',)
+
+
+def tiered_generation_enabled(platform, tier=None):
+    """tier='draft' / 'full' from the request wins; otherwise TIERED_GENERATION_DEFAULT decides"""
+    if platform not in TIERED_PLATFORMS:
+        return False
+    if tier:
+        return tier == 'draft'
+    return getattr(settings, 'TIERED_GENERATION_DEFAULT', False)
+
+
+def _draft_prompt(product):
+    language = getattr(product, 'marketplace_language', '') or MARKETPLACE_LANGUAGES.get(product.marketplace, 'en')
+    language_name = LANGUAGE_NAMES.get(language, LANGUAGE_NAMES.get(language.split('-')[0], 'English'))
+    return f"""Write a first-draft Amazon listing. A full listing (A+ content, FAQs, keywords) follows later.
+
+Product: {product.brand_name} {product.name}
+Marketplace: {product.marketplace} - write everything except the brand name in {language_name}
+Brand tone: {product.brand_tone}
+Target audience: {(product.target_audience or '')[:300]}
+Features: {(product.features or '')[:800]}
+Description: {(product.description or '')[:800]}
+
+- productTitle: brand and product first, then the key benefit, max 200 characters
+- bulletPoints: 5 bullets, each starting with a short CAPITALIZED label and a colon, 150-250 characters
+- productDescription: 3 short paragraphs, specific and benefit-led
+
+Return ONLY valid JSON: {{"productTitle": "...", "bulletPoints": ["...", "...", "...", "...", "..."], "productDescription": "..."}}"""
+
+
+def generate_draft(service, product, listing):
+    """
+    Fill title, bullets and description from the draft model. Returns False (listing untouched)
+    when no draft could be produced, so the caller can fall back to the full generation.
+    """
+    if not service.client:
+        return False
+    model = getattr(settings, 'DRAFT_MODEL', 'gpt-4o-mini')
+    try:
+        response = service._chat_completion(
+            model=model,
+            messages=[{'role': 'user', 'content': _draft_prompt(product)}],
+            max_tokens=getattr(settings, 'DRAFT_MAX_TOKENS', 1200),
+            temperature=0.7,
+            response_format={'type': 'json_object'},
+        )
+        result, repairs = parse_llm_json(response.choices[0].message.content)
+    except Exception as e:
+        logger.warning(f"Draft generation for listing {listing.id} failed: {e}")
+        return False
+    if repairs:
+        logger.info(f"Draft JSON repaired: {', '.join(repairs)}")
+
+    if not isinstance(result, dict):
+        return False
+    title = ' '.join(str(result.get('productTitle') or '').split())
+    bullets = result.get('bulletPoints') or []
+    if isinstance(bullets, str):
+        bullets = bullets.split('\n')
+    bullets = [str(bullet).strip() for bullet in bullets if str(bullet).strip()]
+    description = str(result.get('productDescription') or '').strip()
+    if not (title and bullets and description):
+        logger.warning(f"Draft for listing {listing.id} was incomplete - running the full generation instead")
+        return False
+
+    listing.title = title[:200]
+    listing.bullet_points = '\n\n'.join(bullets)
+    listing.long_description = description
+    listing.refinement_status = 'pending'
+    print(f"📝 Draft ready from {model} - premium refinement queued")
+    return True
+
+
+def refine_listing(listing_id, draft_version):
+    """
+    Run the premium generation over a draft listing. Skipped when the listing is no longer a
+    pending draft of `draft_version` (already refined or being refined, or re-drafted since it
+    was queued). The draft stays in place if the premium pass fails, and edits saved while it
+    runs win over its result.
+    """
+    from .services import ListingGeneratorService
+
+    # Conditional claim: a redelivered task or a concurrent retry finds nothing left to claim
+    claimed_at = timezone.now()
+    claimed = GeneratedListing.objects.filter(
+        id=listing_id, refinement_status='pending', version=draft_version
+    ).update(refinement_status='refining', updated_at=claimed_at)
+    listing = GeneratedListing.objects.select_related('product').get(id=listing_id)
+    if claimed != 1:
+        logger.info(f"Refinement of listing {listing_id} v{draft_version} skipped "
+                    f"({listing.refinement_status or 'not a draft'}, v{listing.version})")
+        return listing
+
+    try:
+        ListingGeneratorService().refine_listing(listing, claimed_at=claimed_at)
+    except RefinementSuperseded as e:
+        GeneratedListing.objects.filter(id=listing_id).update(refinement_status='superseded')
+        logger.info(f"Refinement of listing {listing_id} discarded: {e}")
+        return GeneratedListing.objects.get(id=listing_id)
+    except Exception as e:
+        # Only the refinement columns: the in-memory listing may hold a half-applied premium result
+        GeneratedListing.objects.filter(id=listing_id).update(
+            refinement_status='failed', error_message=f"Refinement failed: {e}"[:1000], updated_at=timezone.now()
+        )
+        raise
+    logger.info(f"Listing {listing_id} refined to v{listing.version}")
+    return listing
@@ -1,6 +1,9 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import GeneratedListingViewSet, generate_listing_clean
+from .views import (GeneratedListingViewSet, generate_listing_clean, create_listing_job, listing_job_status, stream_listing_generation,
+                    create_bulk_batch, bulk_batch_status, resume_bulk_batch, fan_out_marketplaces, fanout_job_status,
+                    regenerate_listing_section, etsy_guides_status, etsy_guide,
+                    derive_platform_listing, reprocess_listing)
 from .api_fix import generate_listing_fixed
 
 router = DefaultRouter()
@@ -11,4 +14,17 @@ urlpatterns = [
     path('generate/<int:product_id>/<str:platform>/', GeneratedListingViewSet.as_view({'post': 'generate'}), name='generate-listing'),
     path('generate-fixed/<int:product_id>/<str:platform>/', generate_listing_fixed, name='generate-listing-fixed'),
     path('generate-clean/<int:product_id>/<str:platform>/', generate_listing_clean, name='generate-listing-clean'),
+    path('jobs/<int:product_id>/<str:platform>/', create_listing_job, name='create-listing-job'),
+    path('jobs/<int:job_id>/', listing_job_status, name='listing-job-status'),
+    path('stream/<int:product_id>/<str:platform>/', stream_listing_generation, name='stream-listing-generation'),
+    path('bulk/', create_bulk_batch, name='create-bulk-batch'),
+    path('bulk/<int:batch_id>/', bulk_batch_status, name='bulk-batch-status'),
+    path('bulk/<int:batch_id>/resume/', resume_bulk_batch, name='resume-bulk-batch'),
+    path('fanout/<int:product_id>/', fan_out_marketplaces, name='fan-out-marketplaces'),
+    path('fanout/jobs/<int:job_id>/', fanout_job_status, name='fanout-job-status'),
+    path('<int:listing_id>/sections/<str:section>/', regenerate_listing_section, name='regenerate-listing-section'),
+    path('<int:listing_id>/etsy-guides/', etsy_guides_status, name='etsy-guides-status'),
+    path('<int:listing_id>/etsy-guides/<str:guide>/', etsy_guide, name='etsy-guide'),
+    path('<int:listing_id>/derive/<str:platform>/', derive_platform_listing, name='derive-platform-listing'),
+    path('<int:listing_id>/reprocess/', reprocess_listing, name='reprocess-listing'),
 ]
\ No newline at end of file
@@ -1,3 +1,4 @@
+import json
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -14,6 +15,18 @@ from .quality_validator import ListingQualityValidator
 from apps.users.models import UserProfile
 
 
+def bypass_cache_requested(request):
+    """?nocache=1 forces fresh LLM completions instead of cached ones"""
+    return request.GET.get('nocache', '').lower() in ('1', 'true', 'yes')
+
+
+def draft_requested(request, platform):
+    """?tier=draft returns a fast draft and refines it in the background; ?tier=full forces one pass"""
+    from .tiered_generation import tiered_generation_enabled
+    tier = request.GET.get('tier', '').lower()
+    return tiered_generation_enabled(platform, tier if tier in ('draft', 'full') else None)
+
+
 @method_decorator(csrf_exempt, name='dispatch')
 class GeneratedListingViewSet(viewsets.ModelViewSet):
     queryset = GeneratedListing.objects.all()
@@ -52,7 +65,7 @@ class GeneratedListingViewSet(viewsets.ModelViewSet):
             # For demo purposes, skip credit check
             # Generate listing
             logger.info("Creating service...")
-            service = ListingGeneratorService()
+            service = ListingGeneratorService(bypass_cache=bypass_cache_requested(request))
             logger.info("Service initialized, generating listing...")
             
             logger.info(f"About to call generate_listing({product_id}, '{platform}')")
@@ -105,6 +118,18 @@ class GeneratedListingViewSet(viewsets.ModelViewSet):
                 'ai_enabled': False
             }, status=400)
     
+    @action(detail=False, methods=['get'])
+    def llm_cache_stats(self, request):
+        """Hit/miss counters for this worker's LLM response cache"""
+        from .llm_cache import get_llm_cache
+        return Response(get_llm_cache().stats())
+
+    @action(detail=False, methods=['get'])
+    def prompt_fragment_stats(self, request):
+        """Reuse counters for this worker's prompt fragment registry"""
+        from .prompt_fragments import get_prompt_fragments
+        return Response(get_prompt_fragments().stats())
+
     @action(detail=True, methods=['get'])
     def images(self, request, pk=None):
         """Get image generation status for a listing"""
@@ -292,8 +317,8 @@ def generate_listing_clean(request, product_id, platform):
             }, status=400)
         
         # Generate listing using the working service
-        service = ListingGeneratorService()
-        listing = service.generate_listing(product_id, platform)
+        service = ListingGeneratorService(bypass_cache=bypass_cache_requested(request))
+        listing = service.generate_listing(product_id, platform, draft=draft_requested(request, platform))
         
         # Return minimal response with safe encoding - platform-specific fields
         # 🔧 CRITICAL FIX: Return correct platform-specific fields instead of generic ones
@@ -310,6 +335,8 @@ def generate_listing_clean(request, product_id, platform):
             'title': title,
             'status': listing.status,
             'aplus_length': content_length,
+            'version': listing.version,
+            'refinement_status': listing.refinement_status,
             'message': 'Listing generated successfully'
         }, status=201)
         
@@ -318,4 +345,412 @@ def generate_listing_clean(request, product_id, platform):
         return JsonResponse({
             'success': False,
             'error': str(e)[:200]  # Limit error message length
-        }, status=500)
\ No newline at end of file
+        }, status=500)
+
+SUPPORTED_PLATFORMS = ['amazon', 'walmart', 'etsy', 'tiktok', 'shopify']
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def create_listing_job(request, product_id, platform):
+    """
+    Queue listing generation and return immediately with a job id.
+    Poll listing_job_status for progress instead of holding the request open.
+    """
+    from apps.core.models import Product
+    from .tasks import enqueue_listing_generation
+
+    if platform not in SUPPORTED_PLATFORMS:
+        return JsonResponse({
+            'success': False,
+            'error': f'Unsupported platform: {platform}'
+        }, status=400)
+
+    try:
+        product = Product.objects.get(id=product_id)
+    except Product.DoesNotExist:
+        return JsonResponse({
+            'success': False,
+            'error': 'Product not found'
+        }, status=404)
+
+    try:
+        listing = enqueue_listing_generation(product, platform, bypass_cache=bypass_cache_requested(request),
+                                             draft=draft_requested(request, platform))
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'error': f'Could not queue generation: {str(e)[:200]}'
+        }, status=503)
+
+    return JsonResponse({
+        'success': True,
+        'job_id': listing.id,
+        'status': listing.status,
+        'status_url': f'/api/listings/jobs/{listing.id}/'
+    }, status=202)
+
+
+@require_http_methods(["GET"])
+def listing_job_status(request, job_id):
+    """Report the state of a queued generation: pending, processing, completed or failed"""
+    try:
+        listing = GeneratedListing.objects.get(id=job_id)
+    except GeneratedListing.DoesNotExist:
+        return JsonResponse({
+            'success': False,
+            'error': 'Job not found'
+        }, status=404)
+
+    if listing.platform == 'walmart':
+        title = listing.walmart_product_title[:100] if listing.walmart_product_title else ''
+    else:
+        title = listing.title[:100] if listing.title else ''
+
+    return JsonResponse({
+        'success': True,
+        'job_id': listing.id,
+        'product_id': listing.product_id,
+        'platform': listing.platform,
+        'status': listing.status,
+        'done': listing.status in ('completed', 'failed'),
+        'title': title if listing.status == 'completed' else '',
+        'error': listing.error_message if listing.status == 'failed' else '',
+        'version': listing.version,
+        'refinement_status': listing.refinement_status,
+        'created_at': listing.created_at.isoformat(),
+        'updated_at': listing.updated_at.isoformat()
+    })
+
+
+def _sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@require_http_methods(["GET"])
+def stream_listing_generation(request, product_id, platform):
+    """
+    Server-Sent Events endpoint: generates the listing and pushes each field
+    (productTitle, bulletPoints, productDescription, ...) as soon as it is decoded.
+    Events: listing (id), field (key/value), complete (id/status), error.
+    """
+    import queue
+    import threading
+    from django.db import close_old_connections
+    from django.http import StreamingHttpResponse
+    from apps.core.models import Product
+
+    if platform != 'amazon':
+        return JsonResponse({
+            'success': False,
+            'error': 'Streaming is only available for Amazon listings'
+        }, status=400)
+
+    try:
+        product = Product.objects.get(id=product_id)
+    except Product.DoesNotExist:
+        return JsonResponse({
+            'success': False,
+            'error': 'Product not found'
+        }, status=404)
+
+    listing = GeneratedListing.objects.create(product=product, platform=platform, status='pending')
+    events = queue.Queue()
+    bypass_cache = bypass_cache_requested(request)
+
+    def run_generation():
+        try:
+            service = ListingGeneratorService(bypass_cache=bypass_cache)
+            service.generate_listing(
+                product.id, platform, listing=listing,
+                on_field=lambda key, value: events.put(('field', {'key': key, 'value': value}))
+            )
+            events.put(('complete', {'id': listing.id, 'status': listing.status}))
+        except Exception as e:
+            events.put(('error', {'id': listing.id, 'error': str(e)[:200]}))
+        finally:
+            close_old_connections()
+
+    worker = threading.Thread(target=run_generation, daemon=True)
+    worker.start()
+
+    def event_stream():
+        yield _sse_event('listing', {'id': listing.id, 'status': 'processing'})
+        while True:
+            try:
+                event, data = events.get(timeout=15)
+            except queue.Empty:
+                yield ": keep-alive\n\n"
+                continue
+            yield _sse_event(event, data)
+            if event in ('complete', 'error'):
+                break
+
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def create_bulk_batch(request):
+    """
+    Start a bulk catalog generation.
+    Accepts a multipart 'catalog' file (CSV or JSON) with 'platforms'/'marketplaces' form fields,
+    or a JSON body {"products": [...], "platforms": [...], "marketplaces": [...]}.
+    """
+    from .bulk import CatalogError, parse_catalog, create_batch, batch_progress
+    from .tasks import enqueue_bulk_batch
+
+    try:
+        if request.FILES.get('catalog'):
+            upload = request.FILES['catalog']
+            fmt = 'json' if upload.name.lower().endswith('.json') else 'csv'
+            definitions = parse_catalog(upload.read(), fmt)
+            options = request.POST
+        else:
+            options = json.loads(request.body or b'{}')
+            if not isinstance(options, dict):
+                raise CatalogError('Request body must be a JSON object')
+            definitions = parse_catalog(json.dumps(options.get('products', [])), 'json')
+
+        workers = options.get('workers')
+        try:
+            workers = int(workers) if workers else None
+        except (TypeError, ValueError):
+            raise CatalogError(f"workers must be a positive integer, got {workers!r}")
+        if workers is not None and workers < 1:
+            raise CatalogError(f"workers must be a positive integer, got {workers}")
+
+        batch = create_batch(
+            definitions,
+            platforms=options.get('platforms', 'amazon'),
+            marketplaces=options.get('marketplaces', 'us'),
+            name=options.get('name', ''),
+        )
+    except (CatalogError, json.JSONDecodeError) as e:
+        return JsonResponse({'success': False, 'error': str(e)[:500]}, status=400)
+
+    enqueue_bulk_batch(batch, workers=workers)
+
+    return JsonResponse({
+        'success': True,
+        **batch_progress(batch),
+        'status_url': f'/api/listings/bulk/{batch.id}/'
+    }, status=202)
+
+
+@require_http_methods(["GET"])
+def bulk_batch_status(request, batch_id):
+    """Aggregate progress, throughput and ETA for a bulk batch"""
+    from .bulk import batch_progress
+    from .models import BulkGenerationBatch
+
+    try:
+        batch = BulkGenerationBatch.objects.get(id=batch_id)
+    except BulkGenerationBatch.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Batch not found'}, status=404)
+
+    progress = batch_progress(batch)
+    failures = list(batch.items.filter(status='failed').values('product_id', 'platform', 'error_message')[:20])
+    return JsonResponse({'success': True, **progress, 'recent_failures': failures})
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def resume_bulk_batch(request, batch_id):
+    """Resume a batch whose worker stopped before finishing (409 while its runner is still alive)"""
+    from .bulk import batch_is_live, batch_progress
+    from .models import BulkGenerationBatch
+    from .tasks import enqueue_bulk_batch
+
+    try:
+        batch = BulkGenerationBatch.objects.get(id=batch_id)
+    except BulkGenerationBatch.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Batch not found'}, status=404)
+
+    if batch_is_live(batch):
+        return JsonResponse({'success': False, 'error': f'Batch {batch_id} is already running',
+                             **batch_progress(batch)}, status=409)
+    enqueue_bulk_batch(batch)
+    return JsonResponse({'success': True, **batch_progress(batch)}, status=202)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def fan_out_marketplaces(request, product_id):
+    """
+    Queue generation of one product for many marketplaces and return a job id immediately.
+    JSON body {"marketplaces": ["us", "de", "walmart_usa", ...], "workers": 6}; omit marketplaces for
+    every Amazon and Walmart market. Poll fanout_job_status for the per-marketplace results.
+    """
+    from apps.core.models import Product
+    from .fanout import FanOutError, create_fanout_job, fanout_job_status
+    from .tasks import enqueue_fanout_job
+
+    try:
+        options = json.loads(request.body or b'{}')
+        workers = options.get('workers')
+        job = create_fanout_job(
+            product_id,
+            marketplaces=options.get('marketplaces') or None,
+            workers=int(workers) if workers else None,
+            bypass_cache=bypass_cache_requested(request),
+        )
+    except Product.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Product not found'}, status=404)
+    except (FanOutError, json.JSONDecodeError, ValueError) as e:
+        return JsonResponse({'success': False, 'error': str(e)[:500]}, status=400)
+
+    try:
+        enqueue_fanout_job(job)
+    except Exception as e:
+        job.status = 'failed'
+        job.error_message = str(e)[:1000]
+        job.save(update_fields=['status', 'error_message', 'updated_at'])
+        return JsonResponse({'success': False, 'error': f'Could not queue fan-out: {str(e)[:200]}'}, status=503)
+
+    return JsonResponse({
+        'success': True,
+        **fanout_job_status(job),
+        'status_url': f'/api/listings/fanout/jobs/{job.id}/',
+    }, status=202)
+
+
+@require_http_methods(["GET"])
+def fanout_job_status(request, job_id):
+    """Progress of a fan-out job with one result entry per marketplace"""
+    from .fanout import fanout_job_status as job_status
+    from .models import FanOutJob
+
+    try:
+        job = FanOutJob.objects.get(id=job_id)
+    except FanOutJob.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Job not found'}, status=404)
+
+    return JsonResponse({'success': job.status != 'failed', **job_status(job)})
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def regenerate_listing_section(request, listing_id, section):
+    """
+    Rewrite one section of an existing listing in place (title, bullets, description, faqs,
+    backend_keywords or aplus). JSON body: {"index": 3} for A+ section 3, optional
+    {"instructions": "shorter, more playful"}. Only the section's columns are updated.
+    """
+    from .section_regeneration import SectionRegenerationError, regenerate_section
+
+    try:
+        options = json.loads(request.body or b'{}')
+        index = options.get('index')
+        result = regenerate_section(
+            listing_id, section,
+            index=int(index) if index else None,
+            instructions=options.get('instructions', ''),
+        )
+    except GeneratedListing.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Listing not found'}, status=404)
+    except (SectionRegenerationError, json.JSONDecodeError, ValueError) as e:
+        return JsonResponse({'success': False, 'error': str(e)[:500]}, status=400)
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': str(e)[:500]}, status=502)
+
+    return JsonResponse({'success': True, **result})
+
+
+@require_http_methods(["GET"])
+def etsy_guides_status(request, listing_id):
+    """Which of the ten Etsy business guides have been generated for a listing"""
+    from .etsy_guides import ETSY_GUIDES, ETSY_GUIDE_FIELDS, guide_status
+
+    try:
+        listing = GeneratedListing.objects.only('id', 'platform', *ETSY_GUIDE_FIELDS).get(id=listing_id)
+    except GeneratedListing.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Listing not found'}, status=404)
+    if listing.platform != 'etsy':
+        return JsonResponse({'success': False, 'error': 'Business guides are only available for Etsy listings'}, status=400)
+
+    generated = guide_status(listing)
+    return JsonResponse({
+        'success': True,
+        'listing_id': listing.id,
+        'guides': [{'guide': slug, 'title': guide.title, 'generated': generated[slug]}
+                   for slug, guide in ETSY_GUIDES.items()],
+    })
+
+
+@csrf_exempt
+@require_http_methods(["GET", "POST"])
+def etsy_guide(request, listing_id, guide):
+    """
+    One Etsy business guide. Generated on the first request and cached on the listing;
+    POST {"refresh": true} generates a new version.
+    """
+    from .etsy_guides import EtsyGuideError, get_etsy_guide
+
+    try:
+        refresh = request.method == 'POST' and bool(json.loads(request.body or b'{}').get('refresh'))
+        result = get_etsy_guide(listing_id, guide, refresh=refresh)
+    except GeneratedListing.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Listing not found'}, status=404)
+    except (EtsyGuideError, json.JSONDecodeError) as e:
+        return JsonResponse({'success': False, 'error': str(e)[:500]}, status=400)
+
+    return JsonResponse({'success': True, **result})
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def derive_platform_listing(request, listing_id, platform):
+    """
+    Build a Walmart, Shopify or TikTok listing from an existing listing of the same product
+    with local transformations (plus one small model call for fields that can't be derived)
+    """
+    from .cross_platform import CrossPlatformError, derive_from_listing
+
+    try:
+        listing = derive_from_listing(listing_id, platform)
+    except GeneratedListing.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Listing not found'}, status=404)
+    except CrossPlatformError as e:
+        return JsonResponse({'success': False, 'error': str(e)[:500]}, status=400)
+
+    return JsonResponse({
+        'success': True,
+        'id': listing.id,
+        'source_listing_id': listing_id,
+        'platform': listing.platform,
+        'status': listing.status,
+    }, status=201)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def reprocess_listing(request, listing_id):
+    """
+    Re-run parsing, normalization, keyword derivation and A+ rendering on the listing's archived
+    raw model response (the latest, or {"response_id": ...}) - no model call is made
+    """
+    from .response_archive import ReprocessError, reprocess_listing as reprocess
+
+    try:
+        options = json.loads(request.body or b'{}')
+        response_id = options.get('response_id')
+        listing, archived = reprocess(listing_id, response_id=int(response_id) if response_id else None)
+    except GeneratedListing.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Listing not found'}, status=404)
+    except (ReprocessError, json.JSONDecodeError, ValueError) as e:
+        return JsonResponse({'success': False, 'error': str(e)[:500]}, status=400)
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': str(e)[:500]}, status=500)
+
+    return JsonResponse({
+        'success': True,
+        'id': listing.id,
+        'response_id': archived.id,
+        'model': archived.model,
+        'prompt_hash': archived.prompt_hash,
+        'status': listing.status,
+    })
@@ -217,6 +217,101 @@ CORS_ALLOW_METHODS = [
 CSRF_TRUSTED_ORIGINS = ['http://localhost:3000', 'http://127.0.0.1:3000']
 
 OPENAI_API_KEY = config('OPENAI_API_KEY', default='')
+OPENAI_BASE_URL = config('OPENAI_BASE_URL', default='')
+
+# LLM backend: 'openai' for the real API, 'replay' for the offline stand-in (recorded/synthetic completions)
+LLM_BACKEND = config('LLM_BACKEND', default='openai')
+LLM_STANDIN_PROFILE = config('LLM_STANDIN_PROFILE', default='instant')  # instant, gpt-4o-mini, gpt-5, degraded
+LLM_REPLAY_PATHS = config('LLM_REPLAY_PATHS', default='', cast=lambda v: [s.strip() for s in v.split(',') if s.strip()])
+LLM_RECORD_DIR = config('LLM_RECORD_DIR', default='')  # Save real completions here for exact replay
+LLM_STANDIN_MODE = config('LLM_STANDIN_MODE', default='replay')  # replay (seed captures) or synthetic
+
+# Shared OpenAI connection pool (one per worker process)
+OPENAI_POOL_MAX_CONNECTIONS = config('OPENAI_POOL_MAX_CONNECTIONS', default=20, cast=int)
+OPENAI_POOL_MAX_KEEPALIVE = config('OPENAI_POOL_MAX_KEEPALIVE', default=10, cast=int)
+OPENAI_POOL_KEEPALIVE_EXPIRY = config('OPENAI_POOL_KEEPALIVE_EXPIRY', default=60.0, cast=float)
+OPENAI_TIMEOUT = config('OPENAI_TIMEOUT', default=120.0, cast=float)
+OPENAI_CONNECT_TIMEOUT = config('OPENAI_CONNECT_TIMEOUT', default=10.0, cast=float)
+OPENAI_MAX_RETRIES = config('OPENAI_MAX_RETRIES', default=0, cast=int)  # Retries are handled by the LLM gateway
+
+# LLM call gateway: shared token buckets, jittered backoff and circuit breaker
+LLM_RATE_LIMIT_STORE = config('LLM_RATE_LIMIT_STORE', default='local')  # 'local' (per process) or 'cache' (shared via CACHES)
+LLM_RATE_LIMIT_RPM = config('LLM_RATE_LIMIT_RPM', default=500, cast=int)
+LLM_RATE_LIMIT_TPM = config('LLM_RATE_LIMIT_TPM', default=200000, cast=int)
+LLM_RATE_LIMIT_MAX_WAIT = config('LLM_RATE_LIMIT_MAX_WAIT', default=60.0, cast=float)
+LLM_MAX_ATTEMPTS = config('LLM_MAX_ATTEMPTS', default=4, cast=int)
+LLM_BACKOFF_BASE = config('LLM_BACKOFF_BASE', default=1.0, cast=float)
+LLM_BACKOFF_MAX = config('LLM_BACKOFF_MAX', default=30.0, cast=float)
+LLM_BREAKER_FAILURE_THRESHOLD = config('LLM_BREAKER_FAILURE_THRESHOLD', default=5, cast=int)
+LLM_BREAKER_RESET_TIMEOUT = config('LLM_BREAKER_RESET_TIMEOUT', default=30.0, cast=float)
+
+# Cache framework - Redis when configured, in-process locmem otherwise (development and tests)
+CACHE_REDIS_URL = config('CACHE_REDIS_URL', default='')
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'listory-default',
+        }
+    }
+
+# LLM response cache (identical prompt + params reuse the stored completion)
+LLM_CACHE_ENABLED = config('LLM_CACHE_ENABLED', default=True, cast=bool)
+LLM_CACHE_TTL = config('LLM_CACHE_TTL', default=86400, cast=int)
+LLM_CACHE_MAX_ENTRIES = config('LLM_CACHE_MAX_ENTRIES', default=256, cast=int)
+LLM_CACHE_ALIAS = config('LLM_CACHE_ALIAS', default='default')
+
+# Shared executor for concurrent LLM calls (per process) and per-call timeout in seconds
+LLM_EXECUTOR_MAX_WORKERS = config('LLM_EXECUTOR_MAX_WORKERS', default=16, cast=int)
+LLM_BRANCH_TIMEOUT = config('LLM_BRANCH_TIMEOUT', default=90.0, cast=float)
+
+# Bulk catalog generation: concurrent listings per batch (provider pacing comes from the LLM gateway)
+BULK_GENERATION_WORKERS = config('BULK_GENERATION_WORKERS', default=4, cast=int)
+# A 'running' batch whose runner has not checked in for this long can be resumed by another runner
+BULK_BATCH_LEASE_SECONDS = config('BULK_BATCH_LEASE_SECONDS', default=300, cast=int)
+
+# Multi-marketplace fan-out: concurrent per-market generations for one product
+MARKETPLACE_FANOUT_WORKERS = config('MARKETPLACE_FANOUT_WORKERS', default=6, cast=int)
+
+# Prompt fragment registry: rendered variants kept per randomized fragment, and warm-up at startup
+PROMPT_FRAGMENT_VARIANTS = config('PROMPT_FRAGMENT_VARIANTS', default=4, cast=int)
+PROMPT_FRAGMENT_WARMUP = config('PROMPT_FRAGMENT_WARMUP', default=False, cast=bool)
+
+# Input-token budget per prompt (0 = unlimited); lowest-priority fragments are cut first
+PROMPT_TOKEN_BUDGET = config('PROMPT_TOKEN_BUDGET', default=0, cast=int)
+AMAZON_PROMPT_TOKEN_BUDGET = config('AMAZON_PROMPT_TOKEN_BUDGET', default=0, cast=int)
+
+# Structured output: platforms whose generation call sends a JSON schema (amazon, walmart);
+# sections that still miss the schema are re-requested alone with this output-token cap
+STRUCTURED_OUTPUT_PLATFORMS = config('STRUCTURED_OUTPUT_PLATFORMS', default='', cast=lambda v: [s.strip() for s in v.split(',') if s.strip()])
+STRUCTURED_OUTPUT_REPAIR_MAX_TOKENS = config('STRUCTURED_OUTPUT_REPAIR_MAX_TOKENS', default=1500, cast=int)
+
+# Draft-then-refine Amazon generation: a small-model draft is returned first and the premium
+# generation runs in the background (per request with ?tier=draft, or for every request by default)
+TIERED_GENERATION_DEFAULT = config('TIERED_GENERATION_DEFAULT', default=False, cast=bool)
+DRAFT_MODEL = config('DRAFT_MODEL', default='gpt-4o-mini')
+DRAFT_MAX_TOKENS = config('DRAFT_MAX_TOKENS', default=1200, cast=int)
+
+# Walmart listings are adapted from the product's existing Amazon/Etsy listing when one exists
+CROSS_PLATFORM_DERIVATION = config('CROSS_PLATFORM_DERIVATION', default=True, cast=bool)
+
+# Localized replacement glossaries: optional JSON file {marketplace: {group: {term: replacement}}}
+# extending the built-in ones (groups: aplus, faq_prefixes)
+LOCALIZED_GLOSSARY_PATH = config('LOCALIZED_GLOSSARY_PATH', default='')
+
+# Raw LLM response archive (zlib-compressed) that listings can be re-processed from without a model call
+LLM_RESPONSE_ARCHIVE = config('LLM_RESPONSE_ARCHIVE', default=True, cast=bool)
+LLM_ARCHIVE_COMPRESSION_LEVEL = config('LLM_ARCHIVE_COMPRESSION_LEVEL', default=6, cast=int)
+
+# Coalescing of identical concurrent generation requests
+LISTING_COALESCE_TTL = config('LISTING_COALESCE_TTL', default=600, cast=int)
 
 CELERY_BROKER_URL = config('REDIS_URL', default='redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = config('REDIS_URL', default='redis://localhost:6379/0')
\ No newline at end of file
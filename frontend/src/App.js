@@ -15,6 +15,7 @@ function App() {
           <Route path="/" element={<LandingPage />} />
           <Route path="/create" element={<ProductForm />} />
           <Route path="/results/:listingId" element={<ListingResults />} />
+          <Route path="/results/stream/:productId" element={<ListingResults />} />
           <Route path="/dashboard" element={<Dashboard />} />
           <Route path="/login" element={<Navigate to="/" replace />} />
           <Route path="/register" element={<Navigate to="/" replace />} />
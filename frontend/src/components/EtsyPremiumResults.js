@@ -7,9 +7,13 @@ import {
   BarChart3, Zap, Crown, Gift, MapPin, Award, Clock, Tag
 } from 'lucide-react';
 import toast from 'react-hot-toast';
+import { listingAPI } from '../services/api';
 
 const EtsyPremiumResults = ({ listing }) => {
   const [activeTab, setActiveTab] = useState('listing');
+  // Business guides are generated on first open and cached on the listing by the backend
+  const [guides, setGuides] = useState({});
+  const [loadingGuide, setLoadingGuide] = useState(null);
   
   const copyToClipboard = (text, label) => {
     navigator.clipboard.writeText(text);
@@ -18,16 +22,16 @@ const EtsyPremiumResults = ({ listing }) => {
 
   const WOWFeatureTabs = [
     { id: 'listing', label: '🎨 Listing Content', icon: Star, description: 'Perfect Etsy listing' },
-    { id: 'shop_setup', label: '🏪 Shop Setup', icon: Crown, description: 'Complete shop guide' },
-    { id: 'social_media', label: '📱 Social Media', icon: Instagram, description: '30-day content plan' },
-    { id: 'photography', label: '📸 Photography', icon: Camera, description: 'Pro photo guide' },
-    { id: 'pricing', label: '💰 Pricing Strategy', icon: DollarSign, description: 'Smart pricing analysis' },
-    { id: 'seo', label: '🔍 SEO Report', icon: TrendingUp, description: 'Traffic optimization' },
-    { id: 'customer_service', label: '💌 Customer Service', icon: MessageCircle, description: 'Email templates' },
-    { id: 'policies', label: '📋 Shop Policies', icon: Award, description: 'Legal protection' },
-    { id: 'variations', label: '🎯 Upsells & Variations', icon: Target, description: 'Revenue optimization' },
-    { id: 'competitor', label: '🕵️ Market Intelligence', icon: BarChart3, description: 'Competitor insights' },
-    { id: 'seasonal', label: '📅 Marketing Calendar', icon: Calendar, description: '12-month strategy' }
+    { id: 'shop_setup', guide: 'shop_setup_guide', label: '🏪 Shop Setup', icon: Crown, description: 'Complete shop guide' },
+    { id: 'social_media', guide: 'social_media_package', label: '📱 Social Media', icon: Instagram, description: '30-day content plan' },
+    { id: 'photography', guide: 'photography_guide', label: '📸 Photography', icon: Camera, description: 'Pro photo guide' },
+    { id: 'pricing', guide: 'pricing_analysis', label: '💰 Pricing Strategy', icon: DollarSign, description: 'Smart pricing analysis' },
+    { id: 'seo', guide: 'seo_report', label: '🔍 SEO Report', icon: TrendingUp, description: 'Traffic optimization' },
+    { id: 'customer_service', guide: 'customer_service_templates', label: '💌 Customer Service', icon: MessageCircle, description: 'Email templates' },
+    { id: 'policies', guide: 'policies_templates', label: '📋 Shop Policies', icon: Award, description: 'Legal protection' },
+    { id: 'variations', guide: 'variations_guide', label: '🎯 Upsells & Variations', icon: Target, description: 'Revenue optimization' },
+    { id: 'competitor', guide: 'competitor_insights', label: '🕵️ Market Intelligence', icon: BarChart3, description: 'Competitor insights' },
+    { id: 'seasonal', guide: 'seasonal_calendar', label: '📅 Marketing Calendar', icon: Calendar, description: '12-month strategy' }
   ];
 
   const EtsyFieldDisplay = ({ label, content, copyLabel, icon: Icon }) => (
@@ -145,22 +149,41 @@ const EtsyPremiumResults = ({ listing }) => {
     </div>
   );
 
-  const renderWOWFeature = (featureId) => {
-    const featureContent = {
-      shop_setup: listing.etsy_shop_setup_guide,
-      social_media: listing.etsy_social_media_package,
-      photography: listing.etsy_photography_guide,
-      pricing: listing.etsy_pricing_analysis,
-      seo: listing.etsy_seo_report,
-      customer_service: listing.etsy_customer_service_templates,
-      policies: listing.etsy_policies_templates,
-      variations: listing.etsy_variations_guide,
-      competitor: listing.etsy_competitor_insights,
-      seasonal: listing.etsy_seasonal_calendar
-    };
+  const guideContent = (feature) => guides[feature.guide] || listing[`etsy_${feature.guide}`];
+
+  const loadGuide = async (feature, refresh = false) => {
+    setLoadingGuide(feature.guide);
+    try {
+      const response = await listingAPI.etsyGuide(listing.id, feature.guide, refresh);
+      setGuides((current) => ({ ...current, [feature.guide]: response.data.content }));
+    } catch (error) {
+      toast.error(error.response?.data?.error || `Could not load ${feature.label}`);
+    } finally {
+      setLoadingGuide(null);
+    }
+  };
+
+  const openTab = (tab) => {
+    setActiveTab(tab.id);
+    if (tab.guide && !guideContent(tab) && loadingGuide !== tab.guide) {
+      loadGuide(tab);
+    }
+  };
 
-    const content = featureContent[featureId];
+  const renderWOWFeature = (featureId) => {
     const feature = WOWFeatureTabs.find(tab => tab.id === featureId);
+    const content = guideContent(feature);
+
+    if (loadingGuide === feature.guide) {
+      return (
+        <div className="text-center py-12">
+          <div className="animate-spin rounded-full h-10 w-10 border-b-2 border-purple-600 mx-auto mb-4"></div>
+          <div className="text-gray-500 text-lg">
+            Generating your {feature.label}...
+          </div>
+        </div>
+      );
+    }
 
     if (!content) {
       return (
@@ -168,6 +191,12 @@ const EtsyPremiumResults = ({ listing }) => {
           <div className="text-gray-400 text-lg">
             {feature?.label} content not available
           </div>
+          <button
+            onClick={() => loadGuide(feature)}
+            className="mt-4 bg-purple-600 hover:bg-purple-700 text-white px-4 py-2 rounded-lg transition-colors"
+          >
+            Generate
+          </button>
         </div>
       );
     }
@@ -195,6 +224,13 @@ const EtsyPremiumResults = ({ listing }) => {
               <Copy className="h-4 w-4" />
               <span>Copy All Content</span>
             </button>
+            <button
+              onClick={() => loadGuide(feature, true)}
+              className="bg-white/20 hover:bg-white/30 text-white px-4 py-2 rounded-lg transition-colors flex items-center space-x-2"
+            >
+              <Zap className="h-4 w-4" />
+              <span>Regenerate</span>
+            </button>
             <div className="text-indigo-100 text-sm">
               🎯 Exclusive Feature - Not Available Anywhere Else!
             </div>
@@ -253,7 +289,7 @@ const EtsyPremiumResults = ({ listing }) => {
             {WOWFeatureTabs.map((tab) => (
               <button
                 key={tab.id}
-                onClick={() => setActiveTab(tab.id)}
+                onClick={() => openTab(tab)}
                 className={`px-4 py-2 rounded-lg text-sm font-medium transition-all ${
                   activeTab === tab.id
                     ? 'bg-purple-600 text-white shadow-lg'
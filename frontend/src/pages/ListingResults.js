@@ -92,11 +92,38 @@ A: These earbuds offer a stable connection up to 33 feet (10 meters) from your d
   };
 
 const ListingResults = () => {
-  const { listingId } = useParams();
+  const { listingId, productId } = useParams();
   const navigate = useNavigate();
   const [activeTab, setActiveTab] = useState('listing');
   const [listing, setListing] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [streamedFields, setStreamedFields] = useState({});
+
+  // Streaming mode: show fields as the AI finishes them, then load the saved listing
+  useEffect(() => {
+    if (!productId) return undefined;
+
+    const source = listingAPI.stream(productId, 'amazon');
+    source.addEventListener('field', (event) => {
+      const { key, value } = JSON.parse(event.data);
+      setStreamedFields((prev) => ({ ...prev, [key]: value }));
+    });
+    source.addEventListener('complete', (event) => {
+      const { id } = JSON.parse(event.data);
+      source.close();
+      toast.success('Listing generated successfully!');
+      navigate(`/results/${id}`, { replace: true });
+    });
+    source.addEventListener('error', (event) => {
+      source.close();
+      const message = event.data ? JSON.parse(event.data).error : 'Connection lost';
+      console.error('Streaming generation failed:', message);
+      toast.error('Failed to generate listing. Please try again.');
+      navigate('/create');
+    });
+
+    return () => source.close();
+  }, [productId, navigate]);
 
   // Fetch real listing data from API
   useEffect(() => {
@@ -134,6 +161,50 @@ const ListingResults = () => {
     toast.success('Copied to clipboard!');
   };
 
+  if (productId) {
+    const streamedBullets = Array.isArray(streamedFields.bulletPoints) ? streamedFields.bulletPoints : [];
+    return (
+      <div className="min-h-screen bg-gray-50 py-12">
+        <div className="max-w-4xl mx-auto px-4">
+          <div className="flex items-center mb-6">
+            <div className="animate-spin rounded-full h-6 w-6 border-b-2 border-primary-600 mr-3"></div>
+            <p className="text-lg text-gray-600">Writing your listing... sections appear as soon as they are ready</p>
+          </div>
+          <div className="bg-white rounded-lg shadow p-6 space-y-6">
+            <div>
+              <h3 className="font-semibold text-gray-900 mb-2">Title</h3>
+              {streamedFields.productTitle ? (
+                <p className="text-gray-800">{streamedFields.productTitle}</p>
+              ) : (
+                <div className="h-5 bg-gray-200 rounded animate-pulse"></div>
+              )}
+            </div>
+            <div>
+              <h3 className="font-semibold text-gray-900 mb-2">Bullet Points</h3>
+              {streamedBullets.length > 0 ? (
+                <ul className="list-disc pl-5 space-y-2 text-sm text-gray-700">
+                  {streamedBullets.map((bullet, index) => <li key={index}>{bullet}</li>)}
+                </ul>
+              ) : (
+                <div className="space-y-2">
+                  {[0, 1, 2].map((i) => <div key={i} className="h-4 bg-gray-200 rounded animate-pulse"></div>)}
+                </div>
+              )}
+            </div>
+            <div>
+              <h3 className="font-semibold text-gray-900 mb-2">Description</h3>
+              {streamedFields.productDescription ? (
+                <p className="whitespace-pre-wrap text-sm text-gray-700">{streamedFields.productDescription}</p>
+              ) : (
+                <div className="h-16 bg-gray-200 rounded animate-pulse"></div>
+              )}
+            </div>
+          </div>
+        </div>
+      </div>
+    );
+  }
+
   if (loading) {
     return (
       <div className="min-h-screen bg-gray-50 flex items-center justify-center">
@@ -252,6 +252,12 @@ const ProductForm = () => {
         throw new Error('No product ID available');
       }
       
+      // Amazon listings stream field-by-field into the results page
+      if (selectedPlatform === 'amazon') {
+        navigate(`/results/stream/${productId}`);
+        return;
+      }
+      
       // Generate listing
       const listingResponse = await listingAPI.generate(productId, selectedPlatform);
       const listingId = listingResponse.data.id;
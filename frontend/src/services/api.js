@@ -45,12 +45,18 @@ export const productAPI = {
 
 export const listingAPI = {
   generate: (productId, platform) => api.post(`/listings/generate-clean/${productId}/${platform}/`),
+  startJob: (productId, platform) => api.post(`/listings/jobs/${productId}/${platform}/`),
+  jobStatus: (jobId) => api.get(`/listings/jobs/${jobId}/`),
+  stream: (productId, platform) => new EventSource(`${API_BASE_URL}/listings/stream/${productId}/${platform}/`),
   list: () => api.get('/listings/generated/'),
   get: (id) => api.get(`/listings/generated/${id}/`),
   delete: (id) => api.delete(`/listings/generated/${id}/`),
   getImages: (id) => api.get(`/listings/generated/${id}/images/`),
   generateImages: (id) => api.post(`/listings/generated/${id}/generate_images/`),
   regenerateImages: (id) => api.post(`/listings/generated/${id}/regenerate_images/`),
+  etsyGuide: (id, guide, refresh = false) => (refresh
+    ? api.post(`/listings/${id}/etsy-guides/${guide}/`, { refresh: true })
+    : api.get(`/listings/${id}/etsy-guides/${guide}/`)),
 };
 
 
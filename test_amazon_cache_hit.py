@@ -0,0 +1,61 @@
+"""
+Check that regenerating the same Amazon product is answered by the LLM response cache: the prompt
+(variations and brand tone / localization fragments) must be identical for identical inputs.
+Runs against the offline stand-in unless LLM_BACKEND is set.
+"""
+
+import os
+import sys
+import django
+
+# Add the project path and configure Django
+project_path = os.path.join(os.path.dirname(__file__), 'backend')
+sys.path.append(project_path)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'listory.settings')
+os.environ.setdefault('LLM_BACKEND', 'replay')
+django.setup()
+
+
+def amazon_cache_hit_test():
+    """Generate one product twice; the second generation must hit the cache and make no new call"""
+
+    from django.contrib.auth.models import User
+    from apps.core.models import Product
+    from apps.listings.llm_cache import get_llm_cache
+    from apps.listings.services import ListingGeneratorService
+
+    print("🗄️ AMAZON REPEATED GENERATION CACHE TEST...")
+    print("=" * 50)
+
+    user, _ = User.objects.get_or_create(username='cache_test', defaults={'email': 'test@test.com'})
+    product = Product.objects.create(
+        user=user,
+        name='Insulated Water Bottle',
+        description='1L stainless steel insulated bottle',
+        brand_name='CacheBrand',
+        brand_tone='luxury',
+        marketplace='de',
+        marketplace_language='de',
+        features='Leakproof lid, keeps drinks cold 24 hours, BPA free',
+        occasion='christmas',
+    )
+    cache = get_llm_cache()
+    try:
+        service = ListingGeneratorService()
+        service.generate_listing(product.id, 'amazon')
+        before = cache.stats()
+        service.generate_listing(product.id, 'amazon')
+        after = cache.stats()
+
+        hits = after['hits'] - before['hits']
+        misses = after['misses'] - before['misses']
+        print(f"   second generation: {hits} cache hit(s), {misses} miss(es)")
+        passed = hits >= 1 and misses == 0
+        print(f"\n{'✅ PASS' if passed else '❌ FAIL'}: repeated Amazon generation served from the cache")
+        return passed
+    finally:
+        product.delete()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if amazon_cache_hit_test() else 1)